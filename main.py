@@ -12,6 +12,7 @@ import seaborn as sns
 import json
 import random
 import hashlib
+from itertools import islice
 
 # --- Constante para os Benchmarks ---
 N_ITENS_BENCHMARK = 10000
@@ -43,57 +44,64 @@ try:
     from src.estrutura_de_dados.cuckoo_hashing import CuckooHashing
     from src.estrutura_de_dados.bloom_filter2 import CountingBloomFilter
     from src.estrutura_de_dados.kd_tree import KDTree
+    from src.estrutura_de_dados.filtro_cuckoo import CuckooFilter
+    from src.estrutura_de_dados.bloom_filter_escalavel import ScalableBloomFilter
+    from src.estrutura_de_dados.indice_estatico import StaticSearchIndex
+    from src.benchmarks.benchmark_arvores import executar_benchmark_arvores
+    from src.benchmarks.benchmark_indices import executar_benchmark_indices
+    from src.benchmarks.benchmark_filtros import executar_benchmark_filtros, planejar_capacidade, simular_crescimento
+    from src.benchmarks.testes_restricao import executar_suite, dados_do_dataframe
+    from src.benchmarks.benchmark_assincrono import executar_benchmark_assincrono
+    from src.benchmarks.benchmark_cache import executar_benchmark_cache
+    from src.benchmarks.benchmark_modelo import executar_benchmark_modelo, executar_benchmark_preprocessamento
+    from src.benchmarks.benchmark_compactacao import executar_benchmark_compactacao
+    from src.benchmarks.benchmark_hash_inteiros import executar_benchmark_hash_inteiros
+    from src.benchmarks.benchmark_cache import gerar_consultas_zipf
+    from src.benchmarks.rastreamento import EstruturaRastreada, Rastro, comparar_estruturas, fabricas_padrao
+    from src.benchmarks.benchmark_adaptativa import executar_benchmark_adaptativa
+    from src.estrutura_de_dados.tabela_hash_inteiros import IntHashMap
+    from src.estrutura_de_dados.arvore_bola import BallTree
+    from src.benchmarks.benchmark_vizinhos import executar_benchmark_vizinhos
+    from src.estrutura_de_dados.hash_espacial import SpatialHashGrid
+    from src.benchmarks.benchmark_espacial import executar_benchmark_espacial
+    from src.benchmarks.benchmark_sketches import executar_benchmark_sketches
+    from src.benchmarks.construcao_paralela import executar_benchmark_paralelo
+    from src.benchmarks.benchmark_memoria_compartilhada import executar_benchmark_memoria_compartilhada, psutil
+    from src.benchmarks.benchmark_kdtree import executar_benchmark_kdtree
+    from src.benchmarks.monitoramento import coletar_estatisticas
+    from src.modelo.arvore_compilada import CompiledDecisionTree
+    from src.modelo.preprocessamento import carregar_dataset, PreprocessadorCompilado, COLUNA_ALVO
     print("Estruturas de dados importadas com sucesso.")
 except ImportError as e:
     print(f"--- ERRO CRÍTICO ---\nErro ao importar estruturas: {e}\nVerifique os arquivos em 'src/'.")
     input("Pressione Enter para sair."); sys.exit(1)
 
-# --- Adição de métodos de memória ---
-def get_ll_memory_usage(self):
-    if not self.head: return 0
-    size = sys.getsizeof(self)
-    node = self.head
-    while node: size += sys.getsizeof(node); node = node.next
-    return size
-LinkedList.get_memory_usage = get_ll_memory_usage
-LinkedListOptimized.get_memory_usage = get_ll_memory_usage
-
 # --- Cache e Funções de Inicialização ---
-RECURSOS_CARREGADOS = {"df": None, "modelo": None, "scaler": None, "X_encoded": None, "y": None}
+RECURSOS_CARREGADOS = {"df": None, "modelo": None, "scaler": None, "modelo_compilado": None,
+                       "preprocessador": None, "X_modelo": None, "y": None, "indice_similaridade": None}
 
 def carregar_recursos():
     if RECURSOS_CARREGADOS["df"] is not None: return True
     print("Carregando recursos (Dataset, Modelo de ML, etc.)...")
     try:
         path_df = resource_path(os.path.join("dataset", "heart_attack_prediction_dataset.csv"))
-        df_raw = pd.read_csv(path_df)
-        df_processed = df_raw.copy()
-        if 'Blood Pressure' in df_processed.columns and df_processed['Blood Pressure'].dtype == 'object':
-            split_bp = df_processed['Blood Pressure'].str.split('/', expand=True)
-            df_processed['Pressao_Sistolica'] = pd.to_numeric(split_bp[0], errors='coerce')
-            df_processed['Pressao_Diastolica'] = pd.to_numeric(split_bp[1], errors='coerce')
-            df_processed = df_processed.drop(columns=['Blood Pressure'])
-        if 'Patient ID' in df_processed.columns: df_processed = df_processed.drop('Patient ID', axis=1)
-        df_processed.fillna(df_processed.median(numeric_only=True), inplace=True)
+        df_processed = carregar_dataset(path_df)  # Mesma limpeza usada no treino (src/modelo), já compactada
         RECURSOS_CARREGADOS["df"] = df_processed
         
-        colunas_para_modelo = [
-            'Age', 'Sex', 'Cholesterol', 'Heart Rate', 'Diabetes', 'Family History', 'Smoking', 'Obesity', 
-            'Alcohol Consumption', 'Exercise Hours Per Week', 'Diet', 'Previous Heart Problems', 'Medication Use', 
-            'Stress Level', 'Sedentary Hours Per Day', 'Income', 'BMI', 'Triglycerides', 
-            'Physical Activity Days Per Week', 'Sleep Hours Per Day', 'Pressao_Sistolica', 'Pressao_Diastolica'
-        ]
-        colunas_para_modelo = [col for col in colunas_para_modelo if col in df_processed.columns]
-        X = df_processed[colunas_para_modelo]
-        y = df_processed['Heart Attack Risk']
-        X_encoded = pd.get_dummies(X, drop_first=True)
-        RECURSOS_CARREGADOS["X_encoded"] = X_encoded
-        RECURSOS_CARREGADOS["y"] = y
-
         path_modelo = resource_path(os.path.join('models', 'modelo_arvore_final.joblib'))
         path_scaler = resource_path(os.path.join('models', 'scaler.joblib'))
         RECURSOS_CARREGADOS["modelo"] = joblib.load(path_modelo)
         RECURSOS_CARREGADOS["scaler"] = joblib.load(path_scaler)
+        # Mapeamento de colunas compilado uma vez; a matriz de features (na ordem do scaler) é
+        # gerada aqui e compartilhada por previsão, testes e benchmarks
+        preprocessador = PreprocessadorCompilado.from_scaler(df_processed, RECURSOS_CARREGADOS["scaler"])
+        RECURSOS_CARREGADOS["preprocessador"] = preprocessador
+        RECURSOS_CARREGADOS["X_modelo"] = preprocessador.transform(df_processed)
+        RECURSOS_CARREGADOS["y"] = df_processed[COLUNA_ALVO]
+        # Pacientes semelhantes: Ball Tree sobre todas as features já escaladas (as do scaler.transform)
+        RECURSOS_CARREGADOS["indice_similaridade"] = BallTree(preprocessador.transform(df_processed, escalar=True))
+        # Árvore achatada em arrays com o scaler embutido nos limiares (previsões sem o sklearn)
+        RECURSOS_CARREGADOS["modelo_compilado"] = CompiledDecisionTree.from_sklearn(RECURSOS_CARREGADOS["modelo"], RECURSOS_CARREGADOS["scaler"])
     except FileNotFoundError as e:
         print(f"❌ ERRO CRÍTICO: Arquivo não encontrado: {e.filename}"); return False
     except Exception as e:
@@ -114,8 +122,11 @@ def inicializar_sistemas(num_registros=100):
         "Tabela Hash": HashTable(size=num_registros*2),
         "Árvore AVL": AVLTree(),
         "Cuckoo Hashing": CuckooHashing(size=num_registros*2),
-        "Counting Bloom Filter": CountingBloomFilter(size=num_registros*20, hash_count=7),
-        "KD-Tree (2D: Age, Cholesterol)": KDTree(dados_pontos_2d)
+        "Counting Bloom Filter": CountingBloomFilter.from_capacity(num_registros*2, fpr=0.001),
+        "Cuckoo Filter": CuckooFilter(capacity=num_registros*2, fpr=0.01),
+        "Scalable Bloom Filter": ScalableBloomFilter(initial_capacity=num_registros, fpr=0.001),
+        "KD-Tree (2D: Age, Cholesterol)": KDTree(dados_pontos_2d),
+        "Hash Espacial (2D: Age, Cholesterol)": SpatialHashGrid.from_dataframe(df.head(num_registros))
     }
     for item in dados_numericos:
         sistemas["Lista Encadeada (Original)"].insert(item)
@@ -126,6 +137,8 @@ def inicializar_sistemas(num_registros=100):
         sistemas["Cuckoo Hashing"].insert(key, value)
     for item_str in dados_strings_json:
         sistemas["Counting Bloom Filter"].insert(item_str)
+        sistemas["Cuckoo Filter"].insert(item_str)
+        sistemas["Scalable Bloom Filter"].insert(item_str)
     print("✅ Sistemas de estruturas de dados prontos.")
     return sistemas
 
@@ -139,10 +152,12 @@ def mostrar_menu_principal(sistemas):
     print(f"{num_estruturas+1}. Executar Benchmark de Acesso Médio")
     print(f"{num_estruturas+2}. Executar Benchmark de Latência Média")
     print(f"{num_estruturas+3}. Executar Testes de Restrição")
+    print(f"{num_estruturas+4}. Executar Benchmarks Avançados")
+    print(f"{num_estruturas+5}. Monitorar Estruturas (estatísticas em O(1))")
     print("\n--- Módulo de Previsão ---")
-    print(f"{num_estruturas+4}. Prever Risco de Ataque Cardíaco")
+    print(f"{num_estruturas+6}. Prever Risco de Ataque Cardíaco")
     print("\n" + "-"*50)
-    print(f"{num_estruturas+5}. Sair")
+    print(f"{num_estruturas+7}. Sair")
     print("="*50)
 
 def formatar_tempo(segundos):
@@ -150,11 +165,16 @@ def formatar_tempo(segundos):
     if segundos < 1: return f"{segundos * 1000:.2f} ms"
     return f"{segundos:.4f} s"
 
+def previa(itens, n=30):
+    """Os primeiros n itens como texto, lidos por um iterador limitado (não percorre a estrutura inteira)."""
+    primeiros = list(islice(itens, n + 1))
+    return ", ".join(map(str, primeiros[:n])) + (", ..." if len(primeiros) > n else "")
+
 # --- Funções de Sub-Menu para Gerenciamento ---
 def gerenciar_simples(instancia, nome_estrutura):
     while True:
         os.system('cls' if os.name == 'nt' else 'clear'); print("="*50, f"\nGerenciando: {nome_estrutura}\n", "="*50, sep="")
-        print(f"Estado atual (primeiros 30 itens): {str(instancia)[:120]}...")
+        print(f"Estado atual ({len(instancia)} itens; primeiros 30): {previa(instancia)}")
         print("\nOpções:\n1. Inserir\n2. Buscar\n3. Remover\n4. Ver Memória\n5. Voltar")
         escolha = input("Sua escolha: ")
         if escolha == '1':
@@ -181,7 +201,7 @@ def gerenciar_simples(instancia, nome_estrutura):
 def gerenciar_hash_kv(instancia, nome_estrutura):
     while True:
         os.system('cls' if os.name == 'nt' else 'clear'); print("="*50, f"\nGerenciando: {nome_estrutura}\n", "="*50, sep="")
-        print(f"\nEstado atual: {type(instancia).__name__} populada.")
+        print(f"\nEstado atual: {type(instancia).__name__} com {len(instancia)} pares. Primeiros 10: {previa(instancia.items(), 10)}")
         print("\nOpções:\n1. Inserir (chave, valor)\n2. Buscar por chave\n3. Remover por chave\n4. Ver Memória\n5. Voltar")
         escolha = input("Sua escolha: ")
         if escolha == '1':
@@ -211,7 +231,16 @@ def gerenciar_hash_kv(instancia, nome_estrutura):
 def gerenciar_bloom_filter(instancia, nome_estrutura):
     while True:
         os.system('cls' if os.name == 'nt' else 'clear'); print("="*50, f"\nGerenciando: {nome_estrutura}\n", "="*50, sep="")
-        print(f"\nEstado: Filtro com {instancia.size} posições e {instancia.hash_count} hashes.")
+        if isinstance(instancia, CuckooFilter):
+            print(f"\nEstado: Filtro com {instancia.num_buckets} baldes x {instancia.bucket_size} posições, fingerprints de {instancia.fingerprint_bits} bits.")
+            print(f"Ocupação: {instancia.load_factor():.2%} | FPR teórica: {instancia.expected_fpr():.4%} | {instancia.bits_per_item():.1f} bits/item")
+        elif isinstance(instancia, ScalableBloomFilter):
+            print(f"\nEstado: Filtro escalável com {len(instancia.layers)} camada(s) e {instancia.count} itens. FPR teórica: {instancia.expected_fpr():.4%}")
+            for camada in instancia.get_layer_statistics():
+                print(f"  Camada {camada['camada']}: {camada['itens']}/{camada['capacidade']} itens, {camada['posicoes']} posições, {camada['hashes']} hashes, FPR alvo {camada['fpr_alvo']:.5f}, {camada['memoria_bytes']:,} bytes")
+        else:
+            print(f"\nEstado: Filtro com {instancia.size} posições e {instancia.hash_count} hashes.")
+            print(f"Itens: {instancia.count} | FPR teórica: {instancia.expected_fpr():.4%} | Overflows de contador: {instancia.overflow_count}")
         print("\nOpções:\n1. Inserir item\n2. Buscar item\n3. Remover item\n4. Ver Memória\n5. Voltar")
         escolha = input("Sua escolha: ")
         if escolha == '1':
@@ -224,8 +253,11 @@ def gerenciar_bloom_filter(instancia, nome_estrutura):
             else: print(f"Resultado: '{item}' DEFINITIVAMENTE NÃO está no conjunto. (Execução: {formatar_tempo(tempo)})")
         elif escolha == '3':
             item = input("Digite o item (string) para remover: ")
-            start = time.perf_counter(); instancia.remove(item); tempo = time.perf_counter() - start
-            print(f"'{item}' removido. (Execução: {formatar_tempo(tempo)})")
+            start = time.perf_counter(); removido = instancia.remove(item); tempo = time.perf_counter() - start
+            if removido is False and isinstance(instancia, ScalableBloomFilter) and item in instancia:
+                print(f"'{item}' casa com mais de uma camada: remoção recusada para não gerar falsos negativos. (Execução: {formatar_tempo(tempo)})")
+            elif removido is False: print(f"'{item}' não encontrado. (Execução: {formatar_tempo(tempo)})")
+            else: print(f"'{item}' removido. (Execução: {formatar_tempo(tempo)})")
         elif escolha == '4':
             memoria = instancia.get_memory_usage()
             print(f"Uso de memória estimado: {memoria:,} bytes ({memoria/1024:.2f} KB)")
@@ -254,9 +286,47 @@ def gerenciar_kdtree(instancia, nome_estrutura):
         else: print("Opção inválida.")
         input("\nPressione Enter para continuar...")
 
+def gerenciar_hash_espacial(instancia, nome_estrutura):
+    while True:
+        os.system('cls' if os.name == 'nt' else 'clear'); print("="*50, f"\nGerenciando: {nome_estrutura}\n", "="*50, sep="")
+        print(f"\nGrade com {len(instancia)} pontos em {len(instancia.celulas)} células de {instancia.largura:g} x {instancia.altura:g}.")
+        print("\nOpções:\n1. Encontrar vizinho mais próximo\n2. Buscar pacientes num raio\n3. Inserir ponto\n4. Remover ponto\n5. Ver Memória\n6. Voltar")
+        escolha = input("Sua escolha: ")
+        if escolha in ('1', '2', '3', '4'):
+            try:
+                px = int(input("Digite a coordenada X (Idade) do ponto (ex: 50): "))
+                py = int(input("Digite a coordenada Y (Colesterol) do ponto (ex: 250): "))
+                raio = float(input("Digite o raio (ex: 10): ")) if escolha == '2' else None
+            except ValueError: print("Entrada inválida."); continue
+            ponto = (px, py)
+            if escolha == '1':
+                start = time.perf_counter(); vizinhos = instancia.nearest(ponto, 1); tempo = time.perf_counter() - start
+                if vizinhos: print(f"\nVizinho mais próximo de {ponto}: {vizinhos[0][2]} (id {vizinhos[0][1]}, distância {vizinhos[0][0]:.2f}). (Execução: {formatar_tempo(tempo)})")
+                else: print("\nA grade está vazia.")
+            elif escolha == '2':
+                try:
+                    start = time.perf_counter(); encontrados = instancia.query_radius(ponto, raio, return_distance=True); tempo = time.perf_counter() - start
+                except ValueError as e: print(e); continue
+                print(f"\n{len(encontrados)} pontos a até {raio:g} de {ponto}. (Execução: {formatar_tempo(tempo)})")
+                for distancia, item_id in encontrados[:10]: print(f"  id {item_id}: {instancia.pontos[item_id]} (distância {distancia:.2f})")
+                if len(encontrados) > 10: print(f"  ... e mais {len(encontrados) - 10}.")
+            elif escolha == '3':
+                start = time.perf_counter(); item_id = instancia.insert(ponto); tempo = time.perf_counter() - start
+                print(f"Ponto {ponto} inserido com id {item_id}. (Execução: {formatar_tempo(tempo)})")
+            else:
+                start = time.perf_counter(); removido = instancia.remove(ponto); tempo = time.perf_counter() - start
+                print(f"Ponto {ponto} {'removido' if removido else 'não encontrado'}. (Execução: {formatar_tempo(tempo)})")
+        elif escolha == '5':
+            memoria = instancia.get_memory_usage()
+            print(f"Uso de memória estimado: {memoria:,} bytes ({memoria/1024:.2f} KB)")
+        elif escolha == '6': return
+        else: print("Opção inválida.")
+        input("\nPressione Enter para continuar...")
+
 def gerenciar_estrutura_principal(nome_estrutura, instancia):
     if isinstance(instancia, KDTree): gerenciar_kdtree(instancia, nome_estrutura)
-    elif isinstance(instancia, CountingBloomFilter): gerenciar_bloom_filter(instancia, nome_estrutura)
+    elif isinstance(instancia, SpatialHashGrid): gerenciar_hash_espacial(instancia, nome_estrutura)
+    elif isinstance(instancia, (CountingBloomFilter, CuckooFilter, ScalableBloomFilter)): gerenciar_bloom_filter(instancia, nome_estrutura)
     elif isinstance(instancia, (HashTable, CuckooHashing)): gerenciar_hash_kv(instancia, nome_estrutura)
     else: gerenciar_simples(instancia, nome_estrutura)
 
@@ -290,6 +360,23 @@ def executar_benchmark_acesso_medio():
         
         start = time.perf_counter(); [instancia.search(i) for i in itens_busca]; tempo_total = time.perf_counter() - start
         resultados[nome] = (tempo_total / N_ACESSOS) * 1e6
+
+    # Tabela Hash em lote: baldes calculados para o array inteiro de uma vez (search_many).
+    # A 1ª chamada após alterações monta o espelho NumPy dos baldes; as seguintes o reaproveitam
+    tabela = estruturas["Tabela Hash"]
+    start = time.perf_counter(); tabela.search_many(indices_aleatorios); tempo_total = time.perf_counter() - start
+    resultados["Tabela Hash (search_many, 1ª chamada)"] = (tempo_total / N_ACESSOS) * 1e6
+    start = time.perf_counter(); tabela.search_many(indices_aleatorios); tempo_total = time.perf_counter() - start
+    resultados["Tabela Hash (search_many, lote)"] = (tempo_total / N_ACESSOS) * 1e6
+
+    # Índice estático (somente leitura) construído a partir da AVL já populada
+    indice = StaticSearchIndex.from_avl(estruturas["Árvore AVL"])
+    itens_busca = [dados_numericos[i] for i in indices_aleatorios]
+    start = time.perf_counter(); [indice.search(i) for i in itens_busca]; tempo_total = time.perf_counter() - start
+    resultados["Índice Estático (Eytzinger)"] = (tempo_total / N_ACESSOS) * 1e6
+    itens_busca = np.asarray(itens_busca)
+    start = time.perf_counter(); indice.search_many(itens_busca); tempo_total = time.perf_counter() - start
+    resultados["Índice Estático (search_many, lote)"] = (tempo_total / N_ACESSOS) * 1e6
     
     df_acesso = pd.DataFrame.from_dict(resultados, orient='index', columns=['Tempo Médio de Acesso (µs)'])
     print("\n--- Resultados ---"); print(df_acesso.round(2))
@@ -319,62 +406,51 @@ def executar_benchmark_latencia_media():
     print("\n--- Resultados ---"); print(df_latencia.round(2))
 
 def _teste_memoria():
-    print("\n--- Executando Teste de Memória (R3) ---"); df_original = RECURSOS_CARREGADOS['df']
-    memoria_antes = df_original.memory_usage(deep=True).sum()
-    df_compactado = df_original.copy()
-    for col in df_compactado.select_dtypes(include=np.number).columns:
-        df_compactado[col] = pd.to_numeric(df_compactado[col], downcast='float'); df_compactado[col] = pd.to_numeric(df_compactado[col], downcast='integer')
-    memoria_depois = df_compactado.memory_usage(deep=True).sum()
-    print(f"Memória Original: {memoria_antes/1e6:.2f} MB | Memória Compactada: {memoria_depois/1e6:.2f} MB")
-    if memoria_antes > 0: print(f"Redução: {(1 - memoria_depois/memoria_antes):.2%}")
+    print("\n--- Executando Teste de Memória (R3) ---")
+    # O dataset já é carregado compacto (category, bool e inteiros reduzidos); aqui os modos são comparados
+    path_df = resource_path(os.path.join("dataset", "heart_attack_prediction_dataset.csv"))
+    df_resumo, df_colunas = executar_benchmark_compactacao(path_df)
+    print(df_resumo.round(3).to_string(index=False))
+    print("\n--- Tipos e Bytes por Coluna ---"); print(df_colunas.to_string(index=False))
+    print(f"\nDataFrame em uso (RECURSOS_CARREGADOS): {RECURSOS_CARREGADOS['df'].memory_usage(deep=True).sum()/1e6:.2f} MB")
+    print("\nEstruturas de dados sob limite de memória (RLIMIT_AS):")
+    _executar_cenarios_restricao(["memoria"])
+
+def _executar_cenarios_restricao(cenarios, n_itens=2000, salvar=False):
+    """Roda cenários da suíte de restrições em todas as estruturas, com os dados do dataset."""
+    dados = dados_do_dataframe(RECURSOS_CARREGADOS['df'], n_itens)
+    caminho = os.path.join(project_root, "resultados", "relatorio_testes_restricao.csv") if salvar else None
+    df_relatorio = executar_suite(n_repeticoes=3, cenarios=cenarios, dados=dados, caminho_relatorio=caminho)
+    print("\n--- Resultados ---")
+    print(df_relatorio.drop(columns=["Repetições"]).round(4).to_string(index=False))
+    if caminho: print(f"\nRelatório salvo em: {caminho}")
 
 def _teste_processamento():
-    print("\n--- Executando Teste de Processamento (R9) ---"); N_ITENS = 3000
-    dados_teste = RECURSOS_CARREGADOS['df']['Age'].head(N_ITENS)
-    print("Realizando 'aquecimento' da CPU..."); avl_warmup = AVLTree(); [avl_warmup.insert(item) for item in dados_teste.head(500)]; time.sleep(0.5)
-    print("CPU 'aquecida'. Iniciando medições...")
-    tempos_normais, tempos_carga = [], []
-    N_RODADAS = 5
-    for _ in range(N_RODADAS):
-        avl_normal = AVLTree(); start_normal = time.perf_counter(); [avl_normal.insert(item) for item in dados_teste]; tempos_normais.append(time.perf_counter() - start_normal)
-        avl_carga = AVLTree(); start_carga = time.perf_counter()
-        for item in dados_teste: avl_carga.insert(item); [(_**2) for _ in range(10)]
-        tempos_carga.append(time.perf_counter() - start_carga)
-    avg_normal = np.mean(tempos_normais[1:]); avg_carga = np.mean(tempos_carga[1:])
-    print(f"Tempo médio de inserção normal: {avg_normal:.4f} segundos")
-    print(f"Tempo médio com carga extra:   {avg_carga:.4f} segundos")
-    if avg_normal > 0 and avg_carga > avg_normal: print(f"Aumento no tempo de execução: {((avg_carga - avg_normal) / avg_normal):.2%}")
-    else: print("Resultado do teste inconsistente.")
+    print("\n--- Executando Teste de Processamento (R9): disputa de CPU com processos de fundo ---")
+    _executar_cenarios_restricao(["cpu"])
 
 def _teste_latencia_restricao():
-    print("\n--- Executando Teste de Latência (R11) ---"); N_BUSCAS = 2000
-    ht = HashTable(size=N_BUSCAS*2); [ht.insert(i,i) for i in range(N_BUSCAS)]
-    start = time.perf_counter(); [ht.search(i) for i in range(N_BUSCAS)]; tempo_normal = time.perf_counter() - start
-    print(f"Tempo para {N_BUSCAS} buscas (sem latência): {tempo_normal:.4f} segundos")
-    LATENCIA_SIMULADA = 0.0001
-    start = time.perf_counter()
-    for i in range(N_BUSCAS): ht.search(i); time.sleep(LATENCIA_SIMULADA)
-    tempo_latencia = time.perf_counter() - start
-    print(f"Tempo com latência de {LATENCIA_SIMULADA*1000:.1f}ms por busca: {tempo_latencia:.4f} segundos")
+    print("\n--- Executando Teste de Latência (R11): atraso aplicado a cada chamada da API ---")
+    _executar_cenarios_restricao(["latencia"])
 
 def _teste_dados():
     print("\n--- Executando Teste de Dados (R18) ---")
     try:
-        modelo, scaler, X_encoded, y = (RECURSOS_CARREGADOS["modelo"], RECURSOS_CARREGADOS["scaler"], RECURSOS_CARREGADOS["X_encoded"], RECURSOS_CARREGADOS["y"])
+        modelo, preprocessador, X_modelo, y = (RECURSOS_CARREGADOS["modelo"], RECURSOS_CARREGADOS["preprocessador"], RECURSOS_CARREGADOS["X_modelo"], RECURSOS_CARREGADOS["y"])
         from sklearn.model_selection import train_test_split
-        _, X_test_original, _, y_test = train_test_split(X_encoded, y, test_size=0.2, random_state=42)
-        expected_features = scaler.feature_names_in_
-        X_test_alinhado = X_test_original.reindex(columns=expected_features, fill_value=0)
-        X_test_scaled = scaler.transform(X_test_alinhado)
+        _, X_test_original, _, y_test = train_test_split(X_modelo, y, test_size=0.2, random_state=42)
+        X_test_scaled = (X_test_original - preprocessador.mean) / preprocessador.scale
         acuracia_original = modelo.score(X_test_scaled, y_test)
         print(f"Acurácia em dados limpos: {acuracia_original:.2%}")
         X_test_corrompido = X_test_scaled.copy()
-        coluna_age_index = list(X_test_alinhado.columns).index('Age')
+        coluna_age_index = preprocessador.feature_names.index('Age')
         indices = np.random.choice(X_test_corrompido.shape[0], size=int(X_test_corrompido.shape[0]*0.15), replace=False)
         X_test_corrompido[indices, coluna_age_index] = 99
         acuracia_corrompida = modelo.score(X_test_corrompido, y_test)
         print(f"Acurácia em dados corrompidos: {acuracia_corrompida:.2%}")
     except Exception as e: print(f"Ocorreu um erro inesperado no teste de dados: {e}")
+    print("\nEstruturas de dados com 15% dos dados corrompidos:")
+    _executar_cenarios_restricao(["corrupcao"])
 
 def _teste_algoritmico():
     print("\n--- Executando Teste Algorítmico (R23) ---")
@@ -394,32 +470,250 @@ def _teste_algoritmico():
     print(f"Tempo de inserção com 'encriptação': {tempo_enc:.4f} segundos")
     if tempo_normal > 0: print(f"Aumento no tempo: {((tempo_enc - tempo_normal) / tempo_normal):.2%}")
 
+def executar_monitoramento(sistemas):
+    os.system('cls' if os.name == 'nt' else 'clear'); print("--- Monitoramento das Estruturas ---")
+    df_estatisticas = coletar_estatisticas(sistemas)
+    print(df_estatisticas.drop(columns=["instante"]).round(4).to_string(index=False))
+    print(f"\nLeitura de todas as estruturas: {formatar_tempo(df_estatisticas['leitura_us'].sum() / 1e6)}")
+
 def executar_testes_restricao():
     while True:
         os.system('cls' if os.name == 'nt' else 'clear'); print("--- Módulo de Testes de Restrição ---"); print("Escolha um teste para executar:")
-        print("1. Teste de Memória (R3)\n2. Teste de Processamento (R9)\n3. Teste de Latência (R11)\n4. Teste de Dados (R18)\n5. Teste Algorítmico (R23)\n6. Voltar")
+        print("1. Teste de Memória (R3)\n2. Teste de Processamento (R9)\n3. Teste de Latência (R11)\n4. Teste de Dados (R18)\n5. Teste Algorítmico (R23)\n6. Suíte Completa (todas as restrições, salva relatório)\n7. Voltar")
         escolha = input("Sua escolha: ")
         if escolha == '1': _teste_memoria()
         elif escolha == '2': _teste_processamento()
         elif escolha == '3': _teste_latencia_restricao()
         elif escolha == '4': _teste_dados()
         elif escolha == '5': _teste_algoritmico()
-        elif escolha == '6': break
+        elif escolha == '6': _executar_cenarios_restricao(None, salvar=True)
+        elif escolha == '7': break
+        else: print("Opção inválida.")
+        input("\nPressione Enter para continuar...")
+
+def _benchmark_filtros():
+    print("\n--- Benchmark de Filtros Probabilísticos (Counting Bloom x Cuckoo) ---")
+    df = RECURSOS_CARREGADOS['df']
+    n_real = min(N_ITENS_BENCHMARK, len(df) // 2)
+    print(f"Usando N={n_real} itens inseridos e {n_real} itens ausentes para medir falsos positivos.")
+    linhas = [json.dumps(tuple(row)) for row in df.head(2 * n_real).to_numpy().tolist()]
+    df_filtros = executar_benchmark_filtros(linhas[:n_real], linhas[n_real:])
+    print("\n--- Resultados ---"); print(df_filtros.round(4).to_string())
+
+def _benchmark_capacidade_bloom():
+    print("\n--- Planejamento de Capacidade do Counting Bloom Filter ---")
+    n_real = min(N_ITENS_BENCHMARK, len(RECURSOS_CARREGADOS['df']))
+    print(f"Usando N={n_real} itens inseridos e 2.000.000 de chaves ausentes.")
+    df_capacidade = planejar_capacidade([n_real], [0.01, 0.001], configuracoes_fixas=[(n_real*20, 7)])
+    print("\n--- Resultados ---"); print(df_capacidade.to_string(index=False))
+
+def _benchmark_crescimento_bloom():
+    print("\n--- Crescimento: Counting Bloom Filter Fixo x Scalable Bloom Filter ---")
+    n_real = min(N_ITENS_BENCHMARK, len(RECURSOS_CARREGADOS['df']))
+    print(f"Ambos dimensionados para {n_real // 4} itens; inserindo até {n_real} itens.")
+    df_crescimento, df_camadas = simular_crescimento(n_real // 4, n_real)
+    print("\n--- Resultados ---"); print(df_crescimento.to_string(index=False))
+    print("\n--- Camadas do Filtro Escalável ---"); print(df_camadas.to_string(index=False))
+
+def _benchmark_arvores():
+    print("\n--- Benchmark de Árvores: AVL x B+ (Busca Pontual e por Intervalo) ---")
+    df_arvores = executar_benchmark_arvores(RECURSOS_CARREGADOS['df'])
+    print("\n--- Resultados ---"); print(df_arvores.round(4).to_string(index=False))
+
+def _benchmark_indices():
+    print("\n--- Benchmark de Índices Secundários x Varredura do Pandas ---")
+    df_indices = executar_benchmark_indices(RECURSOS_CARREGADOS['df'])
+    print("\n--- Resultados ---"); print(df_indices.drop(columns=['Plano']).round(2).to_string(index=False))
+    print("\n--- Planos de Execução ---")
+    for consulta, plano in zip(df_indices['Consulta'], df_indices['Plano']): print(f"{consulta}\n   {plano}")
+
+def _benchmark_assincrono():
+    print("\n--- Benchmark de Latência Assíncrona (Tabela Hash como armazenamento remoto) ---")
+    df = RECURSOS_CARREGADOS['df']
+    n_real = min(N_ITENS_BENCHMARK, len(df))
+    LATENCIA = 0.001
+    tabela = HashTable(size=n_real*2)
+    for i, idade in enumerate(df['Age'].head(n_real).tolist()): tabela.insert(i, idade)
+    print(f"Usando N={n_real} chaves e latência fixa de {LATENCIA*1000:.1f} ms por requisição.")
+    df_async = executar_benchmark_assincrono(tabela, list(range(n_real)), latencia_s=LATENCIA)
+    print("\n--- Resultados ---"); print(df_async.round(3).to_string(index=False))
+
+def _benchmark_cache():
+    print("\n--- Benchmark de Cache LRU em Cargas Zipf (Cuckoo Hashing e Counting Bloom Filter) ---")
+    df = RECURSOS_CARREGADOS['df']
+    n_real = min(N_ITENS_BENCHMARK, len(df))
+    # 'Patient ID' é removido na limpeza do dataset; os IDs são lidos direto do CSV
+    path_df = resource_path(os.path.join("dataset", "heart_attack_prediction_dataset.csv"))
+    ids = pd.read_csv(path_df, usecols=['Patient ID'], nrows=n_real)['Patient ID'].tolist()
+    cuckoo = CuckooHashing(size=n_real*2)
+    for paciente, idade in zip(ids, df['Age'].head(n_real).tolist()): cuckoo.insert(paciente, idade)
+    bloom = CountingBloomFilter.from_capacity(n_real, fpr=0.01)
+    for paciente in ids: bloom.insert(paciente)
+    print(f"Usando N={n_real} IDs de pacientes; consultas concentradas em poucos IDs (Zipf).")
+    df_cache = executar_benchmark_cache({"Cuckoo Hashing": cuckoo, "Counting Bloom Filter": bloom}, ids)
+    print("\n--- Resultados ---"); print(df_cache.round(3).to_string(index=False))
+
+def _benchmark_modelo():
+    print("\n--- Benchmark do Modelo Compilado x sklearn (Paridade e Latência) ---")
+    preprocessador = RECURSOS_CARREGADOS['preprocessador']
+    X_alinhado = pd.DataFrame(RECURSOS_CARREGADOS['X_modelo'], columns=preprocessador.feature_names)
+    linhas, df_modelo = executar_benchmark_modelo(RECURSOS_CARREGADOS['modelo'], RECURSOS_CARREGADOS['scaler'], X_alinhado)
+    print(f"✅ Paridade com o sklearn conferida em {linhas} linhas (classes e probabilidades).")
+    print("\n--- Resultados ---"); print(df_modelo.round(3).to_string(index=False))
+    print("\n--- Pré-processamento: get_dummies + reindex x Pré-processador Compilado ---")
+    df_bruto = pd.read_csv(resource_path(os.path.join("dataset", "heart_attack_prediction_dataset.csv")))
+    df_prep = executar_benchmark_preprocessamento(preprocessador, RECURSOS_CARREGADOS['scaler'], df_bruto)
+    print(df_prep.round(3).to_string(index=False))
+
+def _benchmark_hash_inteiros():
+    print("\n--- Benchmark de Chaves Inteiras (Tabela Hash x Cuckoo x IntHashMap) ---")
+    df = RECURSOS_CARREGADOS['df']
+    n_real = min(N_ITENS_BENCHMARK, len(df))
+    # Mesmos pares de dados_chave_valor: índice da linha -> idade
+    idades = df['Age'].head(n_real)
+    print(f"Usando N={n_real} pares (índice da linha -> idade).")
+    df_hash = executar_benchmark_hash_inteiros(idades.index.to_numpy(), idades.to_numpy())
+    print("\n--- Resultados ---"); print(df_hash.round(2).to_string(index=False))
+
+def _benchmark_replay():
+    print("\n--- Gravação e Replay de Rastros de Operações ---")
+    df = RECURSOS_CARREGADOS['df']
+    n_real = min(N_ITENS_BENCHMARK, len(df))
+    idades = df['Age'].head(n_real).tolist()
+    # Carga gravada sobre a Tabela Hash: 50/40/10 com ids de linha concentrados (Zipf), como tráfego real
+    rng = np.random.default_rng(7)
+    chaves = gerar_consultas_zipf(list(range(n_real)), n_real * 2, s=1.1, seed=7)
+    operacoes = rng.choice(['insercao', 'busca', 'remocao'], size=len(chaves), p=[0.5, 0.4, 0.1])
+    rastreada = EstruturaRastreada(HashTable(size=n_real*2))
+    for op, chave in zip(operacoes, chaves):
+        if op == 'insercao': rastreada.insert(chave, idades[chave])
+        elif op == 'busca': rastreada.search(chave)
+        else: rastreada.remove(chave)
+    caminho = os.path.join(project_root, "resultados", "rastro_carga_mista.bin")
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    rastreada.rastro.save(caminho)
+    rastro = Rastro.load(caminho)
+    resumo = rastro.resumo()
+    print(f"Rastro salvo em {caminho}: {resumo['operacoes']} operações ({resumo['insert']} insert, {resumo['search']} search, "
+          f"{resumo['remove']} remove), {resumo['bytes']/1024:.1f} KiB ({resumo['bytes']/resumo['operacoes']:.0f} bytes/op).")
+    print("\n--- Replay em Velocidade Máxima ---")
+    print(comparar_estruturas(rastro, fabricas_padrao(n_real)).round(2).to_string(index=False))
+    print("\n--- Replay no Tempo Original (carga aberta) ---")
+    fabricas = {"Tabela Hash": lambda: HashTable(size=n_real*2), "IntHashMap": lambda: IntHashMap(capacity=n_real)}
+    print(comparar_estruturas(rastro, fabricas, tempo_original=True).round(2).to_string(index=False))
+    print(f"\nPara repetir com outro rastro: python -m src.benchmarks.rastreamento {caminho}")
+
+def _benchmark_vizinhos():
+    print("\n--- Vizinhos Mais Próximos: Ball Tree x Força Bruta x KD-Tree ---")
+    X = RECURSOS_CARREGADOS["preprocessador"].transform(RECURSOS_CARREGADOS['df'], escalar=True)
+    print(f"Matriz escalada: {X.shape[0]} pacientes x {X.shape[1]} features; usando as primeiras d colunas de cada vez.")
+    df_vizinhos = executar_benchmark_vizinhos(X)
+    print("\n--- Resultados ---"); print(df_vizinhos.round(2).to_string(index=False))
+
+def _benchmark_adaptativa():
+    print("\n--- Estrutura Adaptativa x Representações Fixas (carga em fases) ---")
+    df = RECURSOS_CARREGADOS['df']
+    n_real = min(N_ITENS_BENCHMARK, len(df))
+    idades = df['Age'].head(n_real)
+    print(f"Usando N={n_real} pares (índice da linha -> idade); fases: carga, buscas, lotes, intervalos, busca/remoção.")
+    df_tempos, df_trocas = executar_benchmark_adaptativa(idades.index.to_numpy(), idades.to_numpy())
+    print("\n--- Tempo por Fase ---"); print(df_tempos.round(2).to_string(index=False))
+    print("\n--- Decisões da Estrutura Adaptativa ---")
+    colunas = ['operacao', 'acao', 'de', 'para', 'n', 'custo_estimado_atual_us', 'custo_estimado_novo_us',
+               'migracao_medida_s', 'ganho_medido', 'amortizada_em_ops']
+    print(df_trocas.reindex(columns=colunas).round(3).to_string(index=False) if not df_trocas.empty else "Nenhuma troca considerada.")
+
+def _benchmark_espacial():
+    print("\n--- Hash Espacial x KD-Tree em (Age, Cholesterol) ---")
+    df = RECURSOS_CARREGADOS['df']
+    print(f"Vizinho mais próximo e busca por raio; N acima de {len(df)} reamostra os pacientes com reposição.")
+    df_espacial = executar_benchmark_espacial(df)
+    print("\n--- Resultados ---"); print(df_espacial.round(2).to_string(index=False))
+
+def _benchmark_sketches():
+    print("\n--- Sketches (Count-Min, HyperLogLog, KLL) x Resultado Exato do Pandas ---")
+    df = RECURSOS_CARREGADOS['df']
+    print(f"Fluxo sintético de {50 * len(df):,} eventos gerado a partir dos {len(df)} pacientes; cada sketch também é montado em 4 partes e unido com merge().")
+    df_sketches = executar_benchmark_sketches(df)
+    colunas = ['Sketch', 'Configuração', 'Memória (KB)', 'Memória Exata (KB)', 'Erro Médio', 'Erro Máximo',
+               'Erro Máximo (Unido)', 'Erro Teórico', 'Unidade do Erro', 'Tempo Sketch (ms)', 'Tempo Exato (ms)']
+    print("\n--- Precisão x Memória ---"); print(df_sketches[colunas].round(4).to_string(index=False))
+    quantis = df_sketches.dropna(subset=['Quantis Estimados'])
+    print("\n--- p50 / p90 / p95 / p99 do Colesterol ---"); print(quantis[['Configuração', 'Quantis Estimados', 'Quantis Exatos']].to_string(index=False))
+
+def _benchmark_paralelo():
+    print("\n--- Construção Paralela (um shard por processo + merge) x Serial ---")
+    df = RECURSOS_CARREGADOS['df']
+    n = 10 * N_ITENS_BENCHMARK
+    chaves = np.random.default_rng(42).permutation(n)
+    idades = np.resize(df['Age'].to_numpy(), n)
+    print(f"Usando {n} chaves inteiras embaralhadas (valor = idade); {os.cpu_count()} CPU(s) disponível(is).")
+    df_paralelo = executar_benchmark_paralelo(chaves, idades)
+    print("\n--- Resultados ---"); print(df_paralelo.round(2).to_string(index=False))
+
+def _benchmark_memoria_compartilhada():
+    print("\n--- Tabela Hash + Bloom em Memória Compartilhada x Cópia por Processo ---")
+    df = RECURSOS_CARREGADOS['df']
+    n = 20 * N_ITENS_BENCHMARK
+    chaves = np.random.default_rng(42).choice(10 * n, size=n, replace=False)
+    idades = np.resize(df['Age'].to_numpy(), n)
+    fonte = "psutil (USS)" if psutil is not None else "/proc/self/smaps_rollup (psutil não instalado)"
+    print(f"Usando {n} chaves (valor = idade); memória privada medida por {fonte}.")
+    df_compartilhada = executar_benchmark_memoria_compartilhada(chaves, idades)
+    print("\n--- Resultados ---"); print(df_compartilhada.round(2).to_string(index=False))
+
+def _benchmark_kdtree():
+    print("\n--- KD-Tree: Busca Iterativa Compilada x Recursiva x Força Bruta NumPy ---")
+    df = RECURSOS_CARREGADOS['df']
+    X = RECURSOS_CARREGADOS["preprocessador"].transform(df, escalar=True)
+    conjuntos = {"Age, Cholesterol": df[['Age', 'Cholesterol']].to_numpy()}
+    conjuntos.update({f"Features escaladas ({d}D)": X[:, :d] for d in (3, 5, 8)})
+    print("Consultas uniformes na caixa dos dados; remoção preguiçosa de 0%, 50% e 90% dos pontos.")
+    df_kdtree = executar_benchmark_kdtree(conjuntos)
+    print("\n--- Resultados ---"); print(df_kdtree.round(2).to_string(index=False))
+
+BENCHMARKS_AVANCADOS = [
+    ("Filtros Probabilísticos (Counting Bloom x Cuckoo)", _benchmark_filtros),
+    ("Planejamento de Capacidade do Counting Bloom Filter", _benchmark_capacidade_bloom),
+    ("Crescimento do Bloom Filter (Fixo x Escalável)", _benchmark_crescimento_bloom),
+    ("Árvores AVL x B+ (Busca Pontual e por Intervalo)", _benchmark_arvores),
+    ("Índices Secundários Multicoluna x Pandas", _benchmark_indices),
+    ("Latência Assíncrona (gather, pipeline e cache LRU)", _benchmark_assincrono),
+    ("Cache LRU/TTL em Cargas Zipf", _benchmark_cache),
+    ("Modelo Compilado x sklearn (Previsão)", _benchmark_modelo),
+    ("Tabela Hash de Inteiros (IntHashMap) x Tabela Hash x Cuckoo", _benchmark_hash_inteiros),
+    ("Gravação e Replay de Rastros de Operações", _benchmark_replay),
+    ("Estrutura Adaptativa x Representações Fixas", _benchmark_adaptativa),
+    ("Vizinhos Mais Próximos (Ball Tree x Força Bruta x KD-Tree)", _benchmark_vizinhos),
+    ("Hash Espacial x KD-Tree (Vizinho e Raio em Age, Cholesterol)", _benchmark_espacial),
+    ("Sketches de Agregação (Count-Min, HyperLogLog, KLL) x Pandas", _benchmark_sketches),
+    ("Construção Paralela com Merge (Tabela Hash, Bloom, AVL)", _benchmark_paralelo),
+    ("Memória Compartilhada x Cópia por Processo (Tabela Hash + Bloom)", _benchmark_memoria_compartilhada),
+    ("KD-Tree: Busca Iterativa x Recursiva x Força Bruta", _benchmark_kdtree),
+]
+
+def executar_benchmarks_avancados():
+    while True:
+        os.system('cls' if os.name == 'nt' else 'clear'); print("--- Módulo de Benchmarks Avançados ---"); print("Escolha um benchmark para executar:")
+        for i, (nome, _) in enumerate(BENCHMARKS_AVANCADOS): print(f"{i+1}. {nome}")
+        print(f"{len(BENCHMARKS_AVANCADOS)+1}. Voltar")
+        escolha = input("Sua escolha: ")
+        if escolha == str(len(BENCHMARKS_AVANCADOS)+1): break
+        indice = int(escolha) - 1 if escolha.isdigit() else -1
+        if 0 <= indice < len(BENCHMARKS_AVANCADOS): BENCHMARKS_AVANCADOS[indice][1]()
         else: print("Opção inválida.")
         input("\nPressione Enter para continuar...")
 
 def executar_previsao_paciente():
     os.system('cls' if os.name == 'nt' else 'clear'); print("="*50, f"\nMódulo de Previsão de Risco Cardíaco\n", "="*50, sep="")
-    modelo, scaler, df, X_encoded, y = (RECURSOS_CARREGADOS["modelo"], RECURSOS_CARREGADOS["scaler"], RECURSOS_CARREGADOS["df"], RECURSOS_CARREGADOS["X_encoded"], RECURSOS_CARREGADOS["y"])
+    df, X_modelo, y = (RECURSOS_CARREGADOS["df"], RECURSOS_CARREGADOS["X_modelo"], RECURSOS_CARREGADOS["y"])
     try:
         idx = int(input(f"Digite o índice do paciente para prever (0 a {len(df)-1}): "))
         if not (0 <= idx < len(df)): print("Índice inválido."); return
     except ValueError: print("Entrada inválida."); return
-    colunas_do_modelo = pd.DataFrame(columns=scaler.get_feature_names_out())
-    paciente_a_prever, _ = X_encoded.align(colunas_do_modelo, axis=1, fill_value=0)
-    paciente_a_prever = paciente_a_prever.iloc[[idx]]
-    paciente_scaled = scaler.transform(paciente_a_prever)
-    previsao, probabilidade = modelo.predict(paciente_scaled)[0], modelo.predict_proba(paciente_scaled)[0]
+    compilado = RECURSOS_CARREGADOS["modelo_compilado"]
+    paciente_a_prever = X_modelo[idx].tolist()  # Features originais, já na ordem do scaler
+    previsao, probabilidade = compilado.predict_one(paciente_a_prever), compilado.predict_proba_one(paciente_a_prever)
     print("\n--- Relatório de Risco para o Paciente de Índice {} ---".format(idx))
     resultado_previsto = "ALTO RISCO" if previsao == 1 else "Baixo Risco"; confianca = probabilidade[previsao]
     print(f"Previsão do Modelo: {resultado_previsto} (Confiança: {confianca:.2%})")
@@ -428,6 +722,14 @@ def executar_previsao_paciente():
     print(f"Valor Real no Dataset: {resultado_real}")
     if previsao == y_real: print("✅ O modelo ACERTOU a previsão.")
     else: print("❌ O modelo ERROU a previsão.")
+    print("\n--- Pacientes Mais Semelhantes (Ball Tree, todas as features escaladas) ---")
+    paciente_escalado = RECURSOS_CARREGADOS["preprocessador"].transform(df.iloc[[idx]], escalar=True)
+    distancias, vizinhos = RECURSOS_CARREGADOS["indice_similaridade"].query(paciente_escalado, k=6)
+    semelhantes = [(d, v) for d, v in zip(distancias[0].tolist(), vizinhos[0].tolist()) if v != idx][:5]
+    for distancia, vizinho in semelhantes:
+        risco = "ALTO RISCO" if y.iloc[vizinho] == 1 else "Baixo Risco"
+        print(f"Paciente {vizinho}: distância {distancia:.3f} | Idade {df['Age'].iloc[vizinho]} | {risco}")
+    print(f"Pacientes semelhantes com alto risco: {sum(y.iloc[v] == 1 for _, v in semelhantes)}/{len(semelhantes)}")
 
 def main():
     os.system('cls' if os.name == 'nt' else 'clear')
@@ -446,8 +748,10 @@ def main():
             elif escolha == num_estruturas + 1: executar_benchmark_acesso_medio()
             elif escolha == num_estruturas + 2: executar_benchmark_latencia_media()
             elif escolha == num_estruturas + 3: executar_testes_restricao()
-            elif escolha == num_estruturas + 4: executar_previsao_paciente()
-            elif escolha == num_estruturas + 5: print("Saindo..."); break
+            elif escolha == num_estruturas + 4: executar_benchmarks_avancados()
+            elif escolha == num_estruturas + 5: executar_monitoramento(sistemas)
+            elif escolha == num_estruturas + 6: executar_previsao_paciente()
+            elif escolha == num_estruturas + 7: print("Saindo..."); break
             else: print("Opção inválida.")
         except (ValueError, IndexError):
             print("Entrada inválida.")
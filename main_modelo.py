@@ -2,7 +2,6 @@
 import os
 import sys
 import time
-import pandas as pd
 import joblib
 import warnings
 import json
@@ -38,6 +37,8 @@ try:
     from src.estrutura_de_dados.cuckoo_hashing import CuckooHashing
     from src.estrutura_de_dados.bloom_filter2 import CountingBloomFilter
     from src.estrutura_de_dados.kd_tree import KDTree
+    from src.modelo.preprocessamento import carregar_dataset, PreprocessadorCompilado, COLUNA_ALVO
+    from src.modelo.treinamento import caminho_do_scaler
     print("Estruturas de dados importadas com sucesso.")
 except ImportError as e:
     print(f"--- ERRO CRÍTICO ---\nErro ao importar estruturas: {e}\nVerifique os arquivos em 'src/'.")
@@ -53,7 +54,7 @@ def get_ll_memory_usage(self):
 LinkedListOptimized.get_memory_usage = get_ll_memory_usage
 
 # --- Cache e Funções de Inicialização ---
-RECURSOS_CARREGADOS = {"df": None, "modelo": None, "scaler": None, "X_encoded": None, "y": None}
+RECURSOS_CARREGADOS = {"df": None, "modelo": None, "scaler": None, "preprocessador": None, "y": None}
 
 def carregar_recursos():
     """Carrega o DataFrame, o modelo e o scaler uma única vez."""
@@ -63,20 +64,17 @@ def carregar_recursos():
         # --- AJUSTE DE BOAS PRÁTICAS AQUI ---
         path_df = resource_path(os.path.join("dataset", "heart_attack_prediction_dataset.csv"))
         path_modelo = resource_path(os.path.join('models', 'melhor_modelo_otimizado.joblib'))
-        path_scaler = resource_path(os.path.join('models', 'scaler.joblib'))
+        # O scaler ajustado junto com este modelo (o models/scaler.joblib é o do modelo_arvore_final)
+        path_scaler = caminho_do_scaler(resource_path('models'), 'melhor_modelo_otimizado.joblib')
         
-        df = pd.read_csv(path_df)
-        if 'Patient ID' in df.columns:
-            df = df.drop('Patient ID', axis=1)
+        df = carregar_dataset(path_df)  # Mesma limpeza do main.py e do treino (src/modelo)
         RECURSOS_CARREGADOS["df"] = df
         
         RECURSOS_CARREGADOS["modelo"] = joblib.load(path_modelo)
         RECURSOS_CARREGADOS["scaler"] = joblib.load(path_scaler)
         
-        X = df.drop('Heart Attack Risk', axis=1)
-        y = df['Heart Attack Risk']
-        RECURSOS_CARREGADOS["X_encoded"] = pd.get_dummies(X, drop_first=True)
-        RECURSOS_CARREGADOS["y"] = y
+        RECURSOS_CARREGADOS["preprocessador"] = PreprocessadorCompilado.from_scaler(df, RECURSOS_CARREGADOS["scaler"])
+        RECURSOS_CARREGADOS["y"] = df[COLUNA_ALVO]
 
     except FileNotFoundError as e:
         print(f"❌ ERRO CRÍTICO: Arquivo não encontrado: {e.filename}")
@@ -290,9 +288,9 @@ def executar_previsao_paciente():
     os.system('cls' if os.name == 'nt' else 'clear')
     print("="*50, f"\nMódulo de Previsão de Risco Cardíaco\n", "="*50, sep="")
     
-    modelo, scaler, df, X_encoded, y = (
-        RECURSOS_CARREGADOS["modelo"], RECURSOS_CARREGADOS["scaler"], RECURSOS_CARREGADOS["df"],
-        RECURSOS_CARREGADOS["X_encoded"], RECURSOS_CARREGADOS["y"]
+    modelo, preprocessador, df, y = (
+        RECURSOS_CARREGADOS["modelo"], RECURSOS_CARREGADOS["preprocessador"], RECURSOS_CARREGADOS["df"],
+        RECURSOS_CARREGADOS["y"]
     )
     
     try:
@@ -302,9 +300,8 @@ def executar_previsao_paciente():
     except ValueError:
         print("Entrada inválida."); return
         
-    paciente_a_prever, _ = X_encoded.align(pd.DataFrame(columns=scaler.get_feature_names_out()), axis=1, fill_value=0)
-    paciente_a_prever = paciente_a_prever.iloc[[idx]]
-    paciente_scaled = scaler.transform(paciente_a_prever)
+    # Só a linha do paciente é codificada, direto na ordem de features do scaler
+    paciente_scaled = preprocessador.transform(df.iloc[[idx]], escalar=True)
     
     previsao, probabilidade = modelo.predict(paciente_scaled)[0], modelo.predict_proba(paciente_scaled)[0]
     
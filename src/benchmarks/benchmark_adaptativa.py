@@ -0,0 +1,96 @@
+# src/benchmarks/benchmark_adaptativa.py
+import time
+import numpy as np
+import pandas as pd
+
+from src.estrutura_de_dados.estrutura_adaptativa import AdaptiveStructure, REPRESENTACOES
+
+
+def gerar_fases(chaves, valores, n_operacoes=20_000, largura_intervalo=50, tamanho_lote=500, seed=42):
+    """
+    Carga em fases, cada uma favorecendo uma representação diferente:
+    carga inicial (insert), buscas pontuais, buscas em lote, consultas de intervalo e
+    uma fase mista de busca/remoção. Retorna [(nome da fase, [(operação, argumentos), ...])].
+    """
+    rng = np.random.default_rng(seed)
+    chaves, valores = np.asarray(chaves).tolist(), np.asarray(valores).tolist()
+    limite = 2 * max(chaves) + 1
+    consultas = rng.integers(0, limite, size=n_operacoes).tolist()
+    inicios = rng.integers(0, limite, size=n_operacoes // 10).tolist()
+    lotes = [rng.integers(0, limite, size=tamanho_lote) for _ in range(n_operacoes // tamanho_lote * 4)]
+    mista = rng.integers(0, limite, size=n_operacoes).tolist()
+    return [
+        ("Carga Inicial", [("insert", (k, v)) for k, v in zip(chaves, valores)]),
+        ("Buscas Pontuais", [("search", (k,)) for k in consultas]),
+        ("Buscas em Lote", [("search_many", (lote,)) for lote in lotes]),
+        ("Intervalos", [("range", (lo, lo + largura_intervalo)) for lo in inicios]),
+        ("Busca/Remoção", [("remove" if i % 4 == 0 else "search", (k,)) for i, k in enumerate(mista)]),
+    ]
+
+
+def _executar_fases(fases, metodos):
+    """Roda as fases chamando 'metodos' e retorna ({fase: tempo em s}, respostas normalizadas)."""
+    tempos, respostas = {}, []
+    for nome, operacoes in fases:
+        start = time.perf_counter()
+        resultados = [metodos[op](*args) for op, args in operacoes]
+        tempos[nome] = time.perf_counter() - start
+        respostas.append(resultados)
+    return tempos, respostas
+
+
+def _normalizar(respostas):
+    """search_many devolve arrays; converte para listas comparáveis entre as estruturas."""
+    normalizadas = []
+    for resultados in respostas:
+        for r in resultados:
+            if isinstance(r, tuple) and len(r) == 2 and isinstance(r[1], np.ndarray):
+                valores, encontrados = r
+                r = [v if f else None for v, f in zip(valores.tolist(), encontrados.tolist())]
+            normalizadas.append(r)
+    return normalizadas
+
+
+def executar_benchmark_adaptativa(chaves, valores, n_operacoes=20_000, seed=42):
+    """
+    Compara a AdaptiveStructure com cada representação fixa (Tabela Hash, IntHashMap,
+    Árvore B+) numa carga que muda de fase. Confere que todas devolvem as mesmas respostas.
+    Retorna (tempos, trocas):
+    - tempos: tempo (ms) de cada fase por estrutura, com o total e o tempo gasto em migrações;
+    - trocas: o histórico de decisões da estrutura adaptativa (troca/adiada, custos e ganho medido).
+    """
+    fases = gerar_fases(chaves, valores, n_operacoes=n_operacoes, seed=seed)
+    linhas, referencia = [], None
+    for classe in REPRESENTACOES:
+        print(f"--- Benchmarking: {classe.nome} (fixa) ---")
+        rep = classe([])
+        metodos = {"insert": rep.inserir, "search": rep.buscar, "remove": rep.remover,
+                   "range": rep.intervalo, "search_many": rep.buscar_muitos}
+        tempos, respostas = _executar_fases(fases, metodos)
+        respostas = _normalizar(respostas)
+        if referencia is None:
+            referencia = respostas
+        elif respostas != referencia:
+            raise AssertionError(f"{classe.nome} devolveu respostas diferentes da Tabela Hash.")
+        linhas.append(dict(Estrutura=classe.nome, **tempos, Migracoes=0, TempoMigracao=0.0))
+
+    print("--- Benchmarking: Estrutura Adaptativa ---")
+    AdaptiveStructure._custos_calibrados()  # A calibração (uma vez por processo) fica fora do tempo medido
+    adaptativa = AdaptiveStructure()
+    metodos = {"insert": adaptativa.insert, "search": adaptativa.search, "remove": adaptativa.remove,
+               "range": adaptativa.range, "search_many": adaptativa.search_many}
+    tempos, respostas = _executar_fases(fases, metodos)
+    if _normalizar(respostas) != referencia:
+        raise AssertionError("A Estrutura Adaptativa devolveu respostas diferentes da Tabela Hash.")
+    linhas.append(dict(Estrutura=f"Adaptativa (termina em {adaptativa.representacao})", **tempos,
+                       Migracoes=adaptativa.migracoes, TempoMigracao=adaptativa.tempo_migracao_s))
+
+    df_tempos = pd.DataFrame(linhas)
+    nomes_fases = [nome for nome, _ in fases]
+    df_tempos["Total"] = df_tempos[nomes_fases].sum(axis=1)
+    df_tempos[nomes_fases + ["Total", "TempoMigracao"]] *= 1e3
+    df_tempos = df_tempos.rename(columns={**{nome: f"{nome} (ms)" for nome in nomes_fases + ["Total"]},
+                                          "Migracoes": "Migrações", "TempoMigracao": "Migrações (ms)"})
+
+    df_trocas = pd.DataFrame(adaptativa.historico).drop(columns=["mistura"], errors="ignore")
+    return df_tempos, df_trocas
@@ -0,0 +1,66 @@
+# src/benchmarks/benchmark_arvores.py
+import time
+import numpy as np
+import pandas as pd
+
+from src.estrutura_de_dados.arvore_avl import AVLTree
+from src.estrutura_de_dados.arvore_b_mais import BPlusTree
+
+
+def _tempo_medio(funcao, argumentos):
+    """Executa 'funcao' para cada argumento e retorna o tempo médio por chamada em µs."""
+    start = time.perf_counter()
+    for argumento in argumentos: funcao(*argumento)
+    return (time.perf_counter() - start) / len(argumentos) * 1e6
+
+
+def executar_benchmark_arvores(df, colunas=('Age', 'Cholesterol', 'Income'), n_itens=None,
+                               n_consultas=1000, largura_intervalo=0.05, order=64):
+    """
+    Compara AVLTree e BPlusTree (inserção uma a uma e carga em lote) em cada coluna numérica:
+    tempo de construção, busca pontual e consulta por intervalo.
+    'n_itens' acima do tamanho do DataFrame é atingido reamostrando a coluna com reposição,
+    para simular extrações maiores. 'largura_intervalo' é a fração da faixa de valores
+    coberta por cada consulta de intervalo.
+    """
+    rng = np.random.default_rng(42)
+    linhas = []
+    for coluna in colunas:
+        valores = df[coluna].to_numpy()
+        if n_itens is not None and n_itens != len(valores):
+            valores = rng.choice(valores, size=n_itens, replace=True)
+        chaves = valores.tolist()
+        print(f"Testando coluna '{coluna}' com N={len(chaves)}...")
+
+        consultas_pontuais = [(k,) for k in rng.choice(valores, size=n_consultas).tolist()]
+        minimo, maximo = float(valores.min()), float(valores.max())
+        largura = (maximo - minimo) * largura_intervalo
+        inicios = rng.uniform(minimo, maximo - largura, size=n_consultas)
+        consultas_intervalo = [(lo, lo + largura) for lo in inicios.tolist()]
+
+        avl = AVLTree()
+        start = time.perf_counter()
+        for k in chaves: avl.insert(k)
+        construcao_avl = time.perf_counter() - start
+
+        bplus = BPlusTree(order)
+        start = time.perf_counter()
+        for i, k in enumerate(chaves): bplus.insert(k, i)
+        construcao_bplus = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ordem = np.argsort(valores, kind='stable')
+        bplus_lote = BPlusTree.bulk_load(valores[ordem], ordem, order=order)
+        construcao_lote = time.perf_counter() - start
+
+        for nome, arvore, construcao in (("Árvore AVL", avl, construcao_avl),
+                                         (f"Árvore B+ (ordem {order})", bplus, construcao_bplus),
+                                         (f"Árvore B+ (bulk load, ordem {order})", bplus_lote, construcao_lote)):
+            linhas.append({
+                "Coluna": coluna, "Estrutura": nome, "N": len(chaves),
+                "Construção (s)": construcao,
+                "Busca Pontual (µs)": _tempo_medio(arvore.search, consultas_pontuais),
+                "Consulta Intervalo (µs)": _tempo_medio(arvore.range, consultas_intervalo),
+                "Memória (bytes)": arvore.get_memory_usage(),
+            })
+    return pd.DataFrame(linhas)
@@ -0,0 +1,50 @@
+# src/benchmarks/benchmark_cache.py
+import time
+import numpy as np
+import pandas as pd
+
+from src.estrutura_de_dados.cache_lru import CachedStructure
+
+
+def gerar_consultas_zipf(chaves, n, s=1.1, seed=42):
+    """
+    Sorteia 'n' consultas sobre 'chaves' com popularidade de Zipf: a chave de posição r
+    é acessada com probabilidade proporcional a 1 / r^s (poucas chaves concentram os acessos).
+    """
+    rng = np.random.default_rng(seed)
+    pesos = 1.0 / np.arange(1, len(chaves) + 1) ** s
+    indices = rng.choice(len(chaves), size=n, p=pesos / pesos.sum())
+    return [chaves[i] for i in indices]
+
+
+def executar_benchmark_cache(estruturas, chaves, n_consultas=100_000, expoentes=(0.8, 1.1, 1.4),
+                             capacidades=(64, 512), ttl_s=None, max_bytes=None):
+    """
+    Compara buscas diretas com buscas através de um CachedStructure (LRU) em cargas Zipf.
+    estruturas: dict nome -> instância já populada com 'chaves'.
+    Também confere que o cache devolve exatamente as mesmas respostas da estrutura.
+    """
+    linhas = []
+    for s in expoentes:
+        consultas = gerar_consultas_zipf(chaves, n_consultas, s=s)
+        for nome, estrutura in estruturas.items():
+            start = time.perf_counter()
+            esperado = [estrutura.search(k) for k in consultas]
+            tempo_direto = time.perf_counter() - start
+            for capacidade in capacidades:
+                com_cache = CachedStructure(estrutura, capacity=capacidade, ttl_s=ttl_s, max_bytes=max_bytes)
+                start = time.perf_counter()
+                obtido = [com_cache.search(k) for k in consultas]
+                tempo_cache = time.perf_counter() - start
+                if obtido != esperado:
+                    raise AssertionError(f"O cache devolveu respostas diferentes da estrutura em {nome}.")
+                estatisticas = com_cache.get_statistics()
+                linhas.append({
+                    "Estrutura": nome, "Zipf (s)": s, "Capacidade do Cache": capacidade,
+                    "Taxa de Acerto": estatisticas["taxa_acerto"],
+                    "Direto (µs/busca)": tempo_direto / n_consultas * 1e6,
+                    "Com Cache (µs/busca)": tempo_cache / n_consultas * 1e6,
+                    "Speedup": tempo_direto / tempo_cache,
+                    "Memória do Cache (bytes)": com_cache.cache.get_memory_usage(),
+                })
+    return pd.DataFrame(linhas)
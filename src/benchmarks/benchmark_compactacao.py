@@ -0,0 +1,51 @@
+# src/benchmarks/benchmark_compactacao.py
+import time
+import pandas as pd
+
+from src.modelo.preprocessamento import carregar_dataset, compactar_dataframe, tamanho_flags_empacotadas
+
+
+def _carregar_medindo(funcao, n_repeticoes):
+    """Executa 'funcao' n_repeticoes vezes e retorna (último resultado, menor tempo em segundos)."""
+    melhor, resultado = float('inf'), None
+    for _ in range(n_repeticoes):
+        start = time.perf_counter()
+        resultado = funcao()
+        melhor = min(melhor, time.perf_counter() - start)
+    return resultado, melhor
+
+
+def executar_benchmark_compactacao(caminho, n_repeticoes=3):
+    """
+    Compara o carregamento do dataset sem compactação, compactado (padrão do carregar_dataset)
+    e compactado com floats em float32. Retorna (resumo, detalhe por coluna):
+    - resumo: memória (memory_usage com deep=True), tempo de carga e redução de cada modo;
+    - detalhe: tipo e bytes de cada coluna antes e depois da compactação padrão.
+    """
+    original, tempo_original = _carregar_medindo(lambda: carregar_dataset(caminho, compacto=False), n_repeticoes)
+    compacto, tempo_compacto = _carregar_medindo(lambda: carregar_dataset(caminho), n_repeticoes)
+    compacto_32, tempo_compacto_32 = _carregar_medindo(
+        lambda: compactar_dataframe(carregar_dataset(caminho, compacto=False), float32=True), n_repeticoes)
+
+    memoria_original = original.memory_usage(deep=True).sum()
+    linhas = []
+    for modo, df, tempo in (("Original", original, tempo_original), ("Compacto", compacto, tempo_compacto),
+                            ("Compacto (float32)", compacto_32, tempo_compacto_32)):
+        memoria = df.memory_usage(deep=True).sum()
+        linhas.append({
+            "Modo": modo, "Memória (MB)": memoria / 1e6, "Tempo de Carga (ms)": tempo * 1e3,
+            "Redução": 1 - memoria / memoria_original,
+            # O que as colunas bool ocupariam como bits, fora do pandas (referência, não aplicado)
+            "Flags em Bits (bytes)": tamanho_flags_empacotadas(df),
+        })
+
+    bytes_original = original.memory_usage(deep=True, index=False)
+    bytes_compacto = compacto.memory_usage(deep=True, index=False)
+    detalhe = pd.DataFrame({
+        "Coluna": original.columns,
+        "Tipo Original": [str(t) for t in original.dtypes],
+        "Tipo Compacto": [str(t) for t in compacto.dtypes],
+        "Bytes Original": bytes_original.to_numpy(),
+        "Bytes Compacto": bytes_compacto.to_numpy(),
+    })
+    return pd.DataFrame(linhas), detalhe
@@ -0,0 +1,76 @@
+# src/benchmarks/benchmark_espacial.py
+import math
+import time
+import numpy as np
+import pandas as pd
+
+from src.estrutura_de_dados.hash_espacial import SpatialHashGrid
+from src.estrutura_de_dados.kd_tree import KDTree
+
+
+def _tempo_medio(funcao, argumentos):
+    """Executa 'funcao' para cada argumento e retorna (resultados, tempo médio por chamada em µs)."""
+    start = time.perf_counter()
+    resultados = [funcao(*argumento) for argumento in argumentos]
+    return resultados, (time.perf_counter() - start) / len(argumentos) * 1e6
+
+
+def executar_benchmark_espacial(df, colunas=('Age', 'Cholesterol'), tamanhos=None, raios=(2, 5, 10, 25),
+                                n_consultas=1000, cell_size=5.0, seed=42):
+    """
+    Compara o SpatialHashGrid com a KDTree em (Age, Cholesterol) para vários N:
+    construção, vizinho mais próximo (KDTree.find_nearest_neighbor x grade) e busca por raio
+    (a KDTree não tem; a referência é uma máscara NumPy sobre todos os pontos).
+    N acima do tamanho do DataFrame é atingido reamostrando as linhas com reposição.
+    As consultas são pontos inteiros sorteados na faixa das duas colunas, como no menu.
+    Confere as distâncias do vizinho e os conjuntos por raio. Retorna um DataFrame.
+    """
+    rng = np.random.default_rng(seed)
+    tamanhos = tamanhos or (1000, len(df), 4 * len(df))
+    x, y = colunas
+    base = df[[x, y]].to_numpy(dtype=np.float64)
+    minimos, maximos = base.min(axis=0), base.max(axis=0)
+    consultas = np.column_stack([rng.integers(int(minimos[i]), int(maximos[i]) + 1, size=n_consultas) for i in (0, 1)])
+    lista_consultas = [(tuple(c),) for c in consultas.tolist()]
+    linhas = []
+    for n in tamanhos:
+        pontos = base[rng.choice(len(base), size=n, replace=n > len(base))] if n != len(base) else base
+        print(f"Testando N={n}...")
+
+        start = time.perf_counter()
+        kd = KDTree(pontos.tolist())
+        construcao_kd = time.perf_counter() - start
+        start = time.perf_counter()
+        grade = SpatialHashGrid.from_arrays(pontos[:, 0], pontos[:, 1], cell_size)
+        construcao_grade = time.perf_counter() - start
+
+        vizinhos_kd, tempo_kd = _tempo_medio(kd.find_nearest_neighbor, lista_consultas)
+        vizinhos_grade, tempo_grade = _tempo_medio(grade.find_nearest_neighbor, lista_consultas)
+        for (q,), a, b in zip(lista_consultas, vizinhos_kd, vizinhos_grade):
+            if not math.isclose(math.dist(q, a), math.dist(q, b)):
+                raise AssertionError(f"Grade e KDTree discordam do vizinho mais próximo de {q} (N={n}).")
+        linhas.append({"N": n, "Operação": "Vizinho mais próximo", "Raio": None,
+                       "KD-Tree (µs)": tempo_kd, "Hash Espacial (µs)": tempo_grade, "NumPy (µs)": None,
+                       "Construção KD-Tree (ms)": construcao_kd * 1e3, "Construção Hash Espacial (ms)": construcao_grade * 1e3,
+                       "Pontos por Consulta": 1.0})
+
+        for raio in raios:
+            encontrados, tempo_grade = _tempo_medio(lambda q: grade.query_radius(q, raio), lista_consultas)
+            start = time.perf_counter()
+            referencia = [np.flatnonzero(((pontos - q) ** 2).sum(axis=1) <= raio * raio) for q in consultas]
+            tempo_numpy = (time.perf_counter() - start) / n_consultas * 1e6
+            if any(sorted(a) != b.tolist() for a, b in zip(encontrados, referencia)):
+                raise AssertionError(f"Busca por raio {raio} da grade divergiu da referência (N={n}).")
+            linhas.append({"N": n, "Operação": "Busca por raio", "Raio": raio,
+                           "KD-Tree (µs)": None, "Hash Espacial (µs)": tempo_grade, "NumPy (µs)": tempo_numpy,
+                           "Construção KD-Tree (ms)": None, "Construção Hash Espacial (ms)": None,
+                           "Pontos por Consulta": float(np.mean([len(a) for a in encontrados]))})
+
+        # Inserção e remoção de um ponto (O(1)); a KDTree não insere e só marca remoções
+        novos = [(tuple(c),) for c in consultas.tolist()]
+        ids, tempo_insercao = _tempo_medio(grade.insert, novos)
+        _, tempo_remocao = _tempo_medio(grade.remove_id, [(i,) for i in ids])
+        linhas.append({"N": n, "Operação": "Inserção / Remoção", "Raio": None,
+                       "KD-Tree (µs)": None, "Hash Espacial (µs)": (tempo_insercao + tempo_remocao) / 2, "NumPy (µs)": None,
+                       "Construção KD-Tree (ms)": None, "Construção Hash Espacial (ms)": None, "Pontos por Consulta": None})
+    return pd.DataFrame(linhas)
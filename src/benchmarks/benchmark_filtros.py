@@ -0,0 +1,138 @@
+# src/benchmarks/benchmark_filtros.py
+import time
+import numpy as np
+import pandas as pd
+
+from src.estrutura_de_dados.bloom_filter2 import CountingBloomFilter, calcular_parametros
+from src.estrutura_de_dados.filtro_cuckoo import CuckooFilter
+from src.estrutura_de_dados.bloom_filter_escalavel import ScalableBloomFilter
+
+
+def _medir_filtro(filtro, itens, itens_ausentes):
+    """Mede inserção, busca, taxa de falsos positivos e remoção de um filtro."""
+    res = {}
+    start = time.perf_counter()
+    for item in itens: filtro.insert(item)
+    tempo = time.perf_counter() - start
+    res["Inserções/s"] = len(itens) / tempo if tempo > 0 else float('inf')
+
+    memoria = filtro.get_memory_usage()
+    res["Memória (bytes)"] = memoria
+    res["Bits por Item"] = memoria * 8 / len(itens)
+
+    start = time.perf_counter()
+    encontrados = sum(1 for item in itens if filtro.search(item))
+    tempo = time.perf_counter() - start
+    res["Buscas/s"] = len(itens) / tempo if tempo > 0 else float('inf')
+    res["Falsos Negativos"] = len(itens) - encontrados
+
+    # Itens que nunca foram inseridos: qualquer resposta positiva é falso positivo
+    falsos_positivos = sum(1 for item in itens_ausentes if filtro.search(item))
+    res["FPR Empírica"] = falsos_positivos / len(itens_ausentes)
+
+    start = time.perf_counter()
+    for item in itens: filtro.remove(item)
+    tempo = time.perf_counter() - start
+    res["Remoções/s"] = len(itens) / tempo if tempo > 0 else float('inf')
+    return res
+
+
+def executar_benchmark_filtros(itens, itens_ausentes, fpr_alvo=0.01):
+    """
+    Compara o Counting Bloom Filter (configuração usada no main.py: size=N*20, 7 hashes)
+    com o Cuckoo Filter dimensionado para a mesma quantidade de itens.
+    Retorna um DataFrame com FPR, bits por item e operações por segundo.
+    """
+    n = len(itens)
+    filtros = {
+        "Counting Bloom Filter": CountingBloomFilter(size=n*20, hash_count=7),
+        "Cuckoo Filter": CuckooFilter(capacity=n, fpr=fpr_alvo),
+    }
+    resultados = {}
+    for nome, filtro in filtros.items():
+        print(f"--- Benchmarking: {nome} ---")
+        resultados[nome] = _medir_filtro(filtro, itens, itens_ausentes)
+    return pd.DataFrame.from_dict(resultados, orient='index')
+
+
+def medir_fpr_empirica(filtro, n_inseridos, n_consultas=2_000_000, tamanho_lote=250_000):
+    """
+    Passa 'n_consultas' chaves inteiras que NUNCA foram inseridas (a partir de 'n_inseridos')
+    por search_many, em lotes, e retorna a fração de respostas positivas e as buscas/s.
+    Supõe que o filtro foi populado com as chaves 0 .. n_inseridos-1.
+    """
+    positivos = 0
+    start = time.perf_counter()
+    for inicio in range(n_inseridos, n_inseridos + n_consultas, tamanho_lote):
+        fim = min(inicio + tamanho_lote, n_inseridos + n_consultas)
+        positivos += int(np.count_nonzero(filtro.search_many(np.arange(inicio, fim, dtype=np.int64))))
+    tempo = time.perf_counter() - start
+    return positivos / n_consultas, (n_consultas / tempo if tempo > 0 else float('inf'))
+
+
+def planejar_capacidade(capacidades, fprs_alvo, n_consultas=2_000_000, configuracoes_fixas=None):
+    """
+    Para cada combinação de capacidade e FPR alvo, dimensiona um CountingBloomFilter com
+    calcular_parametros, insere 'capacidade' chaves e mede a FPR empírica contra a teórica.
+    'configuracoes_fixas' aceita pares (size, hash_count) já usados no projeto (ex.: N*20 e 7)
+    para saber que FPR eles realmente entregam.
+    Retorna um DataFrame com uma linha por configuração.
+    """
+    casos = []
+    for capacidade in capacidades:
+        for fpr in fprs_alvo:
+            size, hash_count = calcular_parametros(capacidade, fpr)
+            casos.append((f"alvo {fpr:g}", capacidade, fpr, size, hash_count))
+        for size, hash_count in (configuracoes_fixas or []):
+            casos.append((f"fixo m={size}, k={hash_count}", capacidade, None, size, hash_count))
+
+    linhas = []
+    for rotulo, capacidade, fpr, size, hash_count in casos:
+        print(f"Testando N={capacidade} ({rotulo})...")
+        filtro = CountingBloomFilter(size=size, hash_count=hash_count)
+        start = time.perf_counter()
+        filtro.insert_many(np.arange(capacidade, dtype=np.int64))
+        tempo_insercao = time.perf_counter() - start
+        fpr_empirica, buscas_s = medir_fpr_empirica(filtro, capacidade, n_consultas)
+        estatisticas = filtro.get_statistics()
+        linhas.append({
+            "Configuração": rotulo, "N": capacidade, "FPR Alvo": fpr,
+            "Posições (m)": size, "Hashes (k)": hash_count,
+            "FPR Teórica": estatisticas["fpr_teorica"], "FPR Empírica": fpr_empirica,
+            "Bits por Item": filtro.get_memory_usage() * 8 / capacidade,
+            "Ocupação": estatisticas["ocupacao"], "Contador Máximo": estatisticas["contador_maximo"],
+            "Contadores Saturados": estatisticas["contadores_saturados"], "Overflows": estatisticas["overflows"],
+            "Inserções/s": capacidade / tempo_insercao if tempo_insercao > 0 else float('inf'),
+            "Buscas/s": buscas_s,
+        })
+    return pd.DataFrame(linhas)
+
+
+def simular_crescimento(capacidade_inicial, n_final, n_pontos=5, fpr=0.01, n_consultas=200_000):
+    """
+    Insere chaves 0 .. n_final-1 em um CountingBloomFilter de tamanho fixo (dimensionado para
+    'capacidade_inicial') e em um ScalableBloomFilter, medindo a FPR empírica de ambos
+    em 'n_pontos' momentos do crescimento.
+    Retorna (DataFrame do crescimento, relatório por camada do filtro escalável).
+    """
+    fixo = CountingBloomFilter.from_capacity(capacidade_inicial, fpr)
+    escalavel = ScalableBloomFilter(initial_capacity=capacidade_inicial, fpr=fpr)
+    pontos = np.linspace(n_final / n_pontos, n_final, n_pontos).astype(int)
+    linhas, inseridos = [], 0
+    for ponto in pontos:
+        novas = np.arange(inseridos, ponto, dtype=np.int64)
+        fixo.insert_many(novas)
+        for chave in novas.tolist(): escalavel.insert(chave)
+        inseridos = ponto
+        # As consultas começam depois de n_final, então nunca foram inseridas
+        consultas = np.arange(n_final, n_final + n_consultas, dtype=np.int64)
+        linhas.append({
+            "Itens Inseridos": inseridos,
+            "FPR Fixo": np.count_nonzero(fixo.search_many(consultas)) / n_consultas,
+            "FPR Escalável": np.count_nonzero(escalavel.search_many(consultas)) / n_consultas,
+            "FPR Teórica Escalável": escalavel.expected_fpr(),
+            "Camadas": len(escalavel.layers),
+            "Memória Fixo (bytes)": fixo.get_memory_usage(),
+            "Memória Escalável (bytes)": escalavel.get_memory_usage(),
+        })
+    return pd.DataFrame(linhas), pd.DataFrame(escalavel.get_layer_statistics())
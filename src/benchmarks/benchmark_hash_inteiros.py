@@ -0,0 +1,68 @@
+# src/benchmarks/benchmark_hash_inteiros.py
+import time
+import numpy as np
+import pandas as pd
+
+from src.estrutura_de_dados.tabela_hash import HashTable
+from src.estrutura_de_dados.cuckoo_hashing import CuckooHashing
+from src.estrutura_de_dados.tabela_hash_inteiros import IntHashMap
+
+
+def _por_segundo(n, tempo):
+    return n / tempo if tempo > 0 else float('inf')
+
+
+def executar_benchmark_hash_inteiros(chaves, valores, n_consultas=100_000, seed=42):
+    """
+    Compara HashTable, CuckooHashing e IntHashMap (uma chave por vez e em lote) com chaves
+    e valores inteiros, como os índices de linha -> idade usados no main.py.
+    As consultas sorteiam chaves em [0, 2 * max(chaves)], então parte delas não existe.
+    Confere que todas as estruturas devolvem as mesmas respostas.
+    Retorna um DataFrame com inserções/s, buscas/s, memória e bytes por entrada.
+    """
+    chaves = np.asarray(chaves, dtype=np.int64)
+    valores = np.asarray(valores, dtype=np.int64)
+    consultas = np.random.default_rng(seed).integers(0, 2 * int(chaves.max()) + 1, size=n_consultas)
+    lista_chaves, lista_valores, lista_consultas = chaves.tolist(), valores.tolist(), consultas.tolist()
+    n = len(chaves)
+
+    linhas, referencia = [], None
+    estruturas = {
+        "Tabela Hash": lambda: HashTable(size=n * 2),
+        "Cuckoo Hashing": lambda: CuckooHashing(size=n * 2),
+        "IntHashMap": lambda: IntHashMap(capacity=n),
+    }
+    for nome, criar in estruturas.items():
+        print(f"--- Benchmarking: {nome} ---")
+        estrutura = criar()
+        start = time.perf_counter()
+        for k, v in zip(lista_chaves, lista_valores): estrutura.insert(k, v)
+        tempo_insercao = time.perf_counter() - start
+        start = time.perf_counter()
+        respostas = [estrutura.search(k) for k in lista_consultas]
+        tempo_busca = time.perf_counter() - start
+        if referencia is None:
+            referencia = respostas
+        elif respostas != referencia:
+            raise AssertionError(f"{nome} devolveu respostas diferentes da Tabela Hash.")
+        linhas.append((nome, tempo_insercao, tempo_busca, estrutura.get_memory_usage()))
+
+    print("--- Benchmarking: IntHashMap (lote) ---")
+    estrutura = IntHashMap(capacity=n)
+    start = time.perf_counter()
+    estrutura.insert_many(chaves, valores)
+    tempo_insercao = time.perf_counter() - start
+    start = time.perf_counter()
+    obtidos, encontrados = estrutura.get_many(consultas)
+    tempo_busca = time.perf_counter() - start
+    if [v if f else None for v, f in zip(obtidos.tolist(), encontrados.tolist())] != referencia:
+        raise AssertionError("IntHashMap.get_many devolveu respostas diferentes da Tabela Hash.")
+    linhas.append(("IntHashMap (insert_many / get_many)", tempo_insercao, tempo_busca, estrutura.get_memory_usage()))
+
+    return pd.DataFrame([{
+        "Estrutura": nome,
+        "Inserções/s": _por_segundo(n, tempo_insercao),
+        "Buscas/s": _por_segundo(n_consultas, tempo_busca),
+        "Memória (bytes)": memoria,
+        "Bytes por Entrada": memoria / n,
+    } for nome, tempo_insercao, tempo_busca, memoria in linhas])
@@ -0,0 +1,65 @@
+# src/benchmarks/benchmark_indices.py
+import time
+import numpy as np
+import pandas as pd
+
+from src.estrutura_de_dados.indice_secundario import IndiceSecundario
+
+# Consultas típicas dos analistas: coluna -> valor, lista de valores (IN) ou (low, high)
+CONSULTAS_PADRAO = [
+    {"Country": "Brazil", "Sex": "Female"},
+    {"Country": "Germany", "Diet": "Healthy", "Cholesterol": (250, 300)},
+    {"Sex": "Male", "Diet": "Unhealthy"},
+    {"Cholesterol": (120, 140), "Age": (60, 70)},
+    {"Continent": ["Europe", "Asia"], "Sex": "Female", "Cholesterol": (300, 400)},
+]
+
+
+def _mascara_pandas(df, predicados):
+    """Mesma consulta feita com uma varredura completa do pandas (referência)."""
+    mascara = np.ones(len(df), dtype=bool)
+    for coluna, condicao in predicados.items():
+        if isinstance(condicao, tuple):
+            mascara &= df[coluna].between(*condicao).to_numpy()
+        elif isinstance(condicao, list):
+            mascara &= df[coluna].isin(condicao).to_numpy()
+        else:
+            mascara &= (df[coluna] == condicao).to_numpy()
+    return mascara
+
+
+def executar_benchmark_indices(df, consultas=CONSULTAS_PADRAO, repeticoes=50):
+    """
+    Cria índices de igualdade/intervalo nas colunas usadas pelas consultas, confere que o
+    resultado é idêntico ao filtro do pandas e compara os tempos médios por consulta.
+    """
+    indice = IndiceSecundario(df)
+    start = time.perf_counter()
+    for coluna in ("Country", "Continent", "Diet", "Sex"): indice.criar_indice(coluna, 'igualdade')
+    for coluna in ("Cholesterol", "Age"): indice.criar_indice(coluna, 'intervalo')
+    tempo_construcao = time.perf_counter() - start
+    print(f"Índices criados em {tempo_construcao:.4f} s ({indice.get_memory_usage():,} bytes).")
+
+    linhas = []
+    for predicados in consultas:
+        esperado = np.flatnonzero(_mascara_pandas(df, predicados))
+        obtido = indice.consultar(predicados)
+        if not np.array_equal(esperado, obtido):
+            raise AssertionError(f"Resultado divergente do pandas para {predicados}")
+
+        start = time.perf_counter()
+        for _ in range(repeticoes): df[_mascara_pandas(df, predicados)]
+        tempo_pandas = (time.perf_counter() - start) / repeticoes
+        start = time.perf_counter()
+        for _ in range(repeticoes): indice.consultar_df(predicados)
+        tempo_indice = (time.perf_counter() - start) / repeticoes
+
+        linhas.append({
+            "Consulta": ", ".join(f"{c}={v}" for c, v in predicados.items()),
+            "Linhas": len(obtido),
+            "Pandas (µs)": tempo_pandas * 1e6,
+            "Índice (µs)": tempo_indice * 1e6,
+            "Ganho (x)": tempo_pandas / tempo_indice if tempo_indice > 0 else float('inf'),
+            "Plano": indice.explicar(predicados).replace("\n", " | "),
+        })
+    return pd.DataFrame(linhas)
@@ -0,0 +1,64 @@
+# src/benchmarks/benchmark_kdtree.py
+import math
+import time
+import numpy as np
+import pandas as pd
+
+from src.estrutura_de_dados.kd_tree import KDTree
+
+
+def _tempo_por_consulta(funcao, consultas):
+    """Executa 'funcao' para cada consulta e retorna (resultados, µs por consulta)."""
+    start = time.perf_counter()
+    resultados = [funcao(q) for q in consultas]
+    return resultados, (time.perf_counter() - start) / len(consultas) * 1e6
+
+
+def executar_benchmark_kdtree(conjuntos, n_consultas=500, fracoes_removidas=(0.0, 0.5, 0.9), seed=42):
+    """
+    Compara as buscas de vizinho mais próximo da KDTree: a recursiva original
+    (find_nearest_neighbor_recursive), a iterativa compilada por dimensão
+    (find_nearest_neighbor) e a força bruta NumPy sobre os pontos não removidos.
+    'conjuntos' é um dicionário nome -> matriz de pontos (n x d). Para cada fração em
+    'fracoes_removidas', essa parte dos pontos é removida (remoção preguiçosa) antes das
+    consultas, que são pontos sorteados uniformemente na caixa dos dados.
+    Confere que as três devolvem a mesma distância. Retorna um DataFrame.
+    """
+    rng = np.random.default_rng(seed)
+    linhas = []
+    for nome, pontos in conjuntos.items():
+        pontos = np.asarray(pontos, dtype=np.float64)
+        n, d = pontos.shape
+        print(f"Testando {nome} (N={n}, {d} dimensões)...")
+        lista = pontos.tolist()
+        start = time.perf_counter()
+        arvore = KDTree(lista)
+        construcao = time.perf_counter() - start
+        consultas = rng.uniform(pontos.min(axis=0), pontos.max(axis=0), size=(n_consultas, d))
+        lista_consultas = consultas.tolist()
+        vivos = np.ones(n, dtype=bool)
+        for fracao in fracoes_removidas:
+            # Remove pontos até chegar à fração pedida (cumulativo entre as frações)
+            faltam = int(fracao * n) - int((~vivos).sum())
+            # Com pontos repetidos, remove() marca alguma cópia viva igual: o conjunto que sobra é o mesmo
+            for i in rng.permutation(np.flatnonzero(vivos))[:max(faltam, 0)].tolist():
+                if not arvore.remove(lista[i]):
+                    raise AssertionError(f"remove() não achou um ponto vivo em {nome}.")
+                vivos[i] = False
+            restantes = pontos[vivos]
+
+            recursiva, tempo_recursiva = _tempo_por_consulta(arvore.find_nearest_neighbor_recursive, lista_consultas)
+            iterativa, tempo_iterativa = _tempo_por_consulta(arvore.find_nearest_neighbor, lista_consultas)
+            bruta, tempo_bruta = _tempo_por_consulta(lambda q: restantes[np.argmin(((restantes - q) ** 2).sum(axis=1))], consultas)
+            for q, a, b, c in zip(lista_consultas, recursiva, iterativa, bruta):
+                da, db, dc = math.dist(q, a), math.dist(q, b), math.dist(q, c)
+                if not (math.isclose(da, dc, abs_tol=1e-9) and math.isclose(db, dc, abs_tol=1e-9)):
+                    raise AssertionError(f"Vizinhos divergentes em {nome} com {fracao:.0%} removidos.")
+
+            linhas.append({"Conjunto": nome, "N": n, "Dimensões": d, "Removidos (%)": 100 * (1 - vivos.mean()),
+                           "Construção (ms)": construcao * 1e3,
+                           "Recursiva (µs)": tempo_recursiva, "Iterativa (µs)": tempo_iterativa,
+                           "NumPy Força Bruta (µs)": tempo_bruta,
+                           "Ganho sobre a Recursiva": tempo_recursiva / tempo_iterativa,
+                           "Ganho sobre a Força Bruta": tempo_bruta / tempo_iterativa})
+    return pd.DataFrame(linhas)
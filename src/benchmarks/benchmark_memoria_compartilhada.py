@@ -0,0 +1,172 @@
+# src/benchmarks/benchmark_memoria_compartilhada.py
+import math
+import multiprocessing
+import os
+import tempfile
+import time
+import joblib
+import numpy as np
+import pandas as pd
+
+try:
+    import psutil  # Opcional: dá a memória privada (USS) em qualquer sistema
+except ImportError:
+    psutil = None
+
+try:
+    import resource  # Só existe em sistemas Unix
+except ImportError:
+    resource = None
+
+from src.estrutura_de_dados.tabela_hash import HashTable
+from src.estrutura_de_dados.tabela_hash_inteiros import IntHashMap
+from src.estrutura_de_dados.bloom_filter2 import CountingBloomFilter
+from src.estrutura_de_dados.memoria_compartilhada import SharedPublisher, SharedIntHashTable, SharedBloomFilter
+
+MODOS = ("Cópia por processo (HashTable)", "Cópia por processo (IntHashMap)", "Memória compartilhada")
+
+
+def medir_memoria():
+    """
+    (RSS, memória privada) do processo atual em bytes. A memória privada (USS) é a que
+    só este processo usa: páginas compartilhadas ficam de fora. Usa o psutil se estiver
+    instalado, senão /proc/self/smaps_rollup (Linux); sem nenhum dos dois, o pico de RSS
+    do resource e NaN para a privada.
+    """
+    if psutil is not None:
+        info = psutil.Process().memory_full_info()
+        return info.rss, getattr(info, 'uss', math.nan)
+    try:
+        campos = {}
+        with open('/proc/self/smaps_rollup') as f:
+            for linha in f:
+                partes = linha.split()
+                if len(partes) == 3 and partes[2] == 'kB':
+                    campos[partes[0].rstrip(':')] = int(partes[1]) * 1024
+        return campos['Rss'], campos['Private_Clean'] + campos['Private_Dirty']
+    except (OSError, KeyError, ValueError):
+        if resource is None:
+            return math.nan, math.nan
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024, math.nan
+
+
+def _carregar(modo, fonte):
+    """Estruturas de um trabalhador: a sua própria cópia (do arquivo) ou leitores do bloco compartilhado."""
+    if modo == MODOS[0]:
+        return joblib.load(fonte)
+    if modo == MODOS[1]:
+        chaves, valores, filtro = joblib.load(fonte)
+        tabela = IntHashMap(capacity=len(chaves))
+        tabela.insert_many(chaves, valores)
+        return tabela, filtro
+    return SharedIntHashTable(fonte[0]), SharedBloomFilter(fonte[1])
+
+
+def _trabalhador(modo, fonte, consultas, n_unitarias, tamanho_lote, barreira, conexao):
+    """Roda em cada processo: carrega as estruturas, espera os outros e faz as buscas."""
+    rss_antes, privada_antes = medir_memoria()
+    start = time.perf_counter()
+    tabela, filtro = _carregar(modo, fonte)
+    carga = time.perf_counter() - start
+    barreira.wait()
+
+    start = time.perf_counter()
+    soma, encontrados, positivos = 0, 0, 0
+    for i in range(0, len(consultas), tamanho_lote):
+        lote = consultas[i:i + tamanho_lote]
+        if isinstance(tabela, HashTable):
+            valores, achou = tabela.search_many(lote, default=0, dtype=np.int64)
+        else:
+            valores, achou = tabela.get_many(lote)
+        soma += int(valores[achou].sum())
+        encontrados += int(achou.sum())
+        positivos += int(filtro.search_many(lote).sum())
+    lote_s = time.perf_counter() - start
+    start = time.perf_counter()
+    for chave in consultas[:n_unitarias].tolist():
+        tabela.search(chave)
+        filtro.search(chave)
+    unitarias_s = time.perf_counter() - start
+
+    rss_depois, privada_depois = medir_memoria()
+    conexao.send({"carga_s": carga, "lote_s": lote_s, "unitarias_s": unitarias_s,
+                  "rss": rss_depois - rss_antes, "privada": privada_depois - privada_antes,
+                  "conferencia": (soma, encontrados, positivos)})
+    conexao.close()
+    if hasattr(tabela, 'close'):
+        tabela.close()
+        filtro.close()
+
+
+def _rodar(modo, fonte, consultas, n_processos, n_unitarias, tamanho_lote):
+    """Sobe os processos (spawn: começam sem herdar a memória do pai) e junta os resultados."""
+    ctx = multiprocessing.get_context('spawn')
+    barreira = ctx.Barrier(n_processos + 1)
+    conexoes, processos = [], []
+    for _ in range(n_processos):
+        receptor, emissor = ctx.Pipe(duplex=False)
+        processo = ctx.Process(target=_trabalhador, args=(modo, fonte, consultas, n_unitarias, tamanho_lote, barreira, emissor))
+        processo.start()
+        emissor.close()
+        conexoes.append(receptor)
+        processos.append(processo)
+    barreira.wait()
+    start = time.perf_counter()
+    resultados = [c.recv() for c in conexoes]
+    duracao = time.perf_counter() - start
+    for processo in processos:
+        processo.join()
+    return resultados, duracao
+
+
+def executar_benchmark_memoria_compartilhada(chaves, valores, processos=(1, 2, 4), n_consultas=200_000,
+                                             n_unitarias=20_000, tamanho_lote=10_000, seed=42):
+    """
+    Compara N processos consultando a mesma tabela hash + Bloom filter de três formas:
+    cada processo com sua cópia da HashTable carregada de um arquivo joblib (como o
+    'hashtable_para_teste_paralelo.joblib'), cada processo com seu próprio IntHashMap, e
+    todos lendo os blocos de memória compartilhada publicados por um SharedPublisher.
+    Metade das consultas existe. Confere que todos os modos dão as mesmas respostas.
+    Retorna um DataFrame com memória (RSS e privada, somadas nos processos, mais os blocos
+    compartilhados contados uma vez) e vazão agregada de buscas em lote e unitárias.
+    """
+    chaves, valores = np.asarray(chaves, dtype=np.int64), np.asarray(valores, dtype=np.int64)
+    rng = np.random.default_rng(seed)
+    ausentes = np.setdiff1d(rng.integers(0, 4 * (int(chaves.max()) + 1), size=n_consultas), chaves)[:n_consultas // 2]
+    consultas = rng.permutation(np.concatenate([rng.choice(chaves, size=n_consultas - len(ausentes)), ausentes]))
+
+    tabela = HashTable(size=len(chaves) * 2)
+    tabela.insert_many(chaves, valores)
+    filtro = CountingBloomFilter.from_capacity(len(chaves), fpr=0.01)
+    filtro.insert_many(chaves)
+    linhas = []
+    with tempfile.TemporaryDirectory() as pasta, SharedPublisher() as pub_tabela, SharedPublisher() as pub_filtro:
+        fontes = {MODOS[0]: os.path.join(pasta, "tabela_e_filtro.joblib"),
+                  MODOS[1]: os.path.join(pasta, "chaves_valores_e_filtro.joblib"),
+                  MODOS[2]: (pub_tabela.nome, pub_filtro.nome)}
+        joblib.dump((tabela, filtro), fontes[MODOS[0]])
+        joblib.dump((chaves, valores, filtro), fontes[MODOS[1]])
+        pub_tabela.publish_hash_table(tabela)
+        pub_filtro.publish_bloom_filter(filtro)
+        compartilhado = pub_tabela.get_memory_usage() + pub_filtro.get_memory_usage()
+        referencia = None
+        for n_processos in processos:
+            for modo in MODOS:
+                print(f"Testando {modo} com {n_processos} processo(s)...")
+                resultados, duracao = _rodar(modo, fontes[modo], consultas, n_processos, n_unitarias, tamanho_lote)
+                for r in resultados:
+                    referencia = referencia or r["conferencia"]
+                    if r["conferencia"] != referencia:
+                        raise AssertionError(f"{modo} devolveu respostas diferentes.")
+                extra = compartilhado if modo == MODOS[2] else 0
+                privada = sum(r["privada"] for r in resultados)
+                linhas.append({"Modo": modo, "Processos": n_processos,
+                               "RSS Somado (MB)": sum(r["rss"] for r in resultados) / 2**20,
+                               "Memória Privada Somada (MB)": privada / 2**20,
+                               "Blocos Compartilhados (MB)": extra / 2**20,
+                               "Memória Total (MB)": (privada + extra) / 2**20,
+                               "Carga por Processo (ms)": np.mean([r["carga_s"] for r in resultados]) * 1e3,
+                               "Buscas em Lote/s (agregado)": 2 * n_processos * len(consultas) / max(r["lote_s"] for r in resultados),
+                               "Buscas Unitárias/s (agregado)": 2 * n_processos * n_unitarias / max(r["unitarias_s"] for r in resultados),
+                               "Duração (s)": duracao})
+    return pd.DataFrame(linhas)
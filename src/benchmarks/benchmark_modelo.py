@@ -0,0 +1,116 @@
+# src/benchmarks/benchmark_modelo.py
+import time
+import numpy as np
+import pandas as pd
+
+from src.modelo.arvore_compilada import CompiledDecisionTree
+from src.modelo.preprocessamento import preparar_dataframe, codificar_features
+
+
+def verificar_paridade(compilado, modelo, scaler, X_alinhado):
+    """
+    Compara a árvore compilada com o sklearn em TODAS as linhas (classes e probabilidades),
+    tanto no caminho vetorizado quanto no de uma linha. Lança AssertionError na primeira divergência.
+    X_alinhado: DataFrame com as colunas na ordem de scaler.feature_names_in_.
+    """
+    X_escalado = scaler.transform(X_alinhado)
+    X_bruto = X_alinhado.to_numpy(dtype=np.float64)
+    esperado, proba_esperada = modelo.predict(X_escalado), modelo.predict_proba(X_escalado)
+
+    divergentes = np.flatnonzero(compilado.predict(X_bruto) != esperado)
+    if len(divergentes):
+        raise AssertionError(f"{len(divergentes)} previsões divergentes (primeira na linha {divergentes[0]}).")
+    if not np.allclose(compilado.predict_proba(X_bruto), proba_esperada):
+        raise AssertionError("Probabilidades divergentes no caminho vetorizado.")
+    for i, linha in enumerate(X_bruto.tolist()):
+        if compilado.predict_one(linha) != esperado[i]:
+            raise AssertionError(f"Previsão divergente no caminho de uma linha (linha {i}).")
+    return len(X_bruto)
+
+
+def executar_benchmark_modelo(modelo, scaler, X_alinhado, n_amostras=300):
+    """
+    Confere a paridade com o sklearn no conjunto inteiro e compara a latência:
+    - uma linha: scaler.transform + predict + predict_proba (como em executar_previsao_paciente)
+      contra predict_one + predict_proba_one;
+    - lote: o conjunto inteiro de uma vez.
+    Retorna (linhas verificadas, DataFrame com os tempos).
+    """
+    compilado = CompiledDecisionTree.from_sklearn(modelo, scaler)
+    linhas_verificadas = verificar_paridade(compilado, modelo, scaler, X_alinhado)
+    X_bruto = X_alinhado.to_numpy(dtype=np.float64)
+    amostras = np.random.default_rng(42).integers(0, len(X_alinhado), size=n_amostras)
+
+    start = time.perf_counter()
+    for i in amostras:
+        linha_escalada = scaler.transform(X_alinhado.iloc[[i]])
+        modelo.predict(linha_escalada); modelo.predict_proba(linha_escalada)
+    sklearn_uma = (time.perf_counter() - start) / n_amostras
+
+    linhas = [X_bruto[i].tolist() for i in amostras]
+    start = time.perf_counter()
+    for linha in linhas:
+        compilado.predict_one(linha); compilado.predict_proba_one(linha)
+    compilado_uma = (time.perf_counter() - start) / n_amostras
+
+    start = time.perf_counter()
+    X_escalado = scaler.transform(X_alinhado)
+    modelo.predict(X_escalado); modelo.predict_proba(X_escalado)
+    sklearn_lote = (time.perf_counter() - start) / len(X_bruto)
+
+    start = time.perf_counter()
+    folhas = compilado.apply(X_bruto)
+    compilado.classes[compilado.proba[folhas].argmax(axis=1)]; compilado.proba[folhas]
+    compilado_lote = (time.perf_counter() - start) / len(X_bruto)
+
+    df = pd.DataFrame([
+        {"Caminho": "Uma linha", "sklearn (µs/linha)": sklearn_uma * 1e6, "Compilado (µs/linha)": compilado_uma * 1e6},
+        {"Caminho": f"Lote ({len(X_bruto)} linhas)", "sklearn (µs/linha)": sklearn_lote * 1e6, "Compilado (µs/linha)": compilado_lote * 1e6},
+    ])
+    df["Speedup"] = df["sklearn (µs/linha)"] / df["Compilado (µs/linha)"]
+    return linhas_verificadas, df
+
+
+def executar_benchmark_preprocessamento(preprocessador, scaler, df_bruto, n_amostras=300):
+    """
+    Compara o caminho antigo (preparar_dataframe + get_dummies + reindex + scaler.transform)
+    com o PreprocessadorCompilado, partindo das linhas cruas do CSV:
+    - uma linha: um registro (dict) por vez, como chegaria de uma API;
+    - lote: o DataFrame inteiro.
+    Confere antes que as duas matrizes padronizadas são iguais.
+    """
+    def caminho_antigo(df):
+        X_encoded, _ = codificar_features(preparar_dataframe(df))
+        return scaler.transform(X_encoded.reindex(columns=scaler.feature_names_in_, fill_value=0))
+
+    esperado = caminho_antigo(df_bruto)
+    if not np.allclose(preprocessador.transform(df_bruto, escalar=True, dtype=np.float64), esperado):
+        raise AssertionError("O pré-processador compilado diverge do caminho com get_dummies.")
+
+    amostras = np.random.default_rng(42).integers(0, len(df_bruto), size=n_amostras)
+    registros = df_bruto.to_dict('records')
+    start = time.perf_counter()
+    for i in amostras:
+        caminho_antigo(pd.DataFrame([registros[i]]))
+    antigo_uma = (time.perf_counter() - start) / n_amostras
+
+    start = time.perf_counter()
+    for i in amostras:
+        preprocessador.transform_row(registros[i], escalar=True)
+    compilado_uma = (time.perf_counter() - start) / n_amostras
+
+    start = time.perf_counter()
+    caminho_antigo(df_bruto)
+    antigo_lote = (time.perf_counter() - start) / len(df_bruto)
+
+    saida = np.empty((len(df_bruto), preprocessador.n_features), dtype=np.float32)
+    start = time.perf_counter()
+    preprocessador.transform(df_bruto, saida=saida, escalar=True)
+    compilado_lote = (time.perf_counter() - start) / len(df_bruto)
+
+    df = pd.DataFrame([
+        {"Caminho": "Uma linha", "get_dummies (µs/linha)": antigo_uma * 1e6, "Compilado (µs/linha)": compilado_uma * 1e6},
+        {"Caminho": f"Lote ({len(df_bruto)} linhas)", "get_dummies (µs/linha)": antigo_lote * 1e6, "Compilado (µs/linha)": compilado_lote * 1e6},
+    ])
+    df["Speedup"] = df["get_dummies (µs/linha)"] / df["Compilado (µs/linha)"]
+    return df
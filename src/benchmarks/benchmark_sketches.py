@@ -0,0 +1,142 @@
+# src/benchmarks/benchmark_sketches.py
+import time
+import numpy as np
+import pandas as pd
+
+from src.estrutura_de_dados.sketches import CountMinSketch, HyperLogLog, KLLSketch
+
+QUANTIS = (0.5, 0.9, 0.95, 0.99)
+
+
+def gerar_fluxo(df, fator=50, seed=42):
+    """
+    Fluxo de consultas maior que o DataFrame: fator * len(df) eventos de pacientes sintéticos.
+    Há fator * len(df) / 2 pacientes; o paciente p herda País e Colesterol da linha p % len(df).
+    Os eventos sorteiam pacientes com peso Zipf, então uns voltam muitas vezes e outros nunca.
+    Retorna um DataFrame com 'Patient ID', 'Country' (códigos da categoria) e 'Cholesterol'.
+    """
+    rng = np.random.default_rng(seed)
+    n_pacientes = fator * len(df) // 2
+    pacientes = (rng.zipf(1.2, size=fator * len(df)) - 1) % n_pacientes
+    linhas = pacientes % len(df)
+    paises = df['Country'].astype('category').cat.codes.to_numpy()
+    return pd.DataFrame({"Patient ID": pacientes, "Country": paises[linhas],
+                         "Cholesterol": df['Cholesterol'].to_numpy()[linhas]})
+
+
+def _erros_de_posto(ordenado, estimados):
+    """Distância de cada q até o intervalo de postos que o valor estimado ocupa nos dados ordenados (há empates)."""
+    inicio = np.searchsorted(ordenado, estimados, side="left") / len(ordenado)
+    fim = np.searchsorted(ordenado, estimados, side="right") / len(ordenado)
+    q = np.asarray(QUANTIS)
+    return np.maximum(np.maximum(inicio - q, q - fim), 0.0)
+
+
+def _em_partes(fluxo, n_partes, fabrica, ingerir):
+    """Constrói um sketch por partição do fluxo (como faria cada processo) e une todos com merge()."""
+    sketches = []
+    for parte in np.array_split(np.arange(len(fluxo)), n_partes):
+        sketch = fabrica()
+        ingerir(sketch, fluxo.iloc[parte])
+        sketches.append(sketch)
+    for sketch in sketches[1:]:
+        sketches[0].merge(sketch)
+    return sketches[0]
+
+
+def _ingerir_cms(cms, fluxo):
+    cms.insert_many(fluxo["Patient ID"].to_numpy())
+    return cms
+
+
+def _ingerir_hll(hlls, fluxo, p):
+    """Um HyperLogLog por país; cada um recebe os ids dos eventos daquele país."""
+    ids, paises = fluxo["Patient ID"].to_numpy(), fluxo["Country"].to_numpy()
+    ordem = np.argsort(paises, kind="stable")
+    codigos, inicios = np.unique(paises[ordem], return_index=True)
+    for pais, bloco in zip(codigos.tolist(), np.split(ids[ordem], inicios[1:])):
+        hlls.setdefault(pais, HyperLogLog(p)).insert_many(bloco)
+    return hlls
+
+
+def _ingerir_kll(kll, fluxo):
+    kll.insert_many(fluxo["Cholesterol"].to_numpy())
+    return kll
+
+
+def _medir(funcao):
+    start = time.perf_counter()
+    resultado = funcao()
+    return resultado, time.perf_counter() - start
+
+
+def executar_benchmark_sketches(df, fator=50, larguras_cms=(272, 1360, 2719, 27183), precisoes_hll=(6, 8, 10, 12, 14),
+                                ks_kll=(50, 100, 200, 400), n_partes=4, seed=42):
+    """
+    Precisão x memória dos sketches contra o resultado exato do pandas num fluxo de
+    fator * len(df) eventos (gerar_fluxo):
+    - Count-Min: "quantas vezes cada paciente apareceu" (value_counts de Patient ID);
+    - HyperLogLog: "quantos pacientes distintos por país" (groupby + nunique), um HLL por país;
+    - KLL: p50/p90/p95/p99 do colesterol (Series.quantile), erro medido em posto.
+    Cada configuração também é construída em n_partes partições unidas com merge(): para
+    Count-Min e HyperLogLog o resultado tem de ser idêntico ao de uma passada só.
+    Retorna um DataFrame com memória, erro e tempo de cada configuração e do cálculo exato.
+    """
+    fluxo = gerar_fluxo(df, fator=fator, seed=seed)
+    ids, paises, colesterol = (fluxo[c].to_numpy() for c in ("Patient ID", "Country", "Cholesterol"))
+    print(f"Fluxo: {len(fluxo):,} eventos, {len(np.unique(ids)):,} pacientes distintos, {len(np.unique(paises))} países.")
+    linhas = []
+
+    print("--- Benchmarking: Count-Min Sketch ---")
+    contagens, tempo_exato = _medir(lambda: fluxo["Patient ID"].value_counts())
+    memoria_exata = contagens.memory_usage(index=True, deep=True)
+    for largura in larguras_cms:
+        cms, tempo = _medir(lambda: _ingerir_cms(CountMinSketch(width=largura, depth=4), fluxo))
+        partes = _em_partes(fluxo, n_partes, lambda: CountMinSketch(width=largura, depth=4), _ingerir_cms)
+        if not np.array_equal(partes.tabela, cms.tabela):
+            raise AssertionError(f"Count-Min unido por partes divergiu (width={largura}).")
+        excesso = cms.estimate_many(contagens.index.to_numpy()) - contagens.to_numpy()
+        if (excesso < 0).any():
+            raise AssertionError("O Count-Min subestimou uma contagem.")
+        linhas.append({"Sketch": "Count-Min", "Pergunta": "Ocorrências por paciente", "Configuração": f"width={largura}, depth=4",
+                       "Memória (KB)": cms.get_memory_usage() / 1024, "Memória Exata (KB)": memoria_exata / 1024,
+                       "Erro Médio": float(excesso.mean()), "Erro Máximo": float(excesso.max()),
+                       "Erro Máximo (Unido)": float(excesso.max()), "Erro Teórico": cms.erro_esperado(), "Unidade do Erro": "ocorrências",
+                       "Tempo Sketch (ms)": tempo * 1e3, "Tempo Exato (ms)": tempo_exato * 1e3})
+
+    print("--- Benchmarking: HyperLogLog ---")
+    distintos, tempo_exato = _medir(lambda: fluxo.groupby("Country")["Patient ID"].nunique())
+    memoria_exata = fluxo[["Country", "Patient ID"]].memory_usage(index=False).sum()
+    for p in precisoes_hll:
+        hlls, tempo = _medir(lambda: _ingerir_hll({}, fluxo, p))
+        partes = [_ingerir_hll({}, fluxo.iloc[parte], p) for parte in np.array_split(np.arange(len(fluxo)), n_partes)]
+        for parcial in partes[1:]:
+            for pais, hll in parcial.items():
+                partes[0].setdefault(pais, HyperLogLog(p)).merge(hll)
+        if any(not np.array_equal(partes[0][pais].registros, hll.registros) for pais, hll in hlls.items()):
+            raise AssertionError(f"HyperLogLog unido por partes divergiu (p={p}).")
+        relativo = np.array([abs(hlls[pais].estimate() / exato - 1) for pais, exato in distintos.items()])
+        linhas.append({"Sketch": "HyperLogLog", "Pergunta": "Pacientes distintos por país", "Configuração": f"p={p} (x{len(hlls)} países)",
+                       "Memória (KB)": sum(h.get_memory_usage() for h in hlls.values()) / 1024, "Memória Exata (KB)": memoria_exata / 1024,
+                       "Erro Médio": float(relativo.mean()), "Erro Máximo": float(relativo.max()),
+                       "Erro Máximo (Unido)": float(relativo.max()), "Erro Teórico": HyperLogLog(p).erro_padrao(), "Unidade do Erro": "relativo",
+                       "Tempo Sketch (ms)": tempo * 1e3, "Tempo Exato (ms)": tempo_exato * 1e3})
+
+    print("--- Benchmarking: KLL (quantis) ---")
+    exatos, tempo_exato = _medir(lambda: fluxo["Cholesterol"].quantile(list(QUANTIS)))
+    ordenado = np.sort(colesterol)
+    memoria_exata = fluxo["Cholesterol"].memory_usage(index=False)
+    for k in ks_kll:
+        kll, tempo = _medir(lambda: _ingerir_kll(KLLSketch(k, seed=seed), fluxo))
+        estimados = kll.quantiles(QUANTIS)
+        partes = _em_partes(fluxo, n_partes, lambda: KLLSketch(k, seed=seed), _ingerir_kll)
+        erros, erros_unido = _erros_de_posto(ordenado, estimados), _erros_de_posto(ordenado, partes.quantiles(QUANTIS))
+        linhas.append({"Sketch": "KLL", "Pergunta": "p50/p90/p95/p99 do colesterol", "Configuração": f"k={k}",
+                       "Memória (KB)": kll.get_memory_usage() / 1024, "Memória Exata (KB)": memoria_exata / 1024,
+                       "Erro Médio": float(np.mean(erros)), "Erro Máximo": float(np.max(erros)),
+                       "Erro Máximo (Unido)": float(np.max(erros_unido)), "Erro Teórico": 1.65 / k, "Unidade do Erro": "posto",
+                       "Tempo Sketch (ms)": tempo * 1e3, "Tempo Exato (ms)": tempo_exato * 1e3,
+                       "Quantis Estimados": ", ".join(f"{v:g}" for v in estimados),
+                       "Quantis Exatos": ", ".join(f"{v:g}" for v in exatos.to_numpy())})
+    return pd.DataFrame(linhas)
+
@@ -0,0 +1,75 @@
+# src/benchmarks/benchmark_vizinhos.py
+import time
+import numpy as np
+import pandas as pd
+
+from src.estrutura_de_dados.arvore_bola import BallTree, knn_forca_bruta, raio_forca_bruta
+from src.estrutura_de_dados.kd_tree import KDTree
+
+
+def _medir(funcao):
+    """Executa 'funcao' e retorna (resultado, tempo em segundos)."""
+    start = time.perf_counter()
+    resultado = funcao()
+    return resultado, time.perf_counter() - start
+
+
+def executar_benchmark_vizinhos(X, dimensoes=None, tamanhos=None, n_consultas=200, k=5, leaf_size=40, seed=42):
+    """
+    Compara BallTree, força bruta vetorizada e KDTree (1-NN, a única consulta que ela tem)
+    na matriz de features escalada 'X', usando as primeiras 'd' colunas para cada d em
+    'dimensoes' e as primeiras N linhas para cada N em 'tamanhos'. As consultas são pacientes
+    sorteados da própria amostra. Confere as distâncias k-NN e os resultados por raio da
+    BallTree contra a força bruta, e a distância do vizinho da KDTree.
+    Retorna um DataFrame com tempos de construção e de consulta (em lote e uma a uma) e a
+    fração de folhas lidas / consultas que a BallTree mandou para a força bruta.
+    """
+    X = np.asarray(X, dtype=np.float64)
+    dimensoes = dimensoes or sorted({d for d in (2, 5, 10, 20, X.shape[1]) if d <= X.shape[1]})
+    tamanhos = tamanhos or sorted({n for n in (1000, 4000, len(X)) if n <= len(X)})
+    rng = np.random.default_rng(seed)
+    linhas = []
+    for n in tamanhos:
+        for d in dimensoes:
+            print(f"Testando N={n}, {d} dimensões...")
+            dados = X[:n, :d]
+            consultas = dados[rng.choice(n, size=n_consultas, replace=False)]
+            uma_a_uma = consultas[:max(1, n_consultas // 4)]
+
+            arvore, construcao = _medir(lambda: BallTree(dados, leaf_size=leaf_size))
+            (d_arvore, _), lote_arvore = _medir(lambda: arvore.query(consultas, k))
+            _, unitaria_arvore = _medir(lambda: [arvore.query(q, k) for q in uma_a_uma])
+            (d_bruta, _), lote_bruta = _medir(lambda: knn_forca_bruta(dados, consultas, k))
+            _, unitaria_bruta = _medir(lambda: [knn_forca_bruta(dados, q, k) for q in uma_a_uma])
+            if not np.allclose(d_arvore, d_bruta, atol=1e-6):
+                raise AssertionError(f"BallTree divergiu da força bruta (N={n}, d={d}).")
+
+            # Raio que pega ~k vizinhos por consulta (mediana da k-ésima distância)
+            raio = float(np.median(d_bruta[:, -1]))
+            dentro_arvore, raio_arvore = _medir(lambda: arvore.query_radius(consultas, raio))
+            dentro_bruta, raio_bruta = _medir(lambda: raio_forca_bruta(dados, consultas, raio))
+            if any(not np.array_equal(a, b) for a, b in zip(dentro_arvore, dentro_bruta)):
+                raise AssertionError(f"BallTree.query_radius divergiu da força bruta (N={n}, d={d}).")
+
+            kd, construcao_kd = _medir(lambda: KDTree(dados.tolist()))
+            vizinhos_kd, unitaria_kd = _medir(lambda: [kd.find_nearest_neighbor(q) for q in uma_a_uma.tolist()])
+            d_kd = np.sqrt(((np.array(vizinhos_kd) - uma_a_uma) ** 2).sum(axis=1))
+            if not np.allclose(d_kd, d_bruta[:len(uma_a_uma), 0], atol=1e-6):
+                raise AssertionError(f"KDTree divergiu da força bruta (N={n}, d={d}).")
+
+            estatisticas = arvore.estatisticas_consulta
+            linhas.append({
+                "N": n, "Dimensões": d,
+                "Ball Tree: Construção (ms)": construcao * 1e3,
+                "Ball Tree: Lote (µs/consulta)": lote_arvore / n_consultas * 1e6,
+                "Ball Tree: 1 a 1 (µs/consulta)": unitaria_arvore / len(uma_a_uma) * 1e6,
+                "Ball Tree: Raio (µs/consulta)": raio_arvore / n_consultas * 1e6,
+                "Força Bruta: Lote (µs/consulta)": lote_bruta / n_consultas * 1e6,
+                "Força Bruta: 1 a 1 (µs/consulta)": unitaria_bruta / len(uma_a_uma) * 1e6,
+                "Força Bruta: Raio (µs/consulta)": raio_bruta / n_consultas * 1e6,
+                "KD-Tree 1-NN: Construção (ms)": construcao_kd * 1e3,
+                "KD-Tree 1-NN: 1 a 1 (µs/consulta)": unitaria_kd / len(uma_a_uma) * 1e6,
+                "Folhas Lidas": estatisticas["folhas_visitadas"] / (estatisticas["consultas"] * len(arvore.folhas)),
+                "Consultas na Força Bruta": estatisticas["forca_bruta"] / estatisticas["consultas"],
+            })
+    return pd.DataFrame(linhas)
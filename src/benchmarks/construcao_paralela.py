@@ -0,0 +1,147 @@
+# src/benchmarks/construcao_paralela.py
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+
+from src.estrutura_de_dados.tabela_hash import HashTable
+from src.estrutura_de_dados.bloom_filter2 import CountingBloomFilter
+from src.estrutura_de_dados.arvore_avl import AVLTree
+
+ESTRUTURAS = ("Tabela Hash", "Counting Bloom Filter", "Árvore AVL")
+
+
+def _nova_estrutura(nome, n_total):
+    """Estrutura vazia dimensionada para o total de itens: todos os shards precisam dos mesmos parâmetros para o merge."""
+    if nome == "Tabela Hash":
+        return HashTable(size=n_total * 2)
+    if nome == "Counting Bloom Filter":
+        return CountingBloomFilter.from_capacity(n_total, fpr=0.001)
+    if nome == "Árvore AVL":
+        return AVLTree()
+    raise ValueError(f"Estrutura desconhecida: {nome}")
+
+
+def construir_shard(nome, n_total, chaves, valores):
+    """Constrói uma estrutura só com a fatia (chaves, valores). Roda dentro de cada processo."""
+    estrutura = _nova_estrutura(nome, n_total)
+    if nome == "Tabela Hash":
+        estrutura.insert_many(chaves, valores)
+    elif nome == "Counting Bloom Filter":
+        estrutura.insert_many(chaves)
+    else:
+        for chave in chaves.tolist():
+            estrutura.insert(chave)
+    return estrutura
+
+
+def construir_shard_para_envio(nome, n_total, chaves, valores):
+    """
+    construir_shard como é chamada nos processos: a Tabela Hash de cada shard tem os 'size'
+    baldes da tabela final, quase todos vazios, então só os baldes ocupados voltam ao processo
+    principal (occupied_buckets). Assim o pickle é proporcional à fatia, não ao total.
+    """
+    estrutura = construir_shard(nome, n_total, chaves, valores)
+    return estrutura.occupied_buckets() if nome == "Tabela Hash" else estrutura
+
+
+def unir_em_pares(shards):
+    """
+    Une os shards dois a dois, sempre o da esquerda com o da direita, até sobrar um.
+    A ordem das fatias é preservada (importa para a Tabela Hash) e cada item passa por
+    O(log shards) uniões, em vez de O(shards) numa união em sequência.
+    """
+    if not shards:
+        raise ValueError("Nenhum shard para unir.")
+    while len(shards) > 1:
+        shards = [shards[i].merge(shards[i + 1]) if i + 1 < len(shards) else shards[i] for i in range(0, len(shards), 2)]
+    return shards[0]
+
+
+def construir_em_paralelo(nome, chaves, valores, executor, n_partes):
+    """
+    Divide (chaves, valores) em 'n_partes' fatias contíguas, constrói um shard por fatia
+    nos processos do 'executor' e une os resultados com merge(). Para a Tabela Hash, os
+    baldes ocupados de cada shard são unidos, na ordem das fatias, numa tabela nova
+    (merge_buckets), com o mesmo resultado de unir as tabelas inteiras.
+    Retorna (estrutura, tempo dos shards em s, tempo da união em s); o tempo dos shards
+    inclui enviar as fatias e receber os resultados (pickle) entre os processos.
+    """
+    fatias = np.array_split(np.arange(len(chaves)), n_partes)
+    start = time.perf_counter()
+    shards = list(executor.map(construir_shard_para_envio, [nome] * n_partes, [len(chaves)] * n_partes,
+                               [chaves[f] for f in fatias], [valores[f] for f in fatias]))
+    tempo_shards = time.perf_counter() - start
+    start = time.perf_counter()
+    if nome == "Tabela Hash":
+        estrutura = _nova_estrutura(nome, len(chaves))
+        for baldes in shards:
+            estrutura.merge_buckets(baldes)
+    else:
+        estrutura = unir_em_pares(shards)
+    return estrutura, tempo_shards, time.perf_counter() - start
+
+
+def _altura_avl(node):
+    """Altura da subárvore, conferindo ordem, balanceamento e alturas guardadas; -1 se algo está errado."""
+    if node is None:
+        return 0
+    esquerda, direita = _altura_avl(node.left), _altura_avl(node.right)
+    if esquerda < 0 or direita < 0 or abs(esquerda - direita) > 1 or node.height != 1 + max(esquerda, direita):
+        return -1
+    if (node.left and node.left.key > node.key) or (node.right and node.right.key < node.key):
+        return -1
+    return 1 + max(esquerda, direita)
+
+
+def estruturas_iguais(a, b):
+    """
+    Confere se a estrutura unida ('a') equivale à construída em série ('b'):
+    Tabela Hash com os mesmos baldes (e mesma ordem dentro deles) e a mesma contagem de
+    colisões; Bloom com os mesmos contadores, itens e overflow; AVL com as mesmas chaves em
+    ordem e balanceamento válido (a forma da árvore depende da ordem de inserção).
+    """
+    if isinstance(a, HashTable):
+        return a.table == b.table and a.collision_count == b.collision_count
+    if isinstance(a, CountingBloomFilter):
+        return (np.array_equal(a.count_array, b.count_array) and a.count == b.count
+                and a.overflow_count == b.overflow_count)
+    return len(a) == len(b) and list(a) == list(b) and _altura_avl(a.root) >= 0
+
+
+def executar_benchmark_paralelo(chaves, valores, workers=None, estruturas=ESTRUTURAS):
+    """
+    Para cada estrutura, compara a construção em série com a construção particionada
+    (um shard por processo + merge) para cada quantidade de processos em 'workers'.
+    Confere que o resultado unido é igual ao serial. Retorna um DataFrame com os tempos,
+    a parte gasta nos shards e na união, e o speedup sobre a construção em série.
+    """
+    chaves, valores = np.asarray(chaves), np.asarray(valores)
+    workers = workers or sorted({1, 2, 4, os.cpu_count() or 1})
+    seriais = {}
+    for nome in estruturas:
+        print(f"--- Benchmarking: {nome} (serial) ---")
+        start = time.perf_counter()
+        estrutura = construir_shard(nome, len(chaves), chaves, valores)
+        seriais[nome] = (estrutura, time.perf_counter() - start)
+
+    linhas = []
+    for n_workers in workers:
+        print(f"Testando {n_workers} processo(s)...")
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            list(executor.map(abs, range(n_workers)))  # Sobe os processos antes de medir
+            inicializacao = time.perf_counter() - start
+            for nome in estruturas:
+                unida, tempo_shards, tempo_uniao = construir_em_paralelo(nome, chaves, valores, executor, n_workers)
+                serial, tempo_serial = seriais[nome]
+                if not estruturas_iguais(unida, serial):
+                    raise AssertionError(f"{nome} unida de {n_workers} shards difere da construída em série.")
+                total = tempo_shards + tempo_uniao
+                linhas.append({"Estrutura": nome, "Processos": n_workers,
+                               "Serial (ms)": tempo_serial * 1e3, "Paralelo (ms)": total * 1e3,
+                               "Shards (ms)": tempo_shards * 1e3, "União (ms)": tempo_uniao * 1e3,
+                               "Inicialização do Pool (ms)": inicializacao * 1e3,
+                               "Speedup": tempo_serial / total, "Igual ao Serial": True})
+    return pd.DataFrame(linhas)
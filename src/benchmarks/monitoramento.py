@@ -0,0 +1,53 @@
+# src/benchmarks/monitoramento.py
+"""
+Leitura periódica (polling) das estatísticas das estruturas vivas do menu ('sistemas').
+
+Cada estrutura mantém a contagem de itens, a altura, o fator de carga e a memória estimada
+a cada alteração e os devolve em get_monitoring_stats() sem percorrer nada; aqui só se
+juntam essas leituras num DataFrame, uma linha por estrutura. Estruturas sem
+get_monitoring_stats caem em len() e get_memory_usage(), que podem não ser O(1).
+"""
+import time
+import pandas as pd
+
+COLUNAS = ("itens", "altura", "fator_carga", "memoria_bytes")
+
+
+def ler_estatisticas(estrutura):
+    """Estatísticas de uma estrutura, sempre com as chaves de COLUNAS (None quando não se aplica)."""
+    if hasattr(estrutura, 'get_monitoring_stats'):
+        return estrutura.get_monitoring_stats()
+    return {"itens": len(estrutura) if hasattr(estrutura, '__len__') else None, "altura": None, "fator_carga": None,
+            "memoria_bytes": estrutura.get_memory_usage() if hasattr(estrutura, 'get_memory_usage') else None}
+
+
+def coletar_estatisticas(sistemas, relogio=time.time):
+    """
+    Retrato das estatísticas de todas as estruturas de 'sistemas' (nome -> estrutura) num
+    mesmo instante. Retorna um DataFrame com instante, estrutura, tipo, as COLUNAS, extras
+    de cada estrutura (camadas, células, lápides) e quanto tempo a leitura levou.
+    """
+    instante = relogio()
+    linhas = []
+    for nome, estrutura in sistemas.items():
+        start = time.perf_counter()
+        estatisticas = ler_estatisticas(estrutura)
+        leitura = time.perf_counter() - start
+        linhas.append({"instante": instante, "estrutura": nome, "tipo": type(estrutura).__name__,
+                       **estatisticas, "leitura_us": leitura * 1e6})
+    return pd.DataFrame(linhas)
+
+
+def acompanhar(sistemas, intervalo_s=1.0, leituras=None, relogio=time.time, dormir=time.sleep):
+    """
+    Gera um retrato (coletar_estatisticas) a cada 'intervalo_s' segundos, para sempre ou
+    'leituras' vezes. Feito para ser consumido por quem monitora: for df in acompanhar(...).
+    """
+    if intervalo_s < 0:
+        raise ValueError("O intervalo deve ser não negativo.")
+    feitas = 0
+    while leituras is None or feitas < leituras:
+        if feitas:
+            dormir(intervalo_s)
+        yield coletar_estatisticas(sistemas, relogio)
+        feitas += 1
@@ -0,0 +1,283 @@
+# src/benchmarks/rastreamento.py
+"""
+Gravação e replay de rastros de operações (insert/search/remove).
+
+- EstruturaRastreada envolve qualquer estrutura e grava cada chamada: operação, instante
+  (ns desde o início), chave, valor e se a busca encontrou algo.
+- Rastro guarda os registros em um array NumPy compacto e os salva em um arquivo binário:
+  cabeçalho fixo + registros de 28 bytes + tabela de textos (chaves/valores não numéricos).
+- reproduzir executa um rastro em outra estrutura, em velocidade máxima ou respeitando
+  os instantes originais, e mede vazão, percentis de latência e divergências.
+
+Uso: python -m src.benchmarks.rastreamento caminho_do_rastro.bin
+"""
+import inspect
+import struct
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+INSERIR, BUSCAR, REMOVER = 0, 1, 2
+# Como chave e valor estão codificados no campo int64 do registro.
+# TIPO_NENHUM é um None de verdade; TIPO_AUSENTE é um insert chamado sem valor.
+TIPO_NENHUM, TIPO_INT, TIPO_FLOAT, TIPO_TEXTO, TIPO_AUSENTE = 0, 1, 2, 3, 4
+
+MAGICO = b'RSTR'
+VERSAO = 2  # A versão 1 não separava "sem valor" de None: lá, todo valor None é lido como ausente
+CABECALHO = struct.Struct('<4sHQQ')  # mágico, versão, número de registros, número de textos
+DTYPE_REGISTRO = np.dtype([
+    ('op', 'u1'), ('tipo_chave', 'u1'), ('tipo_valor', 'u1'), ('encontrado', 'u1'),
+    ('t_ns', '<i8'), ('chave', '<i8'), ('valor', '<i8'),
+])  # Sem alinhamento: 28 bytes por operação
+
+_AUSENTE = object()  # Valor padrão de insert: None pode ser um valor guardado
+
+
+def _aceita_valor(estrutura):
+    """HashTable/CuckooHashing/IntHashMap exigem insert(key, value); as demais aceitam insert(key)."""
+    obrigatorios = [p for p in inspect.signature(estrutura.insert).parameters.values()
+                    if p.default is inspect.Parameter.empty]
+    return len(obrigatorios) >= 2
+
+
+def _encontrou(resultado):
+    """Normaliza o retorno de search: None/False é "não encontrado"; o resto (True, valor, nó) é "encontrado"."""
+    return resultado is not None and resultado is not False
+
+
+# --- Rastro ---
+
+class Rastro:
+    """Sequência de operações gravadas: registros (array estruturado) e tabela de textos."""
+    def __init__(self, registros, textos):
+        self.registros = np.asarray(registros, dtype=DTYPE_REGISTRO)
+        self.textos = list(textos)
+
+    def __len__(self):
+        return len(self.registros)
+
+    def _decodificar(self, tipos, brutos):
+        saida = []
+        for tipo, bruto in zip(tipos.tolist(), brutos.tolist()):
+            if tipo == TIPO_INT: saida.append(bruto)
+            elif tipo == TIPO_TEXTO: saida.append(self.textos[bruto])
+            elif tipo == TIPO_FLOAT: saida.append(struct.unpack('<d', struct.pack('<q', bruto))[0])
+            else: saida.append(None)
+        return saida
+
+    def operacoes(self):
+        """
+        Lista de (operação, chave, valor, instante em ns) com chaves e valores já decodificados.
+        Buscas, remoções e inserts sem valor vêm com valor None (o tipo_valor dos registros os distingue).
+        """
+        r = self.registros
+        chaves = self._decodificar(r['tipo_chave'], r['chave'])
+        valores = self._decodificar(r['tipo_valor'], r['valor'])
+        return list(zip(r['op'].tolist(), chaves, valores, r['t_ns'].tolist()))
+
+    def resumo(self):
+        """Contagem por operação, duração e tamanho em disco do rastro."""
+        contagem = np.bincount(self.registros['op'], minlength=3)
+        return {
+            "operacoes": len(self), "insert": int(contagem[INSERIR]), "search": int(contagem[BUSCAR]),
+            "remove": int(contagem[REMOVER]),
+            "duracao_s": float(self.registros['t_ns'][-1]) / 1e9 if len(self) else 0.0,
+            "bytes": self.tamanho_em_bytes(),
+        }
+
+    def tamanho_em_bytes(self):
+        return CABECALHO.size + self.registros.nbytes + sum(4 + len(t.encode('utf-8')) for t in self.textos)
+
+    # --- Arquivo Binário ---
+
+    def save(self, path):
+        """Grava o rastro: cabeçalho, registros em little-endian e textos (tamanho u32 + UTF-8)."""
+        with open(path, 'wb') as f:
+            f.write(CABECALHO.pack(MAGICO, VERSAO, len(self.registros), len(self.textos)))
+            f.write(self.registros.tobytes())
+            for texto in self.textos:
+                dados = texto.encode('utf-8')
+                f.write(struct.pack('<I', len(dados)))
+                f.write(dados)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            magico, versao, n_registros, n_textos = CABECALHO.unpack(f.read(CABECALHO.size))
+            if magico != MAGICO or versao not in (1, VERSAO):
+                raise ValueError(f"'{path}' não é um rastro válido (versão {VERSAO}).")
+            registros = np.frombuffer(f.read(n_registros * DTYPE_REGISTRO.itemsize), dtype=DTYPE_REGISTRO).copy()
+            if versao == 1:
+                registros['tipo_valor'][registros['tipo_valor'] == TIPO_NENHUM] = TIPO_AUSENTE
+            textos = []
+            for _ in range(n_textos):
+                (tamanho,) = struct.unpack('<I', f.read(4))
+                textos.append(f.read(tamanho).decode('utf-8'))
+        return cls(registros, textos)
+
+
+# --- Gravação ---
+
+class EstruturaRastreada:
+    """
+    Envolve qualquer estrutura e grava cada insert/search/remove antes de repassá-lo.
+    Chaves e valores podem ser int, float, str ou None (str é guardado uma vez na tabela de textos).
+    """
+    def __init__(self, instancia):
+        self.instancia = instancia
+        self._inicio = time.perf_counter_ns()
+        self._ops, self._tempos, self._encontrados = [], [], []
+        self._tipos_chave, self._chaves, self._tipos_valor, self._valores = [], [], [], []
+        self._textos = {}
+
+    def _codificar(self, item):
+        if item is _AUSENTE:
+            return TIPO_AUSENTE, 0
+        if item is None:
+            return TIPO_NENHUM, 0
+        if isinstance(item, (int, np.integer)) and not isinstance(item, bool):
+            return TIPO_INT, int(item)
+        if isinstance(item, (float, np.floating)):
+            return TIPO_FLOAT, struct.unpack('<q', struct.pack('<d', float(item)))[0]
+        if isinstance(item, str):
+            return TIPO_TEXTO, self._textos.setdefault(item, len(self._textos))
+        raise ValueError(f"Tipo não suportado no rastro: {type(item).__name__}. Use int, float, str ou None.")
+
+    def _gravar(self, op, metodo, chave, valor=_AUSENTE):
+        instante = time.perf_counter_ns() - self._inicio
+        resultado = metodo(chave) if valor is _AUSENTE else metodo(chave, valor)
+        tipo_chave, chave_codificada = self._codificar(chave)
+        tipo_valor, valor_codificado = self._codificar(valor)
+        self._ops.append(op); self._tempos.append(instante)
+        self._tipos_chave.append(tipo_chave); self._chaves.append(chave_codificada)
+        self._tipos_valor.append(tipo_valor); self._valores.append(valor_codificado)
+        self._encontrados.append(op == BUSCAR and _encontrou(resultado))
+        return resultado
+
+    def insert(self, key, value=_AUSENTE): return self._gravar(INSERIR, self.instancia.insert, key, value)
+    def search(self, key): return self._gravar(BUSCAR, self.instancia.search, key)
+    def remove(self, key): return self._gravar(REMOVER, self.instancia.remove, key)
+    def get_memory_usage(self): return self.instancia.get_memory_usage()
+
+    @property
+    def rastro(self):
+        """Rastro com tudo o que foi gravado até agora."""
+        registros = np.empty(len(self._ops), dtype=DTYPE_REGISTRO)
+        registros['op'], registros['t_ns'], registros['encontrado'] = self._ops, self._tempos, self._encontrados
+        registros['tipo_chave'], registros['chave'] = self._tipos_chave, self._chaves
+        registros['tipo_valor'], registros['valor'] = self._tipos_valor, self._valores
+        return Rastro(registros, sorted(self._textos, key=self._textos.get))
+
+
+# --- Replay ---
+
+def _esperar_ate(alvo_ns):
+    """Dorme enquanto falta mais de 2 ms e termina a espera girando, para não perder o instante."""
+    while True:
+        falta = alvo_ns - time.perf_counter_ns()
+        if falta <= 0:
+            return
+        if falta > 2_000_000:
+            time.sleep((falta - 1_000_000) / 1e9)
+
+
+def reproduzir(rastro, estrutura, tempo_original=False, velocidade=1.0):
+    """
+    Executa as operações de 'rastro' em 'estrutura'.
+    - tempo_original=False: uma operação atrás da outra, em velocidade máxima;
+    - tempo_original=True: cada operação só começa no seu instante gravado (dividido por
+      'velocidade'); se a estrutura se atrasar, as seguintes saem imediatamente (carga aberta).
+    A latência de cada operação não inclui a espera pela agenda.
+    Divergências: buscas cujo resultado (encontrado ou não) difere do gravado.
+    Retorna um dict com as métricas.
+    """
+    operacoes = rastro.operacoes()
+    sem_valor = (rastro.registros['tipo_valor'] == TIPO_AUSENTE).tolist()
+    com_valor = _aceita_valor(estrutura)
+    insert, search, remove = estrutura.insert, estrutura.search, estrutura.remove
+    latencias = np.empty(len(operacoes), dtype=np.int64)
+    encontrados = np.zeros(len(operacoes), dtype=bool)
+    atraso_max = 0
+    inicio = time.perf_counter_ns()
+    for i, (op, chave, valor, instante) in enumerate(operacoes):
+        if tempo_original:
+            alvo = inicio + int(instante / velocidade)
+            _esperar_ate(alvo)
+            atraso_max = max(atraso_max, time.perf_counter_ns() - alvo)
+        t0 = time.perf_counter_ns()
+        if op == BUSCAR:
+            encontrados[i] = _encontrou(search(chave))
+        elif op == INSERIR:
+            if com_valor: insert(chave, chave if sem_valor[i] else valor)
+            else: insert(chave)
+        else:
+            remove(chave)
+        latencias[i] = time.perf_counter_ns() - t0
+    tempo_total = (time.perf_counter_ns() - inicio) / 1e9
+
+    buscas = rastro.registros['op'] == BUSCAR
+    p50, p90, p99, p999 = (np.percentile(latencias, [50, 90, 99, 99.9]) / 1e3) if len(latencias) else (0.0,) * 4
+    return {
+        "operacoes": len(operacoes), "tempo_total_s": tempo_total,
+        "vazao_ops_s": len(operacoes) / tempo_total if tempo_total > 0 else float('inf'),
+        "p50_us": p50, "p90_us": p90, "p99_us": p99, "p999_us": p999,
+        "max_us": latencias.max() / 1e3 if len(latencias) else 0.0,
+        "divergencias": int(np.count_nonzero(encontrados[buscas] != rastro.registros['encontrado'][buscas].astype(bool))),
+        "atraso_max_agenda_ms": atraso_max / 1e6,
+    }
+
+
+def comparar_estruturas(rastro, fabricas, tempo_original=False, velocidade=1.0):
+    """
+    Reproduz o mesmo rastro em uma instância nova de cada estrutura.
+    fabricas: dict nome -> função sem argumentos que cria a estrutura vazia.
+    Retorna um DataFrame com vazão, percentis de latência e divergências.
+    """
+    linhas = []
+    for nome, fabrica in fabricas.items():
+        print(f"--- Replay: {nome} ---")
+        m = reproduzir(rastro, fabrica(), tempo_original=tempo_original, velocidade=velocidade)
+        linha = {
+            "Estrutura": nome, "Vazão (ops/s)": m["vazao_ops_s"],
+            "p50 (µs)": m["p50_us"], "p90 (µs)": m["p90_us"], "p99 (µs)": m["p99_us"],
+            "p99.9 (µs)": m["p999_us"], "Divergências": m["divergencias"],
+        }
+        if tempo_original:
+            linha["Atraso Máx. na Agenda (ms)"] = m["atraso_max_agenda_ms"]
+        linhas.append(linha)
+    return pd.DataFrame(linhas)
+
+
+def fabricas_padrao(n_chaves, chaves_inteiras=True):
+    """
+    Estruturas com semântica de conjunto/mapa que aceitam chaves repetidas; o IntHashMap
+    só entra com chaves inteiras. (O CuckooHashing fica de fora: ele não atualiza chaves
+    existentes e entra em ciclo quando a mesma chave é inserida várias vezes.)
+    """
+    from src.estrutura_de_dados.lista_encadeada_otimizada import LinkedListOptimized
+    from src.estrutura_de_dados.arvore_avl import AVLTree
+    from src.estrutura_de_dados.tabela_hash import HashTable
+    from src.estrutura_de_dados.tabela_hash_inteiros import IntHashMap
+    from src.estrutura_de_dados.estrutura_adaptativa import AdaptiveStructure
+    fabricas = {
+        "Lista Encadeada (Otimizada)": LinkedListOptimized, "Árvore AVL": AVLTree,
+        "Tabela Hash": lambda: HashTable(size=max(1, n_chaves * 2)),
+        "Estrutura Adaptativa": AdaptiveStructure,
+    }
+    if chaves_inteiras:
+        fabricas["IntHashMap"] = lambda: IntHashMap(capacity=max(1, n_chaves))
+    return fabricas
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Uso: python -m src.benchmarks.rastreamento caminho_do_rastro.bin"); sys.exit(1)
+    rastro_carregado = Rastro.load(sys.argv[1])
+    print(rastro_carregado.resumo())
+    registros = rastro_carregado.registros
+    # O IntHashMap só guarda valores int64: inserts sem valor gravam a própria chave (int)
+    inteiras = bool(np.all(registros['tipo_chave'] == TIPO_INT)
+                    and np.isin(registros['tipo_valor'], (TIPO_INT, TIPO_AUSENTE)).all())
+    fabricas = fabricas_padrao(len(np.unique(registros['chave'])), chaves_inteiras=inteiras)
+    print(comparar_estruturas(rastro_carregado, fabricas).round(2).to_string(index=False))
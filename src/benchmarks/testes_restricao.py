@@ -0,0 +1,386 @@
+# src/benchmarks/testes_restricao.py
+"""
+Suíte NÃO interativa de testes de restrição.
+Cada cenário injeta uma restrição (limite de memória, disputa de CPU, latência ou dados
+corrompidos), roda a mesma carga de trabalho em todas as estruturas com várias repetições
+e compara com a execução sem restrição. O relatório traz a degradação (tempo do cenário /
+tempo base), a correção das respostas e se o limite configurado foi respeitado.
+
+Uso: python -m src.benchmarks.testes_restricao
+"""
+import math
+import multiprocessing
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+try:
+    import resource  # Só existe em sistemas Unix
+except ImportError:
+    resource = None
+
+from src.estrutura_de_dados.lista_encadeada_otimizada import LinkedListOptimized
+from src.estrutura_de_dados.tabela_hash import HashTable
+from src.estrutura_de_dados.arvore_avl import AVLTree
+from src.estrutura_de_dados.arvore_b_mais import BPlusTree
+from src.estrutura_de_dados.cuckoo_hashing import CuckooHashing
+from src.estrutura_de_dados.bloom_filter2 import CountingBloomFilter
+from src.estrutura_de_dados.filtro_cuckoo import CuckooFilter
+from src.estrutura_de_dados.kd_tree import KDTree
+
+# Nome -> (fábrica que recebe N, tipo de carga)
+ESTRUTURAS = {
+    "Lista Encadeada (Otimizada)": (lambda n: LinkedListOptimized(), 'valor'),
+    "Tabela Hash": (lambda n: HashTable(size=n*2), 'chave_valor'),
+    "Árvore AVL": (lambda n: AVLTree(), 'valor'),
+    "Árvore B+": (lambda n: BPlusTree(), 'valor'),
+    "Cuckoo Hashing": (lambda n: CuckooHashing(size=n*2), 'chave_valor'),
+    "Counting Bloom Filter": (lambda n: CountingBloomFilter.from_capacity(n, fpr=0.01), 'filtro'),
+    "Cuckoo Filter": (lambda n: CuckooFilter(capacity=n, fpr=0.01), 'filtro'),
+    "KD-Tree": (None, 'pontos'),
+}
+
+# Limites de aprovação de cada cenário
+LIMITES = {
+    "memoria_mb": 64,            # Memória extra permitida além do que o processo já usa
+    "cpu_degradacao": 4.0,       # Tempo sob disputa de CPU / tempo base
+    "latencia_erro": 0.25,       # Erro relativo aceito entre a latência medida e a injetada
+    "corrupcao_degradacao": 1.5, # Tempo com dados corrompidos / tempo base
+}
+
+
+# --- Modelo de Latência ---
+
+class ModeloLatencia:
+    """
+    Modelo de atraso por chamada: 'constante', 'exponencial' ou 'normal' (truncada em 0).
+    O atraso é aplicado com espera ativa (perf_counter), pois o time.sleep tem granularidade
+    de ~0,1 ms a ~15 ms dependendo do sistema e mediria o relógio, não a latência.
+    """
+    def __init__(self, media_s=20e-6, distribuicao='constante', desvio_s=None, seed=42):
+        if distribuicao not in ('constante', 'exponencial', 'normal'):
+            raise ValueError("Distribuição deve ser 'constante', 'exponencial' ou 'normal'.")
+        self.media_s = media_s
+        self.distribuicao = distribuicao
+        self.desvio_s = media_s / 4 if desvio_s is None else desvio_s
+        self._rng = np.random.default_rng(seed)
+
+    def amostrar(self):
+        if self.distribuicao == 'constante':
+            return self.media_s
+        if self.distribuicao == 'exponencial':
+            return self._rng.exponential(self.media_s)
+        return max(0.0, self._rng.normal(self.media_s, self.desvio_s))
+
+    def esperar(self):
+        """
+        Aplica um atraso amostrado. Retorna (atraso pedido, atraso efetivo); o efetivo pode
+        ser maior quando o sistema tira o processo da CPU no meio da espera.
+        """
+        atraso = self.amostrar()
+        inicio = time.perf_counter()
+        fim = inicio + atraso
+        agora = inicio
+        while agora < fim:
+            agora = time.perf_counter()
+        return atraso, agora - inicio
+
+
+class EstruturaComLatencia:
+    """Envolve qualquer estrutura e aplica o modelo de latência a cada insert/search/remove."""
+    def __init__(self, instancia, modelo):
+        self.instancia = instancia
+        self.modelo = modelo
+        self.atraso_pedido = 0.0
+        self.atraso_efetivo = 0.0
+        self.chamadas = 0
+
+    def _com_atraso(self, metodo, *args):
+        pedido, efetivo = self.modelo.esperar()
+        self.atraso_pedido += pedido
+        self.atraso_efetivo += efetivo
+        self.chamadas += 1
+        return metodo(*args)
+
+    def insert(self, *args): return self._com_atraso(self.instancia.insert, *args)
+    def search(self, *args): return self._com_atraso(self.instancia.search, *args)
+    def remove(self, *args): return self._com_atraso(self.instancia.remove, *args)
+    def find_nearest_neighbor(self, *args): return self._com_atraso(self.instancia.find_nearest_neighbor, *args)
+    def get_memory_usage(self): return self.instancia.get_memory_usage()
+
+
+# --- Dados e Carga de Trabalho ---
+
+def gerar_dados(n, seed=42):
+    """Chaves inteiras (com repetições) e pontos 2D no formato (Age, Cholesterol)."""
+    rng = np.random.default_rng(seed)
+    chaves = rng.integers(0, n * 4, size=n).tolist()
+    pontos = np.column_stack([rng.integers(18, 91, size=n), rng.integers(120, 401, size=n)]).tolist()
+    consultas = rng.integers(0, n * 4, size=n).tolist()
+    return chaves, pontos, consultas
+
+
+def dados_do_dataframe(df, n, seed=42):
+    """
+    Dados reais para a suíte: ids de linha como chaves, (Age, Cholesterol) como pontos
+    e consultas sorteadas em [0, 2N), das quais cerca de metade não existe na base.
+    """
+    rng = np.random.default_rng(seed)
+    linhas = rng.choice(len(df), size=min(n, len(df)), replace=False)
+    pontos = df[['Age', 'Cholesterol']].to_numpy()[linhas].tolist()
+    consultas = rng.integers(0, 2 * len(df), size=len(linhas)).tolist()
+    return linhas.tolist(), pontos, consultas
+
+
+def corromper(valores, fracao, seed=7):
+    """
+    Corrompe uma fração dos valores: sentinela 99 (como no teste R18), valores extremos
+    (±10^12) e cópias de outros valores (duplicatas). Funciona para chaves e pontos.
+    """
+    rng = np.random.default_rng(seed)
+    valores = [list(v) if isinstance(v, (list, tuple)) else v for v in valores]
+    n = len(valores)
+    for i in rng.choice(n, size=int(n * fracao), replace=False).tolist():
+        tipo = i % 3
+        if tipo == 0: novo = 99
+        elif tipo == 1: novo = int(rng.choice([-1, 1])) * 10**12
+        else: novo = valores[int(rng.integers(n))]
+        if isinstance(valores[i], list):
+            valores[i] = list(novo) if isinstance(novo, list) else [novo] * len(valores[i])
+        else:
+            valores[i] = novo[0] if isinstance(novo, list) else novo
+    return valores
+
+
+def executar_carga(nome, chaves, pontos, consultas, envolver=None):
+    """
+    Executa a carga padrão em uma estrutura nova: insere tudo, busca 'consultas'
+    e remove 10% das chaves. Em estruturas chave-valor cada chave distinta é inserida uma vez.
+    Retorna (tempo em segundos, fração de respostas corretas, inserções recusadas, estrutura).
+    A correção é conferida contra um conjunto Python com as mesmas operações; inserções
+    recusadas (insert retornando False, como no CuckooFilter cheio) não entram na referência.
+    """
+    fabrica, tipo = ESTRUTURAS[nome]
+    n = len(chaves)
+    if tipo == 'pontos':
+        start = time.perf_counter()
+        instancia = KDTree([tuple(p) for p in pontos])
+        alvo = envolver(instancia) if envolver else instancia
+        consultas_2d = pontos[::max(1, n // 200)]
+        respostas = [alvo.find_nearest_neighbor(tuple(q)) for q in consultas_2d]
+        for p in pontos[:n // 10]: alvo.remove(tuple(p))
+        tempo = time.perf_counter() - start
+        # O vizinho mais próximo de um ponto da própria árvore é ele mesmo (distância 0)
+        corretas = sum(1 for q, r in zip(consultas_2d, respostas)
+                       if r is not None and sum((a - b) ** 2 for a, b in zip(q, r)) == 0)
+        return tempo, corretas / len(consultas_2d), 0, instancia
+
+    instancia = fabrica(n)
+    alvo = envolver(instancia) if envolver else instancia
+    if tipo == 'chave_valor':
+        # Mapas guardam um valor por chave (e o CuckooHashing não suporta chaves repetidas)
+        chaves = list(dict.fromkeys(chaves))
+    start = time.perf_counter()
+    if tipo == 'chave_valor':
+        retornos = [alvo.insert(k, k) for k in chaves]
+    else:
+        retornos = [alvo.insert(k) for k in chaves]
+    respostas = [alvo.search(k) for k in consultas]
+    removidas = chaves[:len(chaves) // 10]
+    for k in removidas: alvo.remove(k)
+    tempo = time.perf_counter() - start
+
+    referencia = {k for k, r in zip(chaves, retornos) if r is not False}
+    recusadas = len(chaves) - sum(1 for r in retornos if r is not False)
+    if tipo == 'filtro':
+        # Filtros podem dar falso positivo, mas nunca falso negativo
+        corretas = sum(1 for k, r in zip(consultas, respostas) if r or k not in referencia)
+    elif tipo == 'chave_valor':
+        corretas = sum(1 for k, r in zip(consultas, respostas) if (r is not None) == (k in referencia))
+    else:
+        corretas = sum(1 for k, r in zip(consultas, respostas) if bool(r) == (k in referencia))
+    return tempo, corretas / len(consultas), recusadas, instancia
+
+
+# --- Cenários ---
+
+def _queimar_cpu(parar):
+    """Processo de fundo que só ocupa um núcleo até receber o sinal de parada."""
+    x = 0
+    while not parar.is_set():
+        for i in range(10000): x = (x + i * i) % 1000003
+
+
+def _uso_virtual_atual():
+    """Tamanho virtual atual do processo em bytes (Linux), ou None se não disponível."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _carga_com_limite_memoria(nome, chaves, pontos, consultas, limite_bytes, conexao):
+    """Executada em um processo filho: aplica RLIMIT_AS e roda a carga."""
+    # Um Pipe (e não uma Queue) porque a Queue cria uma thread ao enviar, e sob o limite
+    # de memória nem a pilha dessa thread cabe mais
+    try:
+        limite = _uso_virtual_atual() + limite_bytes
+        resource.setrlimit(resource.RLIMIT_AS, (limite, limite))
+        tempo, correcao, _, instancia = executar_carga(nome, chaves, pontos, consultas)
+        memoria = instancia.get_memory_usage() if hasattr(instancia, 'get_memory_usage') else math.nan
+        resultado = ("ok", tempo, correcao, memoria)
+    except MemoryError:
+        resultado = ("memoria_esgotada", math.nan, 0.0, math.nan)
+    except Exception as e:
+        # Qualquer outra falha também precisa chegar ao processo pai, senão ele fica esperando
+        resultado = (f"erro: {e}", math.nan, 0.0, math.nan)
+    conexao.send(resultado)
+    conexao.close()
+
+
+def _suporta_limite_memoria():
+    return resource is not None and _uso_virtual_atual() is not None and sys.platform.startswith('linux')
+
+
+def cenario_memoria(nome, dados, limites):
+    """Roda a carga em um processo filho com limite de espaço de endereçamento (RLIMIT_AS)."""
+    if not _suporta_limite_memoria():
+        return None, None, "não suportado nesta plataforma"
+    ctx = multiprocessing.get_context('fork')
+    receptor, emissor = ctx.Pipe(duplex=False)
+    processo = ctx.Process(target=_carga_com_limite_memoria,
+                           args=(nome, *dados, limites["memoria_mb"] * 1024 * 1024, emissor))
+    processo.start()
+    emissor.close()
+    try:
+        resultado = receptor.recv()
+    except EOFError:
+        # Filho morreu sem responder (ex.: encerrado pelo sistema ao estourar o limite)
+        resultado = None
+    processo.join()
+    if resultado is None:
+        resultado = (f"encerrado (código {processo.exitcode})", math.nan, 0.0, math.nan)
+    status, tempo, correcao, memoria = resultado
+    if status == "ok" and not math.isnan(memoria):
+        detalhe = f"{status}; estrutura usou {memoria:,.0f} bytes"
+    else:
+        detalhe = status
+    return tempo, correcao, detalhe
+
+
+def cenario_cpu(nome, dados, limites, n_processos=None):
+    """Roda a carga enquanto processos de fundo disputam todos os núcleos."""
+    n_processos = n_processos or os.cpu_count() or 1
+    parar = multiprocessing.Event()
+    processos = [multiprocessing.Process(target=_queimar_cpu, args=(parar,), daemon=True) for _ in range(n_processos)]
+    for p in processos: p.start()
+    try:
+        time.sleep(0.05)  # Dá tempo para os processos de fundo começarem a disputar a CPU
+        tempo, correcao, _, _ = executar_carga(nome, *dados)
+    finally:
+        parar.set()
+        for p in processos: p.join()
+    return tempo, correcao, f"{n_processos} processo(s) de fundo"
+
+
+def cenario_latencia(nome, dados, limites, modelo=None):
+    """Aplica o modelo de latência a cada chamada da API da estrutura."""
+    modelo = modelo or ModeloLatencia()
+    envolvidas = []
+    def envolver(instancia):
+        estrutura = EstruturaComLatencia(instancia, modelo)
+        envolvidas.append(estrutura)
+        return estrutura
+    tempo, correcao, _, _ = executar_carga(nome, *dados, envolver=envolver)
+    estrutura = envolvidas[0]
+    return tempo, correcao, (estrutura.atraso_pedido, estrutura.atraso_efetivo, estrutura.chamadas)
+
+
+def cenario_corrupcao(nome, dados, limites, fracao=0.15):
+    """Roda a carga com 'fracao' das chaves e pontos corrompidos."""
+    chaves, pontos, consultas = dados
+    corrompidos = (corromper(chaves, fracao), corromper(pontos, fracao), consultas)
+    tempo, correcao, recusadas, _ = executar_carga(nome, *corrompidos)
+    return tempo, correcao, f"{fracao:.0%} dos dados corrompidos; {recusadas} inserção(ões) recusada(s)"
+
+
+CENARIOS = {
+    "memoria": cenario_memoria,
+    "cpu": cenario_cpu,
+    "latencia": cenario_latencia,
+    "corrupcao": cenario_corrupcao,
+}
+
+
+# --- Suíte ---
+
+def executar_suite(n_itens=2000, n_repeticoes=3, cenarios=None, estruturas=None,
+                   limites=None, caminho_relatorio=None, dados=None):
+    """
+    Roda cada cenário em cada estrutura 'n_repeticoes' vezes e monta o relatório.
+    'dados' aceita (chaves, pontos, consultas); por padrão são gerados sinteticamente.
+    Se 'caminho_relatorio' for informado, o relatório também é salvo em CSV.
+    """
+    limites = {**LIMITES, **(limites or {})}
+    cenarios = cenarios or list(CENARIOS)
+    estruturas = estruturas or list(ESTRUTURAS)
+    dados = dados or gerar_dados(n_itens)
+    linhas = []
+    for nome in estruturas:
+        # Tempo base: mediana das repetições sem nenhuma restrição (após uma rodada de aquecimento)
+        executar_carga(nome, *dados)
+        base = [executar_carga(nome, *dados) for _ in range(n_repeticoes)]
+        tempo_base = float(np.median([t for t, _, _, _ in base]))
+        correcao_base = min(c for _, c, _, _ in base)
+        for cenario in cenarios:
+            print(f"Cenário '{cenario}' em {nome}...")
+            resultados = [CENARIOS[cenario](nome, dados, limites) for _ in range(n_repeticoes)]
+            tempos = [t for t, _, _ in resultados if t is not None and not math.isnan(t)]
+            correcao = min((c for _, c, _ in resultados if c is not None), default=None)
+            tempo = float(np.median(tempos)) if tempos else math.nan
+            degradacao = tempo / tempo_base if tempo_base > 0 else math.nan
+            detalhe = resultados[-1][2]
+
+            if correcao is None:
+                passou, limite = None, "-"
+            elif cenario == "memoria":
+                limite = f"+{limites['memoria_mb']} MB"
+                passou = len(tempos) == n_repeticoes and correcao >= correcao_base
+            elif cenario == "cpu":
+                limite = f"<= {limites['cpu_degradacao']}x"
+                passou = degradacao <= limites["cpu_degradacao"] and correcao >= correcao_base
+            elif cenario == "latencia":
+                # O custo extra medido deve bater com o atraso efetivamente aplicado pelo modelo
+                atraso_pedido, atraso_efetivo, chamadas = detalhe
+                pedido, efetivo = atraso_pedido / chamadas, atraso_efetivo / chamadas
+                medido = (tempo - tempo_base) / chamadas
+                erro = abs(medido - efetivo) / efetivo if efetivo > 0 else math.nan
+                limite = f"erro <= {limites['latencia_erro']:.0%}"
+                passou = erro <= limites["latencia_erro"] and correcao >= correcao_base
+                detalhe = (f"{chamadas} chamadas; por chamada: pedido {pedido*1e6:.1f} µs, "
+                           f"efetivo {efetivo*1e6:.1f} µs, medido {medido*1e6:.1f} µs")
+            else:
+                limite = f"<= {limites['corrupcao_degradacao']}x"
+                passou = degradacao <= limites["corrupcao_degradacao"] and correcao >= correcao_base
+
+            linhas.append({
+                "Cenário": cenario, "Estrutura": nome, "Repetições": n_repeticoes,
+                "Tempo Base (s)": tempo_base, "Tempo Cenário (s)": tempo,
+                "Degradação (x)": degradacao, "Correção": correcao,
+                "Limite": limite, "Passou": passou, "Detalhe": detalhe,
+            })
+    relatorio = pd.DataFrame(linhas)
+    if caminho_relatorio:
+        os.makedirs(os.path.dirname(caminho_relatorio) or ".", exist_ok=True)
+        relatorio.to_csv(caminho_relatorio, index=False)
+    return relatorio
+
+
+if __name__ == "__main__":
+    caminho = os.path.join("resultados", "relatorio_testes_restricao.csv")
+    df_relatorio = executar_suite(caminho_relatorio=caminho)
+    print(df_relatorio.drop(columns=["Detalhe"]).round(4).to_string(index=False))
+    print(f"\nRelatório salvo em {caminho}")
@@ -1,5 +1,6 @@
 # src/data_structures/avl_tree.py
 import sys
+import numpy as np
 
 class AVLNode:
     """Nó de uma Árvore AVL. Contém a chave, referências para os filhos e a altura."""
@@ -9,11 +10,15 @@ class AVLNode:
         self.right = None
         self.height = 1 # A altura de um novo nó (folha) é sempre 1
 
+# Todos os nós têm o mesmo tamanho (os atributos ficam fora do objeto): a memória sai da contagem
+_TAMANHO_NO = sys.getsizeof(AVLNode(0))
+
 class AVLTree:
     """A estrutura da Árvore AVL. Gerencia os nós e as operações de balanceamento."""
 
     def __init__(self):
         self.root = None
+        self.count = 0  # Chaves na árvore (com repetições), para __len__ em O(1)
 
     # --- Funções Auxiliares ---
 
@@ -71,6 +76,7 @@ class AVLTree:
     def insert(self, key):
         """Função pública para inserir uma chave na árvore."""
         self.root = self._insert_recursive(self.root, key)
+        self.count += 1
 
 # Em src/estrutura_de_dados/arvore_avl.py, dentro da classe AVLTree
 
@@ -128,6 +134,25 @@ class AVLTree:
         
         return self._search_recursive(root.right, key)
     
+# Dentro da classe AVLTree
+
+    def range(self, low, high):
+        """Retorna as chaves no intervalo fechado [low, high], em ordem."""
+        resultado = []
+        self._range_recursive(self.root, low, high, resultado)
+        return resultado
+
+    def _range_recursive(self, root, low, high, resultado):
+        if not root:
+            return
+        # Só desce para os lados que ainda podem ter chaves dentro do intervalo
+        if low <= root.key:
+            self._range_recursive(root.left, low, high, resultado)
+        if low <= root.key <= high:
+            resultado.append(root.key)
+        if root.key <= high:
+            self._range_recursive(root.right, low, high, resultado)
+
 # Dentro da classe AVLTree
 
     def _get_min_value_node(self, root):
@@ -139,8 +164,12 @@ class AVLTree:
 # Dentro da classe AVLTree
 
     def remove(self, key):
-        """Função pública para remover uma chave da árvore."""
+        """Função pública para remover uma chave da árvore. Retorna True se ela existia."""
+        self._removida = False
         self.root = self._remove_recursive(self.root, key)
+        if self._removida:
+            self.count -= 1
+        return self._removida
 
     def _remove_recursive(self, root, key):
         # 1. Realiza a remoção padrão de BST
@@ -153,6 +182,7 @@ class AVLTree:
             root.right = self._remove_recursive(root.right, key)
         else:
             # O nó a ser deletado foi encontrado!
+            self._removida = True
             # Caso 1 ou 2: Nó com um filho ou sem filhos
             if root.left is None:
                 temp = root.right
@@ -203,21 +233,82 @@ class AVLTree:
         return root
     
 # Dentro da classe AVLTree
+
+    def __iter__(self):
+        """Gera as chaves em ordem crescente (percurso em ordem iterativo, sem recursão)."""
+        pilha, node = [], self.root
+        while pilha or node:
+            while node:
+                pilha.append(node)
+                node = node.left
+            node = pilha.pop()
+            yield node.key
+            node = node.right
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    def items(self):
+        """Pares (posição, chave) em ordem crescente, como Series.items do pandas."""
+        return enumerate(self)
+
+    def to_numpy(self, dtype=None):
+        """
+        Chaves em ordem crescente num array NumPy. Com 'dtype', o array é preenchido direto
+        do percurso (np.fromiter com o tamanho conhecido); sem ele, o NumPy infere o tipo.
+        """
+        if dtype is not None:
+            return np.fromiter(self, dtype=dtype, count=self.count)
+        return np.array(list(self))
+
+    @classmethod
+    def from_sorted(cls, keys):
+        """Constrói em O(n) uma árvore perfeitamente balanceada a partir de chaves já ordenadas."""
+        arvore = cls()
+        arvore.root = arvore._build_balanced(keys, 0, len(keys))
+        arvore.count = len(keys)
+        return arvore
+
+    def _build_balanced(self, keys, inicio, fim):
+        if inicio >= fim:
+            return None
+        meio = (inicio + fim) // 2
+        node = AVLNode(keys[meio])
+        node.left = self._build_balanced(keys, inicio, meio)
+        node.right = self._build_balanced(keys, meio + 1, fim)
+        self._update_height(node)
+        return node
+
+    def merge(self, outro):
+        """
+        Une as chaves de outra árvore a esta em tempo linear (in-place). Retorna self.
+        As duas sequências em ordem são intercaladas (como no merge sort) e a árvore é
+        reconstruída balanceada; duplicatas são mantidas, como no insert.
+        """
+        if not isinstance(outro, AVLTree):
+            raise ValueError("Só é possível unir com outra AVLTree.")
+        a, b = list(self), list(outro)
+        chaves, i, j = [], 0, 0
+        while i < len(a) and j < len(b):
+            if b[j] < a[i]:
+                chaves.append(b[j]); j += 1
+            else:
+                chaves.append(a[i]); i += 1
+        chaves.extend(a[i:]); chaves.extend(b[j:])
+        self.root = self._build_balanced(chaves, 0, len(chaves))
+        self.count = len(chaves)
+        return self
+
 # Dentro da classe AVLTree
-    
+
     def get_memory_usage(self):
-        """Função pública para obter o uso de memória estimado da árvore."""
-        if not self.root:
-            return 0
-        return self._get_memory_recursive(self.root)
+        """Função pública para obter o uso de memória estimado da árvore (O(1): nós x tamanho do nó)."""
+        return self.count * _TAMANHO_NO
 
-    def _get_memory_recursive(self, node):
-        """Soma recursivamente o tamanho de cada nó na árvore."""
-        if not node:
-            return 0
-        
-        # Tamanho do nó atual + tamanho da subárvore esquerda + tamanho da subárvore direita
-        size = sys.getsizeof(node)
-        size += self._get_memory_recursive(node.left)
-        size += self._get_memory_recursive(node.right)
-        return size
\ No newline at end of file
+    def get_monitoring_stats(self):
+        """Estatísticas lidas em O(1) para o monitoramento (ver src/benchmarks/monitoramento.py)."""
+        return {"itens": self.count, "altura": self._get_height(self.root), "fator_carga": None,
+                "memoria_bytes": self.get_memory_usage()}
\ No newline at end of file
@@ -0,0 +1,415 @@
+# src/estrutura_de_dados/arvore_b_mais.py
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+from src.estrutura_de_dados.tabela_hash import _exportar
+
+# dtype.kind de um array NumPy -> typecode do módulo array usado nas folhas
+_TYPECODES = {'i': 'q', 'u': 'Q', 'f': 'd'}
+
+def _typecode(dados):
+    """Typecode para guardar 'dados' em array.array, ou None se não for um array NumPy numérico de até 64 bits."""
+    if not isinstance(dados, np.ndarray) or dados.dtype.kind not in _TYPECODES or dados.dtype.itemsize > 8:
+        return None
+    return _TYPECODES[dados.dtype.kind]
+
+def _buffer(typecode, itens=()):
+    """Buffer de uma folha: array.array com o typecode dado, ou lista quando typecode é None."""
+    if typecode is None:
+        return list(itens)
+    if isinstance(itens, np.ndarray):
+        return array(typecode, itens.tobytes())  # 'itens' já está no dtype do typecode
+    return array(typecode, itens)
+
+class BPlusLeaf:
+    """
+    Folha de uma Árvore B+. Guarda as entradas ordenadas em dois buffers paralelos (chaves e
+    valores) e um ponteiro para a próxima folha. Chaves repetidas aparecem repetidas, uma por
+    entrada. Os buffers são array.array quando a árvore tem typecode (dados numéricos
+    contíguos, sem um objeto Python por número) e listas caso contrário.
+    """
+    def __init__(self, keys=None, values=None):
+        self.keys = [] if keys is None else keys
+        self.values = [] if values is None else values  # values[i] é o valor da entrada keys[i]
+        self.next = None
+
+class BPlusInternal:
+    """Nó interno de uma Árvore B+. keys[i] separa children[i] (<= keys[i]) de children[i+1] (>= keys[i])."""
+    def __init__(self):
+        self.keys = []
+        self.children = []
+
+class BPlusTree:
+    """
+    Árvore B+ com fanout configurável para chaves numéricas (Age, Cholesterol, Income...).
+    Cada nó guarda até 'order' chaves, então a altura fica em log_order(N) em vez de log2(N),
+    e as folhas encadeadas permitem varrer intervalos sequencialmente, sem recursão.
+    Chaves repetidas são entradas repetidas nas folhas (multiconjunto) e podem ocupar várias
+    folhas seguidas, então um separador pode aparecer dos dois lados.
+    key_typecode/value_typecode (códigos do módulo array, como 'q' ou 'd') fazem as folhas
+    guardarem chaves/valores em array.array; sem eles, as folhas usam listas e aceitam
+    qualquer chave comparável e qualquer valor.
+    """
+    def __init__(self, order=64, key_typecode=None, value_typecode=None):
+        if order < 3:
+            raise ValueError("A ordem da árvore deve ser pelo menos 3.")
+        self.order = order
+        self.min_keys = order // 2
+        self.key_typecode = key_typecode
+        self.value_typecode = value_typecode
+        self.root = self._nova_folha()
+        self.count = 0  # Total de entradas (contando repetições)
+
+    def _nova_folha(self, keys=(), values=()):
+        return BPlusLeaf(_buffer(self.key_typecode, keys), _buffer(self.value_typecode, values))
+
+    # --- Construção em Lote ---
+
+    @classmethod
+    def bulk_load(cls, keys, values=None, order=64):
+        """
+        Constrói a árvore a partir de chaves JÁ ORDENADAS, de baixo para cima, em O(N).
+        'values' é opcional e deve ter o mesmo tamanho de 'keys'. Arrays NumPy numéricos
+        (int, uint ou float) são copiados direto para folhas array.array.
+        """
+        tree = cls(order, _typecode(keys), _typecode(values))
+        if tree.key_typecode is not None:
+            keys = np.asarray(keys, dtype=tree.key_typecode)
+            fora_de_ordem = bool(np.any(keys[1:] < keys[:-1]))
+        else:
+            if hasattr(keys, 'tolist'): keys = keys.tolist()  # Arrays NumPy / Series -> tipos nativos
+            fora_de_ordem = any(b < a for a, b in zip(keys, keys[1:]))
+        if fora_de_ordem:
+            raise ValueError("bulk_load exige chaves em ordem crescente.")
+        if values is None:
+            values = [None] * len(keys)
+        elif tree.value_typecode is not None:
+            values = np.asarray(values, dtype=tree.value_typecode)
+        elif hasattr(values, 'tolist'):
+            values = values.tolist()
+        if len(values) != len(keys):
+            raise ValueError("bulk_load exige 'values' do mesmo tamanho de 'keys'.")
+        tree.count = len(keys)
+        if not len(keys):
+            return tree
+
+        # Nível das folhas
+        folhas = []
+        for inicio, fim in tree._split_evenly(len(keys), order):
+            folha = tree._nova_folha(keys[inicio:fim], values[inicio:fim])
+            if folhas: folhas[-1].next = folha
+            folhas.append(folha)
+
+        # Níveis internos: cada nó recebe até order+1 filhos; o separador é a menor chave do filho
+        nivel = [(folha, folha.keys[0]) for folha in folhas]
+        while len(nivel) > 1:
+            proximo = []
+            for inicio, fim in tree._split_evenly(len(nivel), order + 1):
+                node = BPlusInternal()
+                node.children = [filho for filho, _ in nivel[inicio:fim]]
+                node.keys = [menor for _, menor in nivel[inicio + 1:fim]]
+                proximo.append((node, nivel[inicio][1]))
+            nivel = proximo
+        tree.root = nivel[0][0]
+        return tree
+
+    @staticmethod
+    def _split_evenly(total, capacidade):
+        """Divide 'total' itens em grupos de no máximo 'capacidade', com tamanhos equilibrados."""
+        grupos = -(-total // capacidade)
+        base, resto = divmod(total, grupos)
+        inicio = 0
+        for g in range(grupos):
+            fim = inicio + base + (1 if g < resto else 0)
+            yield inicio, fim
+            inicio = fim
+
+    # --- Funções Auxiliares ---
+
+    def _find_leaf(self, key, primeira=False):
+        """
+        Desce até a folha onde a chave está (ou estaria). Retorna a folha e o caminho [(nó, índice do filho)].
+        Por padrão desce à direita dos separadores iguais à chave (folha da ÚLTIMA ocorrência);
+        com primeira=True desce à esquerda, rumo à primeira ocorrência.
+        """
+        busca = bisect_left if primeira else bisect_right
+        node, path = self.root, []
+        while isinstance(node, BPlusInternal):
+            i = busca(node.keys, key)
+            path.append((node, i))
+            node = node.children[i]
+        return node, path
+
+    @staticmethod
+    def _folha_vizinha(path, passo):
+        """Folha seguinte (passo=1) ou anterior (passo=-1) à folha do caminho 'path', com o seu caminho."""
+        path = list(path)
+        while path:
+            node, i = path.pop()
+            i += passo
+            if 0 <= i < len(node.children):
+                path.append((node, i))
+                node = node.children[i]
+                while isinstance(node, BPlusInternal):
+                    j = 0 if passo > 0 else len(node.children) - 1
+                    path.append((node, j))
+                    node = node.children[j]
+                return node, path
+        return None, None
+
+    def _primeira_ocorrencia(self, key):
+        """(folha, posição) da primeira entrada >= key; a entrada pode estar no começo da folha seguinte."""
+        leaf, _ = self._find_leaf(key, primeira=True)
+        i = bisect_left(leaf.keys, key)
+        if i == len(leaf.keys) and leaf.next is not None:
+            return leaf.next, 0
+        return leaf, i
+
+    def _ultima_ocorrencia(self, key):
+        """(folha, posição, caminho) da última entrada com a chave, ou (None, -1, None) se ela não existe."""
+        leaf, path = self._find_leaf(key)
+        j = bisect_right(leaf.keys, key)
+        if j == 0:
+            # Separador igual à chave: a última ocorrência pode ser o fim da folha anterior
+            leaf, path = self._folha_vizinha(path, -1)
+            if leaf is None:
+                return None, -1, None
+            j = len(leaf.keys)
+        if j and leaf.keys[j - 1] == key:
+            return leaf, j - 1, path
+        return None, -1, None
+
+    def _split_leaf(self, leaf):
+        meio = len(leaf.keys) // 2
+        nova = BPlusLeaf(leaf.keys[meio:], leaf.values[meio:])
+        del leaf.keys[meio:]
+        del leaf.values[meio:]
+        nova.next, leaf.next = leaf.next, nova
+        return nova.keys[0], nova
+
+    def _split_internal(self, node):
+        meio = len(node.keys) // 2
+        nova = BPlusInternal()
+        separador = node.keys[meio]
+        nova.keys, node.keys = node.keys[meio + 1:], node.keys[:meio]
+        nova.children, node.children = node.children[meio + 1:], node.children[:meio + 1]
+        return separador, nova
+
+    # --- Operações Públicas ---
+
+    def insert(self, key, value=None):
+        """Insere uma chave (com um valor opcional). Chaves repetidas são permitidas."""
+        leaf, path = self._find_leaf(key)
+        i = bisect_right(leaf.keys, key)  # Depois das repetições: a ordem de inserção se mantém
+        leaf.keys.insert(i, key)
+        try:
+            leaf.values.insert(i, value)
+        except (TypeError, OverflowError):  # Valor que não cabe no array de valores
+            del leaf.keys[i]
+            raise
+        self.count += 1
+        if len(leaf.keys) <= self.order:
+            return
+
+        # A folha estourou: divide e propaga o separador para cima enquanto for preciso
+        separador, nova = self._split_leaf(leaf)
+        while path:
+            parent, idx = path.pop()
+            parent.keys.insert(idx, separador)
+            parent.children.insert(idx + 1, nova)
+            if len(parent.keys) <= self.order:
+                return
+            separador, nova = self._split_internal(parent)
+        # A raiz foi dividida: a árvore cresce um nível
+        raiz = BPlusInternal()
+        raiz.keys = [separador]
+        raiz.children = [self.root, nova]
+        self.root = raiz
+
+    def upsert(self, key, value=None):
+        """Insere a chave ou, se ela já existe, troca todos os seus valores por 'value' (um valor por chave, como num mapa)."""
+        leaf, i, _ = self._ultima_ocorrencia(key)
+        if leaf is None:
+            self.insert(key, value)
+            return
+        unica = leaf.keys[i - 1] != key if i > 0 else self._primeira_ocorrencia(key) == (leaf, 0)
+        if unica:
+            leaf.values[i] = value  # Caso comum de um mapa: troca no lugar
+            return
+        while self.remove(key):
+            pass
+        self.insert(key, value)
+
+    def search(self, key):
+        """Busca uma chave. Retorna True se encontrou, False caso contrário."""
+        leaf, i = self._primeira_ocorrencia(key)
+        return i < len(leaf.keys) and leaf.keys[i] == key
+
+    def get(self, key):
+        """Retorna a lista de valores associados à chave, na ordem de inserção (vazia se não existir)."""
+        valores = []
+        leaf, i = self._primeira_ocorrencia(key)
+        # A igualdade é conferida (e não só a ordem): NaN, por exemplo, não é igual a nada
+        while leaf is not None and i < len(leaf.keys) and leaf.keys[i] == key:
+            j = bisect_right(leaf.keys, key, i)
+            valores += leaf.values[i:j]
+            if j < len(leaf.keys):
+                break
+            leaf, i = leaf.next, 0
+        return valores
+
+    def remove(self, key):
+        """Remove UMA ocorrência da chave (a última inserida). Retorna True se removeu, False se não encontrou."""
+        leaf, i, path = self._ultima_ocorrencia(key)
+        if leaf is None:
+            return False
+        self.count -= 1
+        del leaf.keys[i]
+        del leaf.values[i]
+        self._rebalance(leaf, path)
+        return True
+
+    def _rebalance(self, node, path):
+        """Corrige nós com menos de 'min_keys' chaves emprestando de um irmão ou fundindo com ele."""
+        while path and len(node.keys) < self.min_keys:
+            parent, idx = path.pop()
+            left = parent.children[idx - 1] if idx > 0 else None
+            right = parent.children[idx + 1] if idx + 1 < len(parent.children) else None
+            folha = isinstance(node, BPlusLeaf)
+
+            if left is not None and len(left.keys) > self.min_keys:
+                # Empresta do irmão esquerdo
+                if folha:
+                    node.keys.insert(0, left.keys.pop())
+                    node.values.insert(0, left.values.pop())
+                    parent.keys[idx - 1] = node.keys[0]
+                else:
+                    node.keys.insert(0, parent.keys[idx - 1])
+                    node.children.insert(0, left.children.pop())
+                    parent.keys[idx - 1] = left.keys.pop()
+                return
+            if right is not None and len(right.keys) > self.min_keys:
+                # Empresta do irmão direito
+                if folha:
+                    node.keys.append(right.keys.pop(0))
+                    node.values.append(right.values.pop(0))
+                    parent.keys[idx] = right.keys[0]
+                else:
+                    node.keys.append(parent.keys[idx])
+                    node.children.append(right.children.pop(0))
+                    parent.keys[idx] = right.keys.pop(0)
+                return
+
+            # Nenhum irmão pode emprestar: funde com um deles (o pai perde um separador)
+            if left is not None:
+                esquerda, direita, sep = left, node, idx - 1
+            else:
+                esquerda, direita, sep = node, right, idx
+            if folha:
+                esquerda.keys += direita.keys
+                esquerda.values += direita.values
+                esquerda.next = direita.next
+            else:
+                esquerda.keys += [parent.keys[sep]] + direita.keys
+                esquerda.children += direita.children
+            del parent.keys[sep]
+            del parent.children[sep + 1]
+            node = parent
+
+        # Se a raiz interna ficou com um único filho, a árvore perde um nível
+        if isinstance(self.root, BPlusInternal) and len(self.root.children) == 1:
+            self.root = self.root.children[0]
+
+    def range_items(self, low, high):
+        """Gera os pares (chave, valor) com low <= chave <= high, percorrendo as folhas encadeadas."""
+        leaf, _ = self._find_leaf(low, primeira=True)
+        i = bisect_left(leaf.keys, low)
+        while leaf is not None:
+            j = bisect_right(leaf.keys, high, i)
+            yield from zip(leaf.keys[i:j], leaf.values[i:j])
+            if j < len(leaf.keys):
+                return
+            leaf, i = leaf.next, 0
+
+    def range(self, low, high):
+        """Retorna a lista de chaves (com repetições) no intervalo fechado [low, high]."""
+        return [key for key, _ in self.range_items(low, high)]
+
+    def count_range(self, low, high):
+        """Conta as entradas no intervalo fechado [low, high] sem materializar os valores."""
+        leaf, _ = self._find_leaf(low, primeira=True)
+        i = bisect_left(leaf.keys, low)
+        total = 0
+        while leaf is not None:
+            j = bisect_right(leaf.keys, high, i)
+            total += j - i
+            if j < len(leaf.keys):
+                break
+            leaf, i = leaf.next, 0
+        return total
+
+    # --- Iteração e Exportação ---
+
+    def _primeira_folha(self):
+        node = self.root
+        while isinstance(node, BPlusInternal):
+            node = node.children[0]
+        return node
+
+    def _folhas(self):
+        leaf = self._primeira_folha()
+        while leaf is not None:
+            yield leaf
+            leaf = leaf.next
+
+    def items(self):
+        """Gera todos os pares (chave, valor) em ordem de chave, percorrendo as folhas encadeadas."""
+        for leaf in self._folhas():
+            yield from zip(leaf.keys, leaf.values)
+
+    def __iter__(self):
+        """Gera as chaves em ordem, uma vez por entrada (chaves repetidas aparecem repetidas)."""
+        for leaf in self._folhas():
+            yield from leaf.keys
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    def _exportar_buffers(self, campo, typecode, dtype):
+        """Concatena os buffers das folhas; com array.array, copia os bytes direto, sem passar por objetos Python."""
+        if typecode is None:
+            return _exportar((x for leaf in self._folhas() for x in getattr(leaf, campo)), dtype, self.count)
+        dados = np.concatenate([np.frombuffer(getattr(leaf, campo), dtype=typecode) for leaf in self._folhas()])
+        return dados if dtype is None else dados.astype(dtype)
+
+    def to_numpy(self, key_dtype=None, value_dtype=None):
+        """Exporta (chaves, valores) de todas as entradas, em ordem, em dois arrays NumPy alinhados."""
+        return (self._exportar_buffers('keys', self.key_typecode, key_dtype),
+                self._exportar_buffers('values', self.value_typecode, value_dtype))
+
+    def height(self):
+        """Número de níveis da árvore (1 quando a raiz é uma folha)."""
+        altura, node = 1, self.root
+        while isinstance(node, BPlusInternal):
+            altura += 1
+            node = node.children[0]
+        return altura
+
+    def get_memory_usage(self):
+        """Soma o tamanho dos nós e de seus buffers internos (percurso iterativo)."""
+        size, pilha = 0, [self.root]
+        while pilha:
+            node = pilha.pop()
+            size += sys.getsizeof(node) + sys.getsizeof(node.keys)
+            if isinstance(node, BPlusInternal):
+                size += sys.getsizeof(node.children)
+                pilha.extend(node.children)
+            else:
+                size += sys.getsizeof(node.values)  # array.array já inclui os dados; lista, só os ponteiros
+        return size
@@ -0,0 +1,369 @@
+# src/estrutura_de_dados/arvore_bola.py
+import numpy as np
+
+# Limite de elementos da matriz intermediária (consultas x pontos x dimensões) por bloco
+ELEMENTOS_POR_BLOCO = 1 << 22
+# Consultas em que mais que esta fração das folhas segue candidata após a primeira vão para a força bruta
+FRACAO_FORCA_BRUTA = 0.5
+
+
+# --- Métricas ---
+
+class Metrica:
+    """
+    Métrica de distância usada pela BallTree e pelas buscas por força bruta.
+    'distancia(A, B)' recebe arrays cuja última dimensão são as coordenadas e devolve as
+    distâncias com broadcasting nas demais (linha a linha, ponto contra conjunto ou todos
+    contra todos com A[:, None] e B[None]). 'pares(A, B)' é opcional: um kernel mais rápido
+    para a matriz (len(A), len(B)); sem ele, a matriz é montada por broadcasting em blocos.
+    A poda da árvore usa a desigualdade triangular, então 'distancia' precisa ser uma métrica.
+    """
+    def __init__(self, nome, distancia, pares=None):
+        self.nome = nome
+        self.distancia = distancia
+        self._pares = pares
+
+    def pares(self, A, B):
+        if self._pares is not None:
+            return self._pares(A, B)
+        passo = max(1, ELEMENTOS_POR_BLOCO // max(1, B.shape[0] * B.shape[1]))
+        return np.concatenate([self.distancia(A[i:i + passo, None, :], B[None, :, :])
+                               for i in range(0, len(A), passo)]) if len(A) else np.empty((0, len(B)))
+
+    def __repr__(self):
+        return f"Metrica({self.nome!r})"
+
+
+def _pares_euclidiana(A, B):
+    # ||a - b||² = ||a||² + ||b||² - 2 a·b: a matriz inteira sai de um produto de matrizes
+    quadrados = (A * A).sum(axis=1)[:, None] + (B * B).sum(axis=1)[None, :] - 2.0 * (A @ B.T)
+    return np.sqrt(np.maximum(quadrados, 0.0))
+
+
+def minkowski(p):
+    """Métrica de Minkowski de ordem p >= 1 (p=1 Manhattan, p=2 Euclidiana, p=inf Chebyshev)."""
+    if p < 1:
+        raise ValueError("A métrica de Minkowski exige p >= 1.")
+    if p == 2:
+        return Metrica("euclidean", lambda A, B: np.sqrt(((A - B) ** 2).sum(axis=-1)), _pares_euclidiana)
+    if p == 1:
+        return Metrica("manhattan", lambda A, B: np.abs(A - B).sum(axis=-1))
+    if np.isinf(p):
+        return Metrica("chebyshev", lambda A, B: np.abs(A - B).max(axis=-1))
+    return Metrica(f"minkowski(p={p})", lambda A, B: (np.abs(A - B) ** p).sum(axis=-1) ** (1.0 / p))
+
+
+METRICAS = {"euclidean": 2, "manhattan": 1, "chebyshev": np.inf}
+
+
+def obter_metrica(metric, p=None):
+    """Aceita o nome de uma métrica de METRICAS, 'minkowski' (com p), uma Metrica ou uma função distancia(A, B)."""
+    if isinstance(metric, Metrica):
+        return metric
+    if callable(metric):
+        return Metrica(getattr(metric, "__name__", "personalizada"), metric)
+    if metric == "minkowski":
+        if p is None:
+            raise ValueError("A métrica 'minkowski' exige o parâmetro p.")
+        return minkowski(p)
+    if metric not in METRICAS:
+        raise ValueError(f"Métrica desconhecida: {metric!r}. Opções: {sorted(METRICAS) + ['minkowski']}.")
+    return minkowski(METRICAS[metric])
+
+
+def _como_matriz(X, n_dimensoes=None):
+    X = np.asarray(X, dtype=np.float64)
+    if X.ndim == 1:
+        X = X[None, :]
+    if X.ndim != 2 or (n_dimensoes is not None and X.shape[1] != n_dimensoes):
+        raise ValueError(f"As consultas devem ter formato (m, {n_dimensoes}).")
+    return X
+
+
+def _ordenar_linhas(distancias, indices):
+    """Ordena cada linha por distância (empates pelo índice, para resultados determinísticos)."""
+    ordem = np.lexsort((indices, distancias), axis=1) if distancias.size else np.empty(distancias.shape, dtype=np.intp)
+    return np.take_along_axis(distancias, ordem, axis=1), np.take_along_axis(indices, ordem, axis=1)
+
+
+# --- Força Bruta (referência) ---
+
+def knn_forca_bruta(dados, X, k=1, metric="euclidean", p=None):
+    """
+    k vizinhos mais próximos calculando todas as distâncias (em blocos de consultas).
+    Retorna (distancias, indices), ambos (m, k), em ordem crescente de distância.
+    """
+    metrica = obter_metrica(metric, p)
+    dados = _como_matriz(dados)
+    X = _como_matriz(X, dados.shape[1])
+    if not 1 <= k <= len(dados):
+        raise ValueError(f"k deve estar entre 1 e {len(dados)}.")
+    passo = max(1, ELEMENTOS_POR_BLOCO // max(1, len(dados)))
+    distancias, indices = [], []
+    for i in range(0, len(X), passo):
+        d = metrica.pares(X[i:i + passo], dados)
+        sel = np.argpartition(d, k - 1, axis=1)[:, :k] if k < len(dados) else np.broadcast_to(np.arange(len(dados)), d.shape)
+        d_sel, i_sel = _ordenar_linhas(np.take_along_axis(d, sel, axis=1), np.ascontiguousarray(sel))
+        distancias.append(d_sel); indices.append(i_sel)
+    return np.concatenate(distancias), np.concatenate(indices)
+
+
+def raio_forca_bruta(dados, X, r, metric="euclidean", p=None):
+    """Índices dos pontos a distância <= r de cada consulta (lista de arrays em ordem crescente de índice)."""
+    metrica = obter_metrica(metric, p)
+    dados = _como_matriz(dados)
+    X = _como_matriz(X, dados.shape[1])
+    passo = max(1, ELEMENTOS_POR_BLOCO // max(1, len(dados)))
+    resultado = []
+    for i in range(0, len(X), passo):
+        resultado.extend(np.flatnonzero(linha <= r) for linha in metrica.pares(X[i:i + passo], dados))
+    return resultado
+
+
+# --- Ball Tree ---
+
+class BallTree:
+    """
+    Ball Tree sobre uma matriz de pontos (n, d) para k-NN e buscas por raio em qualquer
+    número de dimensões. Cada nó é uma "bola": centro (média dos seus pontos) e raio (maior
+    distância do centro a um deles). Pela desigualdade triangular, nenhum ponto do nó fica a
+    menos de max(0, d(q, centro) - raio) da consulta q, e o nó inteiro é descartado quando
+    esse limite já passa do k-ésimo melhor (ou do raio pedido). Ao contrário da KD-Tree, o
+    corte não depende de um eixo, então serve para qualquer número de features e métrica.
+
+    A árvore fica em arrays (centro, raio, início/fim e filhos de cada nó) e os pontos são
+    reordenados para que cada folha seja uma fatia contígua. As consultas trabalham sobre as
+    folhas: os limites de todas elas saem de um único kernel NumPy (consultas x centros), e as
+    distâncias de uma folha a todas as consultas que ainda podem ganhar algo nela, de outro
+    (consultas x pontos). Quando a dimensão intrínseca dos dados é alta
+    (como nas 48 colunas codificadas do modelo), quase nenhuma folha é descartada; query
+    detecta isso por consulta e usa a força bruta (ver executar_benchmark_vizinhos).
+    """
+    def __init__(self, points, leaf_size=40, metric="euclidean", p=None):
+        if leaf_size < 1:
+            raise ValueError("leaf_size deve ser pelo menos 1.")
+        pontos = _como_matriz(points)
+        if len(pontos) == 0:
+            raise ValueError("A BallTree precisa de pelo menos um ponto.")
+        self.metrica = obter_metrica(metric, p)
+        self.leaf_size = leaf_size
+        self.n, self.k = pontos.shape
+        self.indices = np.arange(self.n)  # Posição original de cada ponto, na ordem das folhas
+
+        inicio, fim, esquerda, direita = [], [], [], []
+        pilha = [(0, self.n, -1, 0)]  # (início, fim, pai, lado)
+        while pilha:
+            s, e, pai, lado = pilha.pop()
+            no = len(inicio)
+            inicio.append(s); fim.append(e); esquerda.append(-1); direita.append(-1)
+            if pai >= 0:
+                (esquerda if lado == 0 else direita)[pai] = no
+            if e - s <= leaf_size:
+                continue
+            # Divide na dimensão de maior amplitude, pela mediana
+            fatia = self.indices[s:e]
+            bloco = pontos[fatia]
+            eixo = int(np.argmax(bloco.max(axis=0) - bloco.min(axis=0)))
+            meio = (e - s) // 2
+            self.indices[s:e] = fatia[np.argpartition(bloco[:, eixo], meio)]
+            pilha.append((s + meio, e, no, 1))
+            pilha.append((s, s + meio, no, 0))
+
+        self.inicio, self.fim = np.array(inicio), np.array(fim)
+        self.esquerda, self.direita = np.array(esquerda), np.array(direita)
+        self.dados = pontos[self.indices]
+        self.centro = np.empty((len(inicio), self.k))
+        self.raio = np.empty(len(inicio))
+        for no, (s, e) in enumerate(zip(inicio, fim)):
+            self.centro[no] = self.dados[s:e].mean(axis=0)
+            self.raio[no] = self.metrica.distancia(self.dados[s:e], self.centro[no]).max()
+
+        self.folhas = np.flatnonzero(self.esquerda < 0)
+        self._centros_folhas, self._raios_folhas = self.centro[self.folhas], self.raio[self.folhas]
+        # Acumulado das consultas k-NN: quantas caíram na força bruta e quantas folhas foram lidas
+        self.estatisticas_consulta = {"consultas": 0, "forca_bruta": 0, "folhas_visitadas": 0}
+
+    @property
+    def n_nos(self):
+        return len(self.inicio)
+
+    # --- k Vizinhos Mais Próximos ---
+
+    def _distancias_folhas(self, X):
+        """Matriz (m, folhas) com a distância de cada consulta ao centro de cada folha."""
+        return self.metrica.pares(X, self._centros_folhas)
+
+    def _mesclar(self, melhores_d, melhores_i, q, folha, X, k):
+        """Calcula as distâncias das consultas q aos pontos da folha e junta aos k melhores delas."""
+        s, e = self.inicio[folha], self.fim[folha]
+        d = self.metrica.pares(X[q], self.dados[s:e])
+        cand_d = np.concatenate([melhores_d[q], d], axis=1)
+        cand_i = np.concatenate([melhores_i[q], np.broadcast_to(self.indices[s:e], d.shape)], axis=1)
+        sel = np.argpartition(cand_d, k - 1, axis=1)[:, :k]
+        melhores_d[q] = np.take_along_axis(cand_d, sel, axis=1)
+        melhores_i[q] = np.take_along_axis(cand_i, sel, axis=1)
+
+    def _knn_uma(self, x, k, limites):
+        """
+        k-NN de uma consulta em duas rodadas: a folha de menor limite dá um k-ésimo provisório,
+        e todas as folhas que ainda podem superá-lo são lidas juntas, num único kernel.
+        """
+        primeira = int(limites.argmin())
+        folha = self.folhas[primeira]
+        s, e = self.inicio[folha], self.fim[folha]
+        d = self.metrica.pares(x, self.dados[s:e])[0]
+        kesimo = np.partition(d, k - 1)[k - 1] if e - s >= k else np.inf
+        candidatas = limites <= kesimo
+        candidatas[primeira] = True
+        n_candidatas = int(candidatas.sum())
+        densa = n_candidatas > FRACAO_FORCA_BRUTA * len(self.folhas)
+        if densa:
+            posicoes = slice(None)
+            d = self.metrica.pares(x, self.dados)[0]
+        else:
+            posicoes = np.concatenate([np.arange(self.inicio[f], self.fim[f]) for f in self.folhas[candidatas].tolist()])
+            d = self.metrica.pares(x, self.dados[posicoes])[0]
+        sel = np.argpartition(d, k - 1)[:k] if len(d) > k else np.arange(len(d))
+        indices = self.indices[posicoes][sel]
+        self._contar(1, int(densa), n_candidatas)
+        return d[sel][None, :], indices[None, :]
+
+    def _knn_lote(self, X, k, limites):
+        """k-NN de várias consultas: cada folha é lida uma vez, com as consultas que ainda podem melhorar nela."""
+        m = len(X)
+        melhores_d = np.full((m, k), np.inf)
+        melhores_i = np.full((m, k), -1, dtype=np.intp)
+        primeira = limites.argmin(axis=1)
+        ordem = np.argsort(primeira, kind='stable')
+        grupos, inicios = np.unique(primeira[ordem], return_index=True)
+        for j, q in zip(grupos.tolist(), np.split(ordem, inicios[1:])):
+            self._mesclar(melhores_d, melhores_i, q, self.folhas[j], X, k)
+        limites[np.arange(m), primeira] = np.inf  # Já visitada
+
+        candidatas = (limites < melhores_d[:, k - 1:k]).sum(axis=1)
+        densas = candidatas > FRACAO_FORCA_BRUTA * len(self.folhas)
+        if densas.any():
+            q = np.flatnonzero(densas)
+            melhores_d[q], posicoes = knn_forca_bruta(self.dados, X[q], k, metric=self.metrica)
+            melhores_i[q] = self.indices[posicoes]
+        esparsas = np.flatnonzero(~densas)
+        # Folhas mais promissoras (na mediana das consultas) primeiro apertam os k-ésimos
+        if len(esparsas):
+            for j in np.argsort(np.median(limites[esparsas], axis=0)).tolist():
+                q = esparsas[limites[esparsas, j] < melhores_d[esparsas, k - 1]]
+                if len(q):
+                    self._mesclar(melhores_d, melhores_i, q, self.folhas[j], X, k)
+        self._contar(m, int(densas.sum()), m + int(candidatas.sum()))
+        return melhores_d, melhores_i
+
+    def _contar(self, consultas, forca_bruta, folhas):
+        estatisticas = self.estatisticas_consulta
+        estatisticas["consultas"] += consultas
+        estatisticas["forca_bruta"] += forca_bruta
+        estatisticas["folhas_visitadas"] += folhas
+
+    def query(self, X, k=1, return_distance=True):
+        """
+        k vizinhos mais próximos de cada linha de X (um ponto ou uma matriz (m, d)).
+        Retorna (distancias, indices), ambos (m, k) e em ordem crescente de distância, com
+        os índices referentes à matriz original; só os índices se return_distance=False.
+
+        Os limites inferiores de todas as folhas saem de um único kernel (consultas x centros),
+        e cada consulta começa pela sua folha de menor limite. Consultas que, depois dela,
+        não conseguem descartar ao menos metade das folhas (FRACAO_FORCA_BRUTA) usam a força
+        bruta, que nesse caso é mais barata.
+        """
+        X = _como_matriz(X, self.k)
+        if not 1 <= k <= self.n:
+            raise ValueError(f"k deve estar entre 1 e {self.n}.")
+        limites = np.maximum(self._distancias_folhas(X) - self._raios_folhas, 0.0)
+        if len(X) == 1:
+            melhores_d, melhores_i = self._knn_uma(X, k, limites[0])
+        else:
+            melhores_d, melhores_i = self._knn_lote(X, k, limites)
+        distancias, indices = _ordenar_linhas(melhores_d, melhores_i)
+        return (distancias, indices) if return_distance else indices
+
+    # --- Busca por Raio ---
+
+    def query_radius(self, X, r, return_distance=False):
+        """
+        Pontos a distância <= r de cada linha de X. Retorna uma lista (uma entrada por
+        consulta) de arrays de índices em ordem crescente; com return_distance=True, retorna
+        (indices, distancias) com cada par de arrays em ordem crescente de distância.
+        Folhas inteiramente dentro do raio entram sem calcular distância nenhuma (só quando
+        as distâncias não são pedidas); consultas sem poda usam a força bruta, como em query.
+        """
+        if r < 0:
+            raise ValueError("O raio deve ser não negativo.")
+        X = _como_matriz(X, self.k)
+        m = len(X)
+        dist_centros = self._distancias_folhas(X)
+        candidatas = dist_centros - self._raios_folhas <= r
+        inteiras = (dist_centros + self._raios_folhas <= r) if not return_distance else np.zeros_like(candidatas)
+        densas = candidatas.sum(axis=1) > FRACAO_FORCA_BRUTA * len(self.folhas)
+        encontrados = [[] for _ in range(m)]
+
+        q_densas = np.flatnonzero(densas)
+        passo = max(1, ELEMENTOS_POR_BLOCO // self.n)
+        for i in range(0, len(q_densas), passo):
+            bloco = q_densas[i:i + passo]
+            for consulta, linha in zip(bloco.tolist(), self.metrica.pares(X[bloco], self.dados)):
+                mascara = linha <= r
+                encontrados[consulta].append((self.indices[mascara], linha[mascara]))
+
+        candidatas[densas] = False
+        for j in np.flatnonzero(candidatas.any(axis=0)).tolist():
+            folha = self.folhas[j]
+            s, e = self.inicio[folha], self.fim[folha]
+            q = np.flatnonzero(candidatas[:, j])
+            cheias = inteiras[q, j]
+            for consulta in q[cheias].tolist():
+                encontrados[consulta].append((self.indices[s:e], None))
+            q = q[~cheias]
+            if len(q):
+                for consulta, linha in zip(q.tolist(), self.metrica.pares(X[q], self.dados[s:e])):
+                    mascara = linha <= r
+                    if mascara.any():
+                        encontrados[consulta].append((self.indices[s:e][mascara], linha[mascara]))
+
+        indices, distancias = [], []
+        for partes in encontrados:
+            idx = np.concatenate([i for i, _ in partes]) if partes else np.empty(0, dtype=np.intp)
+            if return_distance:
+                d = np.concatenate([d for _, d in partes]) if partes else np.empty(0)
+                ordem = np.lexsort((idx, d))
+                indices.append(idx[ordem]); distancias.append(d[ordem])
+            else:
+                indices.append(np.sort(idx))
+        return (indices, distancias) if return_distance else indices
+
+    # --- Iteração e Exportação ---
+    # A árvore é estática e já guarda os pontos num array (na ordem das folhas): a
+    # exportação é sem cópia, e a iteração segue essa mesma ordem.
+
+    def __len__(self):
+        return self.n
+
+    def __iter__(self):
+        """Gera os pontos (linhas de 'dados') na ordem das folhas."""
+        return iter(self.dados)
+
+    def items(self):
+        """Gera (posição original, ponto) na ordem das folhas."""
+        return zip(self.indices.tolist(), self.dados)
+
+    def to_numpy(self):
+        """
+        Exporta (indices, dados) sem cópia: visões somente leitura da posição original de
+        cada ponto e da matriz n x k dos pontos, ambas na ordem das folhas.
+        Para a ordem original: pontos = np.empty_like(dados); pontos[indices] = dados.
+        """
+        indices, dados = self.indices.view(), self.dados.view()
+        indices.flags.writeable = dados.flags.writeable = False
+        return indices, dados
+
+    def get_memory_usage(self):
+        """Retorna o uso de memória dos arrays da árvore (pontos reordenados incluídos) em bytes."""
+        return sum(a.nbytes for a in (self.indices, self.dados, self.centro, self.raio,
+                                      self.inicio, self.fim, self.esquerda, self.direita))
@@ -0,0 +1,102 @@
+# src/estrutura_de_dados/backend_assincrono.py
+import asyncio
+import inspect
+
+# Marcador para diferenciar "não está no cache" de um valor None guardado
+_AUSENTE = object()
+
+class AsyncKVBackend:
+    """
+    Adaptador asyncio que expõe qualquer estrutura do projeto como um armazenamento
+    chave-valor remoto: cada ida ao "servidor" custa 'latencia_s' segundos de espera.
+    As esperas são feitas com asyncio.sleep, então várias requisições em voo se sobrepõem
+    em vez de se somarem; 'max_concorrencia' limita quantas ficam em voo ao mesmo tempo.
+
+    Recursos:
+    - get/put: uma requisição por chamada;
+    - get_many: lote com asyncio.gather, respeitando o limite de concorrência;
+    - pipeline: várias chaves por ida ao servidor (uma única latência por lote);
+    - cache: LRUCache local opcional (read-through) que evita a ida ao servidor nos acertos.
+    """
+    def __init__(self, estrutura, latencia_s=0.001, max_concorrencia=64, cache=None):
+        if latencia_s < 0 or max_concorrencia <= 0:
+            raise ValueError("Latência deve ser >= 0 e a concorrência máxima positiva.")
+        self.estrutura = estrutura
+        self.latencia_s = latencia_s
+        self.max_concorrencia = max_concorrencia
+        self.cache = cache
+        self.requisicoes = 0  # Idas ao "servidor"
+        self._semaforo = None  # Criado sob demanda, dentro do loop de eventos em uso
+        self._loop = None
+        # HashTable/CuckooHashing exigem insert(key, value); as demais aceitam insert(key)
+        obrigatorios = [p for p in inspect.signature(estrutura.insert).parameters.values()
+                        if p.default is inspect.Parameter.empty]
+        self.chave_valor = len(obrigatorios) >= 2
+
+    def _obter_semaforo(self):
+        """O semáforo fica preso ao loop onde foi usado; cada asyncio.run recebe um novo."""
+        loop = asyncio.get_running_loop()
+        if self._semaforo is None or self._loop is not loop:
+            self._semaforo, self._loop = asyncio.Semaphore(self.max_concorrencia), loop
+        return self._semaforo
+
+    async def _ida_ao_servidor(self, operacao):
+        """Espera a latência de rede (ocupando uma vaga de concorrência) e executa a operação."""
+        async with self._obter_semaforo():
+            self.requisicoes += 1
+            await asyncio.sleep(self.latencia_s)
+            return operacao()
+
+    # --- Operações Públicas ---
+
+    async def get(self, key):
+        """Busca uma chave. Retorna o valor (ou o resultado de search) da estrutura."""
+        if self.cache is not None:
+            valor = self.cache.get(key, _AUSENTE)
+            if valor is not _AUSENTE:
+                return valor
+        valor = await self._ida_ao_servidor(lambda: self.estrutura.search(key))
+        if self.cache is not None:
+            self.cache.put(key, valor)
+        return valor
+
+    async def put(self, key, value=None):
+        """Insere no servidor e invalida a chave no cache local."""
+        if self.chave_valor:
+            await self._ida_ao_servidor(lambda: self.estrutura.insert(key, value))
+        else:
+            await self._ida_ao_servidor(lambda: self.estrutura.insert(key))
+        if self.cache is not None:
+            self.cache.invalidate(key)
+
+    async def get_many(self, keys):
+        """Busca várias chaves concorrentemente (gather), no máximo 'max_concorrencia' em voo."""
+        return await asyncio.gather(*(self.get(k) for k in keys))
+
+    async def pipeline(self, keys, tamanho_lote=32):
+        """
+        Envia as chaves em lotes de 'tamanho_lote' por requisição: cada lote paga uma única
+        latência. Os lotes também são enviados concorrentemente. Retorna os resultados na ordem.
+        """
+        keys = list(keys)
+        resultados = [None] * len(keys)
+        pendentes = []
+        for i, key in enumerate(keys):
+            if self.cache is not None:
+                valor = self.cache.get(key, _AUSENTE)
+                if valor is not _AUSENTE:
+                    resultados[i] = valor
+                    continue
+            pendentes.append(i)
+
+        def executar_lote(indices):
+            return [self.estrutura.search(keys[i]) for i in indices]
+
+        lotes = [pendentes[i:i + tamanho_lote] for i in range(0, len(pendentes), tamanho_lote)]
+        respostas = await asyncio.gather(*(self._ida_ao_servidor(lambda lote=lote: executar_lote(lote)) for lote in lotes))
+        for lote, valores in zip(lotes, respostas):
+            for i, valor in zip(lote, valores):
+                resultados[i] = valor
+                if self.cache is not None:
+                    self.cache.put(keys[i], valor)
+        return resultados
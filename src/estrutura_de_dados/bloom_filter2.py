@@ -1,6 +1,27 @@
 # src/data_structures/counting_bloom_filter.py
-import hashlib
+import math
 import sys
+import numpy as np
+
+from src.estrutura_de_dados.hashing import hash64, hash64_many
+
+# Os contadores são de 8 bits: ao chegar no máximo, "saturam" e nunca mais são decrementados
+COUNTER_MAX = 255
+TAMANHO_BLOCO = 1 << 16  # Contadores examinados por vez em items()
+
+def calcular_parametros(capacity, fpr):
+    """
+    Calcula o tamanho (m) e o número de hashes (k) ótimos para guardar 'capacity' itens
+    com a taxa de falsos positivos desejada:
+        m = -n * ln(p) / ln(2)^2      k = (m / n) * ln(2)
+    """
+    if capacity <= 0:
+        raise ValueError("A capacidade deve ser maior que zero.")
+    if not 0 < fpr < 1:
+        raise ValueError("A taxa de falsos positivos deve estar entre 0 e 1.")
+    size = math.ceil(-capacity * math.log(fpr) / (math.log(2) ** 2))
+    hash_count = max(1, round(size / capacity * math.log(2)))
+    return size, hash_count
 
 class CountingBloomFilter:
     """
@@ -13,32 +34,84 @@ class CountingBloomFilter:
             raise ValueError("Tamanho e contagem de hash devem ser maiores que zero.")
         self.size = size
         self.hash_count = hash_count
-        self.count_array = [0] * size
+        self.count_array = np.zeros(size, dtype=np.uint8)
+        self.count = 0            # Itens inseridos (menos os removidos)
+        self.overflow_count = 0   # Incrementos perdidos porque o contador já estava saturado
+        self.nonzero_count = 0    # Contadores maiores que zero (ocupação em O(1))
+        self._offsets = np.arange(hash_count, dtype=np.uint64)
+
+    @classmethod
+    def from_capacity(cls, capacity, fpr=0.01):
+        """Cria um filtro dimensionado para 'capacity' itens com a taxa de falsos positivos 'fpr'."""
+        size, hash_count = calcular_parametros(capacity, fpr)
+        return cls(size=size, hash_count=hash_count)
 
     def _hashes(self, item):
-        """Gera 'hash_count' valores de hash para um item."""
-        # Garante que o item seja uma string para consistência no encoding
-        item_str = str(item)
-        item_bytes = item_str.encode('utf-8')
-        
-        for i in range(self.hash_count):
-            # Gera um hash diferente para cada iteração 'i'
-            hasher = hashlib.sha256(item_bytes + str(i).encode('utf-8'))
-            yield int(hasher.hexdigest(), 16) % self.size
+        """
+        Gera 'hash_count' posições para um item usando hash duplo (Kirsch-Mitzenmacher):
+        posição_i = (h1 + i * h2) % size, com h1 e h2 tirados de um único hash de 64 bits.
+        """
+        return self._positions_from_hash(hash64(item))
+
+    def _positions_from_hash(self, h):
+        """Posições do item a partir de um hash de 64 bits já calculado."""
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def _hashes_many(self, itens):
+        """Versão vetorizada de _hashes: retorna uma matriz (n_itens, hash_count) de posições."""
+        return self._positions_from_hashes(hash64_many(itens))
+
+    def _positions_from_hashes(self, h):
+        """Versão vetorizada de _positions_from_hash para um array uint64 de hashes."""
+        h1 = h & np.uint64(0xFFFFFFFF)
+        h2 = (h >> np.uint64(32)) | np.uint64(1)
+        return (h1[:, None] + self._offsets[None, :] * h2[:, None]) % np.uint64(self.size)
+
+    def _incrementar(self, posicoes):
+        """Soma 1 nos contadores das posições de um item (saturando em COUNTER_MAX) e conta o item."""
+        for idx in posicoes:
+            contador = self.count_array[idx]
+            if contador < COUNTER_MAX:
+                self.count_array[idx] += 1
+                if contador == 0:
+                    self.nonzero_count += 1
+            else:
+                self.overflow_count += 1
+        self.count += 1
+
+    def _decrementar(self, posicoes):
+        """Desfaz _incrementar para as posições de um item (contadores saturados ficam como estão)."""
+        for idx in posicoes:
+            contador = self.count_array[idx]
+            if 0 < contador < COUNTER_MAX:
+                self.count_array[idx] -= 1
+                if contador == 1:
+                    self.nonzero_count -= 1
+        self.count = max(0, self.count - 1)
 
     def insert(self, item):
         """Insere um item no filtro, incrementando os contadores."""
-        for idx in self._hashes(item):
-            self.count_array[idx] += 1
+        self._incrementar(self._hashes(item))
+
+    def insert_many(self, itens):
+        """Insere vários itens de uma vez (contadores somados de forma vetorizada)."""
+        indices = self._hashes_many(itens).ravel()
+        novos = self.count_array + np.bincount(indices.astype(np.intp), minlength=self.size)
+        self.overflow_count += int(np.maximum(novos - COUNTER_MAX, 0).sum())
+        self.count_array = np.minimum(novos, COUNTER_MAX).astype(np.uint8)
+        self.nonzero_count = int(np.count_nonzero(self.count_array))
+        self.count += len(itens)
 
     def remove(self, item):
         """Remove um item do filtro, decrementando os contadores."""
         # Antes de decrementar, verifica se o item provavelmente existe
         # para evitar que os contadores fiquem negativos se remover algo que não foi inserido.
+        # Contadores saturados não são decrementados: seu valor real é desconhecido.
         if self.search(item):
-            for idx in self._hashes(item):
-                if self.count_array[idx] > 0:
-                    self.count_array[idx] -= 1
+            self._decrementar(self._hashes(item))
+            return True
+        return False
 
     def search(self, item):
         """
@@ -48,6 +121,78 @@ class CountingBloomFilter:
         """
         return all(self.count_array[idx] > 0 for idx in self._hashes(item))
 
+    def search_many(self, itens):
+        """Versão vetorizada de search: retorna um array booleano com uma resposta por item."""
+        return (self.count_array[self._hashes_many(itens)] > 0).all(axis=1)
+
+    def merge(self, outro):
+        """
+        Une outro filtro de mesmo tamanho e número de hashes, somando os contadores posição
+        a posição (in-place). Retorna self. Sem remoções nos filtros, o resultado (contadores,
+        saturação e overflow) é o mesmo de inserir todos os itens num filtro só.
+        """
+        if not isinstance(outro, CountingBloomFilter) or (outro.size, outro.hash_count) != (self.size, self.hash_count):
+            raise ValueError("Só é possível unir filtros com o mesmo tamanho e número de hashes.")
+        novos = self.count_array.astype(np.int64) + outro.count_array
+        self.overflow_count += outro.overflow_count + int(np.maximum(novos - COUNTER_MAX, 0).sum())
+        self.count_array = np.minimum(novos, COUNTER_MAX).astype(np.uint8)
+        self.nonzero_count = int(np.count_nonzero(self.count_array))
+        self.count += outro.count
+        return self
+
+    # --- Iteração e Exportação ---
+    # O filtro não guarda os itens, só contadores: não há __iter__ sobre os itens (e 'in'
+    # usa search). A exportação é a dos contadores.
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, item):
+        return self.search(item)
+
+    def items(self):
+        """Gera (posição, contador) das posições não zeradas, um bloco de contadores por vez."""
+        contadores = self.to_numpy()
+        for inicio in range(0, len(contadores), TAMANHO_BLOCO):
+            bloco = contadores[inicio:inicio + TAMANHO_BLOCO]
+            posicoes = np.flatnonzero(bloco)
+            yield from zip((posicoes + inicio).tolist(), bloco[posicoes].tolist())
+
+    def to_numpy(self):
+        """Visão somente leitura (sem cópia) do array de contadores."""
+        contadores = self.count_array.view()
+        contadores.flags.writeable = False
+        return contadores
+
+    def expected_fpr(self, n_itens=None):
+        """Taxa de falsos positivos teórica: (1 - e^(-k*n/m))^k, para n itens inseridos."""
+        n = self.count if n_itens is None else n_itens
+        return (1 - math.exp(-self.hash_count * n / self.size)) ** self.hash_count
+
+    def get_statistics(self):
+        """Estatísticas de ocupação dos contadores (saturação e overflow)."""
+        nao_zero = self.nonzero_count
+        return {
+            "itens": self.count,
+            "posicoes": self.size,
+            "hashes": self.hash_count,
+            "ocupacao": nao_zero / self.size,
+            "contadores_saturados": int(np.count_nonzero(self.count_array == COUNTER_MAX)),
+            "overflows": self.overflow_count,
+            "contador_maximo": int(self.count_array.max()) if self.size else 0,
+            "fpr_teorica": self.expected_fpr(),
+            # Com a ocupação medida, a FPR é ~ ocupação^k (estimativa mais fiel após remoções)
+            "fpr_estimada": (nao_zero / self.size) ** self.hash_count,
+        }
+
     def get_memory_usage(self):
         """Retorna o uso de memória estimado do array do filtro em bytes."""
-        return sys.getsizeof(self.count_array)
\ No newline at end of file
+        return sys.getsizeof(self.count_array)
+
+    def get_monitoring_stats(self):
+        """
+        Estatísticas lidas em O(1) para o monitoramento (ver src/benchmarks/monitoramento.py).
+        'fator_carga' é a fração de contadores não zerados, mantida a cada inserção e remoção.
+        """
+        return {"itens": self.count, "altura": None, "fator_carga": self.nonzero_count / self.size,
+                "memoria_bytes": self.get_memory_usage()}
@@ -0,0 +1,143 @@
+# src/estrutura_de_dados/bloom_filter_escalavel.py
+import sys
+import numpy as np
+
+from src.estrutura_de_dados.bloom_filter2 import CountingBloomFilter
+from src.estrutura_de_dados.hashing import hash64, hash64_many
+
+class ScalableBloomFilter:
+    """
+    Scalable Bloom Filter (Almeida et al., 2007) construído sobre o CountingBloomFilter.
+    Quando a camada atual atinge sua capacidade, uma nova camada maior e com taxa de
+    falsos positivos mais apertada é empilhada, em vez de deixar a FPR crescer sem limite.
+    Como as FPRs das camadas formam uma série geométrica, a FPR total fica limitada a 'fpr'.
+    Todas as camadas compartilham um único hash de 64 bits por item.
+    """
+    def __init__(self, initial_capacity=1000, fpr=0.01, growth_factor=2, tightening_ratio=0.5):
+        if initial_capacity <= 0 or growth_factor < 1:
+            raise ValueError("Capacidade inicial deve ser positiva e o fator de crescimento >= 1.")
+        if not 0 < fpr < 1 or not 0 < tightening_ratio < 1:
+            raise ValueError("fpr e tightening_ratio devem estar entre 0 e 1.")
+        self.initial_capacity = initial_capacity
+        self.fpr = fpr
+        self.growth_factor = growth_factor
+        self.tightening_ratio = tightening_ratio
+        self.layers = []       # Lista de CountingBloomFilter, da mais antiga para a mais nova
+        self.capacities = []   # Capacidade planejada de cada camada
+        self.fprs = []         # FPR alvo de cada camada
+        self.ambiguous_remove_count = 0  # Remoções recusadas por casar com mais de uma camada
+        self._add_layer()
+
+    def _add_layer(self):
+        """Empilha uma nova camada: capacidade * growth_factor^i e FPR * r^i."""
+        i = len(self.layers)
+        capacidade = int(self.initial_capacity * self.growth_factor ** i)
+        # A soma das FPRs das camadas (série geométrica) nunca passa de 'fpr'
+        fpr_camada = self.fpr * (1 - self.tightening_ratio) * self.tightening_ratio ** i
+        self.layers.append(CountingBloomFilter.from_capacity(capacidade, fpr_camada))
+        self.capacities.append(capacidade)
+        self.fprs.append(fpr_camada)
+
+    @property
+    def count(self):
+        return sum(camada.count for camada in self.layers)
+
+    def _layers_matching(self, h):
+        """Gera os índices das camadas que PODEM conter o item, da mais nova para a mais antiga."""
+        for i in range(len(self.layers) - 1, -1, -1):
+            camada = self.layers[i]
+            array = camada.count_array
+            if all(array[idx] > 0 for idx in camada._positions_from_hash(h)):
+                yield i
+
+    def insert(self, item):
+        """Insere o item na camada mais nova, criando uma camada nova se ela estiver cheia."""
+        if self.layers[-1].count >= self.capacities[-1]:
+            self._add_layer()
+        camada = self.layers[-1]
+        camada._incrementar(camada._positions_from_hash(hash64(item)))
+
+    def search(self, item):
+        """Verifica se o item PODE estar em alguma das camadas."""
+        return next(self._layers_matching(hash64(item)), None) is not None
+
+    def search_many(self, itens):
+        """
+        Busca vetorizada em todas as camadas: os hashes são calculados uma única vez
+        e reaproveitados para sondar cada camada.
+        """
+        h = hash64_many(itens)
+        encontrados = np.zeros(len(h), dtype=bool)
+        for camada in self.layers:
+            encontrados |= (camada.count_array[camada._positions_from_hashes(h)] > 0).all(axis=1)
+        return encontrados
+
+    def remove(self, item):
+        """
+        Remove o item da única camada que o contém. Retorna True se removeu.
+        Se mais de uma camada casa com o item (falso positivo em alguma delas, ou o item
+        inserido de novo depois de uma camada nova), não há como saber qual o guarda:
+        decrementar a errada apagaria contadores de outros itens (falsos negativos). Nesse caso nada é alterado, a remoção é recusada (False) e
+        contada em 'ambiguous_remove_count'.
+        """
+        h = hash64(item)
+        camadas = list(self._layers_matching(h))
+        if len(camadas) != 1:
+            if camadas:
+                self.ambiguous_remove_count += 1
+            return False
+        camada = self.layers[camadas[0]]
+        camada._decrementar(camada._positions_from_hash(h))
+        return True
+
+    # --- Iteração e Exportação ---
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, item):
+        return self.search(item)
+
+    def items(self):
+        """Gera (camada, posição, contador) das posições não zeradas, da camada mais antiga à mais nova."""
+        for i, camada in enumerate(self.layers):
+            for posicao, contador in camada.items():
+                yield i, posicao, contador
+
+    def to_numpy(self):
+        """Lista com a visão somente leitura (sem cópia) dos contadores de cada camada."""
+        return [camada.to_numpy() for camada in self.layers]
+
+    def expected_fpr(self):
+        """FPR teórica total: 1 - produto(1 - fpr_i) sobre as camadas, na ocupação atual."""
+        prob_negativo = 1.0
+        for camada in self.layers:
+            prob_negativo *= 1 - camada.expected_fpr()
+        return 1 - prob_negativo
+
+    def get_layer_statistics(self):
+        """Lista com memória, ocupação e FPR (alvo e teórica) de cada camada."""
+        relatorio = []
+        for i, (camada, capacidade, fpr_alvo) in enumerate(zip(self.layers, self.capacities, self.fprs)):
+            estatisticas = camada.get_statistics()
+            relatorio.append({
+                "camada": i, "capacidade": capacidade, "itens": camada.count,
+                "posicoes": camada.size, "hashes": camada.hash_count,
+                "fpr_alvo": fpr_alvo, "fpr_teorica": estatisticas["fpr_teorica"],
+                "ocupacao": estatisticas["ocupacao"], "memoria_bytes": camada.get_memory_usage(),
+            })
+        return relatorio
+
+    def get_memory_usage(self):
+        """Retorna o uso de memória estimado de todas as camadas em bytes."""
+        return sys.getsizeof(self.layers) + sum(camada.get_memory_usage() for camada in self.layers)
+
+    def get_monitoring_stats(self):
+        """
+        Estatísticas para o monitoramento (ver src/benchmarks/monitoramento.py): O(camadas),
+        que crescem só logaritmicamente com os itens. 'fator_carga' é a fração de contadores
+        não zerados somando todas as camadas.
+        """
+        return {"itens": self.count, "altura": None,
+                "fator_carga": sum(c.nonzero_count for c in self.layers) / sum(c.size for c in self.layers),
+                "memoria_bytes": self.get_memory_usage(), "camadas": len(self.layers)}
@@ -0,0 +1,202 @@
+# src/estrutura_de_dados/cache_lru.py
+import heapq
+import itertools
+import sys
+import time
+from collections import OrderedDict
+
+# Marcador para diferenciar "não está no cache" de um valor None guardado
+_AUSENTE = object()
+
+class LRUCache:
+    """
+    Cache LRU (Least Recently Used) com limites opcionais de validade e de tamanho.
+    Usa um OrderedDict: cada acesso move a chave para o fim, e a chave do início
+    (a usada há mais tempo) é a primeira a ser descartada. Tudo em O(1).
+    A validade fica num heap de (instante de expiração, chave) à parte, com remoção
+    preguiçosa: put e get só retiram do topo as entradas já vencidas, então expirar
+    custa O(log n) por entrada expirada, sem varrer o cache.
+    - capacity: número máximo de entradas;
+    - ttl_s: tempo de vida de cada entrada em segundos (None = sem expiração);
+    - max_bytes: limite do tamanho estimado (sys.getsizeof) de chaves + valores (None = sem limite).
+    """
+    def __init__(self, capacity=1024, ttl_s=None, max_bytes=None, relogio=time.monotonic):
+        if capacity <= 0:
+            raise ValueError("A capacidade do cache deve ser positiva.")
+        if (ttl_s is not None and ttl_s <= 0) or (max_bytes is not None and max_bytes <= 0):
+            raise ValueError("ttl_s e max_bytes devem ser positivos (ou None).")
+        self.capacity = capacity
+        self.ttl_s = ttl_s
+        self.max_bytes = max_bytes
+        self._relogio = relogio
+        self._dados = OrderedDict()  # chave -> (valor, tamanho em bytes, instante de expiração)
+        self._expiracoes = []  # heap de (expira, ordem, chave); itens de entradas já removidas ficam até sair
+        self._ordem = itertools.count()  # desempate no heap, para nunca comparar as chaves
+        self.bytes_usados = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        """
+        Número de entradas guardadas, em O(1) e sem alterar o cache. As que venceram desde a
+        última operação só saem no próximo put/get (ou em purgar_expiradas).
+        """
+        return len(self._dados)
+
+    def __contains__(self, key):
+        entrada = self._dados.get(key)
+        return entrada is not None and (entrada[2] is None or entrada[2] > self._relogio())
+
+    def __iter__(self):
+        """Gera as chaves válidas (não expiradas), da menos para a mais recente, sem mexer na ordem LRU."""
+        for key, _ in self.items():
+            yield key
+
+    def items(self):
+        """Gera os pares (chave, valor) válidos, da menos para a mais recente, sem contar acertos."""
+        agora = self._relogio() if self.ttl_s is not None else None
+        for key, (value, _, expira) in self._dados.items():
+            if expira is None or expira > agora:
+                yield key, value
+
+    def purgar_expiradas(self):
+        """Descarta as entradas expiradas e retorna quantas eram; custa O(log n) por entrada expirada."""
+        if self.ttl_s is None:
+            return 0
+        return self._purgar(self._relogio())
+
+    def _purgar(self, agora):
+        expiradas, heap = 0, self._expiracoes
+        while heap and heap[0][0] <= agora:
+            expira, _, key = heapq.heappop(heap)
+            entrada = self._dados.get(key)
+            # Item antigo (a chave saiu ou foi guardada de novo depois): só o descarta do heap
+            if entrada is not None and entrada[2] == expira:
+                self._descartar(key)
+                expiradas += 1
+        self.expirations += expiradas
+        return expiradas
+
+    def _descartar(self, key):
+        _, tamanho, _ = self._dados.pop(key)
+        self.bytes_usados -= tamanho
+
+    def get(self, key, default=None):
+        """Retorna o valor em cache (e o marca como recente) ou 'default' se não estiver ou expirou."""
+        if self.ttl_s is not None:
+            self._purgar(self._relogio())
+        entrada = self._dados.get(key)
+        if entrada is None:
+            self.misses += 1
+            return default
+        self._dados.move_to_end(key)
+        self.hits += 1
+        return entrada[0]
+
+    def put(self, key, value):
+        """Guarda o valor; descarta as entradas menos recentes enquanto algum limite estiver estourado."""
+        if key in self._dados:
+            self._descartar(key)
+        tamanho = sys.getsizeof(key) + sys.getsizeof(value)
+        if self.max_bytes is not None and tamanho > self.max_bytes:
+            return  # Sozinha a entrada já não cabe: não vale a pena esvaziar o cache por ela
+        expira = None
+        if self.ttl_s is not None:
+            agora = self._relogio()
+            self._purgar(agora)
+            expira = agora + self.ttl_s
+        self._dados[key] = (value, tamanho, expira)
+        self.bytes_usados += tamanho
+        if expira is not None:
+            heapq.heappush(self._expiracoes, (expira, next(self._ordem), key))
+            if len(self._expiracoes) > 2 * len(self._dados) + 64:
+                self._compactar_expiracoes()
+        while len(self._dados) > self.capacity or (self.max_bytes is not None and self.bytes_usados > self.max_bytes):
+            self._descartar(next(iter(self._dados)))
+            self.evictions += 1
+
+    def _compactar_expiracoes(self):
+        """Refaz o heap só com as entradas vivas, quando os itens antigos passam da metade (custo amortizado O(1))."""
+        self._expiracoes = [(expira, next(self._ordem), key) for key, (_, _, expira) in self._dados.items()]
+        heapq.heapify(self._expiracoes)
+
+    def invalidate(self, key):
+        """Remove a chave do cache. Retorna True se ela estava presente."""
+        if key not in self._dados:
+            return False
+        self._descartar(key)
+        return True
+
+    def clear(self):
+        self._dados.clear()
+        self._expiracoes.clear()
+        self.bytes_usados = 0
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get_statistics(self):
+        """Dicionário com ocupação e contadores de acertos, falhas, descartes e expirações (leitura O(1), sem efeitos)."""
+        return {
+            "entradas": len(self), "capacidade": self.capacity,
+            "bytes": self.bytes_usados, "max_bytes": self.max_bytes, "ttl_s": self.ttl_s,
+            "acertos": self.hits, "falhas": self.misses, "taxa_acerto": self.hit_rate(),
+            "descartes": self.evictions, "expiracoes": self.expirations,
+        }
+
+    def get_memory_usage(self):
+        """Retorna o uso de memória estimado do cache (dicionário, heap de validade, chaves e valores) em bytes."""
+        return sys.getsizeof(self._dados) + sys.getsizeof(self._expiracoes) + self.bytes_usados
+
+
+class CachedStructure:
+    """
+    Cache read-through na frente de qualquer estrutura de src/estrutura_de_dados.
+    search consulta primeiro o LRUCache e só chama a estrutura nas falhas; insert e remove
+    são repassados à estrutura e invalidam a chave, então o cache nunca devolve uma
+    resposta anterior a uma modificação daquela chave.
+    """
+    def __init__(self, estrutura, capacity=1024, ttl_s=None, max_bytes=None):
+        self.estrutura = estrutura
+        self.cache = LRUCache(capacity, ttl_s=ttl_s, max_bytes=max_bytes)
+
+    def search(self, key):
+        valor = self.cache.get(key, _AUSENTE)
+        if valor is _AUSENTE:
+            valor = self.estrutura.search(key)
+            self.cache.put(key, valor)
+        return valor
+
+    def insert(self, *args):
+        resultado = self.estrutura.insert(*args)
+        self.cache.invalidate(args[0])
+        return resultado
+
+    def remove(self, key):
+        resultado = self.estrutura.remove(key)
+        self.cache.invalidate(key)
+        return resultado
+
+    def get_statistics(self):
+        return self.cache.get_statistics()
+
+    # A iteração e a exportação são as da estrutura: o cache só tem cópias de respostas dela
+
+    def __iter__(self):
+        return iter(self.estrutura)
+
+    def __len__(self):
+        return len(self.estrutura)
+
+    def items(self):
+        return self.estrutura.items()
+
+    def to_numpy(self, *args, **kwargs):
+        return self.estrutura.to_numpy(*args, **kwargs)
+
+    def get_memory_usage(self):
+        """Memória da estrutura envolvida mais a do cache."""
+        return self.estrutura.get_memory_usage() + self.cache.get_memory_usage()
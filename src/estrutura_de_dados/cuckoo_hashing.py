@@ -3,6 +3,8 @@ import random
 import hashlib
 import sys
 
+from src.estrutura_de_dados.tabela_hash import _exportar
+
 class CuckooHashing:
     """
     Implementação de Cuckoo Hashing com duas tabelas e duas funções de hash.
@@ -13,6 +15,7 @@ class CuckooHashing:
         self.table1 = [None] * size
         self.table2 = [None] * size
         self.rehash_count = 0
+        self.count = 0  # Posições ocupadas nas duas tabelas, mantido a cada alteração
 
     def _hash1(self, key):
         # Usamos SHA256 para uma boa distribuição.
@@ -32,6 +35,7 @@ class CuckooHashing:
             idx1 = self._hash1(key)
             if self.table1[idx1] is None:
                 self.table1[idx1] = (key, value)
+                self.count += 1
                 return True
             
             # Se colidiu, expulsa o antigo e tenta colocar na Tabela 2
@@ -41,6 +45,7 @@ class CuckooHashing:
             idx2 = self._hash2(key)
             if self.table2[idx2] is None:
                 self.table2[idx2] = (key, value)
+                self.count += 1
                 return True
                 
             # Se colidiu de novo, expulsa e volta o loop para tentar na Tabela 1
@@ -66,6 +71,7 @@ class CuckooHashing:
         self.size *= 2
         self.table1 = [None] * self.size
         self.table2 = [None] * self.size
+        self.count = 0  # A reinserção abaixo conta os itens de novo
         
         # Reinsere todos os itens
         for key, value in all_items:
@@ -88,15 +94,51 @@ class CuckooHashing:
         idx1 = self._hash1(key)
         if self.table1[idx1] and self.table1[idx1][0] == key:
             self.table1[idx1] = None
+            self.count -= 1
             return True
         
         idx2 = self._hash2(key)
         if self.table2[idx2] and self.table2[idx2][0] == key:
             self.table2[idx2] = None
+            self.count -= 1
             return True
             
         return False
         
+    # --- Iteração e Exportação ---
+
+    def __iter__(self):
+        """Gera as chaves da Tabela 1 e depois da Tabela 2, pulando as posições vazias."""
+        for key, _ in self.items():
+            yield key
+
+    def items(self):
+        """Gera os pares (chave, valor) da Tabela 1 e depois da Tabela 2."""
+        for tabela in (self.table1, self.table2):
+            for item in tabela:
+                if item is not None:
+                    yield item
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, key):
+        item1, item2 = self.table1[self._hash1(key)], self.table2[self._hash2(key)]
+        return (item1 is not None and item1[0] == key) or (item2 is not None and item2[0] == key)
+
+    def to_numpy(self, key_dtype=None, value_dtype=None):
+        """Exporta (chaves, valores) em dois arrays NumPy alinhados, como HashTable.to_numpy."""
+        n = len(self)
+        return (_exportar(iter(self), key_dtype, n),
+                _exportar((value for _, value in self.items()), value_dtype, n))
+
+    # --- Estatísticas ---
+
     def get_memory_usage(self):
         """Retorna o uso de memória estimado das tabelas."""
-        return sys.getsizeof(self.table1) + sys.getsizeof(self.table2)
\ No newline at end of file
+        return sys.getsizeof(self.table1) + sys.getsizeof(self.table2)
+
+    def get_monitoring_stats(self):
+        """Estatísticas lidas em O(1) para o monitoramento (ver src/benchmarks/monitoramento.py)."""
+        return {"itens": self.count, "altura": None, "fator_carga": self.count / (2 * self.size),
+                "memoria_bytes": self.get_memory_usage()}
\ No newline at end of file
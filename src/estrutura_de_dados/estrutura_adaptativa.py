@@ -0,0 +1,549 @@
+# src/estrutura_de_dados/estrutura_adaptativa.py
+import math
+import operator
+import random
+import sys
+import time
+import numpy as np
+
+from src.estrutura_de_dados.tabela_hash import HashTable
+from src.estrutura_de_dados.tabela_hash_inteiros import IntHashMap, OCUPADO
+from src.estrutura_de_dados.arvore_b_mais import BPlusTree
+
+INSERIR, BUSCAR, REMOVER, INTERVALO, LOTE = range(5)
+NOMES_OPERACOES = ("insert", "search", "remove", "range", "search_many")
+GANHO_MINIMO = 1.1  # Alternativas menos de 10% mais rápidas por operação não são consideradas
+AMOSTRAS_MINIMAS = 16  # Abaixo disso o tempo medido de um tipo de operação é ruído demais
+_MIN_INT64, _MAX_INT64 = -(1 << 63), (1 << 63) - 1
+
+
+# --- Representações Internas ---
+# Todas guardam um mapa chave -> valor (sem chaves repetidas) e são construídas em lote a
+# partir de uma lista de pares, que é como a migração entre elas acontece. A troca é
+# silenciosa, então buscas e remoções respondem igual em todas: uma chave que a
+# representação não consegue guardar (texto no IntHashMap, None na Árvore B+) é só ausente.
+
+def _chave_int64(key):
+    """
+    A chave int64 igual a 'key' (1.0 == 1 e True == 1, como na HashTable), ou None se
+    nenhuma chave int64 pode ser igual a ela (texto, None, 1.5, inteiros fora de 64 bits).
+    """
+    if isinstance(key, (float, np.floating)):
+        if not float(key).is_integer():
+            return None
+        key = int(key)
+    else:
+        try:
+            key = operator.index(key)
+        except TypeError:
+            return None
+    return key if _MIN_INT64 <= key <= _MAX_INT64 else None
+
+
+class _RepHash:
+    """HashTable: melhor para buscas pontuais com chaves de qualquer tipo."""
+    nome = "Tabela Hash"
+
+    def __init__(self, itens):
+        self.tabela = HashTable(size=max(8, 2 * len(itens)))
+        if itens:
+            chaves, valores = zip(*itens)
+            self.tabela.insert_many(list(chaves), list(valores))
+
+    @property
+    def n(self):
+        return self.tabela.count
+
+    def inserir(self, key, value):
+        if self.tabela.count >= 2 * self.tabela.size:
+            # Encadeamento com baldes longos degrada: reconstrói com o dobro de baldes por item
+            self.__init__(self.itens())
+        self.tabela.insert(key, value)
+
+    def buscar(self, key):
+        return self.tabela.search(key)
+
+    def remover(self, key):
+        return self.tabela.remove(key)
+
+    def intervalo(self, low, high):
+        return sorted((k, v) for k, v in self.itens() if low <= k <= high)
+
+    def buscar_muitos(self, keys):
+        return self.tabela.search_many(keys)
+
+    def iterar(self):
+        return self.tabela.items()
+
+    def itens(self):
+        return list(self.tabela.items())
+
+    def exportar(self):
+        return self.tabela.to_numpy()
+
+    def memoria(self):
+        return self.tabela.get_memory_usage()
+
+
+class _RepInteiros:
+    """IntHashMap: só chaves e valores inteiros; buffers compactos e operações em lote vetorizadas."""
+    nome = "IntHashMap"
+
+    def __init__(self, itens):
+        self.mapa = IntHashMap(capacity=max(8, len(itens)))
+        if itens:
+            chaves, valores = zip(*itens)
+            self.mapa.insert_many(np.array(chaves, dtype=np.int64), np.array(valores, dtype=np.int64))
+        # O IntHashMap cresce no próprio objeto, então insert pode ser ligado sem camada extra
+        # (a fachada só deixa chegar aqui chaves e valores int64)
+        self.inserir = self.mapa.insert
+
+    @property
+    def n(self):
+        return self.mapa.count
+
+    def buscar(self, key):
+        if type(key) is not int:
+            key = _chave_int64(key)
+            if key is None:
+                return None
+        return self.mapa.search(key)
+
+    def remover(self, key):
+        if type(key) is not int:
+            key = _chave_int64(key)
+            if key is None:
+                return False
+        return self.mapa.remove(key)
+
+    def intervalo(self, low, high):
+        # Varredura vetorizada dos buffers: O(capacidade), mas em NumPy
+        chaves = self.mapa._keys_np
+        mascara = (self.mapa._states_np == OCUPADO) & (chaves >= low) & (chaves <= high)
+        selecionadas, valores = chaves[mascara], self.mapa._values_np[mascara]
+        ordem = np.argsort(selecionadas, kind='stable')
+        return list(zip(selecionadas[ordem].tolist(), valores[ordem].tolist()))
+
+    def buscar_muitos(self, keys):
+        chaves = np.asarray(keys)
+        if chaves.dtype.kind == 'i':
+            valores, encontrados = self.mapa.get_many(chaves)
+        else:
+            # Floats, objetos, uint64: cada chave é convertida como em buscar; as sem int64 igual são ausentes
+            convertidas = [_chave_int64(k) for k in chaves.tolist()]
+            validas = np.fromiter((k is not None for k in convertidas), dtype=bool, count=len(convertidas))
+            valores = np.zeros(len(convertidas), dtype=np.int64)
+            encontrados = np.zeros(len(convertidas), dtype=bool)
+            valores[validas], encontrados[validas] = self.mapa.get_many(
+                np.array([k for k in convertidas if k is not None], dtype=np.int64))
+        resultado = valores.astype(object)
+        resultado[~encontrados] = None
+        return resultado, encontrados
+
+    def iterar(self):
+        return self.mapa.items()
+
+    def itens(self):
+        chaves, valores = self.mapa.to_numpy()
+        return list(zip(chaves.tolist(), valores.tolist()))
+
+    def exportar(self):
+        return self.mapa.to_numpy()
+
+    def memoria(self):
+        return self.mapa.get_memory_usage()
+
+
+class _RepOrdenada:
+    """BPlusTree: acesso ordenado (intervalos) com folhas encadeadas; construída em O(N) por bulk_load."""
+    nome = "Árvore B+"
+
+    def __init__(self, itens):
+        itens = sorted(itens, key=lambda par: par[0])
+        self.arvore = BPlusTree.bulk_load([k for k, _ in itens], [v for _, v in itens])
+        # A B+ aceita chaves repetidas; o mapa guarda um único valor por chave (upsert)
+        self.inserir = self.arvore.upsert
+
+    @property
+    def n(self):
+        return self.arvore.count
+
+    def buscar(self, key):
+        try:
+            valores = self.arvore.get(key)
+        except TypeError:  # Chave que não se compara com números (texto, None): não está na árvore
+            return None
+        return valores[0] if valores else None
+
+    def remover(self, key):
+        try:
+            return self.arvore.remove(key)
+        except TypeError:
+            return False
+
+    def intervalo(self, low, high):
+        return list(self.arvore.range_items(low, high))
+
+    def buscar_muitos(self, keys):
+        lista = keys.tolist() if isinstance(keys, np.ndarray) else list(keys)
+        resultado = np.empty(len(lista), dtype=object)
+        encontrados = np.zeros(len(lista), dtype=bool)
+        for i, key in enumerate(lista):
+            try:
+                valores = self.arvore.get(key)
+            except TypeError:
+                continue
+            if valores:
+                resultado[i], encontrados[i] = valores[0], True
+        return resultado, encontrados
+
+    def iterar(self):
+        # O upsert mantém uma única entrada por chave, então os pares da B+ já são os do mapa
+        return self.arvore.items()
+
+    def itens(self):
+        return list(self.arvore.items())
+
+    def exportar(self):
+        return self.arvore.to_numpy()
+
+    def memoria(self):
+        return self.arvore.get_memory_usage()
+
+
+REPRESENTACOES = (_RepHash, _RepInteiros, _RepOrdenada)
+
+
+# --- Modelo de Custo ---
+
+def _fachada_de_medicao(rep):
+    """
+    AdaptiveStructure fixa em 'rep': a janela nunca fecha, então ela só amostra os tempos,
+    exatamente como em uso, sem avaliar nem migrar.
+    """
+    fachada = AdaptiveStructure(janela=sys.maxsize)
+    fachada._rep = rep
+    return fachada
+
+
+def calibrar(n=2048, seed=0, rodadas=3):
+    """
+    Mede, uma vez, o custo (s) de cada operação em cada representação com 'n' chaves inteiras,
+    e o custo de construção por item (o que uma migração paga). As operações passam pela
+    mesma fachada amostrada que mede a representação em uso (_fachada_de_medicao), para que
+    alternativas e representação atual sejam comparadas com as mesmas sobrecargas. Fica o
+    menor de 'rodadas' medições. Retorna {"n", "custos": {nome: {op: custo}}, "sobrecarga_ns",
+    "itens_intervalo"}, com o custo de ler o relógio e o número médio de itens por intervalo medido.
+    """
+    start = time.perf_counter_ns()
+    for _ in range(1000): time.perf_counter_ns()
+    sobrecarga_ns = (time.perf_counter_ns() - start) / 1000
+
+    rng = np.random.default_rng(seed)
+    chaves = rng.permutation(n * 4)[:n].tolist()
+    itens = [(k, k) for k in chaves]
+    # A fachada mede ~1 em cada 8 operações: 1024 chamadas dão ~128 amostras, 256 intervalos ~32
+    consultas = rng.choice(chaves, size=1024).tolist()
+    novas = list(range(n * 4, n * 4 + 1024))
+    largura = n // 25  # Intervalos cobrindo ~1% das chaves
+    inicios = [(int(lo), int(lo) + largura) for lo in rng.integers(0, n * 4 - largura, size=256)]
+    lote = rng.choice(chaves, size=n).astype(np.int64)
+    custos = {}
+    for classe in REPRESENTACOES:
+        medidas = []
+        for _ in range(rodadas):
+            start = time.perf_counter()
+            rep = classe(itens)
+            construcao = (time.perf_counter() - start) / n
+            rep.buscar_muitos(lote)  # Aquece o espelho NumPy da HashTable
+            fachada = _fachada_de_medicao(rep)
+            for key in consultas: fachada.search(key)
+            for _ in range(4): fachada.search_many(lote)
+            for low, high in inicios: fachada.range(low, high)
+            # Inserir e depois remover as mesmas chaves deixa a estrutura como estava
+            for key in novas: fachada.insert(key, key)
+            for key in novas: fachada.remove(key)
+            medidas.append(dict(fachada._medidos_na_janela(sobrecarga_ns), construcao=construcao))
+        custos[classe.nome] = {op: min(m[op] for m in medidas) for op in medidas[0]}
+    itens_intervalo = sum(len(rep.intervalo(lo, hi)) for lo, hi in inicios) / len(inicios)
+    return {"n": n, "custos": custos, "sobrecarga_ns": sobrecarga_ns, "itens_intervalo": max(1.0, itens_intervalo)}
+
+
+class AdaptiveStructure:
+    """
+    Mapa chave -> valor que escolhe sozinho a representação interna (Tabela Hash, IntHashMap
+    ou Árvore B+) a partir da carga observada.
+
+    A cada 'janela' operações, a fachada olha para o que amostrou (mistura de insert/search/
+    remove/range/search_many, tempos de ~1 em cada 8 operações e os tipos das chaves) e estima,
+    com um modelo de custo calibrado uma vez por processo (função calibrar), quanto cada
+    representação gastaria com a mesma mistura no tamanho atual. Só troca quando a economia
+    prevista nas próximas 'horizonte' janelas paga a migração (reconstrução em lote de todos os
+    itens) com folga de 'margem' vezes; isso amortiza o custo da troca e evita oscilação. Se a
+    mesma alternativa continua vencendo, o horizonte cresce uma janela por avaliação, então uma
+    carga estável acaba pagando até migrações grandes.
+
+    Cada decisão (troca ou troca adiada) vai para 'historico' com os custos estimados; depois
+    de uma troca, a janela seguinte preenche o ganho medido: a mistura que de fato rodou, com
+    os custos medidos na representação antiga e na nova, e em quantas operações a migração se pagou.
+    """
+    _calibracao = None  # Compartilhada entre instâncias
+
+    def __init__(self, janela=2048, horizonte=4, margem=1.5, representacao_inicial=_RepHash, verbose=False):
+        if janela <= 0 or horizonte <= 0 or margem < 1:
+            raise ValueError("janela e horizonte devem ser positivos e margem >= 1.")
+        self.janela, self.horizonte, self.margem, self.verbose = janela, horizonte, margem, verbose
+        self._rep = representacao_inicial([])
+        self.historico = []
+        self.migracoes = 0
+        self.tempo_migracao_s = 0.0
+        self._chaves_inteiras = True  # Chaves e valores int64: o IntHashMap é elegível
+        self._chaves_numericas = True  # Chaves int/float: a Árvore B+ é elegível
+        self._ops = 0
+        self._sorteio = random.Random(0)
+        self._proxima_amostra = 0  # Próxima operação medida
+        self._pendente = None  # Troca aguardando a medição da janela seguinte
+        self._adiada = None  # Última troca adiada registrada
+        self._candidata, self._persistencia = None, 0  # Alternativa vencedora e há quantas janelas
+        self._medidos = {}  # Último custo medido de cada operação na representação atual
+        self._itens_por_intervalo = 0.0
+        self._zerar_janela()
+
+    # --- Amostragem ---
+
+    def _zerar_janela(self):
+        self._contagem = [0] * 5
+        self._tempo_ns = [0] * 5
+        self._amostras = [0] * 5
+        self._chamadas = [0] * 5
+        self._itens_intervalo = 0
+        self._fim_janela = self._ops + self.janela
+        self._limite = min(self._proxima_amostra, self._fim_janela)
+
+    def _executar(self, op, funcao, args, peso):
+        """
+        Caminho lento das operações, só quando chega a vez de uma amostra ou o fim da janela
+        (as operações públicas já contaram a chamada). As demais vão direto à representação.
+        """
+        if self._ops >= self._proxima_amostra:
+            # Passo sorteado (média 8): um passo fixo coincidiria com eventos periódicos, como o
+            # crescimento da HashTable sempre em potências de 2, e enviesaria a medição
+            self._proxima_amostra = self._ops + self._sorteio.randint(1, 15)
+            t0 = time.perf_counter_ns()
+            resultado = funcao(*args)
+            self._tempo_ns[op] += time.perf_counter_ns() - t0
+            self._amostras[op] += peso
+            self._chamadas[op] += 1
+        else:
+            resultado = funcao(*args)
+        if self._ops >= self._fim_janela:
+            self._avaliar()
+        self._limite = min(self._proxima_amostra, self._fim_janela)
+        return resultado
+
+    def _observar_tipos(self, key, value):
+        if self._chaves_numericas and not (isinstance(key, (int, float)) and not isinstance(key, bool)):
+            self._chaves_numericas = False
+        if self._chaves_inteiras and not (type(key) is int and type(value) is int
+                                          and _MIN_INT64 <= key <= _MAX_INT64 and _MIN_INT64 <= value <= _MAX_INT64):
+            self._chaves_inteiras = False
+            if isinstance(self._rep, _RepInteiros):
+                self._migrar(_RepHash, "chave/valor não inteiro chegou: IntHashMap deixou de ser elegível", {})
+        if not self._chaves_numericas and isinstance(self._rep, _RepOrdenada):
+            self._migrar(_RepHash, "chave não numérica chegou: Árvore B+ deixou de ser elegível", {})
+
+    # --- Operações Públicas ---
+
+    def insert(self, key, value):
+        """Insere ou atualiza o valor de uma chave."""
+        self._observar_tipos(key, value)
+        self._ops += 1
+        self._contagem[INSERIR] += 1
+        if self._ops < self._limite:
+            return self._rep.inserir(key, value)
+        return self._executar(INSERIR, self._rep.inserir, (key, value), 1)
+
+    def search(self, key):
+        """Retorna o valor da chave, ou None se ela não existir."""
+        self._ops += 1
+        self._contagem[BUSCAR] += 1
+        if self._ops < self._limite:
+            return self._rep.buscar(key)
+        return self._executar(BUSCAR, self._rep.buscar, (key,), 1)
+
+    def remove(self, key):
+        """Remove a chave. Retorna True se ela existia."""
+        self._ops += 1
+        self._contagem[REMOVER] += 1
+        if self._ops < self._limite:
+            return self._rep.remover(key)
+        return self._executar(REMOVER, self._rep.remover, (key,), 1)
+
+    def range(self, low, high):
+        """Pares (chave, valor) com low <= chave <= high, em ordem de chave."""
+        self._ops += 1
+        self._contagem[INTERVALO] += 1
+        resultado = self._executar(INTERVALO, self._rep.intervalo, (low, high), 1)
+        self._itens_intervalo += len(resultado)
+        return resultado
+
+    def search_many(self, keys):
+        """Busca em lote. Retorna (valores, encontrados), como HashTable.search_many."""
+        peso = max(1, len(keys))  # Um lote conta como 'peso' operações na janela
+        self._ops += peso
+        self._contagem[LOTE] += peso
+        return self._executar(LOTE, self._rep.buscar_muitos, (keys,), peso)
+
+    @property
+    def representacao(self):
+        return self._rep.nome
+
+    def __len__(self):
+        return self._rep.n
+
+    def __iter__(self):
+        """Gera as chaves na ordem da representação atual (sem contar como operação na janela)."""
+        for key, _ in self._rep.iterar():
+            yield key
+
+    def items(self):
+        """Gera os pares (chave, valor) da representação atual."""
+        return self._rep.iterar()
+
+    def to_numpy(self):
+        """Exporta (chaves, valores) em dois arrays NumPy, com a exportação da representação atual."""
+        return self._rep.exportar()
+
+    # --- Decisão ---
+
+    @classmethod
+    def _custos_calibrados(cls):
+        if cls._calibracao is None:
+            cls._calibracao = calibrar()
+        return cls._calibracao
+
+    def _elegiveis(self):
+        classes = [_RepHash]
+        if self._chaves_inteiras: classes.append(_RepInteiros)
+        if self._chaves_numericas: classes.append(_RepOrdenada)
+        return classes
+
+    def _custo_estimado(self, classe, n, itens_por_intervalo):
+        """Custo previsto (s) de cada tipo de operação em 'classe' com n itens."""
+        calibracao = self._custos_calibrados()
+        base, n0 = calibracao["custos"][classe.nome], calibracao["n"]
+        custos = dict(base)
+        if classe is _RepOrdenada:
+            fator_log = math.log2(max(n, 2)) / math.log2(n0)
+            for op in (INSERIR, BUSCAR, REMOVER, LOTE):
+                custos[op] = base[op] * fator_log
+            # Desce até a primeira folha e percorre só os itens do intervalo
+            custos[INTERVALO] = base[INTERVALO] * max(fator_log, itens_por_intervalo / calibracao["itens_intervalo"])
+        else:
+            custos[INTERVALO] = base[INTERVALO] * max(n, 1) / n0  # Varre a tabela inteira
+        return custos
+
+    def _custo_por_operacao(self, custos, contagem):
+        total = sum(contagem)
+        return sum(contagem[op] * custos[op] for op in range(5)) / total if total else 0.0
+
+    def _medidos_na_janela(self, sobrecarga_ns):
+        """Custo medido (s) de cada tipo de operação nesta janela, sem a leitura do relógio."""
+        return {op: max(0.0, self._tempo_ns[op] - sobrecarga_ns * self._chamadas[op]) / self._amostras[op] / 1e9
+                for op in range(5) if self._amostras[op] >= AMOSTRAS_MINIMAS}
+
+    def _avaliar(self):
+        contagem, n = list(self._contagem), self._rep.n
+        total = sum(contagem)
+        medidos = self._medidos_na_janela(self._custos_calibrados()["sobrecarga_ns"])
+        self._medidos.update(medidos)
+        if self._pendente is not None:
+            self._medir_ganho(contagem, medidos)
+        if self._contagem[INTERVALO]:
+            self._itens_por_intervalo = self._itens_intervalo / self._contagem[INTERVALO]
+
+        atual = type(self._rep)
+        custos = {c: self._custo_estimado(c, n, self._itens_por_intervalo) for c in self._elegiveis()}
+        # Para a representação atual vale o que já foi medido. O medido inclui o que a calibração
+        # não vê (tamanho real, cache, crescimento), então cada alternativa recebe, por operação,
+        # a mesma correção medido/previsto: todas são comparadas nas mesmas condições
+        for op, medido in self._medidos.items():
+            previsto = custos[atual][op]
+            if previsto > 0:
+                for classe in custos:
+                    custos[classe][op] *= medido / previsto
+        estimativas = {c: self._custo_por_operacao(custos[c], contagem) for c in custos}
+        melhor = min(estimativas, key=estimativas.get)
+        if estimativas[melhor] * GANHO_MINIMO > estimativas[atual]:
+            melhor = atual  # Empate técnico: não vale nem registrar
+            self._adiada, self._persistencia = None, 0
+        else:
+            # Quanto mais janelas seguidas a mesma alternativa vence, mais longe vai o horizonte
+            self._persistencia = self._persistencia + 1 if melhor is self._candidata else 1
+            self._candidata = melhor
+            economia = (estimativas[atual] - estimativas[melhor]) * self.janela * (self.horizonte + self._persistencia - 1)
+            migracao = custos[melhor]["construcao"] * n
+            decisao = {
+                "n": n, "mistura": {NOMES_OPERACOES[op]: contagem[op] / total for op in range(5)},
+                "custo_estimado_atual_us": estimativas[atual] * 1e6, "custo_estimado_novo_us": estimativas[melhor] * 1e6,
+                "economia_prevista_s": economia, "migracao_prevista_s": migracao,
+                "janelas_seguidas": self._persistencia,
+            }
+            if economia > migracao * self.margem:
+                entrada = self._migrar(melhor, "economia prevista paga a migração", decisao)
+                self._pendente = (entrada, custos[atual])
+            elif self._adiada is not melhor:  # Registra a troca adiada uma vez, não a cada janela
+                self._adiada = melhor
+                self._registrar(dict(decisao, operacao=self._ops, de=atual.nome, para=melhor.nome,
+                                     acao="adiada", motivo="economia prevista não paga a migração"))
+        self._zerar_janela()
+
+    def _medir_ganho(self, contagem, medidos):
+        """
+        Fecha a troca pendente com a janela que a sucedeu: a mesma mistura de operações é
+        avaliada com os custos da representação antiga (medidos enquanto ela estava em uso,
+        ou estimados) e com os custos medidos agora na nova.
+        """
+        entrada, custos_antes = self._pendente
+        pesos = sum(contagem[op] for op in medidos)
+        if pesos:
+            antes = sum(contagem[op] * custos_antes[op] for op in medidos) / pesos
+            depois = sum(contagem[op] * medidos[op] for op in medidos) / pesos
+            entrada["custo_medido_antes_us"], entrada["custo_medido_depois_us"] = antes * 1e6, depois * 1e6
+            entrada["ganho_medido"] = antes / depois if depois else float('inf')
+            if antes > depois:
+                # Operações necessárias para a economia medida cobrir o tempo da migração
+                entrada["amortizada_em_ops"] = int(entrada["migracao_medida_s"] / (antes - depois))
+        self._pendente = None
+
+    def _migrar(self, classe, motivo, decisao):
+        de = self._rep.nome
+        start = time.perf_counter()
+        self._rep = classe(self._rep.itens())
+        self._adiada, self._candidata, self._persistencia = None, None, 0
+        self._medidos = {}  # Os tempos medidos valiam para a representação anterior
+        tempo = time.perf_counter() - start
+        self.migracoes += 1
+        self.tempo_migracao_s += tempo
+        return self._registrar(dict(decisao, operacao=self._ops, de=de, para=classe.nome, acao="troca",
+                                    motivo=motivo, migracao_medida_s=tempo))
+
+    def _registrar(self, entrada):
+        self.historico.append(entrada)
+        if self.verbose:
+            print(f"[Adaptativa] op {entrada['operacao']}: {entrada['acao']} {entrada['de']} -> {entrada['para']} ({entrada['motivo']})")
+        return entrada
+
+    # --- Estatísticas ---
+
+    def get_statistics(self):
+        total = max(1, sum(self._contagem))
+        return {
+            "representacao": self._rep.nome, "itens": self._rep.n, "operacoes": self._ops,
+            "migracoes": self.migracoes, "tempo_migracao_s": self.tempo_migracao_s,
+            "mistura_janela": {NOMES_OPERACOES[op]: self._contagem[op] / total for op in range(5)},
+            "chaves_inteiras": self._chaves_inteiras, "chaves_numericas": self._chaves_numericas,
+        }
+
+    def get_memory_usage(self):
+        return sys.getsizeof(self) + self._rep.memoria()
@@ -0,0 +1,208 @@
+# src/estrutura_de_dados/filtro_cuckoo.py
+import math
+import random
+import sys
+import numpy as np
+
+from src.estrutura_de_dados.hashing import hash64, hash64_many, _splitmix64, _splitmix64_vetorizado
+
+class CuckooFilter:
+    """
+    Implementação de um Cuckoo Filter (Fan et al., 2014).
+    Guarda apenas "impressões digitais" (fingerprints) pequenas dos itens, em baldes
+    de 'bucket_size' posições dentro de um array NumPy compacto.
+    Assim como o Counting Bloom Filter, permite inserção, busca e remoção,
+    mas gasta poucos bits por item em vez de um contador inteiro por posição.
+    Pode gerar falsos positivos, mas nunca falsos negativos.
+    """
+    def __init__(self, capacity=100000, fpr=0.01, bucket_size=4, max_kicks=500):
+        if capacity <= 0 or bucket_size <= 0:
+            raise ValueError("Capacidade e tamanho do balde devem ser maiores que zero.")
+        if not 0 < fpr < 1:
+            raise ValueError("A taxa de falsos positivos deve estar entre 0 e 1.")
+        self.capacity = capacity
+        self.fpr = fpr
+        self.bucket_size = bucket_size
+        self.max_kicks = max_kicks
+
+        # Bits da fingerprint: f >= log2(2b / fpr), arredondado para cima
+        self.fingerprint_bits = min(32, max(4, math.ceil(math.log2(2 * bucket_size / fpr))))
+        self._fp_mask = (1 << self.fingerprint_bits) - 1
+        if self.fingerprint_bits <= 8: dtype = np.uint8
+        elif self.fingerprint_bits <= 16: dtype = np.uint16
+        else: dtype = np.uint32
+
+        # Número de baldes arredondado para potência de 2 (necessário para o XOR do índice alternativo),
+        # deixando uma folga para ocupação máxima de ~95%
+        baldes_necessarios = math.ceil(capacity / (bucket_size * 0.95))
+        self.num_buckets = 1 << max(1, (baldes_necessarios - 1).bit_length())
+        self._index_mask = self.num_buckets - 1
+
+        # 0 indica posição vazia; as fingerprints nunca valem 0
+        self.buckets = np.zeros((self.num_buckets, bucket_size), dtype=dtype)
+        self.count = 0
+        self.victim = None  # Fingerprint "sem teto" quando o filtro enche: (indice, fingerprint)
+
+    # --- Funções Auxiliares ---
+
+    def _fingerprint_and_index(self, item):
+        """Calcula a fingerprint e o índice primário de um item a partir de um único hash."""
+        h = hash64(item)
+        fp = (h >> 32) & self._fp_mask
+        if fp == 0: fp = 1
+        return fp, h & self._index_mask
+
+    def _alt_index(self, index, fp):
+        """Índice alternativo: i2 = i1 XOR hash(fp). Vale nos dois sentidos."""
+        return (index ^ _splitmix64(fp)) & self._index_mask
+
+    def _insert_into_bucket(self, index, fp):
+        bucket = self.buckets[index]
+        vazios = np.flatnonzero(bucket == 0)
+        if vazios.size:
+            bucket[vazios[0]] = fp
+            return True
+        return False
+
+    def _remove_from_bucket(self, index, fp):
+        bucket = self.buckets[index]
+        posicoes = np.flatnonzero(bucket == fp)
+        if posicoes.size:
+            bucket[posicoes[0]] = 0
+            return True
+        return False
+
+    # --- Operações Públicas ---
+
+    def insert(self, item):
+        """
+        Insere um item no filtro. Retorna False se o filtro estiver cheio
+        (nesse caso o item fica guardado na posição de 'vítima' e ainda é encontrado).
+        """
+        if self.victim is not None:
+            return False
+
+        fp, i1 = self._fingerprint_and_index(item)
+        i2 = self._alt_index(i1, fp)
+        if self._insert_into_bucket(i1, fp) or self._insert_into_bucket(i2, fp):
+            self.count += 1
+            return True
+
+        # Ambos os baldes cheios: expulsa fingerprints ("kicks") até achar espaço
+        index = random.choice((i1, i2))
+        for _ in range(self.max_kicks):
+            slot = random.randrange(self.bucket_size)
+            fp, self.buckets[index, slot] = int(self.buckets[index, slot]), fp
+            index = self._alt_index(index, fp)
+            if self._insert_into_bucket(index, fp):
+                self.count += 1
+                return True
+
+        # Não achou espaço: guarda a última fingerprint expulsa para não gerar falso negativo
+        self.victim = (index, fp)
+        self.count += 1
+        return False
+
+    def search(self, item):
+        """
+        Verifica se um item PODE estar no filtro.
+        Retorna False se o item definitivamente não está.
+        """
+        fp, i1 = self._fingerprint_and_index(item)
+        i2 = self._alt_index(i1, fp)
+        if fp in self.buckets[i1] or fp in self.buckets[i2]:
+            return True
+        return self.victim is not None and self.victim[1] == fp and self.victim[0] in (i1, i2)
+
+    def search_many(self, itens):
+        """Versão vetorizada de search: retorna um array booleano com uma resposta por item."""
+        h = hash64_many(itens)
+        fp = (h >> np.uint64(32)) & np.uint64(self._fp_mask)
+        fp[fp == 0] = 1
+        mask = np.uint64(self._index_mask)
+        i1 = h & mask
+        with np.errstate(over='ignore'):
+            i2 = (i1 ^ _splitmix64_vetorizado(fp)) & mask
+        fp = fp.astype(self.buckets.dtype)[:, None]
+        encontrados = (self.buckets[i1] == fp).any(axis=1) | (self.buckets[i2] == fp).any(axis=1)
+        if self.victim is not None:
+            v_idx, v_fp = self.victim
+            encontrados |= (fp[:, 0] == v_fp) & ((i1 == v_idx) | (i2 == v_idx))
+        return encontrados
+
+    def remove(self, item):
+        """
+        Remove UMA cópia da fingerprint do item. Retorna True se removeu.
+        Assim como no Counting Bloom Filter, só deve ser chamado para itens inseridos.
+        """
+        fp, i1 = self._fingerprint_and_index(item)
+        i2 = self._alt_index(i1, fp)
+        if self._remove_from_bucket(i1, fp) or self._remove_from_bucket(i2, fp):
+            self.count -= 1
+            # Com espaço liberado, tenta reacomodar a vítima
+            if self.victim is not None:
+                v_idx, v_fp = self.victim
+                self.victim = None
+                self.count -= 1
+                self._reinsert_fingerprint(v_idx, v_fp)
+            return True
+        if self.victim is not None and self.victim[1] == fp and self.victim[0] in (i1, i2):
+            self.victim = None
+            self.count -= 1
+            return True
+        return False
+
+    def _reinsert_fingerprint(self, index, fp):
+        """Recoloca uma fingerprint já calculada (usado para a vítima)."""
+        alt = self._alt_index(index, fp)
+        if self._insert_into_bucket(index, fp) or self._insert_into_bucket(alt, fp):
+            self.count += 1
+        else:
+            self.victim = (index, fp)
+            self.count += 1
+
+    # --- Iteração e Exportação ---
+    # Como no Counting Bloom Filter, não há os itens para iterar: exporta as fingerprints.
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, item):
+        return self.search(item)
+
+    def items(self):
+        """Gera (balde, fingerprint) de cada posição ocupada, incluindo a vítima sem teto, se houver."""
+        baldes, posicoes = np.nonzero(self.buckets)
+        yield from zip(baldes.tolist(), self.buckets[baldes, posicoes].tolist())
+        if self.victim is not None:
+            yield self.victim
+
+    def to_numpy(self):
+        """Visão somente leitura (sem cópia) da matriz de baldes (num_buckets x bucket_size; 0 = vazio)."""
+        baldes = self.buckets.view()
+        baldes.flags.writeable = False
+        return baldes
+
+    # --- Métricas ---
+
+    def load_factor(self):
+        """Fração das posições ocupadas."""
+        return self.count / (self.num_buckets * self.bucket_size)
+
+    def expected_fpr(self):
+        """Taxa de falsos positivos teórica na ocupação atual: ~ 2b * ocupação / 2^f."""
+        return min(1.0, 2 * self.bucket_size * self.load_factor() / (1 << self.fingerprint_bits))
+
+    def bits_per_item(self):
+        """Bits de memória gastos por item inserido."""
+        if self.count == 0: return 0.0
+        return self.get_memory_usage() * 8 / self.count
+
+    def get_memory_usage(self):
+        """Retorna o uso de memória estimado do array de baldes em bytes."""
+        return sys.getsizeof(self.buckets)
+
+    def get_monitoring_stats(self):
+        """Estatísticas lidas em O(1) para o monitoramento (ver src/benchmarks/monitoramento.py)."""
+        return {"itens": self.count, "altura": None, "fator_carga": self.load_factor(),
+                "memoria_bytes": self.get_memory_usage()}
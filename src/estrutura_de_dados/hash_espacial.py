@@ -0,0 +1,258 @@
+# src/estrutura_de_dados/hash_espacial.py
+import math
+import operator
+import sys
+from itertools import chain
+import numpy as np
+
+_TAMANHO_PONTO = sys.getsizeof((0.0, 0.0))  # Todo ponto é uma tupla (x, y): tamanho fixo
+
+def _normalizar_id(item_id):
+    """Ids inteiros de qualquer tipo (np.int64, np.uint32...) viram int nativo; os demais ficam como vieram."""
+    try:
+        return operator.index(item_id)
+    except TypeError:
+        return item_id
+
+
+class SpatialHashGrid:
+    """
+    Índice espacial 2D por grade uniforme: cada ponto (x, y) cai na célula
+    (floor(x / largura), floor(y / altura)), e um dicionário leva a coordenada da célula aos
+    pontos dela. Feito para colunas de faixa limitada como (Age, Cholesterol), em que
+    "pacientes perto deste ponto" só precisa olhar as células vizinhas.
+
+    Inserir e remover por id são O(1) (uma célula, um dicionário); remover por ponto varre só
+    a célula dele. O vizinho mais próximo percorre anéis de células em volta da consulta e para
+    quando o anel seguinte já não pode ter nada mais perto do que o melhor encontrado; a busca
+    por raio olha apenas as células que cobrem o quadrado em volta do círculo.
+    Distâncias são euclidianas nas unidades originais das colunas, como na KDTree.
+    """
+    def __init__(self, cell_size=5.0):
+        largura, altura = (cell_size, cell_size) if np.isscalar(cell_size) else cell_size
+        if largura <= 0 or altura <= 0:
+            raise ValueError("O tamanho da célula deve ser positivo.")
+        self.largura, self.altura = float(largura), float(altura)
+        self.celulas = {}  # (cx, cy) -> {id: (x, y)}
+        self.pontos = {}  # id -> (x, y)
+        self._proximo_id = 0
+        self._bytes_celulas = 0  # Soma de sys.getsizeof da chave e do dicionário de cada célula
+        # Faixa de células ocupadas alguma vez: limita os anéis do vizinho mais próximo
+        self._cx_min = self._cy_min = math.inf
+        self._cx_max = self._cy_max = -math.inf
+
+    # --- Construção em Lote ---
+
+    @classmethod
+    def from_arrays(cls, xs, ys, cell_size=5.0, ids=None):
+        """Constrói o índice de uma vez: as células são calculadas e agrupadas com NumPy."""
+        grade = cls(cell_size)
+        xs, ys = np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64)
+        if len(xs) != len(ys):
+            raise ValueError("xs e ys devem ter o mesmo tamanho.")
+        ids = np.arange(len(xs)) if ids is None else np.asarray(ids)
+        if len(ids) != len(xs):
+            raise ValueError("ids deve ter o mesmo tamanho de xs e ys.")
+        if not len(xs):
+            return grade
+        cx = np.floor(xs / grade.largura).astype(np.int64)
+        cy = np.floor(ys / grade.altura).astype(np.int64)
+        ordem = np.lexsort((cy, cx))
+        chaves = np.stack([cx[ordem], cy[ordem]], axis=1)
+        inicios = np.flatnonzero(np.r_[True, (chaves[1:] != chaves[:-1]).any(axis=1)])
+        lista_ids, lista_x, lista_y = ids[ordem].tolist(), xs[ordem].tolist(), ys[ordem].tolist()
+        if ids.dtype == object:  # tolist() mantém os escalares NumPy guardados num array de objetos
+            lista_ids = [_normalizar_id(i) for i in lista_ids]
+        pontos = list(zip(lista_x, lista_y))
+        for inicio, fim in zip(inicios.tolist(), np.r_[inicios[1:], len(ordem)].tolist()):
+            grade.celulas[(int(chaves[inicio, 0]), int(chaves[inicio, 1]))] = dict(zip(lista_ids[inicio:fim], pontos[inicio:fim]))
+        grade.pontos = dict(zip(lista_ids, pontos))
+        grade._bytes_celulas = sum(sys.getsizeof(chave) + sys.getsizeof(celula) for chave, celula in grade.celulas.items())
+        if len(grade.pontos) != len(lista_ids):
+            raise ValueError("ids repetidos.")
+        grade._cx_min, grade._cx_max = int(cx.min()), int(cx.max())
+        grade._cy_min, grade._cy_max = int(cy.min()), int(cy.max())
+        numericos = [i for i in lista_ids if isinstance(i, int)]
+        grade._proximo_id = max(numericos) + 1 if numericos else 0
+        return grade
+
+    @classmethod
+    def from_dataframe(cls, df, colunas=('Age', 'Cholesterol'), cell_size=5.0):
+        """Indexa duas colunas do DataFrame usando o índice das linhas como id."""
+        x, y = colunas
+        return cls.from_arrays(df[x].to_numpy(), df[y].to_numpy(), cell_size, ids=df.index.to_numpy())
+
+    # --- Funções Auxiliares ---
+
+    def _celula(self, x, y):
+        return math.floor(x / self.largura), math.floor(y / self.altura)
+
+    # --- Inserção e Remoção ---
+
+    def insert(self, point, item_id=None):
+        """Insere o ponto (x, y) e retorna o id dele (gerado se 'item_id' não for dado)."""
+        x, y = float(point[0]), float(point[1])
+        if item_id is None:
+            item_id = self._proximo_id
+            while item_id in self.pontos:  # Um id explícito não inteiro igual a ele (5.0, por exemplo)
+                item_id += 1
+        else:
+            item_id = _normalizar_id(item_id)
+            if item_id in self.pontos:
+                raise ValueError(f"O id {item_id!r} já existe.")
+        if isinstance(item_id, int) and item_id >= self._proximo_id:
+            self._proximo_id = item_id + 1
+        cx, cy = self._celula(x, y)
+        celula = self.celulas.get((cx, cy))
+        if celula is None:
+            celula = self.celulas[(cx, cy)] = {}
+            self._bytes_celulas += sys.getsizeof((cx, cy)) + sys.getsizeof(celula)
+            if cx < self._cx_min: self._cx_min = cx
+            if cx > self._cx_max: self._cx_max = cx
+            if cy < self._cy_min: self._cy_min = cy
+            if cy > self._cy_max: self._cy_max = cy
+        antes = sys.getsizeof(celula)
+        celula[item_id] = (x, y)
+        self._bytes_celulas += sys.getsizeof(celula) - antes
+        self.pontos[item_id] = (x, y)
+        return item_id
+
+    def remove_id(self, item_id):
+        """Remove o ponto de id 'item_id'. Retorna True se removeu, False se não existia."""
+        ponto = self.pontos.pop(item_id, None)
+        if ponto is None:
+            return False
+        chave = self._celula(*ponto)
+        celula = self.celulas[chave]
+        antes = sys.getsizeof(celula)
+        del celula[item_id]
+        self._bytes_celulas += sys.getsizeof(celula) - antes
+        if not celula:
+            del self.celulas[chave]
+            self._bytes_celulas -= sys.getsizeof(chave) + sys.getsizeof(celula)
+        return True
+
+    def remove(self, point):
+        """Remove UMA ocorrência do ponto (x, y). Retorna True se removeu, False se não encontrou."""
+        x, y = float(point[0]), float(point[1])
+        celula = self.celulas.get(self._celula(x, y), {})
+        for item_id, ponto in celula.items():
+            if ponto == (x, y):
+                return self.remove_id(item_id)
+        return False
+
+    def search(self, point):
+        """Retorna True se o ponto (x, y) está no índice."""
+        x, y = float(point[0]), float(point[1])
+        return (x, y) in self.celulas.get(self._celula(x, y), {}).values()
+
+    # --- Consultas ---
+
+    def nearest(self, point, k=1):
+        """
+        Os k pontos mais próximos de (x, y), como lista de (distância, id, ponto) em ordem
+        crescente. Percorre anéis de células (distância de Chebyshev em células) a partir da
+        célula da consulta; o anel r só tem pontos a pelo menos (r - 1) * min(largura, altura),
+        então a busca para quando isso passa do k-ésimo melhor.
+        """
+        if k < 1:
+            raise ValueError("k deve ser pelo menos 1.")
+        x, y = float(point[0]), float(point[1])
+        cx, cy = self._celula(x, y)
+        lado = min(self.largura, self.altura)
+        # Anel a partir do qual toda célula ocupada já foi vista
+        ultimo_anel = max(cx - self._cx_min, self._cx_max - cx, cy - self._cy_min, self._cy_max - cy, 0)
+        melhores = []  # (distância², id, ponto), no máximo k, ordenada
+        celulas = self.celulas
+        for r in range(int(ultimo_anel) + 1 if self.celulas else 0):
+            if len(melhores) == k and ((r - 1) * lado) ** 2 > melhores[-1][0]:
+                break
+            if r == 0:
+                anel = [(cx, cy)]
+            else:
+                anel = [(cx + dx, cy - r) for dx in range(-r, r + 1)] + [(cx + dx, cy + r) for dx in range(-r, r + 1)]
+                anel += [(cx - r, cy + dy) for dy in range(-r + 1, r)] + [(cx + r, cy + dy) for dy in range(-r + 1, r)]
+            for chave in anel:
+                celula = celulas.get(chave)
+                if celula is None:
+                    continue
+                for item_id, (px, py) in celula.items():
+                    d2 = (px - x) ** 2 + (py - y) ** 2
+                    if len(melhores) < k or d2 < melhores[-1][0]:
+                        melhores.append((d2, item_id, (px, py)))
+                        melhores.sort(key=lambda m: m[0])
+                        del melhores[k:]
+        return [(math.sqrt(d2), item_id, ponto) for d2, item_id, ponto in melhores]
+
+    def find_nearest_neighbor(self, query_point):
+        """Mesma interface da KDTree: retorna o ponto mais próximo (x, y), ou None se o índice está vazio."""
+        vizinhos = self.nearest(query_point, 1)
+        return vizinhos[0][2] if vizinhos else None
+
+    def query_radius(self, point, radius, return_distance=False):
+        """
+        Ids dos pontos a distância <= radius de (x, y). Só as células que cruzam o quadrado
+        [x - radius, x + radius] x [y - radius, y + radius] são lidas. Com return_distance=True,
+        retorna pares (distância, id) em ordem crescente de distância.
+        """
+        if radius < 0:
+            raise ValueError("O raio deve ser não negativo.")
+        x, y = float(point[0]), float(point[1])
+        cx0, cy0 = self._celula(x - radius, y - radius)
+        cx1, cy1 = self._celula(x + radius, y + radius)
+        cx0, cy0 = max(cx0, self._cx_min), max(cy0, self._cy_min)
+        cx1, cy1 = min(cx1, self._cx_max), min(cy1, self._cy_max)
+        limite, celulas, encontrados = radius * radius, self.celulas, []
+        for i in range(int(cx0), int(cx1) + 1) if cx0 <= cx1 else ():
+            for j in range(int(cy0), int(cy1) + 1):
+                celula = celulas.get((i, j))
+                if celula is None:
+                    continue
+                for item_id, (px, py) in celula.items():
+                    d2 = (px - x) ** 2 + (py - y) ** 2
+                    if d2 <= limite:
+                        encontrados.append((d2, item_id))
+        if return_distance:
+            return [(math.sqrt(d2), item_id) for d2, item_id in sorted(encontrados, key=lambda e: e[0])]
+        return [item_id for _, item_id in encontrados]
+
+    # --- Iteração e Exportação ---
+
+    def __len__(self):
+        return len(self.pontos)
+
+    def __iter__(self):
+        """Gera os ids dos pontos (na ordem de inserção)."""
+        return iter(self.pontos)
+
+    def __contains__(self, item_id):
+        return item_id in self.pontos
+
+    def items(self):
+        """Gera os pares (id, (x, y))."""
+        return iter(self.pontos.items())
+
+    def to_numpy(self):
+        """Exporta (ids, pontos): os ids e uma matriz n x 2 com as coordenadas, preenchida direto dos pontos."""
+        n = len(self.pontos)
+        coordenadas = np.fromiter(chain.from_iterable(self.pontos.values()), dtype=np.float64, count=2 * n)
+        return np.array(list(self.pontos)), coordenadas.reshape(n, 2)
+
+    # --- Estatísticas ---
+
+    def get_memory_usage(self):
+        """
+        Retorna o uso de memória estimado (dicionários, chaves de célula e tuplas dos pontos)
+        em bytes, em O(1): o tamanho das células é acumulado a cada inserção e remoção.
+        """
+        return (sys.getsizeof(self.celulas) + sys.getsizeof(self.pontos) + self._bytes_celulas
+                + len(self.pontos) * _TAMANHO_PONTO)
+
+    def get_monitoring_stats(self):
+        """
+        Estatísticas lidas em O(1) para o monitoramento (ver src/benchmarks/monitoramento.py).
+        'fator_carga' é a média de pontos por célula ocupada.
+        """
+        return {"itens": len(self.pontos), "altura": None,
+                "fator_carga": len(self.pontos) / len(self.celulas) if self.celulas else 0.0,
+                "memoria_bytes": self.get_memory_usage(), "celulas": len(self.celulas)}
@@ -0,0 +1,71 @@
+# src/estrutura_de_dados/hashing.py
+import hashlib
+import numpy as np
+
+MASCARA_64 = (1 << 64) - 1
+
+
+def _splitmix64(x):
+    """Mistura de bits do SplitMix64 para um inteiro de 64 bits (versão escalar)."""
+    x = (x + 0x9E3779B97F4A7C15) & MASCARA_64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASCARA_64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASCARA_64
+    return x ^ (x >> 31)
+
+
+def _splitmix64_vetorizado(x):
+    """Mesma mistura do SplitMix64, aplicada a um array uint64 inteiro de uma vez."""
+    x = x + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def hash64(item):
+    """
+    Gera um hash determinístico de 64 bits para um item.
+    Inteiros usam o SplitMix64 (rápido); os demais itens usam BLAKE2b sobre str(item).
+    Ao contrário do hash() nativo, o resultado é o mesmo em qualquer processo.
+    """
+    if isinstance(item, (int, np.integer)) and not isinstance(item, bool):
+        return _splitmix64(int(item) & MASCARA_64)
+    item_bytes = str(item).encode('utf-8')
+    return int.from_bytes(hashlib.blake2b(item_bytes, digest_size=8).digest(), 'little')
+
+
+def hash64_many(itens):
+    """
+    Versão em lote de hash64. Arrays NumPy de inteiros são processados
+    inteiramente de forma vetorizada; outros tipos caem no laço por item.
+    Retorna um array uint64 com um hash por item.
+    """
+    if isinstance(itens, np.ndarray) and itens.dtype.kind in 'iu':
+        with np.errstate(over='ignore'):
+            return _splitmix64_vetorizado(itens.astype(np.uint64, copy=False))
+    return np.fromiter((hash64(item) for item in itens), dtype=np.uint64, count=len(itens))
+
+
+# Módulo usado pelo hash() nativo de inteiros (sys.hash_info.modulus em 64 bits)
+MODULO_HASH_PYTHON = (1 << 61) - 1
+
+
+def hash_python_many(itens):
+    """
+    Reproduz, em lote, o hash() nativo do Python: para inteiros é o resto de |x| por
+    2^61 - 1 com o sinal de x, e -1 vira -2. Arrays NumPy de inteiros são processados de
+    forma vetorizada; outros tipos chamam hash() item a item. Retorna um array int64.
+    """
+    if isinstance(itens, np.ndarray) and itens.dtype.kind in 'iu':
+        modulo = np.uint64(MODULO_HASH_PYTHON)
+        if itens.dtype.kind == 'u':
+            resultado = (itens.astype(np.uint64) % modulo).astype(np.int64)
+        else:
+            negativos = itens < 0
+            bits = itens.astype(np.int64, copy=False).view(np.uint64)
+            # |x| em uint64 (complemento de dois), sem estourar em -2^63
+            magnitude = np.where(negativos, ~bits + np.uint64(1), bits)
+            resultado = (magnitude % modulo).astype(np.int64)
+            np.negative(resultado, out=resultado, where=negativos)
+        resultado[resultado == -1] = -2
+        return resultado
+    return np.fromiter((hash(item) for item in itens), dtype=np.int64, count=len(itens))
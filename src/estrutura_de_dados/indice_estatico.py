@@ -0,0 +1,165 @@
+# src/estrutura_de_dados/indice_estatico.py
+import sys
+import numpy as np
+
+class StaticSearchIndex:
+    """
+    Índice de busca estático (somente leitura) em layout Eytzinger.
+    As chaves ordenadas são reorganizadas na ordem de uma busca em largura (BFS) de uma
+    árvore binária completa implícita: os filhos da posição k ficam em 2k e 2k+1.
+    Não há ponteiros nem alturas para manter, e as primeiras posições (as mais visitadas)
+    ficam juntas na memória. É construído uma vez, por exemplo a partir de uma AVLTree
+    ou de uma coluna do DataFrame, e depois só atende buscas.
+    """
+    def __init__(self, values, already_sorted=False):
+        ordenados = np.asarray(values)
+        if not already_sorted:
+            ordenados = np.sort(ordenados, kind='stable')
+        self.n = len(ordenados)
+        self.depth = self.n.bit_length()  # Número de níveis da árvore implícita
+
+        # rank[k] = posição em 'ordenados' da chave que fica na posição Eytzinger k (k >= 1)
+        self.rank = self._eytzinger_ranks(self.n)
+        self.eytzinger = np.empty(self.n + 1, dtype=ordenados.dtype)
+        if self.n:
+            self.eytzinger[0] = ordenados[0]  # Posição 0 não é usada; só evita lixo no array
+            self.eytzinger[1:] = ordenados[self.rank[1:]]
+
+    @classmethod
+    def from_avl(cls, tree):
+        """Constrói o índice a partir de uma AVLTree (o percurso em ordem já sai ordenado)."""
+        return cls(tree.to_numpy(), already_sorted=True)
+
+    @classmethod
+    def from_column(cls, column):
+        """Constrói o índice diretamente de uma coluna (Series) ou array."""
+        return cls(np.asarray(column))
+
+    # --- Funções Auxiliares ---
+
+    @staticmethod
+    def _eytzinger_ranks(n):
+        """
+        Calcula, nível a nível e de forma vetorizada, a posição em ordem (rank) de cada nó
+        da árvore implícita com n nós.
+        """
+        rank = np.zeros(n + 1, dtype=np.int64)
+        if n == 0:
+            return rank
+        niveis = [np.arange(1 << d, min(1 << (d + 1), n + 1)) for d in range(n.bit_length())]
+
+        # Tamanho de cada subárvore, somado de baixo para cima
+        tamanho = np.ones(n + 2, dtype=np.int64)
+        tamanho[0] = tamanho[n + 1] = 0
+        for nivel in reversed(niveis[1:]):
+            np.add.at(tamanho, nivel // 2, tamanho[nivel])
+
+        def tamanho_esquerda(nos):
+            filhos = 2 * nos
+            return np.where(filhos <= n, tamanho[np.minimum(filhos, n + 1)], 0)
+
+        # Início do intervalo em ordem de cada subárvore, propagado de cima para baixo
+        inicio = np.zeros(n + 1, dtype=np.int64)
+        for nivel in niveis:
+            esquerda = tamanho_esquerda(nivel)
+            rank[nivel] = inicio[nivel] + esquerda
+            filhos_esq, filhos_dir = 2 * nivel, 2 * nivel + 1
+            validos = filhos_esq <= n
+            inicio[filhos_esq[validos]] = inicio[nivel[validos]]
+            validos = filhos_dir <= n
+            inicio[filhos_dir[validos]] = inicio[nivel[validos]] + esquerda[validos] + 1
+        return rank
+
+    def _lower_bound_many(self, chaves, strict=False):
+        """
+        Para cada chave, retorna o rank da primeira chave do índice >= chave
+        (ou > chave, se strict=True). Retorna n quando não existe.
+        """
+        chaves = np.asarray(chaves)
+        k = np.ones(chaves.shape, dtype=np.int64)
+        if self.n == 0:
+            return k * 0, k * 0
+        for _ in range(self.depth):
+            ativos = k <= self.n
+            valores = self.eytzinger[np.where(ativos, k, 1)]
+            desce_direita = (valores <= chaves) if strict else (valores < chaves)
+            k = np.where(ativos, 2 * k + desce_direita, k)
+        # Desfaz os passos à direita finais: k >>= (número de 1s no final de k) + 1
+        bit_zero = ~k & (k + 1)
+        posicao = k // (2 * bit_zero)
+        return np.where(posicao > 0, self.rank[posicao], self.n), posicao
+
+    # --- Operações Públicas ---
+
+    def search(self, key):
+        """Busca uma chave. Retorna True se encontrou, False caso contrário."""
+        eytzinger, n, k = self.eytzinger, self.n, 1
+        while k <= n:
+            k = 2 * k + 1 if eytzinger[k] < key else 2 * k
+        k >>= ((~k) & (k + 1)).bit_length()
+        return k != 0 and bool(eytzinger[k] == key)
+
+    def search_many(self, keys):
+        """Busca vetorizada: retorna um array booleano com uma resposta por chave."""
+        keys = np.asarray(keys)
+        _, posicao = self._lower_bound_many(keys)
+        if self.n == 0:
+            return np.zeros(keys.shape, dtype=bool)
+        return (posicao > 0) & (self.eytzinger[posicao] == keys)
+
+    def count_range(self, low, high):
+        """
+        Conta quantas chaves estão no intervalo fechado [low, high].
+        Aceita escalares ou arrays (vários intervalos de uma vez).
+        """
+        inicio, _ = self._lower_bound_many(low)
+        fim, _ = self._lower_bound_many(high, strict=True)
+        contagem = np.maximum(fim - inicio, 0)
+        return int(contagem) if contagem.ndim == 0 else contagem
+
+    # --- Iteração e Exportação ---
+
+    def __len__(self):
+        return self.n
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    def __iter__(self):
+        """
+        Gera as chaves em ordem crescente direto do layout Eytzinger, sem pilha: começa no
+        nó mais à esquerda e vai de sucessor em sucessor (desce uma vez à direita e depois
+        tudo à esquerda; sem filho direito, sobe enquanto veio da direita).
+        """
+        eytzinger, n, k = self.eytzinger, self.n, 1
+        if n == 0:
+            return
+        while 2 * k <= n:
+            k *= 2
+        while k:
+            yield eytzinger[k].item()
+            if 2 * k + 1 <= n:
+                k = 2 * k + 1
+                while 2 * k <= n:
+                    k *= 2
+            else:
+                while k & 1:
+                    k >>= 1
+                k >>= 1
+
+    def items(self):
+        """Pares (posição, chave) em ordem crescente, como Series.items do pandas."""
+        return enumerate(self)
+
+    def to_numpy(self):
+        """
+        Chaves em ordem crescente (cópia: desfaz a permutação Eytzinger de uma vez).
+        O layout Eytzinger em si já é um array: eytzinger[1:] é a visão sem cópia.
+        """
+        ordenados = np.empty(self.n, dtype=self.eytzinger.dtype)
+        ordenados[self.rank[1:]] = self.eytzinger[1:]
+        return ordenados
+
+    def get_memory_usage(self):
+        """Retorna o uso de memória estimado dos arrays do índice em bytes."""
+        return sys.getsizeof(self.eytzinger) + sys.getsizeof(self.rank)
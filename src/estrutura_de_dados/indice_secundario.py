@@ -0,0 +1,182 @@
+# src/estrutura_de_dados/indice_secundario.py
+import sys
+import numpy as np
+
+from src.estrutura_de_dados.tabela_hash import HashTable
+from src.estrutura_de_dados.arvore_b_mais import BPlusTree
+
+class IndiceSecundario:
+    """
+    Camada de índices secundários sobre um DataFrame, usando as estruturas do projeto:
+    - índice de IGUALDADE: HashTable de valor -> ids das linhas (e um bitmap compacto
+      pré-calculado para os valores muito frequentes);
+    - índice de INTERVALO: BPlusTree de valor -> id da linha, com folhas encadeadas.
+    Os ids são posições de linha (0 .. N-1), então o resultado pode ser usado com df.iloc.
+
+    Um pequeno planejador ordena os predicados pela seletividade estimada, começa pelo
+    mais seletivo e:
+    - se sobram poucas linhas candidatas, confere os demais predicados só nelas;
+    - se sobram muitas, cruza os predicados como bitmaps (1 bit por linha) com AND.
+    """
+    # Acima desta fração da tabela, um conjunto de linhas passa a ser tratado como bitmap
+    FRACAO_DENSA = 1 / 8
+
+    def __init__(self, df):
+        self.df = df
+        self.n = len(df)
+        self.n_bytes = (self.n + 7) // 8
+        self.limiar_denso = max(1, int(self.n * self.FRACAO_DENSA))
+        self.indices = {}  # coluna -> (tipo, estrutura)
+        self._valores = {}  # coluna -> array NumPy com os valores, para conferir candidatos
+
+    # --- Criação de Índices ---
+
+    def criar_indice(self, coluna, tipo='igualdade', order=64):
+        """Declara um índice em 'coluna'. tipo: 'igualdade' (HashTable) ou 'intervalo' (BPlusTree)."""
+        valores = self.df[coluna].to_numpy()
+        self._valores[coluna] = valores
+        if tipo == 'igualdade':
+            # Agrupa as linhas por valor de uma vez só (ordenação estável mantém os ids crescentes)
+            codigos, uniques = self._fatorar(valores)
+            ordem = np.argsort(codigos, kind='stable').astype(np.int32)
+            limites = np.searchsorted(codigos[ordem], np.arange(len(uniques) + 1))
+            tabela = HashTable(size=max(1, len(uniques) * 2))
+            for i, valor in enumerate(uniques):
+                ids = ordem[limites[i]:limites[i + 1]]
+                bitmap = self._para_bitmap(ids) if len(ids) > self.limiar_denso else None
+                tabela.insert(valor, (ids, bitmap))
+            self.indices[coluna] = ('igualdade', tabela)
+        elif tipo == 'intervalo':
+            ordem = np.argsort(valores, kind='stable')
+            self.indices[coluna] = ('intervalo', BPlusTree.bulk_load(valores[ordem], ordem, order=order))
+        else:
+            raise ValueError(f"Tipo de índice desconhecido: '{tipo}'. Use 'igualdade' ou 'intervalo'.")
+
+    @staticmethod
+    def _fatorar(valores):
+        """Retorna (código de cada linha, valores distintos) — equivalente simples ao pd.factorize."""
+        uniques, codigos = np.unique(valores, return_inverse=True)
+        return codigos, [u.item() if hasattr(u, 'item') else u for u in uniques]
+
+    # --- Bitmaps ---
+
+    def _para_bitmap(self, ids):
+        mascara = np.zeros(self.n, dtype=bool)
+        mascara[ids] = True
+        return np.packbits(mascara)
+
+    def _de_bitmap(self, bitmap):
+        return np.flatnonzero(np.unpackbits(bitmap, count=self.n)).astype(np.int32)
+
+    # --- Avaliação de Predicados ---
+
+    def _ids_predicado(self, coluna, condicao):
+        """Ids (ordenados) das linhas que satisfazem um predicado, usando o índice da coluna."""
+        tipo, estrutura = self.indices[coluna]
+        if tipo == 'igualdade':
+            valores = condicao if isinstance(condicao, (list, set, frozenset)) else [condicao]
+            partes = [entrada[0] for entrada in (estrutura.search(v) for v in valores) if entrada is not None]
+            if not partes:
+                return np.empty(0, dtype=np.int32)
+            return partes[0] if len(partes) == 1 else np.sort(np.concatenate(partes))
+        low, high = condicao
+        return np.sort(np.fromiter((rid for _, rid in estrutura.range_items(low, high)), dtype=np.int32))
+
+    def _bitmap_predicado(self, coluna, condicao):
+        """Bitmap de um predicado; usa os bitmaps pré-calculados quando existem."""
+        tipo, estrutura = self.indices[coluna]
+        if tipo == 'igualdade' and not isinstance(condicao, (list, set, frozenset)):
+            entrada = estrutura.search(condicao)
+            if entrada is None:
+                return np.zeros(self.n_bytes, dtype=np.uint8)
+            if entrada[1] is not None:
+                return entrada[1]
+        return self._para_bitmap(self._ids_predicado(coluna, condicao))
+
+    def _estimar(self, coluna, condicao):
+        """Número de linhas que o predicado seleciona, sem materializar os ids."""
+        tipo, estrutura = self.indices[coluna]
+        if tipo == 'igualdade':
+            valores = condicao if isinstance(condicao, (list, set, frozenset)) else [condicao]
+            return sum(len(entrada[0]) for entrada in (estrutura.search(v) for v in valores) if entrada is not None)
+        return estrutura.count_range(*condicao)
+
+    def _conferir(self, ids, coluna, condicao):
+        """Filtra os candidatos olhando diretamente os valores da coluna (custo proporcional a len(ids))."""
+        valores = self._valores[coluna][ids]
+        if self.indices[coluna][0] == 'intervalo':
+            low, high = condicao
+            return ids[(valores >= low) & (valores <= high)]
+        if isinstance(condicao, (list, set, frozenset)):
+            return ids[np.isin(valores, list(condicao))]
+        return ids[valores == condicao]
+
+    # --- Planejador ---
+
+    def planejar(self, predicados):
+        """
+        Monta o plano de execução: lista de (coluna, condição, linhas estimadas),
+        do predicado mais seletivo para o menos seletivo.
+        predicados: dict coluna -> valor, lista de valores (IN) ou tupla (low, high) para intervalos.
+        """
+        for coluna in predicados:
+            if coluna not in self.indices:
+                raise KeyError(f"A coluna '{coluna}' não possui índice. Use criar_indice primeiro.")
+        plano = [(coluna, condicao, self._estimar(coluna, condicao)) for coluna, condicao in predicados.items()]
+        return sorted(plano, key=lambda passo: passo[2])
+
+    def explicar(self, predicados):
+        """Descreve, em texto, como a consulta seria executada."""
+        plano = self.planejar(predicados)
+        linhas = []
+        for i, (coluna, condicao, estimativa) in enumerate(plano):
+            tipo = self.indices[coluna][0]
+            if i == 0:
+                acao = "buscar no índice"
+            elif plano[0][2] <= self.limiar_denso:
+                acao = "conferir nas linhas candidatas"
+            else:
+                acao = "cruzar bitmap (AND)"
+            linhas.append(f"{i+1}. {coluna} = {condicao!r} [{tipo}] ~{estimativa} linhas -> {acao}")
+        return "\n".join(linhas)
+
+    def consultar(self, predicados):
+        """Retorna um array ordenado com os ids (posições) das linhas que satisfazem TODOS os predicados."""
+        plano = self.planejar(predicados)
+        if not plano:
+            return np.arange(self.n, dtype=np.int32)
+        if plano[0][2] == 0:
+            return np.empty(0, dtype=np.int32)
+
+        coluna, condicao, estimativa = plano[0]
+        if estimativa <= self.limiar_denso:
+            # Caminho seletivo: poucos candidatos, confere os outros predicados só neles
+            ids = self._ids_predicado(coluna, condicao)
+            for coluna, condicao, _ in plano[1:]:
+                if len(ids) == 0: break
+                ids = self._conferir(ids, coluna, condicao)
+            return ids
+
+        # Caminho denso: cruza bitmaps compactos (N/8 bytes cada)
+        bitmap = self._bitmap_predicado(coluna, condicao).copy()
+        for coluna, condicao, _ in plano[1:]:
+            np.bitwise_and(bitmap, self._bitmap_predicado(coluna, condicao), out=bitmap)
+        return self._de_bitmap(bitmap)
+
+    def consultar_df(self, predicados):
+        """Mesma consulta, retornando as linhas do DataFrame."""
+        return self.df.iloc[self.consultar(predicados)]
+
+    def get_memory_usage(self):
+        """Retorna o uso de memória estimado dos índices (ids, bitmaps e estruturas) em bytes."""
+        size = 0
+        for tipo, estrutura in self.indices.values():
+            if tipo == 'igualdade':
+                size += sys.getsizeof(estrutura.table)
+                for bucket in estrutura.table:
+                    for valor, (ids, bitmap) in bucket:
+                        # 'ids' é uma fatia de um array maior: conta só os bytes dos dados
+                        size += ids.nbytes + (bitmap.nbytes if bitmap is not None else 0)
+            else:
+                size += estrutura.get_memory_usage()
+        return size
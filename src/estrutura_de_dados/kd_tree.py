@@ -1,55 +1,168 @@
 # src/data_structures/kd_tree.py
 import sys
+from itertools import chain
+import numpy as np
+
+# Até quantas dimensões o motor de busca guarda o afastamento de cada eixo em variáveis
+# locais (um ramo por eixo); acima disso, usa uma tupla de afastamentos por entrada da pilha
+MAX_EIXOS_DESENROLADOS = 4
+_MOTORES_NN = {}  # dimensão -> função de busca compilada para ela
 
 class KDNode:
     """Nó de uma KD-Tree. Armazena o ponto, eixo, filhos e um status de exclusão."""
+    __slots__ = ('point', 'axis', 'left', 'right', 'deleted', 'vivos')
+
     def __init__(self, point, axis, left=None, right=None):
         self.point = point
         self.axis = axis
         self.left = left
         self.right = right
         self.deleted = False # <-- MUDANÇA 1: Adiciona a flag de exclusão
+        self.vivos = 1  # Pontos não deletados nesta subárvore (subárvores só de deletados são puladas)
+
+_TAMANHO_NO = sys.getsizeof(KDNode(None, 0))  # Igual para todos os nós (__slots__)
+
+
+def _gerar_motor_nn(k):
+    """
+    Gera e compila a busca do vizinho mais próximo para árvores de 'k' dimensões:
+    as coordenadas da consulta viram parâmetros (q0, q1, ...) e a distância é desenrolada,
+    sem laço, sem listas e sem closures por chamada. A busca desce sempre pelo lado da
+    consulta e empilha o outro filho com o limite inferior da distância até a região dele.
+    Esse limite é atualizado eixo a eixo (rd - afastamento_antigo² + afastamento_novo²),
+    então ele soma o afastamento em TODOS os eixos já cortados, não só no último.
+    """
+    q = [f"q{i}" for i in range(k)]
+    desenrolado = k <= MAX_EIXOS_DESENROLADOS
+    afastamentos = [f"o{i}" for i in range(k)] if desenrolado else ["offs"]
+    linhas = [f"def busca(raiz, {', '.join(q)}):",
+              "    melhor_d = INF",
+              "    melhor = None",
+              f"    pilha = [(raiz, 0.0, {', '.join(['0.0'] * k) if desenrolado else 'ZEROS'})]",
+              "    pop = pilha.pop",
+              "    push = pilha.append",
+              "    while pilha:",
+              f"        node, rd, {', '.join(afastamentos)} = pop()",
+              "        while node is not None and rd < melhor_d and node.vivos:",
+              "            p = node.point",
+              "            if not node.deleted:"]
+    linhas += [f"                t{i} = p[{i}] - q{i}" for i in range(k)]
+    linhas += [f"                d = {' + '.join(f't{i} * t{i}' for i in range(k))}",
+               "                if d < melhor_d:",
+               "                    melhor_d = d",
+               "                    melhor = p",
+               "            eixo = node.axis"]
+    if desenrolado:
+        for i in range(k):
+            condicao = "if" if i == 0 else "elif" if i < k - 1 else "else"
+            linhas.append(f"            {condicao}{f' eixo == {i}' if condicao != 'else' else ''}:")
+            novos = ", ".join("diff" if j == i else f"o{j}" for j in range(k))
+            linhas += [f"                diff = q{i} - p[{i}]",
+                       "                if diff < 0:",
+                       "                    perto, longe = node.left, node.right",
+                       "                else:",
+                       "                    perto, longe = node.right, node.left",
+                       "                if longe is not None:",
+                       f"                    novo = rd - o{i} * o{i} + diff * diff",
+                       "                    if novo < melhor_d:",
+                       f"                        push((longe, novo, {novos}))"]
+    else:
+        linhas += ["            diff = Q[eixo] - p[eixo]",
+                   "            if diff < 0:",
+                   "                perto, longe = node.left, node.right",
+                   "            else:",
+                   "                perto, longe = node.right, node.left",
+                   "            if longe is not None:",
+                   "                o = offs[eixo]",
+                   "                novo = rd - o * o + diff * diff",
+                   "                if novo < melhor_d:",
+                   "                    push((longe, novo, offs[:eixo] + (diff,) + offs[eixo + 1:]))"]
+        linhas.insert(1, f"    Q = ({', '.join(q)},)")
+    linhas += ["            node = perto",
+               "    return melhor_d, melhor"]
+    escopo = {"INF": float('inf'), "ZEROS": (0.0,) * k}
+    exec(compile("\n".join(linhas), f"<busca_nn_{k}d>", "exec"), escopo)
+    return escopo["busca"]
+
+
+def motor_nn(k):
+    """Busca do vizinho mais próximo compilada para 'k' dimensões (gerada uma vez por dimensão)."""
+    if k not in _MOTORES_NN:
+        _MOTORES_NN[k] = _gerar_motor_nn(k)
+    return _MOTORES_NN[k]
 
 class KDTree:
     """Implementação de uma KD-Tree com remoção preguiçosa (lazy deletion)."""
     def __init__(self, points):
         self.k = len(points[0]) if points else 0
+        self.n_nos = len(points)  # Nós físicos: a remoção preguiçosa não os apaga
+        self.altura = 0  # Níveis da árvore; fixa depois da construção (não há inserção)
         def build_kdtree(point_list, depth=0):
             if not point_list: return None
+            self.altura = max(self.altura, depth + 1)
             axis = depth % self.k
             point_list.sort(key=lambda p: p[axis])
             median_idx = len(point_list) // 2
             node = KDNode(point=point_list[median_idx], axis=axis)
             node.left = build_kdtree(point_list[:median_idx], depth + 1)
             node.right = build_kdtree(point_list[median_idx + 1:], depth + 1)
+            node.vivos = len(point_list)
             return node
         self.root = build_kdtree(list(points))
+        self._busca_nn = motor_nn(self.k) if self.k else None
 
     # --- MUDANÇA 2: Adiciona um método de busca para encontrar um nó exato ---
     def search(self, point_to_find):
         """Busca por um nó com um ponto exato e o retorna."""
-        def search_recursive(node, point, depth=0):
-            if node is None: return None
-            if node.point == point: return node
-            
-            axis = depth % self.k
-            if point[axis] < node.point[axis]:
-                return search_recursive(node.left, point, depth + 1)
-            return search_recursive(node.right, point, depth + 1)
-            
-        return search_recursive(self.root, point_to_find)
+        return self._search_path(point_to_find)[-1]
+
+    def _search_path(self, point, only_live=False):
+        """
+        Caminho da raiz até o nó com o ponto exato (iterativo); termina em None se não achou.
+        Na construção, coordenadas iguais à do nó podem ficar dos dois lados (a lista é
+        ordenada e cortada na mediana), então num empate os dois filhos são visitados.
+        Com only_live=True, cópias já deletadas do ponto são puladas.
+        """
+        pilha = [(self.root, ())]
+        while pilha:
+            node, caminho = pilha.pop()
+            while node is not None:
+                caminho += (node,)
+                if node.point == point and not (only_live and node.deleted):
+                    return list(caminho)
+                coordenada, corte = point[node.axis], node.point[node.axis]
+                if coordenada == corte and node.left is not None:
+                    pilha.append((node.left, caminho))
+                node = node.left if coordenada < corte else node.right
+        return [None]
 
     # --- MUDANÇA 3: Implementa a remoção "preguiçosa" ---
     def remove(self, point_to_remove):
         """Marca um nó como deletado, sem removê-lo fisicamente."""
-        node_to_mark = self.search(point_to_remove)
+        caminho = self._search_path(point_to_remove, only_live=True)
+        node_to_mark = caminho[-1]
         if node_to_mark and not node_to_mark.deleted:
             node_to_mark.deleted = True
+            for node in caminho:
+                node.vivos -= 1
             return True
         return False
 
     def find_nearest_neighbor(self, query_point):
-        """Encontra o vizinho mais próximo, ignorando nós deletados."""
+        """
+        Encontra o vizinho mais próximo, ignorando nós deletados.
+        Usa o motor iterativo compilado para a dimensão da árvore (motor_nn): pilha
+        explícita, sem recursão, e poda pela distância até a região de cada subárvore.
+        Devolve o mesmo ponto que a versão recursiva (find_nearest_neighbor_recursive).
+        """
+        if self.root is None: return None
+        if len(query_point) != self.k:
+            raise ValueError(f"O ponto de busca deve ter {self.k} coordenadas.")
+        _, nearest_point = self._busca_nn(self.root, *query_point)
+        return nearest_point
+
+    def find_nearest_neighbor_recursive(self, query_point):
+        """Versão original (recursiva) da busca, mantida como referência para os benchmarks."""
         def distance_sq(p1, p2):
             return sum([(c1 - c2) ** 2 for c1, c2 in zip(p1, p2)])
 
@@ -79,13 +192,45 @@ class KDTree:
         _, nearest_point = search_nn(self.root, float('inf'), None)
         return nearest_point
 
+    # --- Iteração e Exportação ---
+
+    def __iter__(self):
+        """Gera os pontos não deletados (pré-ordem iterativa; subárvores só de deletados são puladas)."""
+        pilha = [self.root] if self.root is not None else []
+        while pilha:
+            node = pilha.pop()
+            if not node.deleted:
+                yield node.point
+            for filho in (node.right, node.left):
+                if filho is not None and filho.vivos:
+                    pilha.append(filho)
+
+    def __len__(self):
+        return self.root.vivos if self.root is not None else 0
+
+    def __contains__(self, point):
+        return self._search_path(point, only_live=True)[-1] is not None
+
+    def items(self):
+        """Pares (posição, ponto) na ordem de __iter__, como Series.items do pandas."""
+        return enumerate(self)
+
+    def to_numpy(self):
+        """Exporta os pontos não deletados numa matriz float64 (n x k), preenchida direto do percurso."""
+        n = len(self)
+        return np.fromiter(chain.from_iterable(self), dtype=np.float64, count=n * self.k).reshape(n, self.k)
+
+    # --- Estatísticas ---
+
     def get_memory_usage(self):
-        # Este método não muda e continua correto.
-        if self.root is None: return 0
-        def get_memory_recursive(node):
-            if node is None: return 0
-            size = sys.getsizeof(node)
-            size += get_memory_recursive(node.left)
-            size += get_memory_recursive(node.right)
-            return size
-        return get_memory_recursive(self.root)
\ No newline at end of file
+        """Uso de memória estimado dos nós em O(1): com __slots__, todo KDNode tem o mesmo tamanho."""
+        return self.n_nos * _TAMANHO_NO
+
+    def get_monitoring_stats(self):
+        """
+        Estatísticas lidas em O(1) para o monitoramento (ver src/benchmarks/monitoramento.py).
+        'fator_carga' é a fração de nós ainda vivos: abaixo de ~0.5 vale reconstruir a árvore.
+        """
+        return {"itens": len(self), "altura": self.altura,
+                "fator_carga": len(self) / self.n_nos if self.n_nos else None,
+                "memoria_bytes": self.get_memory_usage()}
\ No newline at end of file
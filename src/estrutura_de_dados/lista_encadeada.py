@@ -1,4 +1,7 @@
 # src/data_structures/linked_list.py
+import sys
+import numpy as np
+
 
 class Node:
     """
@@ -10,6 +13,9 @@ class Node:
         self.next = None  # A referência para o próximo nó (inicialmente nula)
 
 
+# Todos os nós têm o mesmo tamanho (os atributos ficam fora do objeto), então a memória da lista é O(1)
+_TAMANHO_NO = sys.getsizeof(Node(None))
+
 # Continue no mesmo arquivo: src/data_structures/linked_list.py
 
 class LinkedList:
@@ -23,12 +29,43 @@ class LinkedList:
 
     # Para facilitar a visualização da lista
     def __str__(self):
-        nodes = []
+        return " -> ".join(map(str, self))
+
+    # --- Iteração e Exportação ---
+
+    def __iter__(self):
+        """Percorre os dados do início ao fim, um nó por vez (sem montar lista intermediária)."""
         current_node = self.head
         while current_node:
-            nodes.append(str(current_node.data))
+            yield current_node.data
             current_node = current_node.next
-        return " -> ".join(nodes)
+
+    def __len__(self):
+        return self.size
+
+    def items(self):
+        """Pares (posição, dado) na ordem da lista, como Series.items do pandas."""
+        return enumerate(self)
+
+    def to_numpy(self, dtype=None):
+        """
+        Copia os dados para um array NumPy. Com 'dtype', o array é preenchido direto do
+        percurso (np.fromiter com o tamanho conhecido); sem ele, o NumPy infere o tipo.
+        """
+        if dtype is not None:
+            return np.fromiter(self, dtype=dtype, count=self.size)
+        return np.array(list(self))
+
+    # --- Estatísticas ---
+
+    def get_memory_usage(self):
+        """Uso de memória estimado (objeto da lista + nós) em bytes, calculado em O(1) pelo tamanho."""
+        if not self.head: return 0
+        return sys.getsizeof(self) + self.size * _TAMANHO_NO
+
+    def get_monitoring_stats(self):
+        """Estatísticas lidas em O(1) para o monitoramento (ver src/benchmarks/monitoramento.py)."""
+        return {"itens": self.size, "altura": None, "fator_carga": None, "memoria_bytes": self.get_memory_usage()}
 # Dentro da classe LinkedList
 
     def insert(self, data):
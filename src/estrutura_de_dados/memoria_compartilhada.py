@@ -0,0 +1,347 @@
+# src/estrutura_de_dados/memoria_compartilhada.py
+"""
+Versões somente leitura da tabela hash e do Bloom filter dentro de blocos de
+multiprocessing.shared_memory, para que vários processos consultem a MESMA cópia.
+
+Protocolo de publicação (um escritor, vários leitores) com troca de versões:
+- o escritor (SharedPublisher) tem um bloco de controle pequeno, '<nome>', cujo campo
+  'versão' aponta para o bloco de dados atual, '<nome>_v<versão>';
+- publicar é montar um bloco de dados NOVO por inteiro e só então escrever a nova versão no
+  controle (uma escrita alinhada de 8 bytes). Um bloco publicado nunca mais é alterado;
+- antes de cada operação o leitor compara a versão do controle com a que ele tem mapeada e,
+  se mudou, mapeia o bloco novo e solta o antigo. Consultas já em andamento terminam na
+  versão antiga, que continua válida enquanto estiver mapeada;
+- o escritor mantém as últimas 'versoes_mantidas' versões e apaga (unlink) as mais antigas.
+  Um leitor que chegue a um nome já apagado simplesmente relê a versão e tenta de novo.
+
+Antes do Python 3.13 todo bloco anexado é registrado no resource_tracker; por isso os
+leitores devem ser processos criados com multiprocessing a partir do processo do escritor
+(eles compartilham o tracker dele, e o registro repetido não tem efeito).
+"""
+import os
+import uuid
+from multiprocessing import shared_memory
+import numpy as np
+
+from src.estrutura_de_dados.tabela_hash import HashTable
+from src.estrutura_de_dados.tabela_hash_inteiros import IntHashMap
+from src.estrutura_de_dados.bloom_filter2 import CountingBloomFilter
+
+MAGICO = 0x45445348  # "EDSH": confere que o bloco foi criado por este módulo
+TIPO_TABELA_HASH, TIPO_BLOOM = 1, 2
+TAMANHO_CABECALHO = 64  # 8 campos int64; os dados começam alinhados em 64 bytes
+TENTATIVAS_ANEXO = 100
+
+
+def _criar(nome, tamanho):
+    return shared_memory.SharedMemory(name=nome, create=True, size=max(tamanho, 1))
+
+
+def _anexar(nome):
+    """Anexa um bloco existente sem registrá-lo para remoção por este processo, quando o Python permite."""
+    try:
+        return shared_memory.SharedMemory(name=nome, track=False)  # Python 3.13+
+    except TypeError:
+        return shared_memory.SharedMemory(name=nome)
+
+
+def _alinhar(n):
+    return (n + 63) // 64 * 64
+
+
+class SharedPublisher:
+    """
+    Escritor único de uma estrutura compartilhada. Cada publish_* monta um bloco de dados
+    novo e troca a versão no bloco de controle; os leitores (SharedIntHashTable /
+    SharedBloomFilter criados com o mesmo 'nome') passam a usar a versão nova na operação
+    seguinte. close() apaga todos os blocos.
+    """
+    def __init__(self, nome=None, versoes_mantidas=2):
+        if versoes_mantidas < 1:
+            raise ValueError("versoes_mantidas deve ser pelo menos 1.")
+        self.nome = nome or f"ed_{os.getpid()}_{uuid.uuid4().hex[:8]}"
+        self.versoes_mantidas = versoes_mantidas
+        self._controle = _criar(self.nome, TAMANHO_CABECALHO)
+        self._campos = np.ndarray((8,), dtype=np.int64, buffer=self._controle.buf)
+        self._campos[:] = 0
+        self._campos[0] = MAGICO
+        self._blocos = []  # (versão, SharedMemory), da mais antiga para a mais nova
+
+    @property
+    def versao(self):
+        return int(self._campos[1])
+
+    def _publicar(self, tipo, tamanho, preencher):
+        """Cria o bloco da próxima versão, preenche, e só então publica a versão no controle."""
+        if self._campos[2] not in (0, tipo):
+            raise ValueError("Este nome já publica outro tipo de estrutura.")
+        versao = self.versao + 1
+        bloco = _criar(f"{self.nome}_v{versao}", tamanho)
+        preencher(bloco.buf)
+        self._campos[2] = tipo
+        self._campos[1] = versao  # Publicação: a partir daqui os leitores veem a versão nova
+        self._blocos.append((versao, bloco))
+        while len(self._blocos) > self.versoes_mantidas:
+            _, antigo = self._blocos.pop(0)
+            antigo.close()
+            antigo.unlink()
+        return versao
+
+    def publish_hash_table(self, keys, values=None):
+        """
+        Publica uma tabela de chaves e valores inteiros (int64). Aceita arrays/sequências
+        (keys, values) ou uma HashTable, cujos pares são copiados (todos têm de ser inteiros).
+        O bloco tem o mesmo layout do IntHashMap (chaves, valores e estados contíguos, sondagem
+        linear com hash de Fibonacci), montado com insert_many. Retorna a versão publicada.
+        """
+        if isinstance(keys, HashTable):
+            pares = [par for bucket in keys.table for par in bucket]
+            keys, values = [k for k, _ in pares], [v for _, v in pares]
+        if values is None or len(keys) != len(values):
+            raise ValueError("keys e values devem ter o mesmo tamanho.")
+        tabela = IntHashMap(capacity=max(1, len(keys)))
+        tabela.insert_many(keys, values)
+        capacidade = tabela.capacity
+        inicio_valores = TAMANHO_CABECALHO + 8 * capacidade
+        inicio_estados = inicio_valores + 8 * capacidade
+
+        def preencher(buf):
+            np.ndarray((8,), dtype=np.int64, buffer=buf)[:] = (MAGICO, TIPO_TABELA_HASH, tabela.count, capacidade, 0, 0, 0, 0)
+            buf[TAMANHO_CABECALHO:inicio_valores] = tabela.keys.tobytes()
+            buf[inicio_valores:inicio_estados] = tabela.values.tobytes()
+            buf[inicio_estados:inicio_estados + capacidade] = tabela.states.tobytes()
+
+        return self._publicar(TIPO_TABELA_HASH, inicio_estados + capacidade, preencher)
+
+    def publish_bloom_filter(self, filtro):
+        """
+        Publica um CountingBloomFilter na forma de leitura: só um bit por posição
+        (contador > 0), 8x menor que os contadores. Retorna a versão publicada.
+        """
+        if not isinstance(filtro, CountingBloomFilter):
+            raise ValueError("publish_bloom_filter espera um CountingBloomFilter.")
+        bits = np.packbits(filtro.count_array > 0, bitorder='little')
+
+        def preencher(buf):
+            np.ndarray((8,), dtype=np.int64, buffer=buf)[:] = (MAGICO, TIPO_BLOOM, filtro.count, filtro.size, filtro.hash_count, 0, 0, 0)
+            buf[TAMANHO_CABECALHO:TAMANHO_CABECALHO + len(bits)] = bits.tobytes()
+
+        return self._publicar(TIPO_BLOOM, TAMANHO_CABECALHO + _alinhar(len(bits)), preencher)
+
+    def get_memory_usage(self):
+        """Bytes ocupados pelos blocos compartilhados (controle + versões mantidas), uma vez só para todos os leitores."""
+        return self._controle.size + sum(bloco.size for _, bloco in self._blocos)
+
+    def close(self):
+        """Apaga todos os blocos. Leitores que ainda os tenham mapeados continuam lendo a última versão."""
+        for _, bloco in self._blocos:
+            bloco.close()
+            bloco.unlink()
+        self._blocos = []
+        self._campos = None
+        self._controle.close()
+        self._controle.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _LeitorCompartilhado:
+    """
+    Parte comum dos leitores: acompanha a versão no bloco de controle e mapeia (somente
+    leitura) o bloco de dados atual. As subclasses montam suas visões em _montar().
+    """
+    TIPO = None
+
+    def _iniciar_leitor(self, nome):
+        self.nome = nome
+        self._controle = _anexar(nome)
+        self._visao_controle = self._controle.buf.toreadonly()
+        self._campos_controle = np.ndarray((8,), dtype=np.int64, buffer=self._visao_controle)
+        if self._campos_controle[0] != MAGICO:
+            raise ValueError(f"'{nome}' não é um bloco de controle de estrutura compartilhada.")
+        self._bloco = self._visao = None
+        self.versao = 0
+        self.trocas_de_versao = 0
+        self._sincronizar()
+
+    def _sincronizar(self):
+        """Se o escritor publicou outra versão, passa a ler dela (e solta a anterior)."""
+        versao = int(self._campos_controle[1])
+        if versao == self.versao:
+            return
+        for _ in range(TENTATIVAS_ANEXO):
+            if versao == 0:
+                raise ValueError(f"Nada foi publicado ainda em '{self.nome}'.")
+            try:
+                bloco = _anexar(f"{self.nome}_v{versao}")
+                break
+            except FileNotFoundError:
+                versao = int(self._campos_controle[1])  # A versão foi trocada e apagada no meio: relê
+        else:
+            raise RuntimeError(f"Não foi possível anexar uma versão estável de '{self.nome}'.")
+        visao = bloco.buf.toreadonly()
+        cabecalho = np.frombuffer(visao, dtype=np.int64, count=8)
+        if cabecalho[0] != MAGICO or cabecalho[1] != self.TIPO:
+            raise ValueError(f"'{self.nome}' não publica um {type(self).__name__}.")
+        parametros = cabecalho.tolist()
+        del cabecalho
+        self._soltar_bloco()
+        self._bloco, self._visao = bloco, visao
+        self._montar(visao, parametros)
+        if self.versao:
+            self.trocas_de_versao += 1
+        self.versao = versao
+
+    def _soltar_bloco(self):
+        """Descarta as visões do bloco atual (precisam sumir antes de fechá-lo) e o fecha."""
+        if self._bloco is None:
+            return
+        self._desmontar()
+        self._visao.release()
+        self._bloco.close()
+        self._bloco = self._visao = None
+
+    def close(self):
+        """Desanexa os blocos deste processo (não apaga nada; isso é papel do escritor)."""
+        self._soltar_bloco()
+        self._campos_controle = None
+        self._visao_controle.release()
+        self._controle.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def insert(self, *args):
+        raise TypeError(f"{type(self).__name__} é somente leitura; publique uma nova versão com SharedPublisher.")
+
+    insert_many = remove = insert
+
+    def get_memory_usage(self):
+        """Bytes do bloco de dados mapeado. Ele é compartilhado: não se soma por processo."""
+        return self._bloco.size if self._bloco is not None else 0
+
+    def get_monitoring_stats(self):
+        """Estatísticas da versão publicada mais recente, com o número dessa versão."""
+        self._sincronizar()
+        return {**super().get_monitoring_stats(), "versao": self.versao}
+
+
+class SharedIntHashTable(_LeitorCompartilhado, IntHashMap):
+    """
+    Leitor da tabela publicada por SharedPublisher.publish_hash_table. É um IntHashMap
+    cujos buffers são visões somente leitura do bloco compartilhado: search / get_many são
+    os do IntHashMap, sem nenhuma cópia da tabela neste processo.
+    """
+    TIPO = TIPO_TABELA_HASH
+
+    def __init__(self, nome):
+        self._iniciar_leitor(nome)
+
+    def _montar(self, visao, parametros):
+        capacidade = parametros[3]
+        self.count, self.tombstone_count, self.resize_count = parametros[2], 0, 0
+        self.capacity, self._mask = capacidade, capacidade - 1
+        self._shift = 64 - (capacidade.bit_length() - 1)
+        inicio_valores = TAMANHO_CABECALHO + 8 * capacidade
+        inicio_estados = inicio_valores + 8 * capacidade
+        self.keys = visao[TAMANHO_CABECALHO:inicio_valores].cast('q')
+        self.values = visao[inicio_valores:inicio_estados].cast('q')
+        self.states = visao[inicio_estados:inicio_estados + capacidade].cast('b')
+        self._keys_np = np.frombuffer(self.keys, dtype=np.int64)
+        self._values_np = np.frombuffer(self.values, dtype=np.int64)
+        self._states_np = np.frombuffer(self.states, dtype=np.int8)
+
+    def _desmontar(self):
+        self._keys_np = self._values_np = self._states_np = None
+        for buffer in (self.keys, self.values, self.states):
+            buffer.release()
+        self.keys = self.values = self.states = None
+
+    def search(self, key):
+        self._sincronizar()
+        return IntHashMap.search(self, key)
+
+    def get_many(self, keys, default=0):
+        self._sincronizar()
+        return IntHashMap.get_many(self, keys, default)
+
+    def __len__(self):
+        self._sincronizar()
+        return self.count
+
+    def __contains__(self, key):
+        self._sincronizar()
+        return IntHashMap.__contains__(self, key)
+
+    def to_numpy(self):
+        self._sincronizar()
+        return IntHashMap.to_numpy(self)
+
+    def numpy_views(self):
+        """
+        Mesmo formato do IntHashMap, mas com cópias: visões do bloco guardadas fora daqui
+        o prenderiam (não seria possível soltá-lo na troca de versão nem no close).
+        """
+        self._sincronizar()
+        return tuple(a.copy() for a in IntHashMap.numpy_views(self))
+
+    def _ocupados_em_blocos(self):
+        # Um bloco só, já copiado: um gerador parado no meio não segura o bloco compartilhado
+        yield self.to_numpy()
+
+
+class SharedBloomFilter(_LeitorCompartilhado, CountingBloomFilter):
+    """
+    Leitor do filtro publicado por SharedPublisher.publish_bloom_filter: as mesmas
+    posições do CountingBloomFilter (hash duplo sobre hash64), testadas num vetor de bits
+    compartilhado em vez dos contadores.
+    """
+    TIPO = TIPO_BLOOM
+
+    def __init__(self, nome):
+        self._iniciar_leitor(nome)
+
+    def _montar(self, visao, parametros):
+        self.count, self.size, self.hash_count = parametros[2], parametros[3], parametros[4]
+        self.overflow_count = 0
+        self._offsets = np.arange(self.hash_count, dtype=np.uint64)
+        self.count_array = None  # Não há contadores: só os bits
+        self._bits = np.frombuffer(visao, dtype=np.uint8, count=(self.size + 7) // 8, offset=TAMANHO_CABECALHO)
+        # Cada versão é imutável: os bits ligados são contados uma vez, ao montar
+        self.nonzero_count = int(np.unpackbits(self._bits, count=self.size, bitorder='little').sum())
+
+    def _desmontar(self):
+        self._bits = None
+
+    def search(self, item):
+        self._sincronizar()
+        bits = self._bits
+        return all(bits[p >> 3] >> (p & 7) & 1 for p in self._hashes(item))
+
+    def search_many(self, itens):
+        self._sincronizar()
+        posicoes = self._hashes_many(itens)
+        return ((self._bits[posicoes >> np.uint64(3)] >> (posicoes & np.uint64(7)).astype(np.uint8)) & 1).all(axis=1).astype(bool)
+
+    def __len__(self):
+        self._sincronizar()
+        return self.count
+
+    def to_numpy(self):
+        """Bits do filtro desempacotados (0 ou 1 por posição), no lugar dos contadores. É uma cópia."""
+        self._sincronizar()
+        return np.unpackbits(self._bits, count=self.size, bitorder='little')
+
+    def get_statistics(self):
+        """Estatísticas do vetor de bits (não há contadores para saturação/overflow)."""
+        self._sincronizar()
+        ocupacao = self.nonzero_count / self.size
+        return {"itens": self.count, "posicoes": self.size, "hashes": self.hash_count, "ocupacao": ocupacao,
+                "fpr_teorica": self.expected_fpr(), "fpr_estimada": ocupacao ** self.hash_count, "versao": self.versao}
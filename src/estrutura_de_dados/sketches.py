@@ -0,0 +1,322 @@
+# src/estrutura_de_dados/sketches.py
+import math
+import random
+import sys
+import numpy as np
+
+from src.estrutura_de_dados.hashing import hash64, hash64_many
+
+# Todos os sketches usam o mesmo hash64/hash64_many do Bloom filter: o hash é determinístico,
+# então sketches construídos em processos diferentes (com os mesmos parâmetros) podem ser
+# unidos com merge() como se todos os itens tivessem passado por um só.
+
+
+def _comprimento_bits(x):
+    """int.bit_length() vetorizado para um array uint64 (busca binária por deslocamentos, sem float)."""
+    x = x.copy()
+    comprimento = np.zeros(len(x), dtype=np.int64)
+    for passo in (32, 16, 8, 4, 2, 1):
+        maiores = x >= (np.uint64(1) << np.uint64(passo))
+        comprimento[maiores] += passo
+        x[maiores] >>= np.uint64(passo)
+    return comprimento + (x > 0)
+
+
+def _verificar_mesmo_tipo(sketch, outro, *atributos):
+    if type(outro) is not type(sketch) or any(getattr(sketch, a) != getattr(outro, a) for a in atributos):
+        raise ValueError(f"Só é possível unir {type(sketch).__name__} com os mesmos parâmetros ({', '.join(atributos)}).")
+
+
+class CountMinSketch:
+    """
+    Count-Min Sketch: estima quantas vezes cada item apareceu num fluxo.
+    Uma matriz depth x width de contadores; cada item soma em uma posição por linha e a
+    estimativa é o mínimo dessas posições. Nunca subestima; superestima no máximo
+    e/width * (total inserido) com probabilidade 1 - e^(-depth).
+    """
+    def __init__(self, width=2048, depth=4):
+        if width <= 0 or depth <= 0:
+            raise ValueError("Largura e profundidade devem ser maiores que zero.")
+        self.width = width
+        self.depth = depth
+        self.tabela = np.zeros((depth, width), dtype=np.int64)
+        self.count = 0  # Soma de todas as contagens inseridas
+        self._linhas = np.arange(depth, dtype=np.uint64)
+
+    @classmethod
+    def from_error(cls, epsilon=0.001, delta=0.01):
+        """Dimensiona para erro <= epsilon * total com probabilidade 1 - delta: width = e/epsilon, depth = ln(1/delta)."""
+        if not 0 < epsilon < 1 or not 0 < delta < 1:
+            raise ValueError("epsilon e delta devem estar entre 0 e 1.")
+        return cls(width=math.ceil(math.e / epsilon), depth=math.ceil(math.log(1 / delta)))
+
+    def _posicoes(self, h):
+        """Uma coluna por linha, por hash duplo sobre um único hash de 64 bits (como no CountingBloomFilter)."""
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        return [(h1 + i * h2) % self.width for i in range(self.depth)]
+
+    def _posicoes_many(self, h):
+        """Versão vetorizada de _posicoes: matriz (n_itens, depth) de colunas."""
+        h1 = h & np.uint64(0xFFFFFFFF)
+        h2 = (h >> np.uint64(32)) | np.uint64(1)
+        return (h1[:, None] + self._linhas[None, :] * h2[:, None]) % np.uint64(self.width)
+
+    def insert(self, item, count=1):
+        """Soma 'count' (>= 0) ocorrências do item."""
+        if count < 0:
+            raise ValueError("A contagem deve ser não negativa.")
+        for linha, coluna in enumerate(self._posicoes(hash64(item))):
+            self.tabela[linha, coluna] += count
+        self.count += count
+
+    def insert_many(self, itens, counts=None):
+        """Insere vários itens de uma vez (contadores somados com bincount); 'counts' opcional, um por item."""
+        colunas = self._posicoes_many(hash64_many(itens)).astype(np.intp)
+        indices = (colunas + np.arange(self.depth, dtype=np.intp) * self.width).ravel()
+        if counts is None:
+            self.tabela += np.bincount(indices, minlength=self.depth * self.width).reshape(self.depth, self.width)
+            self.count += len(itens)
+            return
+        counts = np.asarray(counts, dtype=np.int64)
+        if len(counts) != len(itens):
+            raise ValueError("counts deve ter um valor por item.")
+        if (counts < 0).any():
+            raise ValueError("As contagens devem ser não negativas.")
+        somas = np.bincount(indices, weights=np.repeat(counts, self.depth), minlength=self.depth * self.width)
+        self.tabela += np.rint(somas).astype(np.int64).reshape(self.depth, self.width)
+        self.count += int(counts.sum())
+
+    def estimate(self, item):
+        """Estimativa (>= valor real) de quantas vezes o item foi inserido."""
+        return int(min(self.tabela[linha, coluna] for linha, coluna in enumerate(self._posicoes(hash64(item)))))
+
+    def estimate_many(self, itens):
+        """Versão vetorizada de estimate: um array int64 com uma estimativa por item."""
+        colunas = self._posicoes_many(hash64_many(itens)).astype(np.intp)
+        return self.tabela[np.arange(self.depth), colunas].min(axis=1)
+
+    def merge(self, outro):
+        """Soma outro sketch de mesmas dimensões a este (in-place). Retorna self."""
+        _verificar_mesmo_tipo(self, outro, "width", "depth")
+        self.tabela += outro.tabela
+        self.count += outro.count
+        return self
+
+    def erro_esperado(self):
+        """Superestimação máxima esperada: e/width * total inserido."""
+        return math.e / self.width * self.count
+
+    def to_numpy(self):
+        """Visão somente leitura (sem cópia) da matriz de contadores (depth x width)."""
+        tabela = self.tabela.view()
+        tabela.flags.writeable = False
+        return tabela
+
+    def get_memory_usage(self):
+        """Retorna o uso de memória estimado da matriz de contadores em bytes."""
+        return sys.getsizeof(self.tabela)
+
+
+class HyperLogLog:
+    """
+    HyperLogLog: estima o número de itens DISTINTOS de um fluxo com 2^p registros de 1 byte.
+    Os p bits altos do hash escolhem o registro; ele guarda a maior posição do primeiro bit 1
+    vista nos bits restantes. Erro padrão relativo ~ 1.04 / sqrt(2^p); para contagens pequenas
+    usa contagem linear sobre os registros zerados. Sem a tabela de correção de viés do HLL++.
+    """
+    def __init__(self, p=12):
+        if not 4 <= p <= 18:
+            raise ValueError("A precisão p deve estar entre 4 e 18.")
+        self.p = p
+        self.m = 1 << p
+        self.registros = np.zeros(self.m, dtype=np.uint8)
+        self._bits_resto = 64 - p
+        if self.m == 16: self.alpha = 0.673
+        elif self.m == 32: self.alpha = 0.697
+        elif self.m == 64: self.alpha = 0.709
+        else: self.alpha = 0.7213 / (1 + 1.079 / self.m)
+
+    @classmethod
+    def from_error(cls, erro=0.01):
+        """Menor p com erro padrão relativo 1.04 / sqrt(2^p) <= 'erro'."""
+        if not 0 < erro < 1:
+            raise ValueError("O erro deve estar entre 0 e 1.")
+        return cls(p=min(18, max(4, math.ceil(2 * math.log2(1.04 / erro)))))
+
+    def insert(self, item):
+        """Registra um item (repetições não mudam a estimativa)."""
+        h = hash64(item)
+        indice, resto = h >> self._bits_resto, h & ((1 << self._bits_resto) - 1)
+        posto = self._bits_resto - resto.bit_length() + 1
+        if posto > self.registros[indice]:
+            self.registros[indice] = posto
+
+    def insert_many(self, itens):
+        """Registra vários itens de uma vez (registros atualizados com np.maximum.at)."""
+        h = hash64_many(itens)
+        indices = (h >> np.uint64(self._bits_resto)).astype(np.intp)
+        restos = h & np.uint64((1 << self._bits_resto) - 1)
+        postos = (self._bits_resto + 1 - _comprimento_bits(restos)).astype(np.uint8)
+        np.maximum.at(self.registros, indices, postos)
+
+    def estimate(self):
+        """Estimativa do número de itens distintos registrados."""
+        estimativa = self.alpha * self.m * self.m / float(np.ldexp(1.0, -self.registros.astype(np.int64)).sum())
+        zerados = int(np.count_nonzero(self.registros == 0))
+        if estimativa <= 2.5 * self.m and zerados:
+            return self.m * math.log(self.m / zerados)
+        return estimativa
+
+    def merge(self, outro):
+        """Une outro HyperLogLog de mesma precisão (máximo registro a registro, in-place). Retorna self."""
+        _verificar_mesmo_tipo(self, outro, "p")
+        np.maximum(self.registros, outro.registros, out=self.registros)
+        return self
+
+    def erro_padrao(self):
+        """Erro padrão relativo teórico: 1.04 / sqrt(2^p)."""
+        return 1.04 / math.sqrt(self.m)
+
+    def to_numpy(self):
+        """Visão somente leitura (sem cópia) dos 2^p registros."""
+        registros = self.registros.view()
+        registros.flags.writeable = False
+        return registros
+
+    def __len__(self):
+        return round(self.estimate())
+
+    def get_memory_usage(self):
+        """Retorna o uso de memória estimado dos registros em bytes."""
+        return sys.getsizeof(self.registros)
+
+
+class KLLSketch:
+    """
+    Sketch de quantis KLL (Karnin, Lang e Liberty): responde "qual o percentil q" e "que
+    fração dos valores é <= x" guardando O(k) valores. Os valores ficam em níveis; um item
+    no nível h representa 2^h valores do fluxo. Quando um nível enche, ele é ordenado e
+    metade dos itens (os de posição par ou ímpar, sorteado) sobe para o nível seguinte.
+    O erro de posto é ~ 1.65 / k com alta probabilidade; mínimo e máximo são exatos.
+    """
+    FATOR_CAPACIDADE = 2 / 3  # Cada nível abaixo do topo comporta 2/3 do nível de cima
+
+    def __init__(self, k=200, seed=None):
+        if k < 8:
+            raise ValueError("k deve ser pelo menos 8.")
+        self.k = k
+        self.niveis = [np.empty(0)]
+        self.n = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._pendentes = []  # Inserções individuais ainda não passadas ao nível 0
+        self._sorteio = random.Random(seed)
+
+    def _capacidade(self, nivel):
+        return max(2, math.ceil(self.k * self.FATOR_CAPACIDADE ** (len(self.niveis) - 1 - nivel)))
+
+    def _descarregar(self):
+        if self._pendentes:
+            self.niveis[0] = np.concatenate([self.niveis[0], self._pendentes])
+            self._pendentes = []
+            self._compactar()
+
+    def _compactar(self):
+        """Sobe de nível compactando (ordena e fica com metade) todo nível acima da capacidade."""
+        nivel = 0
+        while nivel < len(self.niveis):
+            if len(self.niveis[nivel]) >= self._capacidade(nivel):
+                if nivel + 1 == len(self.niveis):
+                    self.niveis.append(np.empty(0))
+                itens = np.sort(self.niveis[nivel])
+                # Com número ímpar de itens, o maior fica no nível (o peso total continua exato)
+                pares, sobra = (itens[:-1], itens[-1:]) if len(itens) % 2 else (itens, itens[:0])
+                self.niveis[nivel + 1] = np.concatenate([self.niveis[nivel + 1], pares[self._sorteio.randint(0, 1)::2]])
+                self.niveis[nivel] = sobra
+            nivel += 1
+
+    def insert(self, valor):
+        """Adiciona um valor numérico (NaN é ignorado)."""
+        valor = float(valor)
+        if math.isnan(valor):
+            return
+        self.n += 1
+        self.min, self.max = min(self.min, valor), max(self.max, valor)
+        self._pendentes.append(valor)
+        if len(self._pendentes) + len(self.niveis[0]) >= self._capacidade(0):
+            self._descarregar()
+
+    def insert_many(self, valores):
+        """Adiciona vários valores de uma vez (NaNs são ignorados, como no pandas)."""
+        valores = np.asarray(valores, dtype=np.float64).ravel()
+        valores = valores[~np.isnan(valores)]
+        if not len(valores):
+            return
+        self.n += len(valores)
+        self.min, self.max = min(self.min, float(valores.min())), max(self.max, float(valores.max()))
+        self.niveis[0] = np.concatenate([self.niveis[0], valores])
+        self._descarregar()
+        self._compactar()
+
+    def _itens_ponderados(self):
+        """Todos os itens guardados, ordenados, e o peso acumulado até cada um."""
+        self._descarregar()
+        itens = np.concatenate(self.niveis)
+        pesos = np.concatenate([np.full(len(itens_nivel), 1 << nivel, dtype=np.int64)
+                                for nivel, itens_nivel in enumerate(self.niveis)])
+        ordem = np.argsort(itens, kind="stable")
+        return itens[ordem], np.cumsum(pesos[ordem])
+
+    def quantiles(self, qs):
+        """Valores estimados para cada quantil em 'qs' (entre 0 e 1); 0 e 1 dão o mínimo e o máximo exatos."""
+        qs = np.asarray(qs, dtype=np.float64)
+        if ((qs < 0) | (qs > 1)).any():
+            raise ValueError("Os quantis devem estar entre 0 e 1.")
+        if not self.n:
+            raise ValueError("O sketch está vazio.")
+        itens, acumulado = self._itens_ponderados()
+        posicoes = np.minimum(np.searchsorted(acumulado, qs * acumulado[-1], side="left"), len(itens) - 1)
+        resultado = itens[posicoes]
+        resultado[qs == 0], resultado[qs == 1] = self.min, self.max
+        return resultado
+
+    def quantile(self, q):
+        """Valor estimado do quantil q (ex.: 0.95 para o p95)."""
+        return float(self.quantiles([q])[0])
+
+    def cdf(self, x):
+        """Fração estimada dos valores <= x."""
+        if not self.n:
+            raise ValueError("O sketch está vazio.")
+        self._descarregar()
+        return sum(int(np.count_nonzero(itens <= x)) << nivel for nivel, itens in enumerate(self.niveis)) / self.n
+
+    def merge(self, outro):
+        """Une outro KLLSketch de mesmo k (nível a nível, depois compacta; in-place). Retorna self."""
+        _verificar_mesmo_tipo(self, outro, "k")
+        outro._descarregar()
+        self._descarregar()
+        while len(self.niveis) < len(outro.niveis):
+            self.niveis.append(np.empty(0))
+        for nivel, itens in enumerate(outro.niveis):
+            self.niveis[nivel] = np.concatenate([self.niveis[nivel], itens])
+        self.n += outro.n
+        self.min, self.max = min(self.min, outro.min), max(self.max, outro.max)
+        self._compactar()
+        return self
+
+    def __len__(self):
+        return self.n
+
+    def to_numpy(self):
+        """
+        Exporta (itens, pesos): os valores guardados em todos os níveis e quantos valores do
+        fluxo cada um representa (2^nível). É uma cópia; os pesos somam len(self).
+        """
+        self._descarregar()
+        pesos = [np.full(len(itens), 1 << nivel, dtype=np.int64) for nivel, itens in enumerate(self.niveis)]
+        return np.concatenate(self.niveis), np.concatenate(pesos)
+
+    def get_memory_usage(self):
+        """Retorna o uso de memória estimado (arrays dos níveis e a lista de pendentes) em bytes."""
+        return sum(sys.getsizeof(itens) for itens in self.niveis) + sys.getsizeof(self._pendentes) + 24 * len(self._pendentes)
@@ -1,5 +1,24 @@
 # src/data_structures/hash_table.py
 import sys
+import numpy as np
+
+from src.estrutura_de_dados.hashing import hash_python_many
+
+_AUSENTE = object()  # Marca "chave não encontrada" (None pode ser um valor guardado)
+_MIN_INT64, _MAX_INT64 = -(1 << 63), (1 << 63) - 1
+_BALDE_VAZIO, _BALDE_UNICO, _BALDE_OUTROS = 0, 1, 2
+_TAMANHO_PAR = sys.getsizeof((0, 0))  # Toda entrada é uma tupla (chave, valor): tamanho fixo
+
+def _exportar(gerador, dtype, n):
+    """Array com os n itens do gerador: preenchido direto com dtype, ou com o tipo inferido pelo NumPy."""
+    if dtype is not None:
+        return np.fromiter(gerador, dtype=dtype, count=n)
+    return np.array(list(gerador))
+
+def _exigir_unidimensional(keys):
+    """As operações em lote recebem uma sequência plana de chaves; arrays 2-D seriam chaves 'lista'."""
+    if isinstance(keys, np.ndarray) and keys.ndim != 1:
+        raise ValueError(f"As chaves devem ser um array 1-D (recebido com formato {keys.shape}).")
 
 class HashTable:
     """
@@ -9,6 +28,9 @@ class HashTable:
         self.size = size
         self.table = [[] for _ in range(self.size)]
         self.collision_count = 0  # Atributo de contagem inicializado aqui
+        self.count = 0  # Pares guardados, mantido a cada alteração (len e estatísticas em O(1))
+        self._bytes_baldes = self.size * sys.getsizeof([])  # Soma de sys.getsizeof de cada balde
+        self._espelho = None  # Espelho NumPy para search_many, refeito após alterações
 
     def _hash_function(self, key):
         return hash(key) % self.size
@@ -19,6 +41,7 @@ class HashTable:
         """
         index = self._hash_function(key)
         bucket = self.table[index]
+        self._espelho = None
 
         # Verifica se a chave já existe (seria uma atualização, não uma nova colisão)
         for i, (existing_key, _) in enumerate(bucket):
@@ -31,7 +54,10 @@ class HashTable:
             self.collision_count += 1
         
         # Insere o novo par (chave, valor)
+        antes = sys.getsizeof(bucket)
         bucket.append((key, value))
+        self._bytes_baldes += sys.getsizeof(bucket) - antes
+        self.count += 1
 
     def search(self, key):
         index = self._hash_function(key)
@@ -46,15 +72,228 @@ class HashTable:
         bucket = self.table[index]
         for i, (existing_key, _) in enumerate(bucket):
             if existing_key == key:
+                antes = sys.getsizeof(bucket)
                 del bucket[i]
+                self._bytes_baldes += sys.getsizeof(bucket) - antes
+                self.count -= 1
+                self._espelho = None
                 return True
         return False
 
-    def get_memory_usage(self):
-        """Calcula o uso de memória estimado da tabela hash."""
-        size = sys.getsizeof(self.table)
+    # --- Operações em Lote ---
+
+    def _baldes(self, keys):
+        """
+        Retorna (chaves como lista, balde de cada chave), o mesmo resultado de _hash_function.
+        Arrays NumPy de inteiros têm o hash calculado de uma vez; outras sequências chamam hash() por item.
+        As chaves viram objetos Python (int em vez de np.int64), iguais às que insert guardaria.
+        """
+        chaves = keys.tolist() if isinstance(keys, np.ndarray) else list(keys)
+        return chaves, hash_python_many(keys if isinstance(keys, np.ndarray) else chaves) % self.size
+
+    @staticmethod
+    def _agrupar(baldes):
+        """
+        Ordena as posições por balde (ordenação estável, que preserva a ordem do lote dentro
+        de cada balde). Retorna (ordem, baldes distintos, inícios): as posições
+        ordem[inicios[g]:inicios[g+1]] caem no balde g.
+        """
+        ordem = np.argsort(baldes, kind='stable')
+        ordenados = baldes[ordem]
+        novo = np.ones(len(ordenados), dtype=bool)
+        novo[1:] = ordenados[1:] != ordenados[:-1]
+        inicios = np.flatnonzero(novo)
+        return ordem, ordenados[inicios], np.append(inicios, len(ordem))
+
+    def insert_many(self, keys, values):
+        """
+        Insere vários pares de uma vez, com a mesma semântica de insert (atualiza chaves
+        existentes e conta colisões). Os baldes são calculados para o lote inteiro e cada
+        balde é visitado uma única vez.
+        """
+        _exigir_unidimensional(keys)
+        if len(keys) != len(values):
+            raise ValueError("keys e values devem ter o mesmo tamanho.")
+        valores = values.tolist() if isinstance(values, np.ndarray) else list(values)
+        self._espelho = None
+        chaves, baldes = self._baldes(keys)
+        ordem, distintos, inicios = self._agrupar(baldes)
+        ordem, inicios = ordem.tolist(), inicios.tolist()
+        for g, indice in enumerate(distintos.tolist()):
+            bucket = self.table[indice]
+            tamanho, antes = len(bucket), sys.getsizeof(bucket)
+            posicoes = {k: i for i, (k, _) in enumerate(bucket)}
+            for j in ordem[inicios[g]:inicios[g + 1]]:
+                key = chaves[j]
+                if key in posicoes:
+                    bucket[posicoes[key]] = (key, valores[j])
+                    continue
+                if len(bucket) > 0:
+                    self.collision_count += 1
+                posicoes[key] = len(bucket)
+                bucket.append((key, valores[j]))
+            self.count += len(bucket) - tamanho
+            self._bytes_baldes += sys.getsizeof(bucket) - antes
+
+    def merge(self, outro):
+        """
+        Une outra tabela de mesmo tamanho a esta, balde a balde (in-place). Retorna self.
+        O resultado é o mesmo de inserir, depois das chaves desta tabela, as da outra na
+        ordem em que estão nos baldes: chaves repetidas ficam com o valor da outra e as
+        colisões são recontadas. Para a construção em paralelo (uma tabela por processo),
+        o hash() das chaves precisa ser igual nos processos: inteiros sempre são; textos só
+        com o mesmo PYTHONHASHSEED (ou processos criados por fork).
+        """
+        if not isinstance(outro, HashTable) or outro.size != self.size:
+            raise ValueError("Só é possível unir tabelas hash de mesmo tamanho.")
+        return self.merge_buckets(enumerate(outro.table))  # Os baldes vazios são pulados lá
+
+    def occupied_buckets(self):
+        """
+        Pares (índice, balde) só dos baldes não vazios: o que merge_buckets precisa, com
+        tamanho proporcional aos itens (e não a 'size'), para enviar entre processos.
+        """
+        return [(indice, bucket) for indice, bucket in enumerate(self.table) if bucket]
+
+    def merge_buckets(self, pares):
+        """
+        Une à tabela os pares (índice, balde) de outra tabela de mesmo tamanho (ex.: os de
+        occupied_buckets, recebidos de outro processo), com a mesma semântica de merge. Retorna self.
+        """
+        self._espelho = None
+        for indice, balde_outro in pares:
+            if not balde_outro:
+                continue
+            bucket = self.table[indice]
+            tamanho, antes = len(bucket), sys.getsizeof(bucket)
+            if not bucket:
+                bucket = self.table[indice] = list(balde_outro)
+                self.collision_count += len(balde_outro) - 1
+            else:
+                posicoes = {k: i for i, (k, _) in enumerate(bucket)}
+                for key, value in balde_outro:
+                    if key in posicoes:
+                        bucket[posicoes[key]] = (key, value)
+                        continue
+                    self.collision_count += 1
+                    posicoes[key] = len(bucket)
+                    bucket.append((key, value))
+            self.count += len(bucket) - tamanho
+            self._bytes_baldes += sys.getsizeof(bucket) - antes
+        return self
+
+    def _espelho_numpy(self):
+        """
+        Espelho NumPy dos baldes, usado por search_many: para cada balde, o tipo (vazio, uma
+        chave inteira ou "outros") e, quando há uma única chave inteira, a chave e o valor.
+        É recalculado só depois de alguma inserção ou remoção.
+        """
+        if self._espelho is None:
+            tamanhos = np.fromiter(map(len, self.table), dtype=np.int64, count=self.size)
+            tipo = np.where(tamanhos == 0, _BALDE_VAZIO, _BALDE_OUTROS).astype(np.int8)
+            unicos = np.flatnonzero(tamanhos == 1)
+            entradas = [self.table[i][0] for i in unicos.tolist()]
+            chaves = np.array([k for k, _ in entradas])
+            if len(entradas) and chaves.dtype.kind not in 'ib':
+                # Há chaves que não são inteiros de 64 bits (texto, float, int enorme): ficam de fora
+                inteiras = np.fromiter((type(k) is int and _MIN_INT64 <= k <= _MAX_INT64 for k, _ in entradas),
+                                       dtype=bool, count=len(entradas))
+                unicos = unicos[inteiras]
+                entradas = [e for e, inteira in zip(entradas, inteiras.tolist()) if inteira]
+                chaves = np.array([k for k, _ in entradas], dtype=np.int64)
+            tipo[unicos] = _BALDE_UNICO
+            chave = np.zeros(self.size, dtype=np.int64)
+            chave[unicos] = chaves
+            valor = np.empty(self.size, dtype=object)
+            valor[unicos] = np.fromiter((v for _, v in entradas), dtype=object, count=len(entradas))
+            self._espelho = (tipo, chave, valor)
+        return self._espelho
+
+    def search_many(self, keys, default=None, dtype=object):
+        """
+        Busca em lote. Retorna (valores, encontrados): um array com o valor de cada chave
+        ('default' onde ela não existe) e a máscara booleana das chaves encontradas.
+        Com valores numéricos, dtype=np.int64 (ou float) devolve um array numérico.
+
+        Com chaves em um array NumPy de inteiros, os baldes vazios ou com uma só entrada
+        (o caso comum com carga baixa) são resolvidos de forma vetorizada pelo espelho NumPy;
+        só as chaves que caem em baldes com colisões percorrem as listas, agrupadas por balde.
+        """
+        _exigir_unidimensional(keys)
+        resultado = np.full(len(keys), default, dtype=dtype)
+        encontrados = np.zeros(len(keys), dtype=bool)
+        if isinstance(keys, np.ndarray) and keys.dtype.kind == 'i':
+            chaves = keys.astype(np.int64, copy=False)
+            baldes = hash_python_many(chaves) % self.size
+            tipo, chave_unica, valor_unico = self._espelho_numpy()
+            tipo_balde = tipo[baldes]
+            achou = (tipo_balde == _BALDE_UNICO) & (chave_unica[baldes] == chaves)
+            resultado[achou] = valor_unico[baldes[achou]]
+            encontrados[achou] = True
+            pendentes = np.flatnonzero(tipo_balde == _BALDE_OUTROS)
+        else:
+            chaves, baldes = self._baldes(keys)
+            pendentes = np.arange(len(chaves))
+        if len(pendentes):
+            lista_chaves = chaves.tolist() if isinstance(chaves, np.ndarray) else chaves
+            ordem, distintos, inicios = self._agrupar(baldes[pendentes])
+            linhas, inicios = pendentes[ordem].tolist(), inicios.tolist()
+            for g, indice in enumerate(distintos.tolist()):
+                bucket = self.table[indice]
+                if not bucket:
+                    continue
+                mapa = dict(bucket)
+                for j in linhas[inicios[g]:inicios[g + 1]]:
+                    valor = mapa.get(lista_chaves[j], _AUSENTE)
+                    if valor is not _AUSENTE:
+                        resultado[j] = valor
+                        encontrados[j] = True
+        return resultado, encontrados
+
+    # --- Iteração e Exportação ---
+
+    def __iter__(self):
+        """Gera as chaves balde a balde, sem montar lista intermediária."""
+        for bucket in self.table:
+            for key, _ in bucket:
+                yield key
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, key):
+        # Olha só o balde da chave (sem isto, 'in' percorreria a tabela inteira via __iter__)
+        return any(existing_key == key for existing_key, _ in self.table[self._hash_function(key)])
+
+    def items(self):
+        """Gera os pares (chave, valor) balde a balde."""
         for bucket in self.table:
-            size += sys.getsizeof(bucket)
-            for item in bucket:
-                size += sys.getsizeof(item)
-        return size
\ No newline at end of file
+            yield from bucket
+
+    def to_numpy(self, key_dtype=None, value_dtype=None):
+        """
+        Exporta (chaves, valores) em dois arrays NumPy alinhados, na ordem dos baldes.
+        Com os dtypes, cada array é preenchido direto do percurso (np.fromiter com o
+        tamanho conhecido); sem eles, o NumPy infere o tipo a partir dos pares.
+        """
+        n = len(self)
+        chaves = (key for bucket in self.table for key, _ in bucket)
+        valores = (value for bucket in self.table for _, value in bucket)
+        return _exportar(chaves, key_dtype, n), _exportar(valores, value_dtype, n)
+
+    # --- Estatísticas ---
+
+    def get_memory_usage(self):
+        """
+        Calcula o uso de memória estimado da tabela hash (lista de baldes, baldes e tuplas)
+        em O(1): o tamanho dos baldes é acumulado a cada alteração e as tuplas têm tamanho fixo.
+        """
+        size = sys.getsizeof(self.table) + self._bytes_baldes + self.count * _TAMANHO_PAR
+        if self._espelho is not None:
+            size += sum(a.nbytes for a in self._espelho)
+        return size
+
+    def get_monitoring_stats(self):
+        """Estatísticas lidas em O(1) para o monitoramento (ver src/benchmarks/monitoramento.py)."""
+        return {"itens": self.count, "altura": None, "fator_carga": self.count / self.size,
+                "memoria_bytes": self.get_memory_usage()}
\ No newline at end of file
@@ -0,0 +1,263 @@
+# src/estrutura_de_dados/tabela_hash_inteiros.py
+import operator
+import sys
+from array import array
+import numpy as np
+
+from src.estrutura_de_dados.hashing import MASCARA_64
+
+# 2^64 / φ (razão áurea): multiplicar por ele espalha bem até chaves consecutivas (0, 1, 2, ...)
+FIBONACCI_64 = 0x9E3779B97F4A7C15
+VAZIO, OCUPADO, REMOVIDO = 0, 1, 2
+TAMANHO_BLOCO = 1 << 16  # Posições examinadas por vez ao percorrer a tabela (iteração em blocos)
+
+class IntHashMap:
+    """
+    Tabela hash especializada em chaves e valores inteiros (int64).
+    Usa endereçamento aberto com sondagem linear e hashing multiplicativo de Fibonacci:
+    a posição é formada pelos bits altos de (chave * 2^64/φ), sem str(), SHA-256 ou hash().
+
+    Chaves, valores e o estado de cada posição (vazia, ocupada, removida) ficam em três
+    buffers contíguos array('q') / array('b'), sem tuplas nem objetos por entrada.
+    As operações de uma chave usam os arrays diretamente (indexar array.array é barato);
+    insert_many / get_many usam visões NumPy dos MESMOS buffers e processam o lote inteiro
+    de forma vetorizada, um passo de sondagem por vez.
+
+    Remoções deixam "lápides" (REMOVIDO), que não interrompem a sondagem e são
+    reaproveitadas por novas inserções. A tabela é reconstruída quando ocupadas + lápides
+    passam de MAX_LOAD da capacidade.
+    """
+    MAX_LOAD = 0.7
+
+    def __init__(self, capacity=1024):
+        """'capacity' é o número de itens esperado; a tabela cresce sozinha se passar dele."""
+        if capacity <= 0:
+            raise ValueError("A capacidade deve ser maior que zero.")
+        self.count = 0
+        self.tombstone_count = 0
+        self.resize_count = 0
+        self._alocar(self._capacidade_para(capacity))
+
+    # --- Funções Auxiliares ---
+
+    @classmethod
+    def _capacidade_para(cls, n_itens):
+        """Menor potência de 2 (mínimo 8) que comporta n_itens sem passar de MAX_LOAD."""
+        minimo = max(8, int(n_itens / cls.MAX_LOAD) + 1)
+        return 1 << (minimo - 1).bit_length()
+
+    def _alocar(self, capacidade):
+        self.capacity = capacidade
+        self._mask = capacidade - 1
+        self._shift = 64 - (capacidade.bit_length() - 1)
+        self.keys = array('q', bytes(8 * capacidade))
+        self.values = array('q', bytes(8 * capacidade))
+        self.states = array('b', bytes(capacidade))
+        # Visões sem cópia dos buffers acima, para as operações em lote
+        self._keys_np = np.frombuffer(self.keys, dtype=np.int64)
+        self._values_np = np.frombuffer(self.values, dtype=np.int64)
+        self._states_np = np.frombuffer(self.states, dtype=np.int8)
+
+    def _hash(self, key):
+        return ((key * FIBONACCI_64) & MASCARA_64) >> self._shift
+
+    def _hash_many(self, chaves):
+        with np.errstate(over='ignore'):
+            produto = chaves.astype(np.uint64) * np.uint64(FIBONACCI_64)
+        return (produto >> np.uint64(self._shift)).astype(np.int64)
+
+    @staticmethod
+    def _como_int64(keys):
+        chaves = np.asarray(keys)
+        if chaves.size and chaves.dtype.kind not in 'iu':
+            raise TypeError("IntHashMap só aceita chaves inteiras.")
+        return chaves.astype(np.int64, copy=False).ravel()
+
+    def _redimensionar(self, n_itens):
+        """
+        Reconstrói a tabela para 'n_itens' itens vivos, descartando as lápides. Dobra a
+        capacidade até a ocupação ficar abaixo de MAX_LOAD / 2, para que o custo da
+        reconstrução se dilua nas inserções seguintes.
+        """
+        capacidade = self.capacity
+        while n_itens > capacidade * self.MAX_LOAD / 2:
+            capacidade *= 2
+        vivos = self._states_np == OCUPADO
+        chaves, valores = self._keys_np[vivos].copy(), self._values_np[vivos].copy()
+        self._alocar(capacidade)
+        self.count = self.tombstone_count = 0
+        self._colocar_many(chaves, valores)
+        self.resize_count += 1
+
+    def _localizar_many(self, chaves):
+        """Posição de cada chave na tabela, ou -1 se ela não está lá."""
+        keys, states, mask = self._keys_np, self._states_np, self._mask
+        posicoes = np.full(len(chaves), -1, dtype=np.int64)
+        pendentes = np.arange(len(chaves))
+        pos = self._hash_many(chaves)
+        while len(pendentes):
+            estado = states[pos]
+            achou = (estado == OCUPADO) & (keys[pos] == chaves[pendentes])
+            posicoes[pendentes[achou]] = pos[achou]
+            # Só uma posição VAZIA encerra a sondagem; lápides e outras chaves fazem seguir adiante
+            continua = ~achou & (estado != VAZIO)
+            pendentes, pos = pendentes[continua], (pos[continua] + 1) & mask
+        return posicoes
+
+    def _colocar_many(self, chaves, valores):
+        """Grava chaves distintas que ainda NÃO estão na tabela (há espaço garantido)."""
+        keys, values, states, mask = self._keys_np, self._values_np, self._states_np, self._mask
+        pendentes = np.arange(len(chaves))
+        pos = self._hash_many(chaves)
+        while len(pendentes):
+            candidatos = np.flatnonzero(states[pos] != OCUPADO)
+            # Várias chaves podem disputar a mesma posição livre: fica a primeira, as outras seguem
+            _, primeiros = np.unique(pos[candidatos], return_index=True)
+            vencedores = candidatos[primeiros]
+            destino, origem = pos[vencedores], pendentes[vencedores]
+            self.tombstone_count -= int(np.count_nonzero(states[destino] == REMOVIDO))
+            keys[destino], values[destino], states[destino] = chaves[origem], valores[origem], OCUPADO
+            restantes = np.ones(len(pendentes), dtype=bool)
+            restantes[vencedores] = False
+            pendentes, pos = pendentes[restantes], (pos[restantes] + 1) & mask
+        self.count += len(chaves)
+
+    # --- Operações de Uma Chave ---
+
+    def insert(self, key, value):
+        """Insere ou atualiza um par chave-valor (ambos inteiros)."""
+        key = operator.index(key)
+        if self.count + self.tombstone_count + 1 > self.capacity * self.MAX_LOAD:
+            self._redimensionar(self.count + 1)
+        keys, states, mask = self.keys, self.states, self._mask
+        pos, livre = self._hash(key), -1
+        while True:
+            estado = states[pos]
+            if estado == VAZIO:
+                break
+            if estado == OCUPADO and keys[pos] == key:
+                self.values[pos] = value
+                return
+            if estado == REMOVIDO and livre < 0:
+                livre = pos  # Primeira lápide do caminho: reaproveitada se a chave não existir
+            pos = (pos + 1) & mask
+        if livre >= 0:
+            pos = livre
+            self.tombstone_count -= 1
+        keys[pos], self.values[pos], states[pos] = key, value, OCUPADO
+        self.count += 1
+
+    def _posicao(self, key):
+        keys, states, mask = self.keys, self.states, self._mask
+        pos = self._hash(operator.index(key))
+        while True:
+            estado = states[pos]
+            if estado == VAZIO:
+                return -1
+            if estado == OCUPADO and keys[pos] == key:
+                return pos
+            pos = (pos + 1) & mask
+
+    def search(self, key):
+        """Retorna o valor da chave, ou None se ela não existir."""
+        pos = self._posicao(key)
+        return self.values[pos] if pos >= 0 else None
+
+    def remove(self, key):
+        pos = self._posicao(key)
+        if pos < 0:
+            return False
+        self.states[pos] = REMOVIDO
+        self.count -= 1
+        self.tombstone_count += 1
+        return True
+
+    # --- Operações em Lote ---
+
+    def insert_many(self, keys, values):
+        """
+        Insere (ou atualiza) todos os pares de uma vez. 'keys' e 'values' podem ser arrays
+        NumPy ou sequências de inteiros. Chaves repetidas no lote: vale o último valor,
+        como em inserções uma a uma.
+        """
+        chaves = self._como_int64(keys)
+        valores = np.asarray(values, dtype=np.int64).ravel()
+        if len(chaves) != len(valores):
+            raise ValueError("keys e values devem ter o mesmo tamanho.")
+        _, ultimas = np.unique(chaves[::-1], return_index=True)
+        ultimas = len(chaves) - 1 - ultimas
+        chaves, valores = chaves[ultimas], valores[ultimas]
+
+        posicoes = self._localizar_many(chaves)
+        existentes = posicoes >= 0
+        self._values_np[posicoes[existentes]] = valores[existentes]
+        novas, valores_novos = chaves[~existentes], valores[~existentes]
+        if self.count + self.tombstone_count + len(novas) > self.capacity * self.MAX_LOAD:
+            self._redimensionar(self.count + len(novas))
+        self._colocar_many(novas, valores_novos)
+
+    def get_many(self, keys, default=0):
+        """
+        Busca vetorizada. Retorna (valores, encontrados): um array int64 com o valor de cada
+        chave ('default' onde ela não existe) e a máscara booleana de chaves encontradas.
+        """
+        chaves = self._como_int64(keys)
+        posicoes = self._localizar_many(chaves)
+        encontrados = posicoes >= 0
+        valores = np.full(len(chaves), default, dtype=np.int64)
+        valores[encontrados] = self._values_np[posicoes[encontrados]]
+        return valores, encontrados
+
+    # --- Iteração e Exportação ---
+
+    def _ocupados_em_blocos(self):
+        """
+        Gera (chaves, valores) das posições ocupadas, TAMANHO_BLOCO posições por vez: a
+        máscara de cada bloco é vetorizada e só um bloco fica materializado de cada vez.
+        Percorre os buffers do início da iteração (um redimensionamento no meio não é visto).
+        """
+        keys, values, states = self._keys_np, self._values_np, self._states_np
+        for inicio in range(0, len(states), TAMANHO_BLOCO):
+            fim = inicio + TAMANHO_BLOCO
+            ocupados = states[inicio:fim] == OCUPADO
+            yield keys[inicio:fim][ocupados], values[inicio:fim][ocupados]
+
+    def __iter__(self):
+        """Gera as chaves na ordem das posições da tabela."""
+        for chaves, _ in self._ocupados_em_blocos():
+            yield from chaves.tolist()
+
+    def items(self):
+        """Gera os pares (chave, valor) na ordem das posições da tabela."""
+        for chaves, valores in self._ocupados_em_blocos():
+            yield from zip(chaves.tolist(), valores.tolist())
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, key):
+        return self._posicao(key) >= 0
+
+    def to_numpy(self):
+        """Exporta (chaves, valores) das posições ocupadas em dois arrays int64 compactos (cópia)."""
+        ocupados = self._states_np == OCUPADO
+        return self._keys_np[ocupados], self._values_np[ocupados]
+
+    def numpy_views(self):
+        """
+        Exportação sem cópia: (chaves, valores, ocupados), com chaves e valores como visões
+        somente leitura dos buffers da tabela inteira (capacity posições) e 'ocupados' a
+        máscara das posições válidas. As visões valem até o próximo redimensionamento.
+        """
+        chaves, valores = self._keys_np.view(), self._values_np.view()
+        chaves.flags.writeable = valores.flags.writeable = False
+        return chaves, valores, self._states_np == OCUPADO
+
+    def get_memory_usage(self):
+        """Retorna o uso de memória dos três buffers (chaves, valores e estados) em bytes."""
+        return sys.getsizeof(self.keys) + sys.getsizeof(self.values) + sys.getsizeof(self.states)
+
+    def get_monitoring_stats(self):
+        """Estatísticas lidas em O(1) para o monitoramento (ver src/benchmarks/monitoramento.py)."""
+        return {"itens": self.count, "altura": None, "fator_carga": self.count / self.capacity,
+                "memoria_bytes": self.get_memory_usage(), "lapides": self.tombstone_count}
@@ -0,0 +1,121 @@
+# src/modelo/arvore_compilada.py
+import sys
+import numpy as np
+
+class CompiledDecisionTree:
+    """
+    Árvore de decisão "compilada": a DecisionTreeClassifier treinada é achatada em arrays
+    NumPy (feature, limiar, filhos e probabilidades de cada nó) e a padronização do
+    StandardScaler é embutida nos limiares. Como (x - média) / escala <= t equivale a
+    x <= t * escala + média (escala > 0), o avaliador recebe as features ORIGINAIS
+    e dispensa o scaler, a validação do sklearn e o alinhamento de DataFrames a cada chamada.
+
+    - predict_one / predict_proba_one: uma linha, percorrendo listas Python (microssegundos);
+    - predict / predict_proba: lote, percorrendo a árvore nível a nível de forma vetorizada.
+    """
+    def __init__(self, feature, threshold, left, right, proba, classes, feature_names=None):
+        self.feature = np.asarray(feature, dtype=np.int64)
+        self.threshold = np.asarray(threshold, dtype=np.float64)
+        self.left = np.asarray(left, dtype=np.int64)
+        self.right = np.asarray(right, dtype=np.int64)
+        self.proba = np.asarray(proba, dtype=np.float64)
+        self.classes = np.asarray(classes)
+        self.feature_names = list(feature_names) if feature_names is not None else None
+        self.depth = self._calcular_profundidade()
+        # Cópias em listas Python: indexar listas é bem mais barato que indexar arrays por escalar
+        self._feature, self._threshold = self.feature.tolist(), self.threshold.tolist()
+        self._left, self._right = self.left.tolist(), self.right.tolist()
+        self._proba = self.proba.tolist()
+        self._classe_folha = self.classes[self.proba.argmax(axis=1)].tolist()
+
+    @classmethod
+    def from_sklearn(cls, modelo, scaler=None):
+        """
+        Exporta uma DecisionTreeClassifier (de uma saída) já treinada.
+        Se 'scaler' (StandardScaler) for informado, ele é dobrado nos limiares.
+        """
+        arvore = modelo.tree_
+        if modelo.n_outputs_ != 1:
+            raise ValueError("Só árvores de uma única saída podem ser compiladas.")
+        feature = arvore.feature.copy()
+        threshold = arvore.threshold.astype(np.float64)
+        internos = arvore.children_left != -1
+        if scaler is not None:
+            escala = scaler.scale_ if scaler.scale_ is not None else np.ones(scaler.n_features_in_)
+            media = scaler.mean_ if scaler.mean_ is not None else np.zeros(scaler.n_features_in_)
+            threshold[internos] = threshold[internos] * escala[feature[internos]] + media[feature[internos]]
+        # Folhas apontam para si mesmas: a travessia vetorizada pode rodar 'depth' passos sem testes
+        nos = np.arange(arvore.node_count)
+        left = np.where(internos, arvore.children_left, nos)
+        right = np.where(internos, arvore.children_right, nos)
+        feature[~internos] = 0
+        threshold[~internos] = np.inf
+        valores = arvore.value[:, 0, :].astype(np.float64)
+        proba = valores / valores.sum(axis=1, keepdims=True)
+        nomes = getattr(scaler, 'feature_names_in_', None)
+        if nomes is None:
+            nomes = getattr(modelo, 'feature_names_in_', None)
+        return cls(feature, threshold, left, right, proba, modelo.classes_, nomes)
+
+    def _calcular_profundidade(self):
+        profundidade, nivel = 0, np.array([0])
+        while True:
+            internos = nivel[self.left[nivel] != nivel]
+            if len(internos) == 0:
+                return profundidade
+            profundidade += 1
+            nivel = np.concatenate([self.left[internos], self.right[internos]])
+
+    # --- Avaliação de Uma Linha ---
+
+    def _folha(self, x):
+        feature, threshold, left, right = self._feature, self._threshold, self._left, self._right
+        no = 0
+        while left[no] != no:
+            no = left[no] if x[feature[no]] <= threshold[no] else right[no]
+        return no
+
+    def predict_one(self, x):
+        """Classe prevista para uma linha (sequência de features originais, na ordem de feature_names)."""
+        return self._classe_folha[self._folha(x)]
+
+    def predict_proba_one(self, x):
+        """Probabilidades de cada classe para uma linha."""
+        return self._proba[self._folha(x)]
+
+    # --- Avaliação em Lote ---
+
+    def apply(self, X):
+        """Índice da folha de cada linha; desce todas as linhas juntas, um nível por passo."""
+        X = np.asarray(X, dtype=np.float64)
+        linhas = np.arange(len(X))
+        nos = np.zeros(len(X), dtype=np.int64)
+        for _ in range(self.depth):
+            vai_esquerda = X[linhas, self.feature[nos]] <= self.threshold[nos]
+            nos = np.where(vai_esquerda, self.left[nos], self.right[nos])
+        return nos
+
+    def predict_proba(self, X):
+        return self.proba[self.apply(X)]
+
+    def predict(self, X):
+        return self.classes[self.proba[self.apply(X)].argmax(axis=1)]
+
+    # --- Exportação ---
+
+    def save(self, path):
+        """Grava os arrays da árvore compilada em um arquivo .npz."""
+        np.savez(path, feature=self.feature, threshold=self.threshold, left=self.left, right=self.right,
+                 proba=self.proba, classes=self.classes,
+                 feature_names=np.array(self.feature_names if self.feature_names is not None else [], dtype=str))
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as dados:
+            nomes = dados['feature_names'].tolist() or None
+            return cls(dados['feature'], dados['threshold'], dados['left'], dados['right'],
+                       dados['proba'], dados['classes'], nomes)
+
+    def get_memory_usage(self):
+        """Retorna o uso de memória estimado dos arrays da árvore em bytes."""
+        return sum(sys.getsizeof(a) for a in (self.feature, self.threshold, self.left, self.right, self.proba, self.classes))
@@ -0,0 +1,234 @@
+# src/modelo/preprocessamento.py
+import numpy as np
+import pandas as pd
+
+COLUNA_ALVO = 'Heart Attack Risk'
+# Colunas de texto com menos valores distintos que esta fração das linhas viram 'category'
+LIMITE_CATEGORIAS = 0.5
+
+
+def _eh_texto(serie):
+    """Coluna de texto: 'object', o tipo 'str' das versões novas do pandas ou 'category'."""
+    return (serie.dtype == object or pd.api.types.is_string_dtype(serie.dtype)
+            or isinstance(serie.dtype, pd.CategoricalDtype))
+
+
+def preparar_dataframe(df):
+    """
+    Limpeza comum a todo o projeto (a mesma do notebook 03-previsao e do carregar_recursos):
+    separa 'Blood Pressure' em sistólica/diastólica, remove 'Patient ID' e preenche
+    valores ausentes numéricos com a mediana da coluna.
+    """
+    df = df.copy()
+    if 'Blood Pressure' in df.columns and _eh_texto(df['Blood Pressure']):
+        split_bp = df['Blood Pressure'].str.split('/', expand=True)
+        df['Pressao_Sistolica'] = pd.to_numeric(split_bp[0], errors='coerce')
+        df['Pressao_Diastolica'] = pd.to_numeric(split_bp[1], errors='coerce')
+        df = df.drop(columns=['Blood Pressure'])
+    if 'Patient ID' in df.columns:
+        df = df.drop('Patient ID', axis=1)
+    df.fillna(df.median(numeric_only=True), inplace=True)
+    return df
+
+
+def compactar_dataframe(df, limite_categorias=LIMITE_CATEGORIAS, float32=False):
+    """
+    Versão compacta de 'df' com os mesmos valores:
+    - texto com poucos valores distintos -> 'category' (códigos inteiros + uma cópia de cada texto);
+    - colunas só com 0/1 -> bool (1 byte por linha em vez de 8), exceto o alvo, que continua
+      inteiro para o modelo manter as classes 0/1;
+    - inteiros -> o menor tipo que comporta a faixa de valores (int8, int16, ...);
+    - floats -> float32 só quando a conversão não perde precisão, ou sempre com float32=True
+      (o que altera os valores vistos pelo modelo).
+    """
+    df = df.copy()
+    for coluna in df.columns:
+        serie = df[coluna]
+        if _eh_texto(serie):
+            if not isinstance(serie.dtype, pd.CategoricalDtype) and serie.nunique() < limite_categorias * len(serie):
+                df[coluna] = serie.astype('category')
+        elif pd.api.types.is_bool_dtype(serie.dtype):
+            continue
+        elif pd.api.types.is_integer_dtype(serie.dtype):
+            if coluna != COLUNA_ALVO and serie.isin((0, 1)).all():
+                df[coluna] = serie.astype(bool)
+            else:
+                df[coluna] = pd.to_numeric(serie, downcast='integer')
+        elif pd.api.types.is_float_dtype(serie.dtype):
+            reduzida = serie.astype(np.float32)
+            if float32 or np.array_equal(reduzida.to_numpy(np.float64), serie.to_numpy(np.float64), equal_nan=True):
+                df[coluna] = reduzida
+    return df
+
+
+def tamanho_flags_empacotadas(df):
+    """
+    Bytes que as colunas bool ocupariam empacotadas em bits (np.packbits, 8 linhas por byte).
+    O pandas não tem um tipo de 1 bit: no DataFrame elas continuam com 1 byte por linha.
+    """
+    colunas = [c for c in df.columns if pd.api.types.is_bool_dtype(df[c].dtype)]
+    return sum(np.packbits(df[c].to_numpy()).nbytes for c in colunas)
+
+
+def carregar_dataset(caminho, compacto=True):
+    """Lê o CSV e aplica preparar_dataframe; com compacto=True, também compactar_dataframe."""
+    df = preparar_dataframe(pd.read_csv(caminho))
+    return compactar_dataframe(df) if compacto else df
+
+
+def codificar_features(df, colunas=None):
+    """
+    Separa features e alvo e aplica One-Hot Encoding (drop_first=True), como no treino.
+    'colunas' restringe as features usadas; por padrão são todas, exceto o alvo.
+    Retorna (X_encoded, y).
+    """
+    X = df[colunas] if colunas is not None else df.drop(COLUNA_ALVO, axis=1)
+    return pd.get_dummies(X, drop_first=True), df[COLUNA_ALVO]
+
+
+class PreprocessadorCompilado:
+    """
+    Pré-processamento ajustado uma única vez e "compilado" em um mapeamento de colunas:
+    para cada feature esperada pelo scaler (na ordem de feature_names_in_) guarda de onde
+    o valor vem — uma coluna numérica, uma das metades de 'Blood Pressure' ou uma categoria
+    de uma coluna de texto (dummy) — junto com a mediana de preenchimento e os parâmetros
+    do StandardScaler.
+
+    transform escreve direto em uma matriz NumPy pré-alocada (float32 por padrão), sem
+    get_dummies, reindex ou align a cada chamada. Aceita tanto linhas cruas do CSV (com
+    'Blood Pressure' e 'Patient ID') quanto linhas já limpas por preparar_dataframe.
+    """
+    def __init__(self, feature_names, numericas, pressao, dummies, medianas, mean, scale):
+        self.feature_names = list(feature_names)
+        self.n_features = len(self.feature_names)
+        self.numericas = numericas  # [(posição, coluna)]
+        self.pressao = pressao      # [(posição, 0 = sistólica | 1 = diastólica)]
+        self.dummies = dummies      # coluna -> {categoria: posição}
+        self.medianas = np.asarray(medianas, dtype=np.float64)  # Uma por feature (0 para dummies)
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self._medianas = self.medianas.tolist()
+
+    @classmethod
+    def from_scaler(cls, df_limpo, scaler):
+        """
+        Ajusta o mapeamento para as features do 'scaler' a partir de um DataFrame já limpo
+        (saída de preparar_dataframe), de onde vêm as medianas e as categorias conhecidas.
+        """
+        nomes = list(scaler.feature_names_in_)
+        numericas, pressao, dummies = [], [], {}
+        medianas = np.zeros(len(nomes))
+        categoricas = [c for c in df_limpo.columns if _eh_texto(df_limpo[c])]
+        for pos, nome in enumerate(nomes):
+            if nome in ('Pressao_Sistolica', 'Pressao_Diastolica'):
+                pressao.append((pos, 0 if nome == 'Pressao_Sistolica' else 1))
+                medianas[pos] = df_limpo[nome].median()
+            elif nome in df_limpo.columns:
+                numericas.append((pos, nome))
+                medianas[pos] = df_limpo[nome].median()
+            else:
+                # Dummy 'Coluna_Categoria': a coluna é o maior prefixo que existe no DataFrame
+                coluna = max((c for c in categoricas if nome.startswith(c + '_')), key=len, default=None)
+                if coluna is None:
+                    raise ValueError(f"Não foi possível mapear a feature '{nome}' para uma coluna do dataset.")
+                dummies.setdefault(coluna, {})[nome[len(coluna) + 1:]] = pos
+        mean = scaler.mean_ if scaler.mean_ is not None else np.zeros(len(nomes))
+        scale = scaler.scale_ if scaler.scale_ is not None else np.ones(len(nomes))
+        return cls(nomes, numericas, pressao, dummies, medianas, mean, scale)
+
+    # --- Transformação em Lote ---
+
+    @staticmethod
+    def _coluna_float(valores, mediana):
+        valores = pd.to_numeric(valores, errors='coerce') if not np.issubdtype(valores.dtype, np.number) else valores
+        valores = np.asarray(valores, dtype=np.float64)
+        return np.where(np.isnan(valores), mediana, valores)
+
+    def _pressoes(self, dados):
+        """Sistólica e diastólica: das colunas já separadas ou quebrando 'Blood Pressure' ('120/80')."""
+        if 'Pressao_Sistolica' in dados:
+            return dados['Pressao_Sistolica'], dados['Pressao_Diastolica']
+        partes = np.char.partition(np.asarray(dados['Blood Pressure'], dtype=str), '/')
+        return partes[:, 0], partes[:, 2]
+
+    def transform(self, dados, saida=None, escalar=False, dtype=np.float32):
+        """
+        Codifica 'dados' (DataFrame ou dict de colunas) em uma matriz (n, n_features).
+        'saida' pode ser uma fatia de uma matriz maior pré-alocada, que é preenchida no lugar.
+        Com escalar=True aplica o StandardScaler (equivale a scaler.transform no DataFrame alinhado).
+        """
+        n = len(dados[next(iter(dados.keys()))]) if isinstance(dados, dict) else len(dados)
+        if saida is None:
+            saida = np.empty((n, self.n_features), dtype=dtype)
+        # Cada coluna é calculada (e padronizada) em float64 e só então gravada no tipo da saída,
+        # para que o resultado bata com o scaler.transform do sklearn
+        if escalar:
+            ajustar = lambda pos, valores: (valores - self.mean[pos]) / self.scale[pos]
+        else:
+            ajustar = lambda pos, valores: valores
+        for pos, coluna in self.numericas:
+            saida[:, pos] = ajustar(pos, self._coluna_float(np.asarray(dados[coluna]), self.medianas[pos]))
+        if self.pressao:
+            partes = self._pressoes(dados)
+            for pos, lado in self.pressao:
+                saida[:, pos] = ajustar(pos, self._coluna_float(np.asarray(partes[lado], dtype=object), self.medianas[pos]))
+        for coluna, posicoes in self.dummies.items():
+            indices = np.fromiter(posicoes.values(), dtype=np.int64, count=len(posicoes))
+            saida[:, indices] = ajustar(indices, np.zeros(len(indices)))
+            # Categoria descartada pelo drop_first (ou desconhecida) -> todas as dummies em 0
+            alvo = np.fromiter((posicoes.get(v, -1) for v in np.asarray(dados[coluna])), dtype=np.int64, count=n)
+            linhas = np.flatnonzero(alvo >= 0)
+            saida[linhas, alvo[linhas]] = ajustar(alvo[linhas], np.ones(len(linhas)))
+        return saida
+
+    @staticmethod
+    def _valor_float(valor, mediana):
+        try:
+            valor = float(valor)
+        except (TypeError, ValueError):
+            return mediana
+        return mediana if valor != valor else valor  # NaN != NaN
+
+    def transform_row(self, registro, escalar=False, dtype=np.float64):
+        """
+        Codifica um único registro (dict coluna -> valor) em um vetor de features.
+        Caminho escalar em Python puro: para uma linha, evita o custo fixo das operações NumPy por coluna.
+        """
+        medianas, valor_float = self._medianas, self._valor_float
+        linha = [0.0] * self.n_features
+        for pos, coluna in self.numericas:
+            linha[pos] = valor_float(registro.get(coluna), medianas[pos])
+        if self.pressao:
+            if 'Pressao_Sistolica' in registro:
+                partes = (registro['Pressao_Sistolica'], registro.get('Pressao_Diastolica'))
+            else:
+                sistolica, _, diastolica = str(registro.get('Blood Pressure', '')).partition('/')
+                partes = (sistolica, diastolica)
+            for pos, lado in self.pressao:
+                linha[pos] = valor_float(partes[lado], medianas[pos])
+        for coluna, posicoes in self.dummies.items():
+            pos = posicoes.get(registro.get(coluna))
+            if pos is not None:
+                linha[pos] = 1.0
+        vetor = np.array(linha, dtype=np.float64)
+        if escalar:
+            vetor = (vetor - self.mean) / self.scale
+        return vetor.astype(dtype, copy=False)
+
+    def transform_csv(self, caminho, tamanho_bloco=5000, escalar=False, dtype=np.float32):
+        """
+        Lê o CSV em blocos e preenche uma única matriz pré-alocada com todas as linhas.
+        Retorna (X, y); y é None se o arquivo não tiver a coluna alvo.
+        """
+        with open(caminho, 'rb') as f:
+            n = sum(1 for _ in f) - 1  # Linhas menos o cabeçalho
+        X = np.empty((n, self.n_features), dtype=dtype)
+        y, inicio = None, 0
+        for bloco in pd.read_csv(caminho, chunksize=tamanho_bloco):
+            fim = inicio + len(bloco)
+            self.transform(bloco, saida=X[inicio:fim], escalar=escalar)
+            if COLUNA_ALVO in bloco:
+                if y is None: y = np.empty(n, dtype=np.int8)
+                y[inicio:fim] = bloco[COLUNA_ALVO].to_numpy()
+            inicio = fim
+        return X[:inicio], (y[:inicio] if y is not None else None)
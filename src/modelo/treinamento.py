@@ -0,0 +1,272 @@
+# src/modelo/treinamento.py
+"""
+Pipeline reprodutível de treino que gera os artefatos da pasta models/
+(o que antes só existia no notebook 03-previsao).
+
+1. Pré-processa o CSV com src/modelo/preprocessamento.py e guarda a matriz codificada
+   em cache (.npz), reaproveitada enquanto o CSV não mudar.
+2. Divide treino/teste (80/20, random_state=42) e ajusta o StandardScaler só no treino.
+3. Busca hiperparâmetros da DecisionTreeClassifier com validação cruzada, cada par
+   (combinação, fold) sendo uma tarefa independente distribuída com joblib em todos os núcleos.
+   O progresso é salvo em um checkpoint JSON: uma busca interrompida continua de onde parou,
+   desde que dados, grade, métrica, folds e random_state sejam os mesmos.
+4. Retreina a melhor combinação no treino inteiro e grava o scaler (com o nome do modelo,
+   para não trocar o models/scaler.joblib usado pelo modelo de produção), o modelo e um
+   manifesto com metadados, cada arquivo de forma atômica (arquivo temporário + os.replace).
+
+Uso: python -m src.modelo.treinamento
+"""
+import hashlib
+import json
+import os
+import platform
+import time
+import numpy as np
+import pandas as pd
+import joblib
+from joblib import Parallel, delayed
+from sklearn import __version__ as versao_sklearn
+from sklearn.metrics import get_scorer
+from sklearn.model_selection import ParameterGrid, StratifiedKFold, train_test_split
+from sklearn.preprocessing import StandardScaler
+from sklearn.tree import DecisionTreeClassifier
+
+from src.modelo.preprocessamento import carregar_dataset, codificar_features
+
+GRADE_PADRAO = {
+    'max_depth': [3, 4, 5, 6, 8, 10],
+    'min_samples_leaf': [1, 5, 20, 50],
+    'criterion': ['gini', 'entropy'],
+    'class_weight': ['balanced', None],
+}
+# O recall sozinho premia a árvore que prevê "risco" para todo mundo; o F1 equilibra os dois erros
+METRICA_PADRAO = 'f1'
+
+
+# --- Escrita Atômica ---
+
+def _escrever_atomico(caminho, escrever):
+    """
+    Chama escrever(caminho_temporario) e só então substitui 'caminho' com os.replace,
+    que é atômico: quem lê o arquivo vê a versão antiga ou a nova, nunca uma pela metade.
+    """
+    os.makedirs(os.path.dirname(caminho) or ".", exist_ok=True)
+    temporario = f"{caminho}.tmp-{os.getpid()}"
+    try:
+        escrever(temporario)
+        os.replace(temporario, caminho)
+    finally:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+
+
+def salvar_json_atomico(caminho, dados):
+    def escrever(tmp):
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(dados, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+    _escrever_atomico(caminho, escrever)
+
+
+def salvar_joblib_atomico(caminho, objeto):
+    _escrever_atomico(caminho, lambda tmp: joblib.dump(objeto, tmp))
+
+
+# --- Dados ---
+
+def _assinatura_arquivo(caminho):
+    """Identifica a versão do CSV pelo tamanho e data de modificação."""
+    info = os.stat(caminho)
+    return f"{info.st_size}-{int(info.st_mtime)}"
+
+
+def preparar_dados(caminho_csv, caminho_cache=None):
+    """
+    Retorna (X, y, nomes_das_features) já codificados. Se 'caminho_cache' for informado,
+    a matriz é lida do cache quando ele corresponde à versão atual do CSV.
+    """
+    assinatura = _assinatura_arquivo(caminho_csv)
+    if caminho_cache and os.path.exists(caminho_cache):
+        with np.load(caminho_cache, allow_pickle=False) as cache:
+            if str(cache['assinatura']) == assinatura:
+                return cache['X'], cache['y'], cache['nomes'].tolist()
+
+    X_encoded, y = codificar_features(carregar_dataset(caminho_csv))
+    X, y, nomes = X_encoded.to_numpy(dtype=np.float64), y.to_numpy(), list(X_encoded.columns)
+    if caminho_cache:
+        def escrever(tmp):
+            with open(tmp, 'wb') as f:
+                np.savez(f, X=X, y=y, nomes=np.array(nomes), assinatura=np.array(assinatura))
+        _escrever_atomico(caminho_cache, escrever)
+    return X, y, nomes
+
+
+# --- Busca de Hiperparâmetros ---
+
+def _chave_tarefa(parametros, fold):
+    return json.dumps(parametros, sort_keys=True) + f"#{fold}"
+
+
+def _cabecalho_checkpoint(combinacoes, X, metrica, n_folds, random_state, assinatura_dados):
+    """
+    Tudo de que os scores salvos dependem. Um checkpoint cujo cabeçalho difere deste
+    veio de outra busca (outro CSV, grade, divisão ou semente) e é descartado.
+    """
+    grade_json = json.dumps(combinacoes, sort_keys=True, default=str)
+    return {"metrica": metrica, "n_folds": n_folds, "random_state": random_state,
+            "grade_sha256": hashlib.sha256(grade_json.encode('utf-8')).hexdigest(),
+            "formato_treino": list(np.shape(X)), "assinatura_dados": assinatura_dados}
+
+
+def _avaliar(X, y, treino, validacao, parametros, metrica, random_state):
+    """Treina uma combinação em um fold e retorna (score, segundos). Roda nos processos do joblib."""
+    start = time.perf_counter()
+    modelo = DecisionTreeClassifier(random_state=random_state, **parametros)
+    modelo.fit(X[treino], y[treino])
+    score = get_scorer(metrica)(modelo, X[validacao], y[validacao])
+    return float(score), time.perf_counter() - start
+
+
+def buscar_hiperparametros(X, y, grade=None, metrica=METRICA_PADRAO, n_folds=5, n_jobs=-1,
+                           caminho_checkpoint=None, tamanho_lote=None, random_state=42, assinatura_dados=None):
+    """
+    Validação cruzada em grade com todas as tarefas (combinação x fold) em paralelo.
+    Com 'caminho_checkpoint', os scores já calculados são lidos no início e o arquivo é
+    regravado (atomicamente) a cada lote de tarefas concluído. O checkpoint só é
+    reaproveitado se o cabeçalho bater: mesma métrica, folds, random_state, grade, formato
+    do treino e 'assinatura_dados' (identifica a versão dos dados, ex.: _assinatura_arquivo do CSV).
+    Retorna um DataFrame com a média e o desvio do score de cada combinação, do melhor ao pior.
+    """
+    combinacoes = list(ParameterGrid(grade or GRADE_PADRAO))
+    folds = list(StratifiedKFold(n_splits=n_folds, shuffle=True, random_state=random_state).split(X, y))
+
+    cabecalho = _cabecalho_checkpoint(combinacoes, X, metrica, n_folds, random_state, assinatura_dados)
+    concluidas = {}
+    if caminho_checkpoint and os.path.exists(caminho_checkpoint):
+        with open(caminho_checkpoint, encoding='utf-8') as f:
+            estado = json.load(f)
+        if estado.get("cabecalho") == cabecalho:
+            concluidas = estado["resultados"]
+
+    pendentes = [(p, k) for p in combinacoes for k in range(n_folds) if _chave_tarefa(p, k) not in concluidas]
+    n_processos = joblib.cpu_count() if n_jobs in (-1, None) else n_jobs
+    tamanho_lote = tamanho_lote or max(1, n_processos * 8)
+    with Parallel(n_jobs=n_jobs) as paralelo:  # Reaproveita os mesmos processos entre lotes
+        for inicio in range(0, len(pendentes), tamanho_lote):
+            lote = pendentes[inicio:inicio + tamanho_lote]
+            resultados = paralelo(delayed(_avaliar)(X, y, folds[k][0], folds[k][1], p, metrica, random_state) for p, k in lote)
+            for (p, k), (score, segundos) in zip(lote, resultados):
+                concluidas[_chave_tarefa(p, k)] = {"score": score, "segundos": segundos}
+            if caminho_checkpoint:
+                salvar_json_atomico(caminho_checkpoint, {"cabecalho": cabecalho, "resultados": concluidas})
+
+    linhas = []
+    for p in combinacoes:
+        scores = [concluidas[_chave_tarefa(p, k)]["score"] for k in range(n_folds)]
+        linhas.append({**p, "score_medio": float(np.mean(scores)), "score_desvio": float(np.std(scores))})
+    return pd.DataFrame(linhas).sort_values("score_medio", ascending=False, kind='stable').reset_index(drop=True)
+
+
+# --- Pipeline Completo ---
+
+def _hash_arquivo(caminho):
+    h = hashlib.sha256()
+    with open(caminho, 'rb') as f:
+        for bloco in iter(lambda: f.read(1 << 20), b''):
+            h.update(bloco)
+    return h.hexdigest()
+
+
+def nome_do_scaler(nome_modelo):
+    """Nome do arquivo do scaler que treinar() grava junto com 'nome_modelo'."""
+    return f"{os.path.splitext(nome_modelo)[0]}.scaler.joblib"
+
+
+def caminho_do_scaler(pasta, nome_modelo):
+    """
+    Caminho do scaler ajustado junto com 'nome_modelo': o registrado em manifesto_modelo.json
+    quando o manifesto descreve esse modelo, senão nome_do_scaler(nome_modelo) na mesma pasta.
+    """
+    caminho_manifesto = os.path.join(pasta, "manifesto_modelo.json")
+    if os.path.exists(caminho_manifesto):
+        with open(caminho_manifesto, encoding='utf-8') as f:
+            manifesto = json.load(f)
+        if manifesto.get("modelo") == nome_modelo and manifesto.get("scaler"):
+            return os.path.join(pasta, manifesto["scaler"])
+    return os.path.join(pasta, nome_do_scaler(nome_modelo))
+
+
+def treinar(caminho_csv=os.path.join("dataset", "heart_attack_prediction_dataset.csv"), pasta_saida="models",
+            grade=None, metrica=METRICA_PADRAO, n_folds=5, n_jobs=-1,
+            nome_modelo="melhor_modelo_otimizado.joblib", random_state=42):
+    """
+    Executa o pipeline inteiro e grava em 'pasta_saida': 'nome_modelo', o scaler ajustado
+    junto com ele ('<nome_modelo>.scaler.joblib') e manifesto_modelo.json. O scaler.joblib
+    de produção, pareado com modelo_arvore_final.joblib, não é tocado. O cache da matriz e o
+    checkpoint da busca ficam em 'pasta_saida/cache'. Retorna (modelo, scaler, manifesto).
+    """
+    inicio = time.perf_counter()
+    pasta_cache = os.path.join(pasta_saida, "cache")
+    nome_scaler = nome_do_scaler(nome_modelo)
+    X, y, nomes = preparar_dados(caminho_csv, os.path.join(pasta_cache, "matriz_codificada.npz"))
+    X_treino, X_teste, y_treino, y_teste = train_test_split(X, y, test_size=0.2, random_state=random_state)
+    scaler = StandardScaler()
+    X_treino_escalado = scaler.fit_transform(pd.DataFrame(X_treino, columns=nomes))
+    X_teste_escalado = scaler.transform(pd.DataFrame(X_teste, columns=nomes))
+
+    ranking = buscar_hiperparametros(X_treino_escalado, y_treino, grade, metrica, n_folds, n_jobs,
+                                     os.path.join(pasta_cache, "checkpoint_busca.json"), random_state=random_state,
+                                     assinatura_dados=_assinatura_arquivo(caminho_csv))
+    colunas_parametros = [c for c in ranking.columns if c not in ("score_medio", "score_desvio")]
+    melhores = {c: ranking.loc[0, c] for c in colunas_parametros}
+    melhores = {c: (None if pd.isna(v) else v.item() if hasattr(v, 'item') else v) for c, v in melhores.items()}
+
+    modelo = DecisionTreeClassifier(random_state=random_state, **melhores).fit(X_treino_escalado, y_treino)
+    scorer = get_scorer(metrica)
+    manifesto = {
+        "modelo": nome_modelo, "scaler": nome_scaler, "tipo": type(modelo).__name__,
+        "parametros": melhores, "metrica": metrica,
+        "score_validacao_cruzada": float(ranking.loc[0, "score_medio"]),
+        "score_teste": float(scorer(modelo, X_teste_escalado, y_teste)),
+        "acuracia_teste": float(modelo.score(X_teste_escalado, y_teste)),
+        "features": nomes, "n_treino": int(len(y_treino)), "n_teste": int(len(y_teste)),
+        "combinacoes_avaliadas": int(len(ranking)), "n_folds": n_folds,
+        "dataset_sha256": _hash_arquivo(caminho_csv), "random_state": random_state,
+        "versoes": {"python": platform.python_version(), "sklearn": versao_sklearn, "numpy": np.__version__},
+        "tempo_total_s": time.perf_counter() - inicio,
+    }
+    # O manifesto é gravado por último: se ele existe, scaler e modelo já estão completos
+    salvar_joblib_atomico(os.path.join(pasta_saida, nome_scaler), scaler)
+    salvar_joblib_atomico(os.path.join(pasta_saida, nome_modelo), modelo)
+    salvar_json_atomico(os.path.join(pasta_saida, "manifesto_modelo.json"), manifesto)
+    return modelo, scaler, manifesto
+
+
+def medir_escalabilidade(caminho_csv=os.path.join("dataset", "heart_attack_prediction_dataset.csv"),
+                         niveis_n_jobs=None, grade=None, metrica=METRICA_PADRAO, n_folds=5):
+    """
+    Tempo de relógio da busca (sem checkpoint) para cada número de processos.
+    Por padrão testa 1, 2, 4, ... até o número de núcleos da máquina.
+    """
+    X, y, nomes = preparar_dados(caminho_csv)
+    X_escalado = StandardScaler().fit_transform(X)
+    if niveis_n_jobs is None:
+        nucleos = joblib.cpu_count()
+        niveis_n_jobs = sorted({2 ** i for i in range(nucleos.bit_length()) if 2 ** i <= nucleos} | {nucleos})
+    linhas = []
+    for n_jobs in niveis_n_jobs:
+        start = time.perf_counter()
+        buscar_hiperparametros(X_escalado, y, grade, metrica, n_folds, n_jobs)
+        linhas.append({"Processos": n_jobs, "Tempo (s)": time.perf_counter() - start})
+    df = pd.DataFrame(linhas)
+    df["Speedup"] = df["Tempo (s)"].iloc[0] / df["Tempo (s)"]
+    df["Eficiência"] = df["Speedup"] / df["Processos"]
+    return df
+
+
+if __name__ == "__main__":
+    _, _, manifesto = treinar()
+    print(json.dumps({k: v for k, v in manifesto.items() if k != "features"}, ensure_ascii=False, indent=2))
+    print("\n--- Tempo da Busca x Número de Processos ---")
+    print(medir_escalabilidade().round(3).to_string(index=False))